@@ -1119,6 +1119,25 @@ class FileExportAdminPage(admin.ModelAdmin):
         "dxf",
     ]
 
+
+class QuantityTakeoffRebarInline(admin.TabularInline):
+    model = models.QuantityTakeoffRebar
+    extra = 0
+
+
+@admin.register(models.QuantityTakeoff)
+class QuantityTakeoffAdminPage(admin.ModelAdmin):
+    list_display = [
+        "stair",
+        "concrete_volume",
+        "steel_weight",
+        "lifting_count",
+        "demolding_count",
+        "rail_count",
+        "update_time",
+    ]
+    inlines = [QuantityTakeoffRebarInline]
+
 @admin.register(PreSetModelData)
 class PreSetModelDataAdmin(PreCustomFieldSetAdmin):
     list_display = ["remark_name"]
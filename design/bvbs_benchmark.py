@@ -0,0 +1,69 @@
+"""
+BVBS 导出的基准测试:以IFC 基准测试的样例楼梯及结构参数扫描生成基础楼梯,组合成1、50、500 个楼梯的
+合成项目,统计钢筋数据转换、BVBS 及钢筋JSON 压缩文件生成整个流程的吞吐量、峰值内存及输出大小
+需在Django 测试数据库中运行:
+    RUN_BENCHMARKS=1 python manage.py test design.tests.TestBVBSExportBenchmark
+"""
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from stair_rebar_bvbs.benchmark import PROJECT_SIZES, run_export_benchmark
+from stair_rebar_layout.models import RebarforBIM
+from stair_structure.model import StructuralDesign
+
+from .ifc_benchmark import BENCHMARK_CASES, create_benchmark_case
+
+_logger = logging.getLogger(__name__)
+
+# 相对于STRUCTURE_PARAMETERS 修改的结构设计参数,与各样例组合生成基础楼梯
+STRUCTURE_SWEEPS: Dict[str, Dict] = {
+    "base": {},
+    "steep": dict(height=3300, steps_number=14, clear_span=3000),
+    "short": dict(height=2800, steps_number=16, clear_span=4160),
+}
+
+
+def create_base_stairs(
+    sweeps: Optional[Dict[str, Dict]] = None, cases: Optional[Dict[str, Dict]] = None
+) -> List[Tuple[StructuralDesign, RebarforBIM]]:
+    """
+    在数据库中录入结构参数扫描与样例的全部组合,完成设计及钢筋排布
+    Args:
+        sweeps: 结构参数扫描,默认STRUCTURE_SWEEPS
+        cases: 样例名称及深化设计参数修改,默认BENCHMARK_CASES
+
+    Returns:
+        各基础楼梯的结构设计参数及钢筋排布结果
+    """
+    sweeps = STRUCTURE_SWEEPS if sweeps is None else sweeps
+    cases = BENCHMARK_CASES if cases is None else cases
+    base_stairs = []
+    for sweep_name, structure_overrides in sweeps.items():
+        for case_name, detail_overrides in cases.items():
+            exchanged, rebar_data = create_benchmark_case(
+                f"{sweep_name}_{case_name}", detail_overrides, structure_overrides
+            )
+            base_stairs.append((exchanged.structure_design, rebar_data))
+    return base_stairs
+
+
+def run_bvbs_export_benchmark(
+    sizes: Tuple[int, ...] = PROJECT_SIZES,
+    repeat: int = 3,
+    sweeps: Optional[Dict[str, Dict]] = None,
+    cases: Optional[Dict[str, Dict]] = None,
+) -> Dict[int, Dict]:
+    """
+    运行各楼梯数量的合成项目导出基准测试
+    Args:
+        sizes: 合成项目的楼梯数量
+        repeat: 计时的运行次数
+        sweeps: 结构参数扫描,默认STRUCTURE_SWEEPS
+        cases: 样例名称及深化设计参数修改,默认BENCHMARK_CASES
+
+    Returns:
+        各楼梯数量的统计指标
+    """
+    base_stairs = create_base_stairs(sweeps, cases)
+    _logger.info(f"BVBS 导出基准测试,基础楼梯{len(base_stairs)}个")
+    return run_export_benchmark(base_stairs, sizes, repeat)
@@ -0,0 +1,223 @@
+"""
+IFC 生成的基准测试:以典型楼梯设计(简单、多孔洞、手动栏杆、手动布置吊装预埋件)为样例,
+统计stair_IFC_creation 的耗时、实体数量、文件大小及峰值内存,并与基准结果比较,超出阈值即视为性能退化
+样例设计参数见design/sample_parameters.py,需在Django 测试数据库中运行:
+    RUN_BENCHMARKS=1 python manage.py test design.tests.TestIfcBenchmark
+"""
+import json
+import logging
+import os
+import time
+import tracemalloc
+from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
+
+from stair_rebar_layout.models import RebarforBIM
+from stair_detailed.models import (
+    HoleDesignMode,
+    HoleType,
+    LiftingDesignMode,
+    RailLayout,
+    WaterDripLayout,
+)
+from stair_ifc.create_ifc import stair_IFC_creation
+
+from . import tools
+from .models import (
+    DetailData,
+    ModelConstructionData,
+    RebarLayoutModel,
+)
+from .sample_parameters import DETAIL_PARAMETERS, STRUCTURE_PARAMETERS
+
+_logger = logging.getLogger(__name__)
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "ifc_benchmark_baseline.json")
+
+# 各指标允许的相对增长比例,耗时受运行环境影响较大,阈值较宽
+THRESHOLDS = {
+    "wall_time": 1.0,
+    "entity_count": 0.02,
+    "output_bytes": 0.05,
+    "peak_memory": 0.25,
+}
+
+# 各样例相对于DETAIL_PARAMETERS 修改的深化设计参数
+BENCHMARK_CASES: Dict[str, Dict] = {
+    "simple": dict(
+        water_drip_layout=WaterDripLayout.ONLY_TOP.value,
+        rail_layout=RailLayout.ONLY_RIGHT.value,
+        rail_number="2",
+    ),
+    "many_holes": dict(
+        hole_design_mode=HoleDesignMode.MANUAL.value,
+        top_hole_type=HoleType.SLIDING_HINGE.value,
+        bottom_hole_type=HoleType.SLIDING_HINGE.value,
+    ),
+    "manual_rails": dict(
+        rail_layout=RailLayout.BOTH.value,
+        rail_number=" ".join(str(i) for i in range(1, 18)),
+    ),
+    "dense_parts": dict(
+        hole_design_mode=HoleDesignMode.MANUAL.value,  # 吊装预埋件位置随孔洞设计模式手动输入
+        hoist_design_mode=LiftingDesignMode.MANUAL.value,
+        hoist_position_a=3,
+        hoist_position_b=15,
+        hoist_position_c=200,
+        hoist_position_d=200,
+    ),
+}
+
+
+def create_benchmark_case(
+    name: str, detail_overrides: Dict, structure_overrides: Optional[Dict] = None
+) -> Tuple[tools.BeforeFinalCall, RebarforBIM]:
+    """
+    在数据库中录入样例楼梯,依次完成结构计算、深化设计及钢筋排布
+    Args:
+        name: 样例名称,作为构件编号
+        detail_overrides: 相对于DETAIL_PARAMETERS 修改的深化设计参数
+        structure_overrides: 相对于STRUCTURE_PARAMETERS 修改的结构设计参数
+
+    Returns:
+        IFC 生成所需的数据层转换结果及钢筋数据
+    """
+    structure_parameters = ModelConstructionData.objects.create(
+        component_num=name,
+        **dict(STRUCTURE_PARAMETERS, **(structure_overrides or {})),
+    )
+    tools.call_structural_calculation(structure_parameters)
+    detail_parameters = DetailData.objects.create(
+        stair=structure_parameters, **dict(DETAIL_PARAMETERS, **detail_overrides)
+    )
+    design_result_instance = tools.call_detailed_design_by_model(detail_parameters)
+    rebar_for_bim = tools.call_rebar_layout(design_result_instance)
+    rebar_result = RebarLayoutModel.objects.create(
+        stair=structure_parameters, content=asdict(rebar_for_bim)
+    )
+    return tools.BeforeFinalCall(rebar_result), RebarforBIM(**rebar_result.content)
+
+
+def measure_ifc_creation(
+    exchanged: tools.BeforeFinalCall, rebar_data: RebarforBIM, repeat: int = 3
+) -> Dict:
+    """
+    统计一个楼梯IFC 生成的各项指标,耗时取多次运行的最小值,峰值内存单独运行一次统计
+    以确定性模式生成,文件大小不受GlobalId 及时间戳影响
+    Args:
+        exchanged: 数据层转换结果
+        rebar_data: 钢筋数据
+        repeat: 计时的运行次数
+
+    Returns:
+        wall_time(s), entity_count, output_bytes, peak_memory(byte)
+    """
+    args = (
+        exchanged.structure_design,
+        exchanged.structure_result,
+        exchanged.detail_design,
+        exchanged.detail_result,
+        rebar_data,
+    )
+    wall_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        stair_IFC_creation(*args, deterministic=True)
+        wall_times.append(time.perf_counter() - start)
+
+    # tracemalloc 只统计Python 层的内存分配,IfcOpenShell 内部的分配不计入
+    tracemalloc.start()
+    try:
+        ifc_doc = stair_IFC_creation(*args, deterministic=True)
+        ifc_content = ifc_doc.ifcfile.to_string()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "wall_time": min(wall_times),
+        "entity_count": len(list(ifc_doc.ifcfile)),
+        "output_bytes": len(ifc_content.encode("utf-8")),
+        "peak_memory": peak_memory,
+    }
+
+
+def run_ifc_benchmark(
+    cases: Optional[Dict[str, Dict]] = None, repeat: int = 3
+) -> Dict[str, Dict]:
+    """
+    运行全部样例的IFC 生成基准测试
+    Args:
+        cases: 样例名称及深化设计参数修改,默认BENCHMARK_CASES
+        repeat: 计时的运行次数
+
+    Returns:
+        各样例的统计指标
+    """
+    cases = BENCHMARK_CASES if cases is None else cases
+    results = {}
+    for name, detail_overrides in cases.items():
+        exchanged, rebar_data = create_benchmark_case(name, detail_overrides)
+        results[name] = measure_ifc_creation(exchanged, rebar_data, repeat)
+        _logger.info(f"IFC 基准测试{name}:{results[name]}")
+    return results
+
+
+def compare_with_baseline(
+    results: Dict[str, Dict],
+    baseline: Dict[str, Dict],
+    thresholds: Optional[Dict[str, float]] = None,
+) -> List[str]:
+    """
+    与基准结果比较,返回超出阈值的指标说明;基准中没有的样例或指标不做比较
+    Args:
+        results: 本次统计结果
+        baseline: 基准结果
+        thresholds: 各指标允许的相对增长比例,默认THRESHOLDS
+
+    Returns:
+        性能退化说明,为空表示没有退化
+    """
+    thresholds = THRESHOLDS if thresholds is None else thresholds
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            base_value = baseline.get(name, {}).get(metric)
+            if base_value is None or metric not in thresholds:
+                continue
+            limit = base_value * (1 + thresholds[metric])
+            if value > limit:
+                regressions.append(
+                    f"{name}.{metric}:{value} 超出基准{base_value}"
+                    f"(阈值{thresholds[metric]:.0%})"
+                )
+    return regressions
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Dict[str, Dict]:
+    """
+    读取基准结果,文件不存在时返回空字典
+    Args:
+        path:
+
+    Returns:
+
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(results: Dict[str, Dict], path: str = BASELINE_PATH):
+    """
+    保存基准结果,性能有意变化(如新增构件)后需重新生成
+    Args:
+        results:
+        path:
+
+    Returns:
+
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
@@ -0,0 +1,132 @@
+"""
+项目级IFC 导出的基准测试:以IFC 基准测试的样例楼梯组合成1、10、100 个楼梯的合成项目,
+统计project_IFC_creation 流式导出的耗时、吞吐量、实体数量、文件大小及峰值内存,
+以及楼层、材质、钢筋类型的数量(多楼梯共用时不随楼梯数量增长)
+需在Django 测试数据库中运行:
+    RUN_BENCHMARKS=1 python manage.py test design.tests.TestProjectIfcBenchmark
+"""
+import io
+import logging
+import time
+import tracemalloc
+from dataclasses import replace
+from typing import Dict, List, Optional, Sequence
+
+from stair_ifc.create_ifc import StairIfcInput, project_IFC_creation
+
+from .ifc_benchmark import BENCHMARK_CASES, create_benchmark_case
+
+_logger = logging.getLogger(__name__)
+
+PROJECT_SIZES = (1, 10, 100)
+
+
+def create_project_base_stairs(
+    cases: Optional[Dict[str, Dict]] = None
+) -> List[StairIfcInput]:
+    """
+    在数据库中录入各样例楼梯,完成设计及钢筋排布
+    Args:
+        cases: 样例名称及深化设计参数修改,默认BENCHMARK_CASES
+
+    Returns:
+        各基础楼梯的IFC 输入数据
+    """
+    cases = BENCHMARK_CASES if cases is None else cases
+    base_stairs = []
+    for name, detail_overrides in cases.items():
+        exchanged, rebar_data = create_benchmark_case(name, detail_overrides)
+        base_stairs.append(
+            StairIfcInput(
+                structure_design=exchanged.structure_design,
+                structure_design_result=exchanged.structure_result,
+                detailed_design=exchanged.detail_design,
+                detailed_design_result=exchanged.detail_result,
+                rebar_data=rebar_data,
+                name=name,
+            )
+        )
+    return base_stairs
+
+
+def create_synthetic_project(
+    base_stairs: List[StairIfcInput], stair_count: int
+) -> List[StairIfcInput]:
+    """
+    依次循环使用基础楼梯组成指定数量楼梯的合成项目,各楼梯以序号区分名称
+    Args:
+        base_stairs: 基础楼梯
+        stair_count: 楼梯数量
+
+    Returns:
+
+    """
+    stairs = []
+    for index in range(stair_count):
+        base_stair = base_stairs[index % len(base_stairs)]
+        stairs.append(replace(base_stair, name=f"{base_stair.name}-{index + 1}"))
+    return stairs
+
+
+def measure_project_ifc_creation(stairs: List[StairIfcInput], repeat: int = 1) -> Dict:
+    """
+    统计一个项目流式导出IFC 的各项指标,耗时取多次运行的最小值,峰值内存单独运行一次统计
+    Args:
+        stairs: 项目的楼梯
+        repeat: 计时的运行次数
+
+    Returns:
+        wall_time(s), stairs_per_second, entity_count, output_bytes, peak_memory(byte),
+        storey_count, material_count, rebar_type_count
+    """
+    wall_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        project_IFC_creation(stairs, stream=io.StringIO(), deterministic=True)
+        wall_times.append(time.perf_counter() - start)
+
+    # tracemalloc 只统计Python 层的内存分配,IfcOpenShell 内部的分配不计入
+    stream = io.StringIO()
+    tracemalloc.start()
+    try:
+        ifc_doc = project_IFC_creation(stairs, stream=stream, deterministic=True)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    wall_time = min(wall_times)
+    return {
+        "stair_count": len(stairs),
+        "wall_time": wall_time,
+        "stairs_per_second": len(stairs) / wall_time,
+        "entity_count": len(list(ifc_doc.ifcfile)),
+        "output_bytes": len(stream.getvalue().encode("utf-8")),
+        "peak_memory": peak_memory,
+        "storey_count": len(ifc_doc.ifcfile.by_type("IfcBuildingStorey")),
+        "material_count": len(ifc_doc.ifcfile.by_type("IfcMaterial")),
+        "rebar_type_count": len(ifc_doc.ifcfile.by_type("IfcReinforcingBarType")),
+    }
+
+
+def run_project_ifc_benchmark(
+    sizes: Sequence[int] = PROJECT_SIZES,
+    repeat: int = 1,
+    cases: Optional[Dict[str, Dict]] = None,
+) -> Dict[int, Dict]:
+    """
+    运行各楼梯数量的合成项目IFC 导出基准测试
+    Args:
+        sizes: 合成项目的楼梯数量
+        repeat: 计时的运行次数
+        cases: 样例名称及深化设计参数修改,默认BENCHMARK_CASES
+
+    Returns:
+        各楼梯数量的统计指标
+    """
+    base_stairs = create_project_base_stairs(cases)
+    _logger.info(f"项目级IFC 导出基准测试,基础楼梯{len(base_stairs)}个")
+    results = {}
+    for stair_count in sizes:
+        stairs = create_synthetic_project(base_stairs, stair_count)
+        results[stair_count] = measure_project_ifc_creation(stairs, repeat)
+        _logger.info(f"项目级IFC 导出{stair_count}个楼梯:{results[stair_count]}")
+    return results
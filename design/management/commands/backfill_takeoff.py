@@ -0,0 +1,42 @@
+"""
+为已完成钢筋排布、但没有工程量汇总的楼梯补充计算工程量汇总:
+    python manage.py backfill_takeoff [--project-num 项目编号] [--all]
+"""
+import logging
+
+from django.core.management.base import BaseCommand
+
+from design import models
+from design.takeoff import update_stair_takeoff
+
+_logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "为已完成钢筋排布的楼梯补充计算工程量汇总"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--project-num", help="只处理该项目编号下的楼梯")
+        parser.add_argument(
+            "--all", action="store_true", help="重新计算全部楼梯,包括已有汇总的楼梯"
+        )
+
+    def handle(self, *args, **options):
+        rebar_results = models.RebarLayoutModel.objects.select_related("stair")
+        if options["project_num"] is not None:
+            rebar_results = rebar_results.filter(
+                stair__project_num=options["project_num"]
+            )
+        if not options["all"]:
+            rebar_results = rebar_results.filter(stair__takeoff__isnull=True)
+        done, failed = 0, 0
+        for rebar_result in rebar_results.order_by("stair_id").iterator():
+            try:
+                update_stair_takeoff(rebar_result)
+            except Exception:
+                # 设计数据不完整的楼梯跳过,不影响其余楼梯
+                _logger.exception(f"楼梯{rebar_result.stair_id}工程量汇总计算失败")
+                failed += 1
+            else:
+                done += 1
+        self.stdout.write(f"工程量汇总完成{done}个楼梯,失败{failed}个楼梯")
@@ -0,0 +1,133 @@
+# Generated by Django 3.2 on 2026-10-19 16:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("design", "0035_rename_width_presetmodeldata_weight"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QuantityTakeoff",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "concrete_volume",
+                    models.FloatField(default=0, verbose_name="混凝土体积 m³"),
+                ),
+                (
+                    "steel_weight",
+                    models.FloatField(default=0, verbose_name="钢筋总重 kg"),
+                ),
+                (
+                    "hole_count",
+                    models.IntegerField(default=0, verbose_name="孔洞数量"),
+                ),
+                (
+                    "lifting_count",
+                    models.IntegerField(default=0, verbose_name="吊装预埋件数量"),
+                ),
+                (
+                    "lifting_name",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        max_length=128,
+                        verbose_name="吊装预埋件型号",
+                    ),
+                ),
+                (
+                    "demolding_count",
+                    models.IntegerField(default=0, verbose_name="脱模预埋件数量"),
+                ),
+                (
+                    "demolding_name",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        max_length=128,
+                        verbose_name="脱模预埋件型号",
+                    ),
+                ),
+                (
+                    "rail_count",
+                    models.IntegerField(default=0, verbose_name="栏杆预埋件数量"),
+                ),
+                (
+                    "update_time",
+                    models.DateTimeField(auto_now=True, verbose_name="更新时间"),
+                ),
+                (
+                    "stair",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="design.modelconstructiondata",
+                        verbose_name="所属楼梯",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "工程量汇总",
+                "verbose_name_plural": "工程量汇总",
+            },
+        ),
+        migrations.CreateModel(
+            name="QuantityTakeoffRebar",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "rebar_grade",
+                    models.CharField(max_length=64, verbose_name="钢筋等级"),
+                ),
+                (
+                    "rebar_diameter",
+                    models.IntegerField(verbose_name="钢筋直径 mm"),
+                ),
+                (
+                    "quantity",
+                    models.IntegerField(default=0, verbose_name="钢筋根数"),
+                ),
+                (
+                    "total_length",
+                    models.FloatField(default=0, verbose_name="钢筋总长 mm"),
+                ),
+                (
+                    "weight",
+                    models.FloatField(default=0, verbose_name="钢筋重量 kg"),
+                ),
+                (
+                    "takeoff",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rebars",
+                        to="design.quantitytakeoff",
+                        verbose_name="工程量汇总",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "工程量汇总钢筋用量",
+                "verbose_name_plural": "工程量汇总钢筋用量",
+            },
+        ),
+    ]
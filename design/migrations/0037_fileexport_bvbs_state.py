@@ -0,0 +1,23 @@
+# Generated by Django 3.2 on 2026-10-19 16:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("design", "0036_quantitytakeoff"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="fileexport",
+            name="bvbs_state",
+            field=models.JSONField(
+                blank=True,
+                help_text="各钢筋组的输入摘要及生成的BVBS、钢筋JSON,用于增量生成",
+                null=True,
+                verbose_name="BVBS 分组生成结果",
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 3.2 on 2026-10-19 18:40
+
+from django.db import migrations, models
+from django.db.models import Max
+import django.db.models.deletion
+
+
+def remove_duplicate_takeoffs(apps, schema_editor):
+    """
+    每个楼梯只保留最后保存的工程量汇总,其余删除后才能建立唯一约束
+    """
+    QuantityTakeoff = apps.get_model("design", "QuantityTakeoff")
+    latest_ids = QuantityTakeoff.objects.values("stair_id").annotate(
+        latest_id=Max("id")
+    )
+    QuantityTakeoff.objects.exclude(
+        id__in=[row["latest_id"] for row in latest_ids]
+    ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("design", "0037_fileexport_bvbs_state"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_takeoffs, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="quantitytakeoff",
+            name="stair",
+            field=models.OneToOneField(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="takeoff",
+                to="design.modelconstructiondata",
+                verbose_name="所属楼梯",
+            ),
+        ),
+    ]
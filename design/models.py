@@ -1242,7 +1242,65 @@ class FileExport(models.Model):
         upload_to="%Y/%m/%d",
         null=True,
     )
+    bvbs_state = models.JSONField(
+        verbose_name="BVBS 分组生成结果",
+        null=True,
+        blank=True,
+        help_text="各钢筋组的输入摘要及生成的BVBS、钢筋JSON,用于增量生成",
+    )
 
     class Meta:
         verbose_name = "楼梯导出模型"
         verbose_name_plural = verbose_name
+
+
+class QuantityTakeoff(models.Model):
+    """
+    楼梯工程量汇总:混凝土体积、钢筋总重及预埋件数量,由钢筋排布结果直接计算,不生成各导出文件
+    """
+
+    stair = models.OneToOneField(
+        ModelConstructionData,
+        verbose_name="所属楼梯",
+        on_delete=models.CASCADE,
+        related_name="takeoff",
+    )
+    concrete_volume = models.FloatField(verbose_name="混凝土体积 m³", default=0)
+    steel_weight = models.FloatField(verbose_name="钢筋总重 kg", default=0)
+    hole_count = models.IntegerField(verbose_name="孔洞数量", default=0)
+    lifting_count = models.IntegerField(verbose_name="吊装预埋件数量", default=0)
+    lifting_name = models.CharField(
+        verbose_name="吊装预埋件型号", max_length=128, blank=True, default=""
+    )
+    demolding_count = models.IntegerField(verbose_name="脱模预埋件数量", default=0)
+    demolding_name = models.CharField(
+        verbose_name="脱模预埋件型号", max_length=128, blank=True, default=""
+    )
+    rail_count = models.IntegerField(verbose_name="栏杆预埋件数量", default=0)
+    update_time = models.DateTimeField(verbose_name="更新时间", auto_now=True)
+
+    class Meta:
+        verbose_name = "工程量汇总"
+        verbose_name_plural = verbose_name
+
+
+class QuantityTakeoffRebar(models.Model):
+    """
+    楼梯工程量汇总中按钢筋等级、直径统计的钢筋用量
+    """
+
+    takeoff = models.ForeignKey(
+        QuantityTakeoff,
+        verbose_name="工程量汇总",
+        related_name="rebars",
+        on_delete=models.CASCADE,
+    )
+    rebar_grade = models.CharField(verbose_name="钢筋等级", max_length=64)
+    rebar_diameter = models.IntegerField(verbose_name="钢筋直径 mm")
+    quantity = models.IntegerField(verbose_name="钢筋根数", default=0)
+    total_length = models.FloatField(verbose_name="钢筋总长 mm", default=0)
+    weight = models.FloatField(verbose_name="钢筋重量 kg", default=0)
+
+    class Meta:
+        verbose_name = "工程量汇总钢筋用量"
+        verbose_name_plural = verbose_name
@@ -0,0 +1,142 @@
+"""
+测试及基准测试共用的典型楼梯设计参数:TestDetailed.test_logic 及IFC、BVBS 基准测试的样例楼梯
+均以此录入,修改后各处同时生效
+"""
+from stair_detailed.models import (
+    HoleDesignMode,
+    JointDesignMode,
+    StepSlotDesignMode,
+    WaterDripDesignMode,
+    HoleType,
+    WaterDripLayout,
+    WaterDripShape,
+    RebarDesignMode,
+    LiftingDesignMode,
+    DemoldingDesignMode,
+    RailDesignMode,
+    LiftingType,
+    PouringWay,
+    DemoldingType,
+    RailLayout,
+)
+
+# 结构设计参数
+STRUCTURE_PARAMETERS = dict(
+    rebar_name="HRB400",
+    concrete_grade=30,
+    protective_layer_thickness=20,
+    longitudinal_top_stress_bar_margin=25,
+    height=3000,
+    thickness=210,
+    weight=1280,
+    clear_span=4420,
+    top_top_length=500,
+    bottom_top_length=500,
+    steps_number=18,
+    live_load=3.5,
+    railing_load=0.0,
+    permanent_load_partial_factor=1.2,
+    live_load_load_partial_factor=1.4,
+    quasi_permanent_value_coefficient=0.4,
+    combined_value_coefficient=0.7,
+    reinforced_concrete_bulk_density=25,
+    crack=0.3,
+)
+
+# 深化设计参数
+DETAIL_PARAMETERS = dict(
+    width=1280,
+    top_to_length=500,
+    top_thickness=200,
+    top_b=0,
+    bottom_top_length=500,
+    bottom_thickness=200,
+    bottom_b=0,
+    hole_design_mode=HoleDesignMode.AUTOMATIC.value,
+    joint_design_mode=JointDesignMode.MANUAL.value,
+    step_slot_design_mode=StepSlotDesignMode.MANUAL.value,
+    water_drip_design_mode=WaterDripDesignMode.MANUAL.value,
+    top_hole_type=HoleType.FIXED_HINGE.value,
+    top_sliding_hinge_c1=70,
+    top_sliding_hinge_d1=55,
+    top_sliding_hinge_e1=65,
+    top_sliding_hinge_f1=50,
+    top_sliding_hinge_h1=50,
+    top_fix_hinge_c2=60,
+    top_fix_hinge_d2=50,
+    top_hole_position_a1=100,
+    top_hole_position_a2=100,
+    top_hole_position_b1=300,
+    top_hole_position_b2=300,
+    bottom_hole_type=HoleType.FIXED_HINGE.value,
+    bottom_sliding_hinge_c1=70,
+    bottom_sliding_hinge_d1=55,
+    bottom_sliding_hinge_e1=65,
+    bottom_sliding_hinge_f1=50,
+    bottom_sliding_hinge_h1=50,
+    bottom_fix_hinge_c2=60,
+    bottom_fix_hinge_d2=50,
+    bottom_hole_position_a1=100,
+    bottom_hole_position_a2=100,
+    bottom_hole_position_b1=300,
+    bottom_hole_position_b2=300,
+    top_joint_a=30,
+    top_joint_b=50,
+    top_joint_c=20,
+    bottom_joint_a=30,
+    bottom_joint_b=50,
+    bottom_joint_c=20,
+    step_slot_a=9,
+    step_slot_b=6,
+    step_slot_c=16,
+    step_slot_d=8,
+    step_slot_e=6,
+    step_slot_position_c1=50,
+    step_slot_position_c2=50,
+    step_slot_position_c3=21,
+    water_drip_layout=WaterDripLayout.BOTH.value,
+    water_drip_shape=WaterDripShape.TRAPEZOID.value,
+    water_drip_semicircle_a=10,
+    water_drip_semicircle_b=10,
+    water_drip_trapezoid_a=5,
+    water_drip_trapezoid_b=10,
+    water_drip_trapezoid_c=15,
+    water_drip_position_a1=15,
+    water_drip_position_a2=15,
+    water_drip_position_a3=20,
+    rebar_design_mode=RebarDesignMode.AUTOMATIC.value,
+    bottom_edge_longitudinal_rebar_diameter=12,
+    bottom_edge_longitudinal_rebar_spacing=210,
+    top_edge_longitudinal_rebar_diameter=12,
+    top_edge_longitudinal_rebar_spacing=210,
+    bottom_edge_stirrup_diameter=8,
+    bottom_edge_stirrup_spacing=130,
+    top_edge_stirrup_diameter=8,
+    top_edge_stirrup_spacing=130,
+    hole_reinforce_rebar_diameter=10,
+    hoisting_reinforce_rebar_diameter=10,
+    top_edge_reinforce_rebar_diameter=10,
+    bottom_edge_reinforce_rebar_diameter=10,
+    hoist_design_mode=LiftingDesignMode.AUTOMATIC.value,
+    demold_design_mode=DemoldingDesignMode.AUTOMATIC.value,
+    rail_design_mode=RailDesignMode.MANUAL.value,
+    hoist_type=LiftingType.ROUNDING_HEAD.value,
+    hoist_position_a=2,
+    hoist_position_b=10,
+    hoist_position_c=300,
+    hoist_position_d=300,
+    hoist_name="DJ-25-170",
+    pouring_way=PouringWay.VERTICAL_HORIZONTAL.value,
+    demold_type=DemoldingType.ANCHOR.value,
+    demold_position_a=600,
+    demold_position_b=600,
+    demold_position_c=300,
+    demold_position_d=300,
+    demold_position_t=20,
+    demold_name="DJ-25-170",
+    rail_layout=RailLayout.BOTH.value,
+    rail_number="2 4 6 8",
+    rail_name="M1",
+    rail_position_a=75,
+    rail_position_b=130,
+)
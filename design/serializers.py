@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from design import models
+from design.takeoff import group_project_rebar_takeoff
 
 
 class Structure(serializers.ModelSerializer):
@@ -52,3 +53,79 @@ class StructurePreSet(serializers.ModelSerializer):
             "top_b",
             "bottom_b",
         ]
+
+
+class QuantityTakeoffRebar(serializers.ModelSerializer):
+    class Meta:
+        model = models.QuantityTakeoffRebar
+        fields = [
+            "rebar_grade",
+            "rebar_diameter",
+            "quantity",
+            "total_length",
+            "weight",
+        ]
+
+
+class StairTakeoff(serializers.ModelSerializer):
+    project_num = serializers.CharField(source="stair.project_num", read_only=True)
+    component_num = serializers.CharField(source="stair.component_num", read_only=True)
+    rebars = QuantityTakeoffRebar(many=True, read_only=True)
+
+    class Meta:
+        model = models.QuantityTakeoff
+        fields = [
+            "id",
+            "stair",
+            "project_num",
+            "component_num",
+            "concrete_volume",
+            "steel_weight",
+            "hole_count",
+            "lifting_count",
+            "lifting_name",
+            "demolding_count",
+            "demolding_name",
+            "rail_count",
+            "update_time",
+            "rebars",
+        ]
+
+
+class ProjectTakeoffList(serializers.ListSerializer):
+    """
+    项目工程量汇总列表,当前页各项目的钢筋用量在一次查询中聚合
+    """
+
+    def to_representation(self, data):
+        rows = list(data)
+        self._context["project_rebars"] = group_project_rebar_takeoff(
+            row["stair__project_num"] for row in rows
+        )
+        return super().to_representation(rows)
+
+
+class ProjectTakeoff(serializers.Serializer):
+    """
+    项目工程量汇总,数据来自数据库聚合的结果
+    """
+
+    project_num = serializers.CharField(source="stair__project_num")
+    stair_count = serializers.IntegerField()
+    concrete_volume = serializers.FloatField()
+    steel_weight = serializers.FloatField()
+    hole_count = serializers.IntegerField()
+    lifting_count = serializers.IntegerField()
+    demolding_count = serializers.IntegerField()
+    rail_count = serializers.IntegerField()
+    rebars = serializers.SerializerMethodField()
+
+    class Meta:
+        list_serializer_class = ProjectTakeoffList
+
+    def get_rebars(self, obj):
+        project_num = obj["stair__project_num"]
+        project_rebars = self.context.get("project_rebars")
+        if project_rebars is None:
+            project_rebars = group_project_rebar_takeoff([project_num])
+        return project_rebars[project_num]
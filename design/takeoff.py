@@ -0,0 +1,227 @@
+"""
+工程量汇总:由钢筋排布结果计算楼梯的混凝土体积、钢筋重量及预埋件数量并保存,
+项目汇总在数据库中聚合,不需要生成IFC、BVBS 等导出文件
+"""
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Count, QuerySet, Sum
+
+from stair_detailed.geometry import get_stair_geometry
+from stair_detailed.models import PouringWay, RailDesignMode
+from stair_detailed.tools import get_volume
+from stair_for_bvbs.layout_data import data_for_bvbs_from_layout
+from stair_for_bvbs.models import RebarforBVBS
+from stair_rebar_bvbs.create_bvbs import get_bar_weight
+from stair_rebar_layout.models import RebarforBIM
+
+from . import models
+from .tools import BeforeFinalCall
+
+_logger = logging.getLogger(__name__)
+
+
+def calculate_rebar_takeoff(rebar_for_bvbs: RebarforBVBS) -> List[Dict]:
+    """
+    按钢筋等级、直径统计钢筋根数、总长及重量
+    Args:
+        rebar_for_bvbs: 楼梯的BVBS 钢筋数据
+
+    Returns:
+        按钢筋等级、直径排列的统计结果
+
+    """
+    totals: Dict[Tuple[str, int], Dict] = {}
+    for _, record in rebar_for_bvbs.iter_rebars():
+        if not record.rebar_quantity:
+            continue
+        key = (record.rebar_grade, int(record.rebar_diameter))
+        total = totals.setdefault(
+            key,
+            {
+                "rebar_grade": key[0],
+                "rebar_diameter": key[1],
+                "quantity": 0,
+                "total_length": 0.0,
+                "weight": 0.0,
+            },
+        )
+        total["quantity"] += record.rebar_quantity
+        total["total_length"] += record.rebar_length * record.rebar_quantity
+        total["weight"] += (
+            get_bar_weight(record.rebar_diameter, record.rebar_length)
+            * record.rebar_quantity
+        )
+    return [totals[key] for key in sorted(totals)]
+
+
+def calculate_concrete_volume(exchanged: BeforeFinalCall) -> float:
+    """
+    楼梯混凝土体积,与深化设计中的计算一致
+    Args:
+        exchanged:
+
+    Returns:
+        体积 m³
+
+    """
+    geometric = exchanged.structure_design.geometric
+    geometric_detailed = exchanged.detail_design.geometric_detailed
+    return get_volume(
+        steps_number=geometric.steps_number,
+        thickness=geometric.thickness,
+        cos=exchanged.structure_result.cos,
+        steps_h=exchanged.structure_result.steps_h,
+        steps_b=exchanged.structure_result.steps_b,
+        b0=geometric_detailed.width,
+        top_top_length=geometric_detailed.top_top_length,
+        top_thickness=geometric_detailed.top_thickness,
+        top_b=geometric_detailed.top_b,
+        bottom_top_length=geometric_detailed.bottom_top_length,
+        bottom_thickness=geometric_detailed.bottom_thickness,
+        bottom_b=geometric_detailed.bottom_b,
+        top_bottom_length=exchanged.detail_result.top_bottom_length,
+    )
+
+
+def calculate_embedded_parts(exchanged: BeforeFinalCall) -> Dict:
+    """
+    孔洞及预埋件的数量,与IFC 模型中的布置一致(使用深化设计结果中补全了自动计算参数的设计数据)
+    Args:
+        exchanged:
+
+    Returns:
+
+    """
+    detailed_design = exchanged.detail_result.detailed_design
+    geometry = get_stair_geometry(
+        exchanged.structure_design,
+        exchanged.structure_result,
+        detailed_design,
+        exchanged.detail_result,
+    )
+    inserts_detailed = detailed_design.inserts_detailed
+    if inserts_detailed.rail_design_mode == RailDesignMode.NO:
+        rail_count = 0
+    else:
+        rail_count = len(geometry.rail_positions)
+    # 卧式浇筑卧式脱模时使用吊装预埋件脱模,没有侧面脱模预埋件
+    if inserts_detailed.pouring_way == PouringWay.HORIZONTAL_HORIZONTAL:
+        demolding_count = 0
+    else:
+        demolding_count = len(geometry.demolding_positions[0])
+    return {
+        "hole_count": len(geometry.top_hole_positions)
+        + len(geometry.bottom_hole_positions),
+        "lifting_count": len(geometry.lifting_positions),
+        "lifting_name": exchanged.detail_result.lifting_name or "",
+        "demolding_count": demolding_count,
+        "demolding_name": (exchanged.detail_result.demolding_name or "")
+        if demolding_count
+        else "",
+        "rail_count": rail_count,
+    }
+
+
+def update_stair_takeoff(
+    rebar_row: models.RebarLayoutModel,
+    exchanged: Optional[BeforeFinalCall] = None,
+    rebar_for_bvbs: Optional[RebarforBVBS] = None,
+) -> models.QuantityTakeoff:
+    """
+    计算并保存楼梯的工程量汇总,已有的汇总结果被替换
+    Args:
+        rebar_row: 钢筋排布结果
+        exchanged: 已查询的设计数据,为空时由rebar_row 查询
+        rebar_for_bvbs: 已由rebar_row 生成的BVBS 钢筋数据,为空时重新转换
+
+    Returns:
+
+    """
+    if exchanged is None:
+        exchanged = BeforeFinalCall(rebar_row)
+    if rebar_for_bvbs is None:
+        rebar_for_bvbs = data_for_bvbs_from_layout(
+            exchanged.structure_design, RebarforBIM(**rebar_row.content)
+        )
+    rebars = calculate_rebar_takeoff(rebar_for_bvbs)
+    defaults = {
+        "concrete_volume": calculate_concrete_volume(exchanged),
+        "steel_weight": sum(rebar["weight"] for rebar in rebars),
+        **calculate_embedded_parts(exchanged),
+    }
+    with transaction.atomic():
+        takeoff, _ = models.QuantityTakeoff.objects.update_or_create(
+            defaults=defaults, stair=rebar_row.stair
+        )
+        takeoff.rebars.all().delete()
+        models.QuantityTakeoffRebar.objects.bulk_create(
+            [models.QuantityTakeoffRebar(takeoff=takeoff, **rebar) for rebar in rebars]
+        )
+    _logger.info(
+        f"楼梯{rebar_row.stair_id}工程量:混凝土{takeoff.concrete_volume:.3f}m³,"
+        f"钢筋{takeoff.steel_weight:.2f}kg"
+    )
+    return takeoff
+
+
+def project_takeoff_queryset() -> QuerySet:
+    """
+    按项目编号聚合的工程量汇总,在数据库中完成求和
+    Returns:
+
+    """
+    return (
+        models.QuantityTakeoff.objects.values("stair__project_num")
+        .annotate(
+            stair_count=Count("id"),
+            concrete_volume=Sum("concrete_volume"),
+            steel_weight=Sum("steel_weight"),
+            hole_count=Sum("hole_count"),
+            lifting_count=Sum("lifting_count"),
+            demolding_count=Sum("demolding_count"),
+            rail_count=Sum("rail_count"),
+        )
+        .order_by("stair__project_num")
+    )
+
+
+def project_rebar_takeoff_queryset(project_nums: Iterable[str]) -> QuerySet:
+    """
+    各项目按钢筋等级、直径聚合的钢筋用量,多个项目在一次查询中聚合
+    Args:
+        project_nums: 项目编号
+
+    Returns:
+
+    """
+    return (
+        models.QuantityTakeoffRebar.objects.filter(
+            takeoff__stair__project_num__in=list(project_nums)
+        )
+        .values("takeoff__stair__project_num", "rebar_grade", "rebar_diameter")
+        .annotate(
+            quantity=Sum("quantity"),
+            total_length=Sum("total_length"),
+            weight=Sum("weight"),
+        )
+        .order_by("takeoff__stair__project_num", "rebar_grade", "rebar_diameter")
+    )
+
+
+def group_project_rebar_takeoff(project_nums: Iterable[str]) -> Dict[str, List[Dict]]:
+    """
+    各项目的钢筋用量,按项目编号分组
+    Args:
+        project_nums: 项目编号
+
+    Returns:
+        {项目编号: [{rebar_grade, rebar_diameter, quantity, total_length, weight}]}
+    """
+    project_nums = list(project_nums)
+    grouped = {project_num: [] for project_num in project_nums}
+    for row in project_rebar_takeoff_queryset(project_nums):
+        project_num = row.pop("takeoff__stair__project_num")
+        grouped[project_num].append(row)
+    return grouped
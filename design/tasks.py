@@ -1,5 +1,7 @@
+import io
 import json
 import logging
+import tempfile
 import uuid
 import importlib
 import warnings
@@ -8,14 +10,16 @@ from dataclasses import asdict
 from celery import shared_task
 
 from django.contrib.auth.models import User
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 from django.contrib.admin.options import get_content_type_for_model
 from django.contrib.admin.models import LogEntry, CHANGE, ADDITION, settings
 
+from stair_for_bvbs.layout_data import data_for_bvbs_from_layout
 from stair_rebar_layout.models import RebarforBIM
 
 from . import models as db_models
 from .models import ModelDetailedResult, RebarLayoutModel
+from . import takeoff
 from . import tools
 from .tools import call_rebar_layout
 
@@ -68,31 +72,61 @@ def total_back_handle(_, detailed_result_id: int) -> None:
     # 预处理的数据
     logger.debug(rebar_row)
     exchanged = tools.BeforeFinalCall(rebar_row)
-    ifc_content = tools.call_ifc_create(exchanged, rebar_row)
-
+    # BVBS 钢筋数据只转换一次,工程量汇总与BVBS 增量生成共用
+    rebar_for_bvbs = data_for_bvbs_from_layout(exchanged.structure_design, rebar_bim)
+    # 工程量汇总只依赖钢筋排布结果,先于各导出文件保存
+    takeoff.update_stair_takeoff(rebar_row, exchanged, rebar_for_bvbs)
     export_manager, created = db_models.FileExport.objects.update_or_create(
         stair=detail_result_row.stair
     )
 
-    export_manager.ifc.save(
-        name=f"stair_{detail_result_row.stair.id}_{time_uuid}.ifc",
-        content=ContentFile(ifc_content),
-    )
-
-    # BVBS 生成
-    bvbs, zip_json = tools.make_call_bvbs(exchanged, rebar_row)
-    export_manager.bvbs.save(
-        name=f"stair_{detail_result_row.stair.id}_{time_uuid}.bvbs",
-        content=ContentFile(bvbs),
-    )
-    export_manager.zip_json.save(
-        name=f"stair_{detail_result_row.stair.id}_{time_uuid}.zip",
-        content=ContentFile(zip_json),
+    # IFC 流式写入临时文件后保存,避免在内存中保留整个文件字符串
+    with tempfile.TemporaryFile() as ifc_file:
+        ifc_stream = io.TextIOWrapper(ifc_file, encoding="utf-8", newline="")
+        tools.call_ifc_create_to_stream(exchanged, rebar_row, ifc_stream)
+        ifc_stream.flush()
+        ifc_file.seek(0)
+        export_manager.ifc.save(
+            name=f"stair_{detail_result_row.stair.id}_{time_uuid}.ifc",
+            content=File(ifc_file),
+        )
+        ifc_stream.detach()
+
+    # BVBS 及钢筋JSON 压缩文件:只重新生成排布结果有变化的钢筋组,全部未变化时保留已保存的文件
+    bvbs_state, changed_groups = tools.make_call_bvbs_incremental(
+        exchanged, rebar_row, export_manager.bvbs_state, rebar_for_bvbs
     )
+    if changed_groups or not export_manager.bvbs or not export_manager.zip_json:
+        bvbs_file, zip_file = tempfile.TemporaryFile(), tempfile.TemporaryFile()
+        with bvbs_file, zip_file:
+            bvbs_stream = io.TextIOWrapper(bvbs_file, encoding="utf-8", newline="")
+            tools.write_bvbs_outputs(bvbs_state, bvbs_stream, zip_file)
+            bvbs_stream.flush()
+            bvbs_file.seek(0)
+            export_manager.bvbs.save(
+                name=f"stair_{detail_result_row.stair.id}_{time_uuid}.bvbs",
+                content=File(bvbs_file),
+                save=False,
+            )
+            bvbs_stream.detach()
+            zip_file.seek(0)
+            export_manager.zip_json.save(
+                name=f"stair_{detail_result_row.stair.id}_{time_uuid}.zip",
+                content=File(zip_file),
+                save=False,
+            )
+    export_manager.bvbs_state = bvbs_state
+    export_manager.save()
 
     # DXF 文件生成调用  save dxf file
     try:
-        dxf_bytes_content = tools.make_call_dxf(exchanged, rebar_bim)
+        if settings.DXF_PROFILE_ENABLED:
+            # 性能分析报告写入日志,用于定位耗时较大的视图
+            dxf_bytes_content, _ = tools.make_call_dxf_with_profile(
+                exchanged, rebar_bim
+            )
+        else:
+            dxf_bytes_content = tools.make_call_dxf(exchanged, rebar_bim)
     except FileNotFoundError as e:
         logger.debug(f"模板文件缺失,不对其进行处理:{e}")
     else:
@@ -1,10 +1,19 @@
+import io
 import json
 import logging
+import math
 import os
-from unittest import skip, skipIf
+import uuid
+import zipfile
+from unittest import skip, skipIf, skipUnless
+from unittest.mock import Mock, patch
+from collections import Counter
 from datetime import datetime
-from dataclasses import asdict
+from dataclasses import asdict, replace
 
+import ezdxf
+import numpy as np
+from django.core.management import call_command
 from django.test import TestCase
 from django.forms.models import model_to_dict
 from django.core.files.base import ContentFile
@@ -12,20 +21,7 @@ from django.core.files.base import ContentFile
 from stair_detailed import __version__ as detailed_v
 from stair_detailed.models import (
     HoleDesignMode,
-    JointDesignMode,
-    StepSlotDesignMode,
-    WaterDripDesignMode,
-    HoleType,
-    WaterDripLayout,
-    WaterDripShape,
-    RebarDesignMode,
-    LiftingDesignMode,
-    DemoldingDesignMode,
-    RailDesignMode,
-    LiftingType as HoistType,
-    PouringWay,
-    DemoldingType as DemoldType,
-    RailLayout,
+    RailParameter,
     GeometricDetailed,
     RebarDetailed,
     RebarDiamSpac,
@@ -51,13 +47,82 @@ from stair_structure.model import (
     LoadData,
     LimitSetting,
     StructuralDesign,
+    RebarParameter,
 )
 from stair_structure.structure_calculation import structure_cal
 from stair_rebar_layout.Rebar_layout import rebar_layout
+from stair_rebar_layout.models import RebarforBIM
 
 from stair_for_bvbs.data_for_bvbs import data_for_bvbs
-from stair_rebar_bvbs.create_bvbs import create_bvbs, save_string_to_file
-from stair_rebar_bvbs.create_JSON import create_json, save_string_to_json_file
+from stair_for_bvbs.models import RebarforBVBS, RebarBVBS, RebarGeoBVBS
+from stair_for_bvbs.layout_data import (
+    data_for_bvbs_from_layout,
+    group_to_bvbs,
+)
+from stair_for_bvbs.tools import legs_to_geometric, polyline_legs, polylines_to_legs
+from stair_rebar_bvbs.cache import RebarOutputCache
+from stair_rebar_bvbs.create_bvbs import (
+    BVBS,
+    bvbs_checksum,
+    create_bvbs,
+    create_bvbs_record,
+    create_project_bvbs,
+    save_string_to_file,
+    write_bvbs,
+    write_bvbs_records,
+)
+from stair_rebar_bvbs.benchmark import benchmark_bvbs_writer, create_synthetic_schedule
+from stair_rebar_bvbs.create_JSON import (
+    create_json,
+    save_string_to_json_file,
+    write_zip_content_export,
+)
+from stair_rebar_bvbs.incremental import update_group_outputs, write_bvbs_from_state
+from stair_rebar_bvbs.cutting_stock import (
+    first_fit_decreasing,
+    optimize_project_cutting,
+    solve_exact,
+    summarize_cutting_plans,
+)
+
+import ifcopenshell.guid
+from OCC.Core.gp import gp_Pnt, gp_Ax2, gp_Dir, gp_Circ
+from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeEdge
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox
+from OCC.Core.GC import GC_MakeArcOfCircle
+from OCC.Core.GProp import GProp_GProps
+from OCC.Core.BRepGProp import brepgprop_VolumeProperties
+from OCC.Core.TopoDS import TopoDS_Compound
+from OCC.Extend.TopologyUtils import TopologyExplorer
+from stair_ifc.core import IfcDocument, GeometryLOD, encode_global_id
+from stair_ifc.create_ifc import (
+    StairIfcInput,
+    project_IFC_creation,
+    stair_IFC_creation,
+)
+from stair_ifc.writer import IfcStreamWriter, write_ifc_stream
+from stair_ifc.rebar_arc_point import rebar_arc, rebar_arc_batch
+from stair_ifc.get_data import StairData
+from stair_dxf.stair_design.countrebar import HoleLocation
+from stair_dxf.stair_generate_dxf import _DEFAULT_DXF_TEMPLATE, load_dxf_template
+from stair_dxf.generate_drawing.drawing_profile import (
+    DISCRETIZE,
+    HLR,
+    OCC_BOOLEAN,
+    DrawingProfile,
+    profile_section,
+)
+from stair_dxf.generate_drawing.dxf_drawing_generate.block_registry import (
+    insert_hoist_embedded_diagram,
+    insert_projected_part,
+)
+from stair_dxf.generate_drawing.occ_drawing.occ_expand_function import (
+    discretize_projected_edge,
+    general_cut_shape,
+    general_fuse_shape,
+    projected_edge_to_entity,
+)
+from dc_rebar import Rebar
 
 from design import models as db_models
 from .models import (
@@ -77,13 +142,19 @@ from .tools import (
     call_ifc_create,
 )
 from . import exchange
+from . import takeoff
+from . import ifc_benchmark
+from . import bvbs_benchmark
+from . import ifc_project_benchmark
+from .sample_parameters import DETAIL_PARAMETERS, STRUCTURE_PARAMETERS
 from design import layers
 
 _logger = logging.getLogger(__name__)
 
-HoistDesignMode = LiftingDesignMode
-DemoldDesignMode = DemoldingDesignMode
-
+# 基准测试耗时较长且受运行环境影响,默认不运行
+benchmark_test = skipUnless(
+    os.environ.get("RUN_BENCHMARKS"), "基准测试,设置环境变量RUN_BENCHMARKS=1 后运行"
+)
 
 # Create your tests here.
 
@@ -190,25 +261,7 @@ class TestDetailed(TestCase):
         """
 
         structure_parameters = ModelConstructionData.objects.create(
-            rebar_name="HRB400",
-            concrete_grade=30,
-            protective_layer_thickness=20,
-            longitudinal_top_stress_bar_margin=25,
-            height=3000,
-            thickness=210,
-            weight=1280,
-            clear_span=4420,
-            top_top_length=500,
-            bottom_top_length=500,
-            steps_number=18,
-            live_load=3.5,
-            railing_load=0.0,
-            permanent_load_partial_factor=1.2,
-            live_load_load_partial_factor=1.4,
-            quasi_permanent_value_coefficient=0.4,
-            combined_value_coefficient=0.7,
-            reinforced_concrete_bulk_density=25,
-            crack=0.3,
+            **STRUCTURE_PARAMETERS
         )
         # model instance
         structure_calculation_result: ModelConstructionResult = (
@@ -227,102 +280,7 @@ class TestDetailed(TestCase):
 
         # 录入深化设计参数
         detail_design_parameter = DetailData.objects.create(
-            stair=structure_parameters,
-            width=1280,
-            top_to_length=500,
-            top_thickness=200,
-            top_b=0,
-            bottom_top_length=500,
-            bottom_thickness=200,
-            bottom_b=0,
-            hole_design_mode=HoleDesignMode.AUTOMATIC.value,
-            joint_design_mode=JointDesignMode.MANUAL.value,
-            step_slot_design_mode=StepSlotDesignMode.MANUAL.value,
-            water_drip_design_mode=WaterDripDesignMode.MANUAL.value,
-            top_hole_type=HoleType.FIXED_HINGE.value,
-            top_sliding_hinge_c1=70,
-            top_sliding_hinge_d1=55,
-            top_sliding_hinge_e1=65,
-            top_sliding_hinge_f1=50,
-            top_sliding_hinge_h1=50,
-            top_fix_hinge_c2=60,
-            top_fix_hinge_d2=50,
-            top_hole_position_a1=100,
-            top_hole_position_a2=100,
-            top_hole_position_b1=300,
-            top_hole_position_b2=300,
-            bottom_hole_type=HoleType.FIXED_HINGE.value,
-            bottom_sliding_hinge_c1=70,
-            bottom_sliding_hinge_d1=55,
-            bottom_sliding_hinge_e1=65,
-            bottom_sliding_hinge_f1=50,
-            bottom_sliding_hinge_h1=50,
-            bottom_fix_hinge_c2=60,
-            bottom_fix_hinge_d2=50,
-            bottom_hole_position_a1=100,
-            bottom_hole_position_a2=100,
-            bottom_hole_position_b1=300,
-            bottom_hole_position_b2=300,
-            top_joint_a=30,
-            top_joint_b=50,
-            top_joint_c=20,
-            bottom_joint_a=30,
-            bottom_joint_b=50,
-            bottom_joint_c=20,
-            step_slot_a=9,
-            step_slot_b=6,
-            step_slot_c=16,
-            step_slot_d=8,
-            step_slot_e=6,
-            step_slot_position_c1=50,
-            step_slot_position_c2=50,
-            step_slot_position_c3=21,
-            # 滴水槽
-            water_drip_layout=WaterDripLayout.BOTH.value,
-            water_drip_shape=WaterDripShape.TRAPEZOID.value,
-            water_drip_semicircle_a=10,
-            water_drip_semicircle_b=10,
-            water_drip_trapezoid_a=5,
-            water_drip_trapezoid_b=10,
-            water_drip_trapezoid_c=15,
-            water_drip_position_a1=15,
-            water_drip_position_a2=15,
-            water_drip_position_a3=20,
-            rebar_design_mode=RebarDesignMode.AUTOMATIC.value,
-            bottom_edge_longitudinal_rebar_diameter=12,
-            bottom_edge_longitudinal_rebar_spacing=210,
-            top_edge_longitudinal_rebar_diameter=12,
-            top_edge_longitudinal_rebar_spacing=210,
-            bottom_edge_stirrup_diameter=8,
-            bottom_edge_stirrup_spacing=130,
-            top_edge_stirrup_diameter=8,
-            top_edge_stirrup_spacing=130,
-            hole_reinforce_rebar_diameter=10,
-            hoisting_reinforce_rebar_diameter=10,
-            top_edge_reinforce_rebar_diameter=10,
-            bottom_edge_reinforce_rebar_diameter=10,
-            hoist_design_mode=HoistDesignMode.AUTOMATIC.value,
-            demold_design_mode=DemoldDesignMode.AUTOMATIC.value,
-            rail_design_mode=RailDesignMode.MANUAL.value,
-            hoist_type=HoistType.ROUNDING_HEAD.value,
-            hoist_position_a=2,
-            hoist_position_b=10,
-            hoist_position_c=300,
-            hoist_position_d=300,
-            hoist_name="DJ-25-170",
-            pouring_way=PouringWay.VERTICAL_HORIZONTAL.value,
-            demold_type=DemoldType.ANCHOR.value,
-            demold_position_a=600,
-            demold_position_b=600,
-            demold_position_c=300,
-            demold_position_d=300,
-            demold_position_t=20,
-            demold_name="DJ-25-170",
-            rail_layout=RailLayout.BOTH.value,
-            rail_number="2 4 6 8",
-            rail_name="M1",
-            rail_position_a=75,
-            rail_position_b=130,
+            stair=structure_parameters, **DETAIL_PARAMETERS
         )
 
         design_result_instance = call_detailed_design_by_model(detail_design_parameter)
@@ -348,6 +306,275 @@ class TestDetailed(TestCase):
         )
         exchanged = tools.BeforeFinalCall(rebar_result)
         ifc_call_result = call_ifc_create(exchanged, rebar_result)
+        # 形状相同的钢筋共用类型:类型数少于钢筋数,钢筋几何以IfcMappedItem 引用类型几何
+        ifc_inputs = (
+            exchanged.structure_design,
+            exchanged.structure_result,
+            exchanged.detail_design,
+            exchanged.detail_result,
+            RebarforBIM(**rebar_result.content),
+        )
+        instanced_ifc = stair_IFC_creation(*ifc_inputs, rebar_instancing=True).ifcfile
+        rebar_count = len(instanced_ifc.by_type("IfcReinforcingBar"))
+        self.assertGreater(rebar_count, 0)
+        rebar_types = instanced_ifc.by_type("IfcReinforcingBarType")
+        self.assertLess(len(rebar_types), rebar_count)
+        for rebar in instanced_ifc.by_type("IfcReinforcingBar"):
+            items = rebar.Representation.Representations[0].Items
+            self.assertTrue(all(item.is_a("IfcMappedItem") for item in items))
+        plain_ifc = stair_IFC_creation(*ifc_inputs, rebar_instancing=False).ifcfile
+        self.assertEqual(len(plain_ifc.by_type("IfcReinforcingBar")), rebar_count)
+        self.assertEqual(plain_ifc.by_type("IfcReinforcingBarType"), [])
+        # 建模过程中逐组写出,已写出的实体未被修改:写出内容与建模完成后的文档一致
+        ifc_stream = io.StringIO()
+        with patch.object(
+            IfcStreamWriter, "flush", autospec=True, side_effect=IfcStreamWriter.flush
+        ) as flush:
+            streamed_doc = stair_IFC_creation(*ifc_inputs, stream=ifc_stream)
+        self.assertGreater(flush.call_count, 5)
+        self.assertEqual(
+            [
+                line
+                for line in streamed_doc.ifcfile.to_string().splitlines()
+                if not line.startswith("FILE_NAME")
+            ],
+            [
+                line
+                for line in ifc_stream.getvalue().splitlines()
+                if not line.startswith("FILE_NAME")
+            ],
+        )
+        # 项目级IFC 导出,同一项目编号下的楼梯写入同一文件
+        project_ifc = tools.call_project_ifc_create(
+            structure_parameters.project_num, io.StringIO()
+        ).getvalue()
+        self.assertEqual(project_ifc.count("=IFCSTAIR("), 1)
+        self.assertEqual(
+            tools.call_project_ifc_create(
+                structure_parameters.project_num, io.StringIO(), deterministic=True
+            ).getvalue(),
+            tools.call_project_ifc_create(
+                structure_parameters.project_num, io.StringIO(), deterministic=True
+            ).getvalue(),
+        )
+        # 多个楼梯共用楼层、材质及钢筋类型,钢筋类型关联各楼梯的钢筋
+        stair_input = StairIfcInput(*ifc_inputs)
+        single_ifc = project_IFC_creation([stair_input]).ifcfile
+        shared_ifc = project_IFC_creation(
+            [stair_input, replace(stair_input, name="stair-2")]
+        ).ifcfile
+        self.assertEqual(len(shared_ifc.by_type("IfcStair")), 2)
+        # 楼梯输入数据可逐个生成,以指纹键代替输入数据计算确定性GlobalId
+        generated_ifc = project_IFC_creation(
+            (replace(stair_input, name=f"stair-{index}") for index in range(2)),
+            deterministic=True,
+            fingerprint_keys=[1, 2],
+        ).ifcfile
+        self.assertEqual(len(generated_ifc.by_type("IfcStair")), 2)
+        storeys = shared_ifc.by_type("IfcBuildingStorey")
+        self.assertEqual(len(storeys), 1)
+        self.assertEqual(
+            sorted(
+                len(rel.RelatedElements)
+                for rel in shared_ifc.by_type("IfcRelContainedInSpatialStructure")
+                if rel.RelatingStructure == storeys[0]
+            ),
+            [1, 1],
+        )
+        for ifc_type in ("IfcMaterial", "IfcReinforcingBarType"):
+            self.assertEqual(
+                len(shared_ifc.by_type(ifc_type)),
+                len(single_ifc.by_type(ifc_type)),
+                ifc_type,
+            )
+        # 每个钢筋类型只有一个类型关联,包含两个楼梯的钢筋
+        for rebar_type in shared_ifc.by_type("IfcReinforcingBarType"):
+            self.assertEqual(len(rebar_type.Types), 1)
+        self.assertEqual(
+            sum(
+                len(rebar_type.Types[0].RelatedObjects)
+                for rebar_type in shared_ifc.by_type("IfcReinforcingBarType")
+            ),
+            len(shared_ifc.by_type("IfcReinforcingBar")),
+        )
+        self.assertEqual(
+            len(shared_ifc.by_type("IfcReinforcingBar")),
+            2 * len(single_ifc.by_type("IfcReinforcingBar")),
+        )
+        # BVBS 由钢筋排布结果生成,每组钢筋至少一条记录
+        bvbs, zip_json = tools.make_call_bvbs(exchanged, rebar_result)
+        self.assertGreaterEqual(len(bvbs.splitlines()), 12)
+        # 与按设计参数计算的RebarData 一致:外包尺寸(取整误差1mm 以内)、弯折方向、序号
+        rebar_for_bvbs = data_for_bvbs_from_layout(
+            exchanged.structure_design, RebarforBIM(**rebar_result.content)
+        )
+        from_layout = dict(rebar_for_bvbs.iter_rebars())
+        from_design = data_for_bvbs(
+            exchanged.structure_design,
+            exchanged.structure_result,
+            exchanged.detail_design,
+            exchanged.detail_result,
+        )
+        for attr, expected in from_design.iter_rebars():
+            actual = from_layout[attr]
+            self.assertEqual(actual.mark, expected.mark, attr)
+            self.assertEqual(actual.rebar_quantity, expected.rebar_quantity, attr)
+            self.assertEqual(len(actual.geometric), len(expected.geometric), attr)
+            for geo, expected_geo in zip(actual.geometric, expected.geometric):
+                self.assertLessEqual(abs(geo.length - expected_geo.length), 1, attr)
+            # 最后一段的角度不参与弯折
+            self.assertEqual(
+                [np.sign(geo.angle) for geo in actual.geometric[:-1]],
+                [np.sign(geo.angle) for geo in expected.geometric[:-1]],
+                attr,
+            )
+        # 流式导出与整体生成的内容一致
+        bvbs_stream, zip_stream = io.StringIO(), io.BytesIO()
+        write_bvbs(rebar_for_bvbs, bvbs_stream)
+        write_zip_content_export(*create_json(rebar_for_bvbs), zip_stream)
+        self.assertEqual(bvbs_stream.getvalue(), bvbs)
+        with zipfile.ZipFile(io.BytesIO(zip_json)) as expected, zipfile.ZipFile(
+            zip_stream
+        ) as streamed:
+            self.assertEqual(expected.namelist(), streamed.namelist())
+            for name in expected.namelist():
+                content = json.loads(streamed.read(name))
+                self.assertEqual(json.loads(expected.read(name)), content)
+                if name.startswith("read_"):
+                    self.assertEqual(content["finish"], content["plan"])
+        # 增量生成:首次生成全部钢筋组,结果与完整生成相同
+        bvbs_state, changed_groups = tools.make_call_bvbs_incremental(
+            exchanged, rebar_result
+        )
+        self.assertEqual(len(changed_groups), 12)
+        bvbs_stream, zip_stream = io.StringIO(), io.BytesIO()
+        tools.write_bvbs_outputs(bvbs_state, bvbs_stream, zip_stream)
+        self.assertEqual(bvbs_stream.getvalue(), bvbs)
+        with zipfile.ZipFile(io.BytesIO(zip_json)) as expected, zipfile.ZipFile(
+            zip_stream
+        ) as incremental:
+            self.assertEqual(expected.namelist(), incremental.namelist())
+            for name in expected.namelist():
+                self.assertEqual(expected.read(name), incremental.read(name))
+        # 使用已转换的BVBS 钢筋数据时结果相同
+        self.assertEqual(
+            tools.make_call_bvbs_incremental(
+                exchanged,
+                rebar_result,
+                rebar_for_bvbs=data_for_bvbs_from_layout(
+                    exchanged.structure_design, RebarforBIM(**rebar_result.content)
+                ),
+            ),
+            (bvbs_state, changed_groups),
+        )
+        # 只有中部分布筋变化时只重新生成该组
+        content = json.loads(json.dumps(rebar_result.content))
+        content["mid_rebar"] = content["mid_rebar"][:-1]
+        bvbs_state, changed_groups = update_group_outputs(
+            exchanged.structure_design, content, json.loads(json.dumps(bvbs_state))
+        )
+        self.assertEqual(changed_groups, ["mid_rebar"])
+        self.assertEqual(
+            write_bvbs_from_state(bvbs_state, io.StringIO()).getvalue(),
+            create_bvbs(
+                data_for_bvbs_from_layout(
+                    exchanged.structure_design, RebarforBIM(**content)
+                )
+            ),
+        )
+        # 项目级BVBS 导出
+        project_bvbs = tools.make_call_project_bvbs(
+            structure_parameters.project_num, io.StringIO()
+        ).getvalue()
+        self.assertTrue(project_bvbs.startswith("BF2D@"))
+        # 项目钢筋下料优化:项目中全部钢筋排入原材
+        cutting_plans, cutting_summary = tools.make_call_project_cutting_plan(
+            structure_parameters.project_num
+        )
+        self.assertTrue(cutting_plans)
+        self.assertEqual(
+            cutting_summary["piece_count"],
+            sum(record.rebar_quantity for record in from_layout.values()),
+        )
+        self.assertEqual(
+            cutting_summary["required_length"],
+            sum(
+                record.rebar_length * record.rebar_quantity
+                for record in from_layout.values()
+            ),
+        )
+        self.assertLessEqual(cutting_summary["utilization"], 1)
+        # 工程量汇总,项目汇总由数据库聚合
+        stair_takeoff = takeoff.update_stair_takeoff(rebar_result, exchanged)
+        self.assertAlmostEqual(
+            stair_takeoff.concrete_volume, design_result_instance.v, places=3
+        )
+        self.assertEqual(stair_takeoff.lifting_count, 4)
+        self.assertAlmostEqual(
+            stair_takeoff.steel_weight,
+            sum(rebar.weight for rebar in stair_takeoff.rebars.all()),
+        )
+        # 已有楼梯的工程量汇总由管理命令补充计算
+        stair_takeoff.delete()
+        call_command("backfill_takeoff", stdout=io.StringIO())
+        stair_takeoff = db_models.QuantityTakeoff.objects.get(stair=rebar_result.stair)
+        self.assertEqual(stair_takeoff.lifting_count, 4)
+        response = self.client.get(
+            "/design/takeoff/project",
+            {"project_num": structure_parameters.project_num},
+        )
+        self.assertEqual(response.status_code, 200)
+        project_row = response.json()["results"][0]
+        self.assertEqual(project_row["stair_count"], 1)
+        self.assertAlmostEqual(project_row["steel_weight"], stair_takeoff.steel_weight)
+        self.assertEqual(len(project_row["rebars"]), stair_takeoff.rebars.count())
+        # 当前页各项目的钢筋用量在一次查询中聚合
+        other_stair = ModelConstructionData.objects.create(
+            project_num=f"{structure_parameters.project_num}-2"
+        )
+        other_takeoff = db_models.QuantityTakeoff.objects.create(stair=other_stair)
+        db_models.QuantityTakeoffRebar.objects.create(
+            takeoff=other_takeoff, rebar_grade="HRB400", rebar_diameter=8, quantity=1
+        )
+        with self.assertNumQueries(3):
+            response = self.client.get("/design/takeoff/project")
+        project_rows = {row["project_num"]: row for row in response.json()["results"]}
+        self.assertEqual(len(project_rows[other_stair.project_num]["rebars"]), 1)
+        self.assertEqual(
+            project_rows[structure_parameters.project_num]["rebars"],
+            project_row["rebars"],
+        )
+        # 确定性模式下相同输入生成逐字节相同的IFC 文件
+        self.assertEqual(
+            call_ifc_create(exchanged, rebar_result, deterministic=True),
+            call_ifc_create(exchanged, rebar_result, deterministic=True),
+        )
+        # 简化几何保留全部钢筋及预埋件,文件更小
+        for lod in (GeometryLOD.SIMPLIFIED, GeometryLOD.BOUNDING_BOX):
+            lod_ifc = call_ifc_create(exchanged, rebar_result, lod=lod)
+            self.assertLess(len(lod_ifc), len(ifc_call_result))
+            for ifc_type in ("=IFCREINFORCINGBAR(", "=IFCELEMENTASSEMBLY("):
+                self.assertEqual(
+                    lod_ifc.count(ifc_type), ifc_call_result.count(ifc_type)
+                )
+        # IFC 与dxf 共用同一份楼梯几何数据
+        stair_data = StairData(
+            exchanged.structure_design,
+            exchanged.structure_result,
+            exchanged.detail_design,
+            exchanged.detail_result,
+        )
+        hole_location = HoleLocation(
+            exchanged.structure_design,
+            exchanged.detail_design,
+            exchanged.structure_result,
+            exchanged.detail_result,
+        )
+        self.assertIs(stair_data.geometry, hole_location.geometry)
+        self.assertEqual(
+            [[p.x, p.y, p.z] for p in hole_location.get_hole_loc()],
+            stair_data.get_bottom_hole_position() + stair_data.get_top_hole_position(),
+        )
         file_exports = db_models.FileExport(
             stair=structure_parameters,
         )
@@ -368,25 +595,7 @@ class TestDetailed(TestCase):
 
         """
         structure_parameters = ModelConstructionData.objects.create(
-            rebar_name="HRB400",
-            concrete_grade=30,
-            protective_layer_thickness=20,
-            longitudinal_top_stress_bar_margin=25,
-            height=3000,
-            thickness=210,
-            weight=1280,
-            clear_span=4420,
-            top_top_length=500,
-            bottom_top_length=500,
-            steps_number=18,
-            live_load=3.5,
-            railing_load=0.0,
-            permanent_load_partial_factor=1.2,
-            live_load_load_partial_factor=1.4,
-            quasi_permanent_value_coefficient=0.4,
-            combined_value_coefficient=0.7,
-            reinforced_concrete_bulk_density=25,
-            crack=0.3,
+            **STRUCTURE_PARAMETERS
         )
         # model instance
         structure_calculation_result: ModelConstructionResult = (
@@ -406,106 +615,584 @@ class TestDetailed(TestCase):
         # 录入深化设计参数
         detail_design_parameter = DetailData.objects.create(
             stair=structure_parameters,
-            width=1280,
-            top_to_length=500,
-            top_thickness=200,
-            top_b=0,
-            bottom_top_length=500,
-            bottom_thickness=200,
-            bottom_b=0,
-            hole_design_mode=HoleDesignMode.MANUAL.value,
-            joint_design_mode=JointDesignMode.MANUAL.value,
-            step_slot_design_mode=StepSlotDesignMode.MANUAL.value,
-            water_drip_design_mode=WaterDripDesignMode.MANUAL.value,
-            top_hole_type=HoleType.FIXED_HINGE.value,
-            top_sliding_hinge_c1=70,
-            top_sliding_hinge_d1=55,
-            top_sliding_hinge_e1=65,
-            top_sliding_hinge_f1=50,
-            top_sliding_hinge_h1=50,
-            top_fix_hinge_c2=60,
-            top_fix_hinge_d2=50,
-            top_hole_position_a1=100,
-            top_hole_position_a2=100,
-            top_hole_position_b1=300,
-            top_hole_position_b2=300,
-            bottom_hole_type=HoleType.FIXED_HINGE.value,
-            bottom_sliding_hinge_c1=70,
-            bottom_sliding_hinge_d1=55,
-            bottom_sliding_hinge_e1=65,
-            bottom_sliding_hinge_f1=50,
-            bottom_sliding_hinge_h1=50,
-            bottom_fix_hinge_c2=60,
-            bottom_fix_hinge_d2=50,
-            bottom_hole_position_a1=100,
-            bottom_hole_position_a2=100,
-            bottom_hole_position_b1=300,
-            bottom_hole_position_b2=300,
-            top_joint_a=30,
-            top_joint_b=50,
-            top_joint_c=20,
-            bottom_joint_a=30,
-            bottom_joint_b=50,
-            bottom_joint_c=20,
-            step_slot_a=9,
-            step_slot_b=6,
-            step_slot_c=16,
-            step_slot_d=8,
-            step_slot_e=6,
-            step_slot_position_c1=50,
-            step_slot_position_c2=50,
-            step_slot_position_c3=21,
-            # 滴水槽
-            water_drip_layout=WaterDripLayout.BOTH.value,
-            water_drip_shape=WaterDripShape.TRAPEZOID.value,
-            water_drip_semicircle_a=10,
-            water_drip_semicircle_b=10,
-            water_drip_trapezoid_a=5,
-            water_drip_trapezoid_b=10,
-            water_drip_trapezoid_c=15,
-            water_drip_position_a1=15,
-            water_drip_position_a2=15,
-            water_drip_position_a3=20,
-            rebar_design_mode=RebarDesignMode.AUTOMATIC.value,
-            bottom_edge_longitudinal_rebar_diameter=12,
-            bottom_edge_longitudinal_rebar_spacing=210,
-            top_edge_longitudinal_rebar_diameter=12,
-            top_edge_longitudinal_rebar_spacing=210,
-            bottom_edge_stirrup_diameter=8,
-            bottom_edge_stirrup_spacing=130,
-            top_edge_stirrup_diameter=8,
-            top_edge_stirrup_spacing=130,
-            hole_reinforce_rebar_diameter=10,
-            hoisting_reinforce_rebar_diameter=10,
-            top_edge_reinforce_rebar_diameter=10,
-            bottom_edge_reinforce_rebar_diameter=10,
-            hoist_design_mode=HoistDesignMode.AUTOMATIC.value,
-            demold_design_mode=DemoldDesignMode.AUTOMATIC.value,
-            rail_design_mode=RailDesignMode.MANUAL.value,
-            hoist_type=HoistType.ROUNDING_HEAD.value,
-            hoist_position_a=2,
-            hoist_position_b=10,
-            hoist_position_c=300,
-            hoist_position_d=300,
-            hoist_name="DJ-25-170",
-            pouring_way=PouringWay.VERTICAL_HORIZONTAL.value,
-            demold_type=DemoldType.ANCHOR.value,
-            demold_position_a=600,
-            demold_position_b=600,
-            demold_position_c=300,
-            demold_position_d=300,
-            demold_position_t=20,
-            demold_name="DJ-25-170",
-            rail_layout=RailLayout.BOTH.value,
-            rail_number="2 4 6 8",
-            rail_name="M1",
-            rail_position_a=75,
-            rail_position_b=130,
+            **dict(DETAIL_PARAMETERS, hole_design_mode=HoleDesignMode.MANUAL.value),
         )
 
         design_result_instance = call_detailed_design_by_model(detail_design_parameter)
 
 
+class TestIfcEntityPool(TestCase):
+    @staticmethod
+    def create_primitives(ifc_doc: IfcDocument):
+        """
+        模拟孔洞、防滑槽、预埋件中重复出现的点、方向和坐标系
+        """
+        placements = []
+        for i in range(10):
+            placements.append(
+                ifc_doc.create_IfcAxis2Placement3D(
+                    origin=[0.0, 0.0, 0.0], z=[1.0, 0.0, 0.0], x=[0.0, 1.0, 0.0]
+                )
+            )
+            placements.append(
+                ifc_doc.create_IfcAxis2Placement3D(
+                    origin=[100.0 * (i % 2), 50.0, -0.0],
+                    z=[0.0, 0.0, -1.0],
+                    x=[1.0, 0.0, 0.0],
+                )
+            )
+        return placements
+
+    @staticmethod
+    def placement_geometry(placement):
+        return (
+            tuple(placement.Location.Coordinates),
+            tuple(placement.Axis.DirectionRatios),
+            tuple(placement.RefDirection.DirectionRatios),
+        )
+
+    def test_pool_reduces_entities_and_keeps_geometry(self):
+        doc_without_pool = IfcDocument(entity_pool=False)
+        doc_with_pool = IfcDocument(entity_pool=True)
+        placements_without_pool = self.create_primitives(doc_without_pool)
+        placements_with_pool = self.create_primitives(doc_with_pool)
+
+        for ifc_type in ("IfcCartesianPoint", "IfcDirection", "IfcAxis2Placement3D"):
+            self.assertLess(
+                len(doc_with_pool.ifcfile.by_type(ifc_type)),
+                len(doc_without_pool.ifcfile.by_type(ifc_type)),
+            )
+        # 相同的坐标系复用同一实体
+        self.assertEqual(placements_with_pool[0].id(), placements_with_pool[2].id())
+        self.assertEqual(
+            [self.placement_geometry(p) for p in placements_without_pool],
+            [self.placement_geometry(p) for p in placements_with_pool],
+        )
+
+
+class TestIfcGlobalId(TestCase):
+    def test_encoder_matches_ifcopenshell(self):
+        for _ in range(100):
+            value = uuid.uuid4()
+            self.assertEqual(
+                encode_global_id(value.int), ifcopenshell.guid.compress(value.hex)
+            )
+
+    def test_deterministic_global_id(self):
+        first = IfcDocument(global_id_namespace="stair-a").ifcfile.to_string()
+        second = IfcDocument(global_id_namespace="stair-a").ifcfile.to_string()
+        other = IfcDocument(global_id_namespace="stair-b").ifcfile.to_string()
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+
+
+class TestIfcStreamWriter(TestCase):
+    def test_stream_matches_to_string(self):
+        ifc_doc = IfcDocument()
+        ifc_doc.create_site()
+        stream_content = write_ifc_stream(ifc_doc, io.StringIO()).getvalue()
+        # 文件头中的时间戳不同,不参与比较
+        self.assertEqual(
+            [
+                line
+                for line in ifc_doc.ifcfile.to_string().splitlines()
+                if not line.startswith("FILE_NAME")
+            ],
+            [
+                line
+                for line in stream_content.splitlines()
+                if not line.startswith("FILE_NAME")
+            ],
+        )
+
+
+class TestRebarArcBatch(TestCase):
+    @staticmethod
+    def make_rebar(radius, points, segments=None):
+        return Rebar(
+            radius=radius,
+            poly={
+                "points": [{"x": x, "y": y, "z": z} for x, y, z in points],
+                "segments": segments or [],
+            },
+        )
+
+    def test_batch_parity_with_scalar(self):
+        rebars = [
+            self.make_rebar(5, [(0, 0, 0), (0, 0, 1000)]),  # 直筋
+            self.make_rebar(6, [(0, 0, 300), (0, 0, 0), (2000, 0, 800)]),  # 单弯折
+            self.make_rebar(  # 空间多弯折
+                4,
+                [
+                    (0, 0, 0),
+                    (0, 500, 0),
+                    (300, 500, 200),
+                    (300, 900, 900),
+                    (0, 900, 900),
+                ],
+            ),
+            self.make_rebar(  # 已给出分段
+                6,
+                [(0, 0, 0), (100, 0, 0), (110, 10, 0), (110, 100, 0)],
+                segments=[[1, 2], [2, 3, 4]],
+            ),
+        ]
+        for rebar_grade in (1, 2, 3):
+            batch_rebars = rebar_arc_batch(rebars, rebar_grade)
+            self.assertEqual(len(batch_rebars), len(rebars))
+            for rebar, batch_rebar in zip(rebars, batch_rebars):
+                scalar_rebar = rebar_arc(rebar, rebar_grade)
+                self.assertEqual(scalar_rebar.radius, batch_rebar.radius)
+                self.assertEqual(scalar_rebar.seg_s, batch_rebar.seg_s)
+                self.assertEqual(len(scalar_rebar.points), len(batch_rebar.points))
+                for scalar_point, batch_point in zip(
+                    scalar_rebar.points, batch_rebar.points
+                ):
+                    for a, b in zip(scalar_point, batch_point):
+                        self.assertAlmostEqual(a, b, places=6)
+
+
+class TestProjectBVBS(TestCase):
+    @staticmethod
+    def create_rebar(mark, quantity, length=1000):
+        return RebarBVBS(
+            project_ID="P",
+            stair_ID=str(mark),
+            mark=mark,
+            rebar_length=length,
+            rebar_quantity=quantity,
+            rebar_diameter=12,
+            rebar_grade="HRB400",
+            mandrel_diameter=60,
+            geometric=[RebarGeoBVBS(length=length, angle=0)],
+        )
+
+    def test_same_shapes_are_aggregated(self):
+        stairs = [
+            RebarforBVBS(
+                bottom_rebar=self.create_rebar(1, 7),
+                top_rebar=self.create_rebar(2, 5, length=1200),
+            ),
+            RebarforBVBS(
+                bottom_rebar=self.create_rebar(1, 3),
+                top_rebar=self.create_rebar(2, 2, length=1000.0),
+            ),
+        ]
+        stream = io.StringIO()
+        schedule = create_project_bvbs(iter(stairs), "P1", stream)
+        self.assertEqual(schedule.stair_count, 2)
+        self.assertEqual(
+            [(r.mark, r.rebar_quantity) for r in schedule.records.values()],
+            [(1, 12), (2, 5)],
+        )
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("@HjP1@r1@", lines[0])
+        self.assertIn("@n12@", lines[0])
+
+
+class TestBVBSWriter(TestCase):
+    def test_checksum_matches_character_sum(self):
+        for record in ("BF2D@Hj1@r1@i@p1@l1000@n1@", "BF2D@Hj楼梯@r1@"):
+            self.assertEqual(
+                bvbs_checksum(record), 96 - sum(ord(c) for c in record) % 32
+            )
+
+    def test_synthetic_schedule_benchmark(self):
+        records = create_synthetic_schedule(100)
+        stream = io.StringIO()
+        self.assertEqual(write_bvbs_records(records, stream), 100)
+        self.assertEqual(
+            stream.getvalue(), "".join(create_bvbs_record(r) for r in records)
+        )
+        result = benchmark_bvbs_writer(10000, repeat=1)
+        self.assertGreater(result["records_per_second"], 0)
+
+
+class TestCuttingStock(TestCase):
+    def test_exact_improves_first_fit_decreasing(self):
+        pieces = [6000, 5000, 5000, 4500, 2000, 1500]
+        bins = first_fit_decreasing(Counter(pieces), 12000)
+        self.assertEqual(len(bins), 3)
+        exact, optimal = solve_exact(pieces, 12000, upper_bound=len(bins))
+        self.assertTrue(optimal)
+        self.assertEqual(len(exact), 2)
+        self.assertEqual(sorted(sum(exact, [])), sorted(pieces))
+        # 超出搜索节点数时不视为最优解
+        _, optimal = solve_exact(pieces, 12000, upper_bound=len(bins), max_nodes=3)
+        self.assertFalse(optimal)
+
+    def test_project_plan_covers_all_pieces(self):
+        records = create_synthetic_schedule(600)
+        plans = optimize_project_cutting(records, stock_lengths=(9000, 12000), kerf=3)
+        self.assertEqual(
+            sum(plan.piece_count for plan in plans),
+            sum(r.rebar_quantity for r in records),
+        )
+        for plan in plans:
+            for pattern in plan.patterns:
+                self.assertLessEqual(
+                    sum(pattern.cuts) + plan.kerf * (len(pattern.cuts) - 1),
+                    plan.stock_length,
+                )
+        summary = summarize_cutting_plans(plans)
+        self.assertGreater(summary["utilization"], 0.9)
+
+
+class TestBVBSOutputCache(TestCase):
+    def test_same_shape_reuses_output(self):
+        records = create_synthetic_schedule(24)
+        expected = [
+            BVBS(
+                project_number=r.project_ID,
+                schedule_number=r.stair_ID,
+                bar_mark=str(r.mark),
+                bar_length=str(r.rebar_length),
+                bar_quantity=str(r.rebar_quantity),
+                bar_diameter=str(r.rebar_diameter),
+                steel_grade=r.rebar_grade,
+                mandrel_diameter=str(r.mandrel_diameter),
+            ).create_BF2D(Geometry_block=r.geometric)
+            for r in records
+        ]
+        cache = RebarOutputCache()
+        self.assertEqual([create_bvbs_record(r, cache) for r in records], expected)
+        # 箍筋形状相同,只生成一次
+        self.assertEqual(cache.misses, 24 - 8 + 1)
+        # 90 与90.0 相等,输出不同,不共用缓存
+        record = records[2]
+        float_record = RebarBVBS(
+            **dict(
+                asdict(record),
+                geometric=[
+                    RebarGeoBVBS(length=geo.length, angle=float(geo.angle))
+                    for geo in record.geometric
+                ],
+            )
+        )
+        self.assertIn("w90.0@", create_bvbs_record(float_record, cache))
+        self.assertIn("w90@", create_bvbs_record(record, cache))
+
+
+class TestBVBSFromLayout(TestCase):
+    @staticmethod
+    def create_u_bar(x_start, x_end):
+        return Rebar(
+            radius=5,
+            poly={
+                "points": [
+                    {"x": x_start, "y": 0, "z": 100},
+                    {"x": x_start, "y": 0, "z": 0},
+                    {"x": x_end, "y": 0, "z": 0},
+                    {"x": x_end, "y": 0, "z": 100},
+                ]
+            },
+        )
+
+    def test_legs_and_mirrored_bars(self):
+        lengths, angles = polylines_to_legs(
+            np.array(
+                [
+                    [[0, 0, 0], [0, 300, 0], [0, 300, 400]],
+                    [[0, 0, 0], [0, 300, 0], [0, 300, -400]],
+                ],
+                dtype=float,
+            ),
+            [(0, 1), (1, 2)],
+        )
+        self.assertEqual(lengths.tolist(), [[300, 400], [300, 400]])
+        self.assertEqual(angles.tolist(), [[90, 0], [-90, 0]])
+
+        # 两端反向描述的U 形钢筋为同一形状,各段为外包尺寸
+        records = group_to_bvbs(
+            [self.create_u_bar(0, 1000), self.create_u_bar(1000, 0)],
+            3,
+            "P",
+            "S",
+            RebarParameter.by_name("HRB400"),
+        )
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].rebar_quantity, 2)
+        self.assertEqual(records[0].rebar_length, 1220)
+        self.assertEqual(
+            [(geo.length, abs(geo.angle)) for geo in records[0].geometric],
+            [(105, 90), (1010, 90), (105, 0)],
+        )
+
+    def test_polyline_legs_outside_dimensions(self):
+        # 封闭箍筋每段两端均为弯折,各段加一个钢筋直径
+        stirrup = [[0, 0, 0], [0, 300, 0], [0, 300, 200], [0, 0, 200], [0, 0, 0]]
+        lengths, angles = polyline_legs(stirrup, 10, normal=(1, 0, 0))
+        self.assertEqual(lengths.tolist(), [310, 210, 310, 210])
+        self.assertEqual(
+            [(geo.length, geo.angle) for geo in legs_to_geometric(lengths, angles)],
+            [(310, 90), (210, 90), (310, 90), (210, 0)],
+        )
+        # 批量计算,自由端不加长度
+        lengths, angles = polyline_legs(
+            [[[0, 0, 0], [0, 300, 0], [0, 300, 400]]] * 2, np.array([8, 12])
+        )
+        self.assertEqual(lengths.tolist(), [[304, 404], [306, 406]])
+        self.assertEqual(angles.tolist(), [[90, 0], [90, 0]])
+        # 两段之间为弧段(U 形钢筋),直线段已算至弯弧起点,不加长度
+        lengths, angles = polyline_legs(
+            [[0, 0, 0], [0, 300, 0], [0, 360, 60], [0, 300, 120], [0, 0, 120]],
+            10,
+            normal=(1, 0, 0),
+            line_segments=[(0, 1), (3, 4)],
+        )
+        self.assertEqual(lengths.tolist(), [300, 300])
+        self.assertEqual(angles.tolist(), [180, 0])
+
+
+@benchmark_test
+class TestIfcBenchmark(TestCase):
+    def test_no_regression(self):
+        """
+        IFC 生成的耗时、实体数量、文件大小及峰值内存不超过基准结果的阈值;
+        设置环境变量IFC_BENCHMARK_UPDATE=1 时重新生成基准
+        :return:
+        """
+        results = ifc_benchmark.run_ifc_benchmark()
+        self.assertEqual(set(results), set(ifc_benchmark.BENCHMARK_CASES))
+        if os.environ.get("IFC_BENCHMARK_UPDATE") == "1":
+            ifc_benchmark.save_baseline(results)
+            return
+        baseline = ifc_benchmark.load_baseline()
+        self.assertTrue(
+            baseline,
+            f"基准文件{ifc_benchmark.BASELINE_PATH}不存在,"
+            f"设置环境变量IFC_BENCHMARK_UPDATE=1 生成",
+        )
+        regressions = ifc_benchmark.compare_with_baseline(results, baseline)
+        self.assertEqual(regressions, [], "\n".join(regressions))
+
+
+@benchmark_test
+class TestBVBSExportBenchmark(TestCase):
+    def test_synthetic_projects(self):
+        """
+        1、50、500 个楼梯的合成项目导出BVBS 及钢筋JSON 压缩文件,输出随楼梯数量增长;
+        钢筋排布耗时较长,基础楼梯只使用simple 样例
+        :return:
+        """
+        results = bvbs_benchmark.run_bvbs_export_benchmark(
+            repeat=1, cases={"simple": ifc_benchmark.BENCHMARK_CASES["simple"]}
+        )
+        self.assertEqual(list(results), [1, 50, 500])
+        for stair_count, result in results.items():
+            self.assertEqual(result["stair_count"], stair_count)
+            self.assertGreater(result["record_count"], stair_count)
+            self.assertGreater(result["stairs_per_second"], 0)
+            self.assertGreater(result["peak_memory"], 0)
+        self.assertLess(results[50]["bvbs_bytes"], results[500]["bvbs_bytes"])
+        self.assertLess(results[50]["zip_bytes"], results[500]["zip_bytes"])
+
+
+@benchmark_test
+class TestProjectIfcBenchmark(TestCase):
+    def test_synthetic_projects(self):
+        """
+        1、10、100 个楼梯的合成项目流式导出IFC,楼层、材质及钢筋类型不随楼梯数量增长
+        :return:
+        """
+        results = ifc_project_benchmark.run_project_ifc_benchmark()
+        self.assertEqual(list(results), [1, 10, 100])
+        for stair_count, result in results.items():
+            self.assertEqual(result["stair_count"], stair_count)
+            self.assertEqual(result["storey_count"], 1)
+            self.assertGreater(result["stairs_per_second"], 0)
+            self.assertGreater(result["peak_memory"], 0)
+        self.assertEqual(results[10]["material_count"], results[100]["material_count"])
+        self.assertEqual(
+            results[10]["rebar_type_count"], results[100]["rebar_type_count"]
+        )
+        self.assertLess(results[10]["entity_count"], results[100]["entity_count"])
+        self.assertLess(results[10]["output_bytes"], results[100]["output_bytes"])
+
+
+class TestOccBoolean(TestCase):
+    @staticmethod
+    def get_volume(shape):
+        props = GProp_GProps()
+        brepgprop_VolumeProperties(shape, props)
+        return props.Mass()
+
+    def test_fuse_and_cut(self):
+        # 没有形状时(如不设置栏杆预埋件)返回空的复合体,单个形状直接返回
+        empty = general_fuse_shape([])
+        self.assertIsInstance(empty, TopoDS_Compound)
+        self.assertEqual(TopologyExplorer(empty).number_of_solids(), 0)
+        box = BRepPrimAPI_MakeBox(gp_Pnt(0, 0, 0), 10, 10, 10).Shape()
+        self.assertIs(general_fuse_shape([box]), box)
+        # 一次布尔并运算合并相互重叠的实体
+        fused = general_fuse_shape(
+            [
+                BRepPrimAPI_MakeBox(gp_Pnt(x, 0, 0), 10, 10, 10).Shape()
+                for x in (0, 5, 10)
+            ]
+        )
+        self.assertAlmostEqual(self.get_volume(fused), 2000, places=6)
+        self.assertEqual(TopologyExplorer(fused).number_of_solids(), 1)
+        # 一次布尔差运算挖去全部工具形状
+        self.assertIs(general_cut_shape(fused, []), fused)
+        cut = general_cut_shape(
+            fused,
+            [BRepPrimAPI_MakeBox(gp_Pnt(x, 2, 2), 2, 2, 2).Shape() for x in (2, 12)],
+        )
+        self.assertAlmostEqual(self.get_volume(cut), 2000 - 2 * 8, places=6)
+
+
+class TestProjectedEdge(TestCase):
+    @staticmethod
+    def make_arc(*points):
+        return BRepBuilderAPI_MakeEdge(
+            GC_MakeArcOfCircle(*(gp_Pnt(*point) for point in points)).Value()
+        ).Edge()
+
+    def assert_arc(self, entity, start_angle, end_angle):
+        self.assertEqual(entity["type"], "ARC")
+        self.assertAlmostEqual(entity["radius"], 5)
+        self.assertAlmostEqual(entity["start_angle"], start_angle)
+        self.assertAlmostEqual(entity["end_angle"], end_angle)
+
+    def test_line_circle_arc(self):
+        line = BRepBuilderAPI_MakeEdge(gp_Pnt(0, 0, 0), gp_Pnt(10, 0, 0)).Edge()
+        self.assertEqual(
+            projected_edge_to_entity(line),
+            {"type": "LINE", "start": (0, 0, 0), "end": (10, 0, 0)},
+        )
+        self.assertEqual(len(discretize_projected_edge(line)), 2)
+
+        circle = BRepBuilderAPI_MakeEdge(
+            gp_Circ(gp_Ax2(gp_Pnt(1, 2, 0), gp_Dir(0, 0, 1)), 5)
+        ).Edge()
+        self.assertEqual(
+            projected_edge_to_entity(circle),
+            {"type": "CIRCLE", "center": (1, 2, 0), "radius": 5},
+        )
+        # 整圆的离散点首尾重合,按折线绘制时没有缺口
+        points = discretize_projected_edge(circle)
+        self.assertGreater(len(points), 3)
+        self.assertEqual(points[0], points[-1])
+
+        middle = (5 * math.cos(math.pi / 4), 5 * math.sin(math.pi / 4), 0)
+        # 逆时针圆弧,0 度至90 度
+        self.assert_arc(
+            projected_edge_to_entity(self.make_arc((5, 0, 0), middle, (0, 5, 0))),
+            0,
+            90,
+        )
+        # 顺时针圆弧的轴线沿-Z 方向,dxf 中仍按逆时针绘制同一段圆弧
+        self.assert_arc(
+            projected_edge_to_entity(self.make_arc((0, 5, 0), middle, (5, 0, 0))),
+            0,
+            90,
+        )
+
+
+class TestDxfTemplate(TestCase):
+    def test_template_copies_are_independent(self):
+        template = ezdxf.readfile(_DEFAULT_DXF_TEMPLATE)
+        first = load_dxf_template()
+        first.modelspace().add_line((0, 0), (1, 1))
+        first.layers.add("TEST")
+        # 由缓存的模板标签建立的文档与模板相同,互不影响
+        second = load_dxf_template()
+        self.assertEqual(len(second.modelspace()), len(template.modelspace()))
+        self.assertNotIn("TEST", second.layers)
+        self.assertEqual(
+            sorted(layer.dxf.name for layer in second.layers),
+            sorted(layer.dxf.name for layer in template.layers),
+        )
+        self.assertEqual(
+            sorted(block.name for block in second.blocks),
+            sorted(block.name for block in template.blocks),
+        )
+
+
+class TestBlockRegistry(TestCase):
+    def test_same_parameters_reuse_block(self):
+        dxf_doc = ezdxf.new()
+        msp = dxf_doc.modelspace()
+        block_count = len(dxf_doc.blocks)
+        first = insert_hoist_embedded_diagram(msp, (0, 0, 0), 20, 30, "A", "B")
+        second = insert_hoist_embedded_diagram(msp, (100, 0, 0), 20.0, 30, "A", "B")
+        # 相同参数的第二次插入复用已有图块
+        self.assertEqual(first.dxf.name, second.dxf.name)
+        self.assertEqual(len(dxf_doc.blocks), block_count + 1)
+        self.assertEqual(len(dxf_doc.blocks.get(first.dxf.name)), 4)
+        self.assertEqual(len(msp), 2)
+        third = insert_hoist_embedded_diagram(msp, (200, 0, 0), 25, 30, "A", "B")
+        self.assertNotEqual(third.dxf.name, first.dxf.name)
+        self.assertEqual(len(dxf_doc.blocks), block_count + 2)
+
+    def test_projected_part_projects_once(self):
+        dxf_doc = ezdxf.new()
+        msp = dxf_doc.modelspace()
+        rail = RailParameter(
+            name="M1", a=100, b=100, c=80, d=80, t=8, fi=8, depth=20, length=140
+        )
+        entities = [
+            {"type": "LINE", "start": (0, 0, 0), "end": (100, 0, 0)},
+            {"type": "CIRCLE", "center": (0, 0, 0), "radius": 50},
+        ]
+        project = Mock(return_value=entities)
+        first = insert_projected_part(msp, "rail", rail, project, (0, 0), 100, "A")
+        second = insert_projected_part(
+            msp, "rail", replace(rail), project, (10, 0), 100, "A", rotation=90
+        )
+        # 相同型号的预埋件只投影一次,以块参照平移或旋转插入
+        project.assert_called_once_with()
+        self.assertEqual(first.dxf.name, second.dxf.name)
+        self.assertEqual(second.dxf.rotation, 90)
+        block = dxf_doc.blocks.get(first.dxf.name)
+        self.assertEqual([entity.dxftype() for entity in block], ["LINE", "CIRCLE"])
+        self.assertAlmostEqual(block[0].dxf.end.x, 1)
+        third = insert_projected_part(
+            msp, "rail", replace(rail, fi=10), project, (20, 0), 100, "A"
+        )
+        self.assertNotEqual(third.dxf.name, first.dxf.name)
+        self.assertEqual(project.call_count, 2)
+
+
+class TestDrawingProfile(TestCase):
+    def test_nested_sections_and_dxf_remainder(self):
+        dxf_doc = ezdxf.new()
+        profile = DrawingProfile(dxf_doc)
+        # 依次为:视图开始、布尔开始、离散开始、离散结束、布尔结束、视图结束
+        clock = iter([0.0, 1.0, 2.0, 5.0, 7.0, 10.0])
+        with patch(
+            "stair_dxf.generate_drawing.drawing_profile.time.perf_counter",
+            lambda: next(clock),
+        ):
+            with profile.record("view", "main_run_process"):
+                with profile_section(OCC_BOOLEAN):
+                    with profile_section(DISCRETIZE):
+                        pass
+                dxf_doc.modelspace().add_line((0, 0), (1, 1))
+                dxf_doc.modelspace().add_circle((0, 0), 1)
+        report = profile.report()
+        view = report["views"][0]
+        self.assertEqual(view["elapsed"], 10.0)
+        self.assertEqual(view["stages"], {"main_run_process": 10.0})
+        # 外层布尔运算扣除内层离散的耗时,其余时间计入ezdxf 图元创建
+        self.assertEqual(view[OCC_BOOLEAN], 3.0)
+        self.assertEqual(view[DISCRETIZE], 3.0)
+        self.assertEqual(view[HLR], 0.0)
+        self.assertEqual(view["dxf"], 4.0)
+        self.assertEqual(view["entities"], 2)
+        self.assertEqual(report["total"]["dxf"], 4.0)
+
+    def test_section_without_profile(self):
+        profile = DrawingProfile()
+        # 未处于视图记录中时计时段不做统计
+        with profile_section(HLR):
+            pass
+        self.assertEqual(profile.records, [])
+        self.assertEqual(profile.report()["views"], [])
+
+
 class TestCelery(TestCase):
     @skip(f"测试暂时跳过对队列的调用,本地开发环境中rabbit mq 服务异常")
     def test_task_call(self):
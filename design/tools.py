@@ -3,11 +3,22 @@ Date&Time           2022/8/4 12:22
 Author              HaoLan
 
 """
+import hashlib
 import os
 import logging
 import warnings
 from dataclasses import asdict
-from typing import IO, Optional, Tuple
+from typing import (
+    IO,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
 from traceback import format_exc
 
 from stair_rebar_layout.models import RebarforBIM
@@ -27,13 +38,35 @@ from stair_structure.structure_calculation import (
     structure_cal,
 )
 
-from stair_for_bvbs.data_for_bvbs import data_for_bvbs
-from stair_rebar_bvbs.create_bvbs import create_bvbs
+from stair_for_bvbs.layout_data import data_for_bvbs_from_layout
+from stair_for_bvbs.models import RebarforBVBS
+from stair_rebar_bvbs.create_bvbs import (
+    ProjectBVBSSchedule,
+    create_bvbs,
+    create_project_bvbs,
+)
+from stair_rebar_bvbs.incremental import (
+    update_group_outputs,
+    write_bvbs_from_state,
+    write_zip_from_state,
+)
+from stair_rebar_bvbs.cutting_stock import (
+    DEFAULT_STOCK_LENGTHS,
+    CuttingPlan,
+    optimize_project_cutting,
+    summarize_cutting_plans,
+)
 from stair_rebar_bvbs.create_JSON import create_json, make_zip_content_export
 
-from stair_ifc.create_ifc import stair_IFC_creation
+from stair_ifc.create_ifc import (
+    stair_IFC_creation,
+    project_IFC_creation,
+    StairIfcInput,
+)
+from stair_ifc.core import GeometryLOD
 
 from stair_dxf.stair_generate_dxf import stair_generate_dxf
+from stair_dxf.generate_drawing.drawing_profile import DrawingProfile
 
 from . import exchange
 from . import models
@@ -293,13 +326,18 @@ class BeforeFinalCall:
 
 
 def call_ifc_create(
-    exchanged: BeforeFinalCall, rebar_result: models.RebarLayoutModel
+    exchanged: BeforeFinalCall,
+    rebar_result: models.RebarLayoutModel,
+    deterministic: bool = False,
+    lod: GeometryLOD = GeometryLOD.FULL,
 ) -> str:
     """
     orm 数据到IFC content str 的调用生成
     Args:
         exchanged: 数据层转换结果
         rebar_result: 对IFC 调用需要钢筋数据,这是最后生成的
+        deterministic: 相同输入是否生成逐字节相同的文件,便于缓存与比对
+        lod: 几何详细程度,仅需混凝土主体和预埋件位置时可使用简化几何
 
     Returns:
 
@@ -311,15 +349,102 @@ def call_ifc_create(
         exchanged.detail_design,
         exchanged.detail_result,
         rebar_for_bim,
+        deterministic=deterministic,
+        lod=lod,
     )
     return ifc_content.ifcfile.to_string()
 
 
+def call_ifc_create_to_stream(
+    exchanged: BeforeFinalCall, rebar_result: models.RebarLayoutModel, stream: TextIO
+) -> TextIO:
+    """
+    orm 数据到IFC 的调用生成,建模过程中逐组将实体流式写入文件句柄,不生成整个文件的字符串
+    Args:
+        exchanged: 数据层转换结果
+        rebar_result: 对IFC 调用需要钢筋数据,这是最后生成的
+        stream: 文本文件句柄
+
+    Returns:
+
+    """
+    rebar_for_bim = RebarforBIM(**rebar_result.content)
+    stair_IFC_creation(
+        exchanged.structure_design,
+        exchanged.structure_result,
+        exchanged.detail_design,
+        exchanged.detail_result,
+        rebar_for_bim,
+        stream=stream,
+    )
+    return stream
+
+
+def call_project_ifc_create(
+    project_num: str, stream: TextIO, deterministic: bool = False
+) -> TextIO:
+    """
+    项目级IFC 导出:项目编号下已完成钢筋排布的全部楼梯按楼梯id 顺序写入同一个IFC 文件,
+    逐个楼梯读取数据并建模,不同时保留全部楼梯的输入数据
+    Args:
+        project_num: 项目编号,对应ModelConstructionData.project_num
+        stream: 文本文件句柄
+        deterministic: 是否生成确定性的GlobalId,指纹由各楼梯的id 及钢筋数据摘要计算
+
+    Returns:
+
+    """
+    rebar_results = (
+        models.RebarLayoutModel.objects.filter(stair__project_num=project_num)
+        .select_related("stair")
+        .order_by("stair_id")
+    )
+    fingerprint_keys = None
+    if deterministic:
+        fingerprint_keys = [
+            (stair_id, hashlib.sha1(repr(content).encode("utf-8")).hexdigest())
+            for stair_id, content in rebar_results.values_list(
+                "stair_id", "content"
+            ).iterator()
+        ]
+    _logger.info(f"项目{project_num}共{rebar_results.count()}个楼梯写入IFC")
+    project_IFC_creation(
+        (
+            _project_stair_ifc_input(rebar_result)
+            for rebar_result in rebar_results.iterator()
+        ),
+        stream=stream,
+        deterministic=deterministic,
+        fingerprint_keys=fingerprint_keys,
+    )
+    return stream
+
+
+def _project_stair_ifc_input(rebar_result: models.RebarLayoutModel) -> StairIfcInput:
+    """
+    由已存储的钢筋排布结果生成项目级IFC 导出中单个楼梯的输入数据
+    Args:
+        rebar_result: 钢筋排布结果,需关联楼梯
+
+    Returns:
+
+    """
+    exchanged = BeforeFinalCall(rebar_result)
+    return StairIfcInput(
+        structure_design=exchanged.structure_design,
+        structure_design_result=exchanged.structure_result,
+        detailed_design=exchanged.detail_design,
+        detailed_design_result=exchanged.detail_result,
+        rebar_data=RebarforBIM(**rebar_result.content),
+        name=rebar_result.stair.component_num or "预制混凝土楼梯",
+    )
+
+
 def make_call_bvbs(
     exchanged: BeforeFinalCall, rebar_result: models.RebarLayoutModel
 ) -> Tuple[str, bytes]:
     """
-    计算bvbs数据
+    计算bvbs数据,由已存储的钢筋排布结果直接转换,与IFC 中的钢筋一致
     Args:
         exchanged:
         rebar_result:
@@ -327,11 +452,8 @@ def make_call_bvbs(
     Returns:
 
     """
-    rebar_for_bvbs = data_for_bvbs(
-        exchanged.structure_design,
-        exchanged.structure_result,
-        exchanged.detail_design,
-        exchanged.detail_result,
+    rebar_for_bvbs = data_for_bvbs_from_layout(
+        exchanged.structure_design, RebarforBIM(**rebar_result.content)
     )
     rebar_data_ascii_strings = create_bvbs(rebar_for_bvbs)
     file_name, write_rebar, read_rebar = create_json(rebar_for_bvbs)
@@ -339,12 +461,127 @@ def make_call_bvbs(
     return rebar_data_ascii_strings, zip_content
 
 
-def make_call_dxf(exchanged: BeforeFinalCall, rebar_data: RebarforBIM) -> bytes:
+def make_call_bvbs_incremental(
+    exchanged: BeforeFinalCall,
+    rebar_result: models.RebarLayoutModel,
+    bvbs_state: Optional[Dict] = None,
+    rebar_for_bvbs: Optional[RebarforBVBS] = None,
+) -> Tuple[Dict, List[str]]:
+    """
+    增量计算bvbs数据:只重新生成排布结果有变化的钢筋组,其余钢筋组使用上次保存的内容
+    Args:
+        exchanged:
+        rebar_result:
+        bvbs_state: 上次保存的分组生成结果,即FileExport.bvbs_state
+        rebar_for_bvbs: 已由rebar_result 生成的BVBS 钢筋数据,为空时按需转换有变化的钢筋组
+
+    Returns:
+        本次的分组生成结果,重新生成的钢筋组名称
+
+    """
+    return update_group_outputs(
+        exchanged.structure_design,
+        rebar_result.content,
+        bvbs_state,
+        rebar_for_bvbs=rebar_for_bvbs,
+    )
+
+
+def write_bvbs_outputs(bvbs_state: Dict, bvbs_stream: TextIO, zip_file: BinaryIO):
+    """
+    由分组生成结果拼接BVBS 及钢筋JSON 压缩文件,内容与完整生成相同
+    Args:
+        bvbs_state: make_call_bvbs_incremental 返回的分组生成结果
+        bvbs_stream: 文本文件句柄
+        zip_file: 二进制文件句柄
+
+    Returns:
+
+    """
+    write_bvbs_from_state(bvbs_state, bvbs_stream)
+    write_zip_from_state(bvbs_state, zip_file)
+
+
+def iter_project_rebar_for_bvbs(project_num: str) -> Iterator[RebarforBVBS]:
+    """
+    依次计算项目编号下已完成钢筋排布的各楼梯的BVBS 钢筋数据,不同时保留全部楼梯的钢筋数据
+    Args:
+        project_num: 项目编号,对应ModelConstructionData.project_num
+
+    Returns:
+
+    """
+    rebar_results = (
+        models.RebarLayoutModel.objects.filter(stair__project_num=project_num)
+        .select_related("stair")
+        .order_by("stair_id")
+    )
+    for rebar_result in rebar_results.iterator():
+        structure_design = StructuralDesign(
+            **dict(
+                exchange.structure.StructureDataSerializer(
+                    instance=rebar_result.stair
+                ).data
+            )
+        )
+        yield data_for_bvbs_from_layout(
+            structure_design, RebarforBIM(**rebar_result.content)
+        )
+
+
+def make_call_project_bvbs(project_num: str, stream: TextIO) -> TextIO:
+    """
+    项目级BVBS 导出:项目编号下已完成钢筋排布的全部楼梯写入同一个钢筋表,形状相同的钢筋合并
+    Args:
+        project_num: 项目编号,对应ModelConstructionData.project_num
+        stream: 文本文件句柄
+
+    Returns:
+
+    """
+    schedule = create_project_bvbs(
+        iter_project_rebar_for_bvbs(project_num), project_num, stream
+    )
+    _logger.info(
+        f"项目{project_num}共{schedule.stair_count}个楼梯合并为{len(schedule.records)}条BVBS 记录"
+    )
+    return stream
+
+
+def make_call_project_cutting_plan(
+    project_num: str,
+    stock_lengths: Sequence[int] = DEFAULT_STOCK_LENGTHS,
+    kerf: int = 0,
+) -> Tuple[List[CuttingPlan], Dict]:
+    """
+    项目钢筋下料优化:汇总项目下全部楼梯的钢筋,按钢筋等级、直径在定尺原材上排料
+    Args:
+        project_num: 项目编号,对应ModelConstructionData.project_num
+        stock_lengths: 可选的原材长度(mm)
+        kerf: 每次切割的损耗(mm)
+
+    Returns:
+        各钢筋等级、直径的下料方案,余料统计
+
+    """
+    schedule = ProjectBVBSSchedule(project_num)
+    for rebar_for_bvbs in iter_project_rebar_for_bvbs(project_num):
+        schedule.add_stair(rebar_for_bvbs)
+    plans = optimize_project_cutting(schedule.records.values(), stock_lengths, kerf)
+    return plans, summarize_cutting_plans(plans)
+
+
+def make_call_dxf(
+    exchanged: BeforeFinalCall,
+    rebar_data: RebarforBIM,
+    drawing_profile: Optional[DrawingProfile] = None,
+) -> bytes:
     """
     调用dxf 文件生成函数
     Args:
         rebar_data:
         exchanged:
+        drawing_profile: 性能分析记录,传入时统计各视图的耗时和图元数量
 
     Returns:
 
@@ -356,6 +593,7 @@ def make_call_dxf(exchanged: BeforeFinalCall, rebar_data: RebarforBIM) -> bytes:
             exchanged.detail_design,
             exchanged.detail_result,
             rebar_data,
+            drawing_profile=drawing_profile,
         )
     except Exception as e:
         # TODO(bigpangl@163.com):待内部相对稳定后,删除外层,为了调试提供数据所做的输出
@@ -368,3 +606,23 @@ def make_call_dxf(exchanged: BeforeFinalCall, rebar_data: RebarforBIM) -> bytes:
     else:
         bytes_content.seek(0)
         return bytes_content.read()
+
+
+def make_call_dxf_with_profile(
+    exchanged: BeforeFinalCall, rebar_data: RebarforBIM, log_profile: bool = True
+) -> Tuple[bytes, Dict]:
+    """
+    调用dxf 文件生成函数,同时返回各视图的耗时及图元数量分析报告
+    Args:
+        exchanged:
+        rebar_data:
+        log_profile: 是否将分析报告写入日志
+
+    Returns:
+
+    """
+    drawing_profile = DrawingProfile()
+    dxf_bytes_content = make_call_dxf(exchanged, rebar_data, drawing_profile)
+    if log_profile:
+        _logger.info(f"dxf 生成性能分析:\n{drawing_profile.format_report()}")
+    return dxf_bytes_content, drawing_profile.report()
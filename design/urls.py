@@ -30,5 +30,15 @@ urlpatterns = [
         "presetmodel",
         views.PreSetModelAPI.as_view({"get": "list"}),
         name="preset_model_list",
-    )
+    ),
+    path(
+        "takeoff/stair",
+        views.StairTakeoffAPI.as_view({"get": "list"}),
+        name="stair_takeoff_list",
+    ),
+    path(
+        "takeoff/project",
+        views.ProjectTakeoffAPI.as_view({"get": "list"}),
+        name="project_takeoff_list",
+    ),
 ]
@@ -3,6 +3,7 @@ from django.views import View
 from rest_framework import pagination
 from rest_framework.viewsets import ModelViewSet
 from .tools import api_to_word, call_design_book
+from .takeoff import project_takeoff_queryset
 from design import models, serializers
 from .models import ModelConstructionResult, ModelDetailedResult, ModelConstructionData, PreSetModelData
 
@@ -65,3 +66,52 @@ class PreSetModelAPI(ModelViewSet):
         response = super().list(request, *args, **kwargs)
         response.headers.setdefault("Access-Control-Allow-Origin", "*")
         return response
+
+
+class StairTakeoffAPI(ModelViewSet):
+    """
+    楼梯工程量汇总,可按project_num 筛选
+    """
+
+    queryset = (
+        models.QuantityTakeoff.objects.select_related("stair")
+        .prefetch_related("rebars")
+        .order_by("stair_id")
+    )
+    pagination_class = DefaultLimitOffsetPagination
+    permission_classes = []
+    serializer_class = serializers.StairTakeoff
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        project_num = self.request.query_params.get("project_num")
+        if project_num is not None:
+            queryset = queryset.filter(stair__project_num=project_num)
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        response.headers.setdefault("Access-Control-Allow-Origin", "*")
+        return response
+
+
+class ProjectTakeoffAPI(ModelViewSet):
+    """
+    项目工程量汇总,各楼梯的汇总结果在数据库中聚合
+    """
+
+    pagination_class = DefaultLimitOffsetPagination
+    permission_classes = []
+    serializer_class = serializers.ProjectTakeoff
+
+    def get_queryset(self):
+        queryset = project_takeoff_queryset()
+        project_num = self.request.query_params.get("project_num")
+        if project_num is not None:
+            queryset = queryset.filter(stair__project_num=project_num)
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        response.headers.setdefault("Access-Control-Allow-Origin", "*")
+        return response
@@ -0,0 +1,329 @@
+"""
+楼梯几何数据:由结构设计和深化设计结果计算楼梯主体轮廓、孔洞、防滑槽、滴水线槽及预埋件的定位,
+IFC 建模(stair_ifc)、钢筋排布的碰撞检测(stair_rebar_layout)和dxf 图纸(stair_dxf)共用同一份计算结果
+坐标系:x 为楼梯宽度方向,y 为纵向(由底端到顶端),z 为高度方向,原点为楼梯底端右下角
+"""
+import hashlib
+from collections import OrderedDict
+from functools import cached_property
+from typing import List, Tuple
+
+from stair_structure.model import StructuralDesign, StructuralDesignResult
+from stair_detailed.models import DetailedDesign, DetailedDesignResult
+
+# 缓存的楼梯数量,同一次生成流程中IFC、dxf、钢筋排布的输入相同,共用缓存结果
+GEOMETRY_CACHE_SIZE = 32
+_GEOMETRY_CACHE: "OrderedDict[str, StairGeometry]" = OrderedDict()
+
+
+class StairGeometry(object):
+    """
+    楼梯几何数据,各项结果首次使用时计算,之后直接返回;调用方不应修改返回的列表
+    """
+
+    def __init__(
+        self,
+        structure_design: StructuralDesign,
+        structure_design_result: StructuralDesignResult,
+        detailed_design: DetailedDesign,
+        detailed_design_result: DetailedDesignResult,
+    ):
+        self.structure_design = structure_design
+        self.structure_design_result = structure_design_result
+        self.detailed_design = detailed_design
+        self.detailed_design_result = detailed_design_result
+
+        self.steps_number = structure_design.geometric.steps_number
+        self.steps_h = structure_design_result.steps_h
+        self.steps_b = structure_design_result.steps_b
+        self.width = detailed_design.geometric_detailed.width
+        self.top_b = detailed_design.geometric_detailed.top_b  # 上部挑耳
+        self.bottom_b = detailed_design.geometric_detailed.bottom_b  # 下部挑耳
+        self.bottom_thickness = detailed_design.geometric_detailed.bottom_thickness
+        self.top_thickness = detailed_design.geometric_detailed.top_thickness
+        self.bottom_top_length = detailed_design.geometric_detailed.bottom_top_length
+        self.top_bottom_length = detailed_design_result.top_bottom_length
+        self.bottom_bottom_length = detailed_design_result.bottom_bottom_length
+        self.ln = structure_design.geometric.clear_span
+        self.l_total = detailed_design_result.l_total  # 纵向总长
+        self.h_total = detailed_design_result.h_total  # 楼梯总高度
+        self.tan = detailed_design_result.tan
+        self.cos = detailed_design_result.cos
+        self.sin = detailed_design_result.sin
+
+    @cached_property
+    def step_points(self) -> List[List[float]]:
+        """
+        楼梯主体侧面轮廓角点(y, z),顶端和底端挑耳除外,以楼梯立面图右下角为初始点,逆时针方向前进,首尾相连
+        前2 * steps_number + 3 个点为底端板、踏步及顶端板上表面
+        :return:
+        """
+        geometry_points = [
+            [0.0, 0.0],
+            [0.0, float(self.bottom_thickness)],
+            [float(self.bottom_top_length), float(self.bottom_thickness)],
+        ]
+        for i in range(self.steps_number - 1):
+            geometry_points.append(
+                [
+                    self.bottom_top_length + i * self.steps_b,
+                    self.bottom_thickness + (i + 1) * self.steps_h,
+                ]
+            )
+            geometry_points.append(
+                [
+                    self.bottom_top_length + (i + 1) * self.steps_b,
+                    self.bottom_thickness + (i + 1) * self.steps_h,
+                ]
+            )
+        geometry_points = geometry_points + [
+            [float(self.bottom_top_length + self.ln), float(self.h_total)],
+            [float(self.l_total), float(self.h_total)],
+            [float(self.l_total), float(self.h_total - self.top_thickness)],
+            [
+                float(self.l_total - self.top_bottom_length),
+                float(self.h_total - self.top_thickness),
+            ],
+            [float(self.bottom_bottom_length), 0.0],
+            [0.0, 0.0],
+        ]
+        return geometry_points
+
+    @cached_property
+    def top_hole_positions(self) -> List[List[float]]:
+        """
+        顶端销键或连接孔洞的位置,以孔洞下边缘的圆心为标志点,由左到右
+        :return:
+        """
+        top_hole_position = self.detailed_design.construction_detailed.top_hole_position
+        return [
+            [
+                float(top_hole_position.b2),
+                float(self.l_total - top_hole_position.a2),
+                float(self.h_total - self.top_thickness),
+            ],
+            [
+                float(self.width - top_hole_position.b1),
+                float(self.l_total - top_hole_position.a1),
+                float(self.h_total - self.top_thickness),
+            ],
+        ]
+
+    @cached_property
+    def bottom_hole_positions(self) -> List[List[float]]:
+        """
+        底端销键或连接孔洞的位置,以孔洞下边缘的圆心为标志点,由左到右
+        :return:
+        """
+        bottom_hole_position = (
+            self.detailed_design.construction_detailed.bottom_hole_position
+        )
+        return [
+            [float(bottom_hole_position.b4), float(bottom_hole_position.a4), 0.0],
+            [
+                float(self.width - bottom_hole_position.b3),
+                float(bottom_hole_position.a3),
+                0.0,
+            ],
+        ]
+
+    @cached_property
+    def step_slot_positions(self) -> List[List[float]]:
+        """
+        各踏步防滑槽组的位置:防滑槽组右侧边缘,由底端到顶端
+        :return:
+        """
+        step_slot_position = self.detailed_design.construction_detailed.step_slot_position
+        init_position = [
+            float(step_slot_position.c1),
+            float(self.bottom_top_length + step_slot_position.c3),
+            float(self.bottom_thickness),
+        ]
+        return [
+            [
+                init_position[0],
+                init_position[1] + float(num * self.steps_b),
+                init_position[2] + float((num + 1) * self.steps_h),
+            ]
+            for num in range(self.steps_number)
+        ]
+
+    @cached_property
+    def water_drip_curves(self) -> List[List[List[float]]]:
+        """
+        滴水线槽路径,上部(x 较大一侧)在前
+        :return:
+        """
+        water_drip_position = self.detailed_design.construction_detailed.water_drip_position
+        water_drip_layout = self.detailed_design.construction_detailed.water_drip_layout
+        a1 = water_drip_position.a1
+        a2 = water_drip_position.a2
+        a3 = water_drip_position.a3
+        top_curve = [
+            [float(self.width + self.bottom_b), float(a2), 0.0],
+            [float(self.width - a3), float(a2), 0.0],
+            [float(self.width - a3), float(self.bottom_bottom_length), 0.0],
+            [
+                float(self.width - a3),
+                float(self.l_total - self.top_bottom_length),
+                float(self.h_total - self.top_thickness),
+            ],
+            [
+                float(self.width - a3),
+                float(self.l_total - a1),
+                float(self.h_total - self.top_thickness),
+            ],
+            [
+                float(self.width + self.top_b),
+                float(self.l_total - a1),
+                float(self.h_total - self.top_thickness),
+            ],
+        ]
+        bottom_curve = [
+            [0.0, float(a2), 0.0],
+            [float(a3), float(a2), 0.0],
+            [float(a3), float(self.bottom_bottom_length), 0.0],
+            [
+                float(a3),
+                float(self.l_total - self.top_bottom_length),
+                float(self.h_total - self.top_thickness),
+            ],
+            [
+                float(a3),
+                float(self.l_total - a1),
+                float(self.h_total - self.top_thickness),
+            ],
+            [
+                0.0,
+                float(self.l_total - a1),
+                float(self.h_total - self.top_thickness),
+            ],
+        ]
+        if water_drip_layout.value == 0:  # 只有上部
+            return [top_curve]
+        if water_drip_layout.value == 1:  # 只有下部
+            return [bottom_curve]
+        return [top_curve, bottom_curve]
+
+    @cached_property
+    def rail_positions(self) -> List[List[float]]:
+        """
+        栏杆预埋件的位置:栏杆上表面中心,栏杆布置侧为上楼梯方向的左右侧
+        :return:
+        """
+        inserts_detailed = self.detailed_design.inserts_detailed
+        rail_number = inserts_detailed.rail_number  # 栏杆所在的阶数
+        x_a = inserts_detailed.rail_position.a  # 横向边距
+        y_b = inserts_detailed.rail_position.b  # 纵向距离台阶
+        rail_layout = inserts_detailed.rail_layout
+        if rail_layout.value == 0:  # ONLY_RIGHT = 0 ONLY_LEFT = 1   BOTH = 2
+            position_x = [float(self.width - x_a)]
+        elif rail_layout.value == 1:
+            position_x = [float(x_a)]
+        else:
+            position_x = [float(x_a), float(self.width - x_a)]
+        return [
+            [
+                x,
+                float(self.bottom_top_length + i * self.steps_b - y_b),
+                float(self.bottom_thickness + i * self.steps_h),
+            ]
+            for x in position_x
+            for i in rail_number
+        ]
+
+    @cached_property
+    def lifting_positions(self) -> List[List[float]]:
+        """
+        吊装预埋件的位置:预埋件上部中心点,顺序为左侧底端、左侧顶端、右侧底端、右侧顶端
+        :return:
+        """
+        lifting_position = self.detailed_design.inserts_detailed.lifting_position
+        edge_a = (
+            self.bottom_top_length + (lifting_position.a - 0.5) * self.steps_b
+        )  # 吊装预埋件顶端纵向边距
+        edge_b = (
+            self.bottom_top_length + (lifting_position.b - 0.5) * self.steps_b
+        )  # 吊装预埋件底端纵向边距
+        top_h = self.bottom_thickness + lifting_position.a * self.steps_h
+        bottom_h = self.bottom_thickness + lifting_position.b * self.steps_h
+        position_x = [
+            float(lifting_position.c),
+            float(self.width - float(lifting_position.d)),
+        ]
+        position_y = [float(edge_b), float(edge_a)]
+        position_z = [float(bottom_h), float(top_h)]
+        return [
+            [position_x[0], position_y[0], position_z[0]],
+            [position_x[0], position_y[1], position_z[1]],
+            [position_x[1], position_y[0], position_z[0]],
+            [position_x[1], position_y[1], position_z[1]],
+        ]
+
+    @cached_property
+    def demolding_positions(
+        self,
+    ) -> Tuple[List[List[float]], List[float], List[float]]:
+        """
+        侧面脱模预埋件的位置(侧面上的中心点,顶端在前)及其局部坐标系的z、x 方向
+        :return:
+        """
+        demolding_position = self.detailed_design.inserts_detailed.demolding_position
+        demolding_a = float(demolding_position.a)  # 脱模埋件顶端纵向边距
+        demolding_b = float(demolding_position.b)  # 脱模埋件底端纵向边距
+        demolding_t = float(demolding_position.t)  # 脱模埋件厚度方向边距
+        demolding_t_y = self.l_total - demolding_a  # 顶端侧面脱模预埋件y坐标
+        demolding_t_z = (
+            self.l_total - self.bottom_bottom_length - demolding_a
+        ) * self.tan + demolding_t / self.cos
+        demolding_b_y = demolding_b  # 底端侧面脱模预埋件y坐标
+        demolding_b_z = (
+            demolding_b - self.bottom_bottom_length
+        ) * self.tan + demolding_t / self.cos
+        positions = [
+            [float(self.width), demolding_t_y, demolding_t_z],
+            [float(self.width), demolding_b_y, demolding_b_z],
+        ]
+        z_direction = [-1.0, 0.0, 0.0]
+        x_direction = [0.0, -self.sin, self.cos]
+        return positions, z_direction, x_direction
+
+
+def get_stair_geometry(
+    structure_design: StructuralDesign,
+    structure_design_result: StructuralDesignResult,
+    detailed_design: DetailedDesign,
+    detailed_design_result: DetailedDesignResult,
+) -> StairGeometry:
+    """
+    获取楼梯几何数据,输入内容相同时返回同一实例,各导出模块不再重复计算
+    :param structure_design:
+    :param structure_design_result:
+    :param detailed_design:
+    :param detailed_design_result:
+    :return:
+    """
+    key = hashlib.sha1(
+        repr(
+            (
+                structure_design,
+                structure_design_result,
+                detailed_design,
+                detailed_design_result,
+            )
+        ).encode("utf-8")
+    ).hexdigest()
+    geometry = _GEOMETRY_CACHE.get(key)
+    if geometry is not None:
+        _GEOMETRY_CACHE.move_to_end(key)
+        return geometry
+    geometry = StairGeometry(
+        structure_design,
+        structure_design_result,
+        detailed_design,
+        detailed_design_result,
+    )
+    _GEOMETRY_CACHE[key] = geometry
+    if len(_GEOMETRY_CACHE) > GEOMETRY_CACHE_SIZE:
+        _GEOMETRY_CACHE.popitem(last=False)
+    return geometry
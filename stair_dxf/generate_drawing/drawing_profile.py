@@ -0,0 +1,156 @@
+"""
+dxf 图纸生成过程的性能分析:统计每个视图的耗时(OCC 布尔运算、HLR 投影、离散、ezdxf 图元创建)和图元数量
+未启用分析时各计时点不做任何统计,不影响正常生成
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+# OCC 相关的计时类别,其余时间计入ezdxf 图元创建
+OCC_BOOLEAN = "occ_boolean"
+HLR = "hlr"
+DISCRETIZE = "discretize"
+OCC_CATEGORIES = (OCC_BOOLEAN, HLR, DISCRETIZE)
+
+_ACTIVE_PROFILE: ContextVar[Optional["DrawingProfile"]] = ContextVar(
+    "_ACTIVE_PROFILE", default=None
+)
+
+
+def count_dxf_entities(dxf_doc) -> int:
+    """
+    统计dxf 文档中模型空间、图纸空间及所有图块内的图元数量
+    :param dxf_doc:
+    :return:
+    """
+    return sum(len(block) for block in dxf_doc.blocks)
+
+
+class DrawingProfile(object):
+    """
+    图纸生成性能记录:按视图和阶段(创建、绘制、放置图块)记录耗时及新增图元数量
+    """
+
+    def __init__(self, dxf_doc=None):
+        self.dxf_doc = dxf_doc
+        self.records: List[Dict] = []
+        self._current: Optional[Dict] = None
+        # 嵌套计时段的耗时累计,外层计时段只统计扣除内层后的耗时
+        self._sections: List[float] = []
+
+    @contextmanager
+    def record(self, view: str, stage: str):
+        """
+        记录一个视图阶段的耗时和新增图元数量
+        :param view: 视图名称
+        :param stage: 阶段名称,如main_run_process、place_block_sets
+        :return:
+        """
+        item = {"view": view, "stage": stage}
+        for category in OCC_CATEGORIES:
+            item[category] = 0.0
+        entities_before = (
+            count_dxf_entities(self.dxf_doc) if self.dxf_doc is not None else 0
+        )
+        previous, self._current = self._current, item
+        token = _ACTIVE_PROFILE.set(self)
+        start = time.perf_counter()
+        try:
+            yield item
+        finally:
+            item["elapsed"] = time.perf_counter() - start
+            _ACTIVE_PROFILE.reset(token)
+            self._current = previous
+            item["dxf"] = max(
+                item["elapsed"] - sum(item[category] for category in OCC_CATEGORIES),
+                0.0,
+            )
+            item["entities"] = (
+                count_dxf_entities(self.dxf_doc) - entities_before
+                if self.dxf_doc is not None
+                else 0
+            )
+            self.records.append(item)
+
+    def add_time(self, category: str, elapsed: float):
+        """
+        将耗时计入当前视图阶段
+        :param category: 计时类别
+        :param elapsed: 耗时,秒
+        :return:
+        """
+        if self._current is not None:
+            self._current[category] = self._current.get(category, 0.0) + elapsed
+
+    def report(self) -> Dict:
+        """
+        生成结构化的分析报告,视图按总耗时由大到小排序
+        :return:
+        """
+        views: Dict[str, Dict] = {}
+        for item in self.records:
+            view = views.setdefault(
+                item["view"],
+                {
+                    "view": item["view"],
+                    "elapsed": 0.0,
+                    "entities": 0,
+                    "dxf": 0.0,
+                    "stages": {},
+                    **{category: 0.0 for category in OCC_CATEGORIES},
+                },
+            )
+            view["stages"][item["stage"]] = item["elapsed"]
+            for key in ("elapsed", "entities", "dxf") + OCC_CATEGORIES:
+                view[key] += item[key]
+        sorted_views = sorted(views.values(), key=lambda v: v["elapsed"], reverse=True)
+        total = {
+            key: sum(view[key] for view in sorted_views)
+            for key in ("elapsed", "entities", "dxf") + OCC_CATEGORIES
+        }
+        return {"total": total, "views": sorted_views}
+
+    def format_report(self) -> str:
+        """
+        将分析报告格式化为便于日志输出的文本
+        :return:
+        """
+        report = self.report()
+        columns = ("elapsed",) + OCC_CATEGORIES + ("dxf",)
+        lines = [
+            "{:<40}".format("view")
+            + "".join("{:>12}".format(column) for column in columns)
+            + "{:>10}".format("entities")
+        ]
+        for view in report["views"] + [dict(report["total"], view="total")]:
+            lines.append(
+                "{:<40}".format(view["view"])
+                + "".join("{:>12.3f}".format(view[column]) for column in columns)
+                + "{:>10d}".format(view["entities"])
+            )
+        return "\n".join(lines)
+
+
+@contextmanager
+def profile_section(category: str):
+    """
+    在启用分析时将代码段耗时计入当前视图的指定类别,嵌套时外层类别不含内层耗时
+    :param category: 计时类别
+    :return:
+    """
+    profile = _ACTIVE_PROFILE.get()
+    if profile is None:
+        yield
+        return
+    profile._sections.append(0.0)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        nested = profile._sections.pop()
+        if profile._sections:
+            profile._sections[-1] += elapsed
+        # 嵌套的计时段只计入最内层类别,避免重复统计
+        profile.add_time(category, elapsed - nested)
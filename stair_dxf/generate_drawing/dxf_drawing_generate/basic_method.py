@@ -6,7 +6,7 @@ import math
 import ezdxf
 from ezdxf.layouts import Modelspace  # 模型空间
 from ezdxf import document
-from typing import List, Tuple
+from typing import List, Tuple, Dict
 import copy
 import numpy as np
 import uuid  # 给对象赋予不同的名称
@@ -145,6 +145,47 @@ def draw_polyline(msp: Modelspace, point: List[Tuple]):
     return msp
 
 
+def draw_projected_entities(
+    msp: Modelspace, entities: List[Dict], scale: float, dxfattribs: Dict
+):
+    """
+    绘制投影图元:直线、整圆、圆弧直接生成对应的dxf 图元,仅自由曲线以多段线绘制
+    :param msp: 模型空间
+    :param entities: 投影图元,参见occ_expand_function.projected_edge_to_entity
+    :param scale: 实际尺寸与绘图尺寸的比例
+    :param dxfattribs: 图元属性
+    :return:
+    """
+    ratio = 1 / scale
+    for entity in entities:
+        if entity["type"] == "LINE":
+            msp.add_line(
+                adjust_drawing_scale(list(entity["start"]), ratio),
+                adjust_drawing_scale(list(entity["end"]), ratio),
+                dxfattribs=dxfattribs,
+            )
+        elif entity["type"] == "CIRCLE":
+            msp.add_circle(
+                adjust_drawing_scale(list(entity["center"]), ratio),
+                entity["radius"] * ratio,
+                dxfattribs=dxfattribs,
+            )
+        elif entity["type"] == "ARC":
+            msp.add_arc(
+                adjust_drawing_scale(list(entity["center"]), ratio),
+                entity["radius"] * ratio,
+                entity["start_angle"],
+                entity["end_angle"],
+                dxfattribs=dxfattribs,
+            )
+        else:
+            msp.add_lwpolyline(
+                [(point[0] * ratio, point[1] * ratio) for point in entity["points"]],
+                dxfattribs=dxfattribs,
+            )
+    return msp
+
+
 def transform_point_from_yz_to_xy(point: List[float]):
     """
     转换坐标点：由平面图形yz转换到xy平面
@@ -0,0 +1,215 @@
+"""
+参数化图块注册表:相同参数的部件(如吊装预埋件示意图、吊装预埋件)在同一dxf 文档中只定义一次图块,
+各处以块参照(INSERT)插入,减少图元数量和文件大小。
+预埋件以型号参数(RoundHeadParameter、AnchorParameter、RailParameter)为键,
+在原点处投影一次作为图块定义,各位置平移或旋转插入,不再逐个投影。
+仅适用于由多个图元组成且在局部坐标系下可直接绘制的部件;单个图元(如钢筋截面圆)改为块参照
+并不减少图元数量,反而增加图块定义,不应通过注册表插入
+"""
+import hashlib
+import weakref
+from dataclasses import asdict, is_dataclass
+from typing import Callable, Dict, List, Tuple
+
+from ezdxf.document import Drawing
+from ezdxf.layouts import BaseLayout, BlockLayout
+
+from stair_dxf.generate_drawing.dxf_drawing_generate.basic_method import (
+    draw_projected_entities,
+)
+
+# 参数取整位数,避免浮点误差导致相同部件生成不同图块
+_KEY_PRECISION = 6
+
+# 每个dxf 文档对应一个注册表,文档释放后注册表随之释放
+_REGISTRIES = weakref.WeakKeyDictionary()
+
+
+def _normalize_parameters(parameters) -> Tuple:
+    """
+    将部件参数转换为可哈希的键:支持dataclass(如RoundHeadParameter)和字典
+    :param parameters:
+    :return:
+    """
+    if is_dataclass(parameters):
+        parameters = asdict(parameters)
+    items = []
+    for key in sorted(parameters):
+        value = parameters[key]
+        if isinstance(value, float):
+            value = round(value, _KEY_PRECISION)
+        elif isinstance(value, dict) or is_dataclass(value):
+            value = _normalize_parameters(value)
+        elif isinstance(value, (list, tuple)):
+            value = tuple(
+                round(v, _KEY_PRECISION) if isinstance(v, float) else v for v in value
+            )
+        items.append((key, value))
+    return tuple(items)
+
+
+class ParametricBlockRegistry(object):
+    """
+    参数化图块注册表
+    """
+
+    def __init__(self, dxf_doc: Drawing):
+        self.dxf_doc = dxf_doc
+        self.block_names: Dict[Tuple, str] = {}
+
+    def get_block_name(
+        self,
+        part_name: str,
+        parameters,
+        draw_function: Callable[[BlockLayout, Dict], None],
+    ) -> str:
+        """
+        获取部件对应的图块名称,首次使用时调用draw_function 在局部坐标系(插入点为原点)下绘制图块
+        :param part_name: 部件名称
+        :param parameters: 部件参数,dataclass 或字典
+        :param draw_function: 图块绘制函数,参数为图块和部件参数字典
+        :return:
+        """
+        key = (part_name, _normalize_parameters(parameters))
+        if key in self.block_names:
+            return self.block_names[key]
+        digest = hashlib.md5(repr(key).encode("utf-8")).hexdigest()[:12]
+        block_name = f"{part_name}_{digest}"
+        if block_name not in self.dxf_doc.blocks:
+            block = self.dxf_doc.blocks.new(block_name)
+            if is_dataclass(parameters):
+                parameters = asdict(parameters)
+            draw_function(block, parameters)
+        self.block_names[key] = block_name
+        return block_name
+
+    def insert(
+        self,
+        layout: BaseLayout,
+        part_name: str,
+        parameters,
+        draw_function: Callable[[BlockLayout, Dict], None],
+        insert_point,
+        rotation: float = 0,
+    ):
+        """
+        在布局(模型空间或图块)中插入部件的块参照
+        :param layout: 布局
+        :param part_name: 部件名称
+        :param parameters: 部件参数
+        :param draw_function: 图块绘制函数
+        :param insert_point: 插入点
+        :param rotation: 旋转角度,角度制
+        :return:
+        """
+        block_name = self.get_block_name(part_name, parameters, draw_function)
+        return layout.add_blockref(
+            block_name, tuple(insert_point), dxfattribs={"rotation": rotation}
+        )
+
+
+def get_block_registry(dxf_doc: Drawing) -> ParametricBlockRegistry:
+    """
+    获取dxf 文档对应的图块注册表,同一文档的各视图共用
+    :param dxf_doc:
+    :return:
+    """
+    registry = _REGISTRIES.get(dxf_doc)
+    if registry is None:
+        registry = ParametricBlockRegistry(dxf_doc)
+        _REGISTRIES[dxf_doc] = registry
+    return registry
+
+
+def draw_hoist_embedded_diagram_block(block: BlockLayout, parameters: Dict):
+    """
+    吊装预埋件示意图:两个同心圆和十字轴线
+    :param block:
+    :param parameters: top_radius,bottom_radius,layer,sub_layer
+    :return:
+    """
+    top_radius = parameters["top_radius"]
+    bottom_radius = parameters["bottom_radius"]
+    total_length = top_radius + bottom_radius
+    block.add_circle((0, 0, 0), top_radius, dxfattribs={"layer": parameters["layer"]})
+    block.add_circle(
+        (0, 0, 0), bottom_radius, dxfattribs={"layer": parameters["layer"]}
+    )
+    block.add_line(
+        (-total_length, 0, 0),
+        (total_length, 0, 0),
+        dxfattribs={"layer": parameters["sub_layer"]},
+    )
+    block.add_line(
+        (0, -total_length, 0),
+        (0, total_length, 0),
+        dxfattribs={"layer": parameters["sub_layer"]},
+    )
+
+
+def insert_hoist_embedded_diagram(
+    layout: BaseLayout,
+    center,
+    top_radius: float,
+    bottom_radius: float,
+    layer: str,
+    sub_layer: str,
+):
+    """
+    插入吊装预埋件示意图块参照
+    :param layout: 布局
+    :param center: 预埋件中心
+    :param top_radius: 顶部半径
+    :param bottom_radius: 底部半径
+    :param layer: 圆所在图层
+    :param sub_layer: 轴线所在图层
+    :return:
+    """
+    parameters = {
+        "top_radius": top_radius,
+        "bottom_radius": bottom_radius,
+        "layer": layer,
+        "sub_layer": sub_layer,
+    }
+    return get_block_registry(layout.doc).insert(
+        layout,
+        "hoist_embedded_diagram",
+        parameters,
+        draw_hoist_embedded_diagram_block,
+        center,
+    )
+
+
+def insert_projected_part(
+    layout: BaseLayout,
+    part_name: str,
+    part_parameter,
+    project_function: Callable[[], List[Dict]],
+    insert_point,
+    scale: float,
+    layer: str,
+    rotation: float = 0,
+):
+    """
+    插入预埋件等部件的块参照:首次使用时调用project_function 得到部件在原点处的投影图元,
+    按比例绘制为图块,之后相同参数的部件直接插入,不再投影
+    :param layout: 布局
+    :param part_name: 部件名称
+    :param part_parameter: 部件型号参数,如RoundHeadParameter、AnchorParameter、RailParameter
+    :param project_function: 部件在原点处的投影图元,参见draw_projected_entities
+    :param insert_point: 插入点,绘图尺寸
+    :param scale: 实际尺寸与绘图尺寸的比例
+    :param layer: 图元所在图层
+    :param rotation: 旋转角度,角度制
+    :return:
+    """
+    parameters = {"part": part_parameter, "scale": scale, "layer": layer}
+
+    def draw_block(block: BlockLayout, _parameters: Dict):
+        draw_projected_entities(
+            block, project_function(), scale, dxfattribs={"layer": layer}
+        )
+
+    return get_block_registry(layout.doc).insert(
+        layout, part_name, parameters, draw_block, insert_point, rotation
+    )
@@ -1,6 +1,9 @@
 """
 产生所有深化设计图纸
 """
+from contextlib import nullcontext
+from typing import Optional
+
 import numpy as np
 
 import ezdxf
@@ -16,6 +19,7 @@ from stair_structure.model import (
     RebarParameter,
 )
 
+from stair_dxf.generate_drawing.drawing_profile import DrawingProfile
 from stair_dxf.generate_drawing.dxf_drawing_generate.stair_total_detail_drawing import (
     StairTopView,
     StairBottomView,
@@ -51,6 +55,7 @@ class StairDetailView(object):
         detailed_design_result,
         rebar_for_bim,
         dxf_doc: Drawing,
+        drawing_profile: Optional[DrawingProfile] = None,
     ):
         self.structure_design = structure_design
         self.detailed_design = detailed_design_result.detailed_design
@@ -58,9 +63,11 @@ class StairDetailView(object):
         self.detailed_design_result = detailed_design_result
         self.rebar_for_bim = rebar_for_bim
         self.dxf_doc = dxf_doc
+        self.drawing_profile = drawing_profile  # 性能分析记录,为None 时不统计
         self.load_dxf_file()  # 加载dxf文件
         self.generate_basic_data()  # 产生基本数据
-        self.create_total_dxf_drawing()  # 产生所有dxf图形
+        with self.profile_stage("all_views", "create_total_dxf_drawing"):
+            self.create_total_dxf_drawing()  # 产生所有dxf图形
 
     def generate_basic_data(self):
         """
@@ -1188,56 +1195,117 @@ class StairDetailView(object):
             },
         )  # 逆时针旋转0度
 
+    def profile_stage(self, view: str, stage: str):
+        """
+        视图阶段的性能记录,未启用性能分析时不做统计
+        :param view: 视图名称
+        :param stage: 阶段名称
+        :return:
+        """
+        if self.drawing_profile is None:
+            return nullcontext()
+        return self.drawing_profile.record(view, stage)
+
     def main_run_process(self):
         """
         主程序
         :return:
         """
-        self.stair_top_view.main_run_process()
-        self.place_stair_top_view_block_sets()
-        self.stair_bottom_view.main_run_process()
-        self.place_stair_bottom_view_block_sets()
-        self.stair_left_view.main_run_process()
-        self.place_stair_left_view_block_sets()
-
-        self.stair_reinforce_view.main_run_process()
-        self.place_stair_reinforce_block_sets()
-
-        self.stair_section_one_view.main_run_process()
-        self.place_stair_section_one_to_one_block_sets()
-        self.stair_section_two_view.main_run_process()
-        self.place_stair_section_two_to_two_block_sets()
-
-        self.stair_section_a_view.main_run_process()
-        self.place_stair_section_a_to_a_block_sets()
-        self.stair_section_b_view.main_run_process()
-        self.place_stair_section_b_to_b_block_sets()
-        self.stair_section_c_view.main_run_process()
-        self.place_stair_section_c_to_c_block_sets()
-
-        self.stair_bottom_install_view.main_run_process()
-        self.place_stair_bottom_install_node_block_sets()
-        self.stair_top_install_view.main_run_process()
-        self.place_stair_top_install_node_block_sets()
-
-        self.stair_bottom_hole_rein_view.main_run_process()
-        self.place_stair_bottom_hole_rein_rebar_block_sets()
-        self.stair_top_hole_rein_view.main_run_process()
-        self.place_stair_top_hole_rein_rebar_block_sets()
-
-        self.stair_step_slot_left_view.main_run_process()
-        self.place_stair_step_slot_left_block_sets()
-        self.stair_step_slot_top_view.main_run_process()
-        self.place_stair_step_top_block_sets()
-
-        self.stair_double_wall_long_joint_view.main_run_process()
-        self.place_stair_double_wall_long_joint_block_sets()
-
-        self.stair_double_wall_tran_joint_view.main_run_process()
-        self.place_stair_double_wall_tran_joint_block_sets()
-
+        view_sets = [
+            ("stair_top_view", self.stair_top_view, self.place_stair_top_view_block_sets),
+            (
+                "stair_bottom_view",
+                self.stair_bottom_view,
+                self.place_stair_bottom_view_block_sets,
+            ),
+            (
+                "stair_left_view",
+                self.stair_left_view,
+                self.place_stair_left_view_block_sets,
+            ),
+            (
+                "stair_reinforce_view",
+                self.stair_reinforce_view,
+                self.place_stair_reinforce_block_sets,
+            ),
+            (
+                "stair_section_one_view",
+                self.stair_section_one_view,
+                self.place_stair_section_one_to_one_block_sets,
+            ),
+            (
+                "stair_section_two_view",
+                self.stair_section_two_view,
+                self.place_stair_section_two_to_two_block_sets,
+            ),
+            (
+                "stair_section_a_view",
+                self.stair_section_a_view,
+                self.place_stair_section_a_to_a_block_sets,
+            ),
+            (
+                "stair_section_b_view",
+                self.stair_section_b_view,
+                self.place_stair_section_b_to_b_block_sets,
+            ),
+            (
+                "stair_section_c_view",
+                self.stair_section_c_view,
+                self.place_stair_section_c_to_c_block_sets,
+            ),
+            (
+                "stair_bottom_install_view",
+                self.stair_bottom_install_view,
+                self.place_stair_bottom_install_node_block_sets,
+            ),
+            (
+                "stair_top_install_view",
+                self.stair_top_install_view,
+                self.place_stair_top_install_node_block_sets,
+            ),
+            (
+                "stair_bottom_hole_rein_view",
+                self.stair_bottom_hole_rein_view,
+                self.place_stair_bottom_hole_rein_rebar_block_sets,
+            ),
+            (
+                "stair_top_hole_rein_view",
+                self.stair_top_hole_rein_view,
+                self.place_stair_top_hole_rein_rebar_block_sets,
+            ),
+            (
+                "stair_step_slot_left_view",
+                self.stair_step_slot_left_view,
+                self.place_stair_step_slot_left_block_sets,
+            ),
+            (
+                "stair_step_slot_top_view",
+                self.stair_step_slot_top_view,
+                self.place_stair_step_top_block_sets,
+            ),
+            (
+                "stair_double_wall_long_joint_view",
+                self.stair_double_wall_long_joint_view,
+                self.place_stair_double_wall_long_joint_block_sets,
+            ),
+            (
+                "stair_double_wall_tran_joint_view",
+                self.stair_double_wall_tran_joint_view,
+                self.place_stair_double_wall_tran_joint_block_sets,
+            ),
+        ]
         if self.detailed_design.inserts_detailed.rail_design_mode.value != 2:  # 无栏杆预埋件
-            self.stair_rail_embedded_detail_view.main_run_process()
-            self.place_stair_rail_embedded_block_sets()
+            view_sets.append(
+                (
+                    "stair_rail_embedded_detail_view",
+                    self.stair_rail_embedded_detail_view,
+                    self.place_stair_rail_embedded_block_sets,
+                )
+            )
+        for view_name, view, place_block_sets in view_sets:
+            with self.profile_stage(view_name, "main_run_process"):
+                view.main_run_process()
+            with self.profile_stage(view_name, "place_block_sets"):
+                place_block_sets()
 
         return self.dxf_doc
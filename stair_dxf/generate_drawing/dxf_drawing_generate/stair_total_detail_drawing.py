@@ -33,7 +33,6 @@ from stair_dxf.generate_drawing.occ_drawing.solid_projection import (
 )
 
 from stair_dxf.generate_drawing.dxf_drawing_generate.basic_method import (
-    get_circle_radius_and_center,
     adjust_drawing_scale,
     radian_bt_vectors,
     rotation_3d,
@@ -43,6 +42,11 @@ from stair_dxf.generate_drawing.dxf_drawing_generate.basic_method import (
     rotation_point_from_base_to_theta,
     calculate_normal_vector,
     transform_point_from_xy_to_yx,
+    draw_projected_entities,
+)
+from stair_dxf.generate_drawing.dxf_drawing_generate.block_registry import (
+    insert_hoist_embedded_diagram,
+    insert_projected_part,
 )
 from stair_dxf.generate_drawing.dxf_drawing_generate.dimension_need_datas import (
     TopViewDimensionData,
@@ -185,37 +189,39 @@ class StairTopView(object):
         开始绘制多段线
         :return:
         """
-        points = (
-            self.stair_projection_data.get_stair_solid_projection()
-        )  # [[(),()],[(),()]]
+        entities = self.stair_projection_data.get_stair_solid_projection_entities(
+            self.scale
+        )  # 按边类型输出的投影图元
         layer_name = "G_Outline"
-        self.begin_draw_standard_profile_points(points, layer_name)
+        draw_projected_entities(
+            self.Top_Shape, entities, self.scale, dxfattribs={"layer": layer_name}
+        )
 
     def begin_draw_circle(self):
         """
         开始绘制圆
         :return:
         """
-        hole_points = self.stair_projection_data.get_hole_projection()  # 获取孔洞投影数据
+        entities = self.stair_projection_data.get_hole_projection_entities(
+            self.scale
+        )  # 获取孔洞投影图元,孔洞轮廓直接为圆
         layer_name = "G_Outline"
-        for num in range(len(hole_points)):
-            single_hole = hole_points[num]
-            center, radius = get_circle_radius_and_center(single_hole)
-            center_list = list(center)
-            center_list = adjust_drawing_scale(center_list, 1 / self.scale)  # 调整坐标的比例
-            radius *= 1 / self.scale  # 调整圆半径比例
-            self.Top_Shape.add_circle(
-                center_list, radius, dxfattribs={"layer": layer_name}
-            )
+        draw_projected_entities(
+            self.Top_Shape, entities, self.scale, dxfattribs={"layer": layer_name}
+        )
 
     def begin_draw_step_slot(self):
         """
         开始绘制防滑槽
         :return:
         """
-        points = self.stair_projection_data.get_step_slot_projection()
+        entities = self.stair_projection_data.get_step_slot_projection_entities(
+            self.scale
+        )
         layer_name = "G_Step_Slot"
-        self.begin_draw_standard_profile_points(points, layer_name)
+        draw_projected_entities(
+            self.Top_Shape, entities, self.scale, dxfattribs={"layer": layer_name}
+        )
 
     def begin_draw_hoist_embedded_diagram(self):
         """
@@ -236,31 +242,14 @@ class StairTopView(object):
         for num in range(len(hoist_points)):
             current_point = list(hoist_points[num])
             current_point[2] = 0
-            total_length = radius_sets[0] + radius_sets[1]
-            point_1 = copy.deepcopy(current_point)
-            point_2 = copy.deepcopy(current_point)
-            point_3 = copy.deepcopy(current_point)
-            point_4 = copy.deepcopy(current_point)
-            # 生成吊装预埋件示意图的轴线
-            point_1[0] = point_1[0] - total_length
-            point_2[0] = point_2[0] + total_length
-            point_3[1] = point_3[1] - total_length
-            point_4[1] = point_4[1] + total_length
-            self.Top_Shape.add_circle(
-                tuple(current_point), radius_sets[0], dxfattribs={"layer": "G_Embedded"}
-            )
-            self.Top_Shape.add_circle(
-                tuple(current_point), radius_sets[1], dxfattribs={"layer": "G_Embedded"}
-            )
-            self.Top_Shape.add_line(
-                tuple(point_1),
-                tuple(point_2),
-                dxfattribs={"layer": "G_Embedded_Subline"},
-            )
-            self.Top_Shape.add_line(
-                tuple(point_3),
-                tuple(point_4),
-                dxfattribs={"layer": "G_Embedded_Subline"},
+            # 相同规格的预埋件示意图共用一个图块
+            insert_hoist_embedded_diagram(
+                self.Top_Shape,
+                current_point,
+                radius_sets[0],
+                radius_sets[1],
+                "G_Embedded",
+                "G_Embedded_Subline",
             )
 
     def begin_draw_hole_rein_rebar(self):
@@ -858,7 +847,7 @@ class StairBottomView(object):
         :return:
         """
         points = (
-            self.stair_projection_data.get_stair_solid_projection()
+            self.stair_projection_data.get_stair_solid_projection(self.scale)
         )  # [[(),()],[(),()]]
         layer_name = "G_Outline"
         self.begin_draw_standard_profile_points(points, layer_name)
@@ -868,17 +857,12 @@ class StairBottomView(object):
         开始绘制圆
         :return:
         """
-        hole_points = self.stair_projection_data.get_hole_projection()  # 获取孔洞投影数据
-        layer_name = "G_Outline"
-        for num in range(len(hole_points)):
-            single_hole = hole_points[num]
-            center, radius = get_circle_radius_and_center(single_hole)
-            center_list = list(center)
-            center_list = adjust_drawing_scale(center_list, 1 / self.scale)  # 调整坐标的比例
-            radius *= 1 / self.scale  # 调整圆半径比例
-            self.Bottom_Shape.add_circle(
-                center_list, radius, dxfattribs={"layer": layer_name}
-            )
+        entities = self.stair_projection_data.get_hole_projection_entities(
+            self.scale
+        )  # 获取孔洞投影图元,孔洞轮廓直接为圆
+        draw_projected_entities(
+            self.Bottom_Shape, entities, self.scale, dxfattribs={"layer": "G_Outline"}
+        )
 
     def begin_draw_hole_rein_rebar(self):
         """
@@ -1394,31 +1378,24 @@ class StairLeftView(object):
 
     def begin_draw_hoist_embedded_shape(self):
         """
-        开始绘制吊装预埋件
+        开始绘制吊装预埋件:各预埋件型号相同,投影一次后以块参照插入
         :return:
         """
-        hoist_data = self.stair_projection_data.get_hoist_embedded_cut_shape()
-        layer_name = "G_Embedded"
-        # 变换绘制比例
-        for num in range(len(hoist_data)):
-            hoist_data[num][0] = transform_point_from_yz_to_xy(
-                list(hoist_data[num][0])
-            )  # 起点
-            hoist_data[num][1] = transform_point_from_yz_to_xy(
-                list(hoist_data[num][1])
-            )  # 终点
-            hoist_data[num][0] = adjust_drawing_scale(
-                hoist_data[num][0], 1 / self.scale
+        data = self.stair_projection_data
+        hoist_parameter = data.hoist_loc.lifting_parameter  # 吊装预埋件型号
+        for point in data.get_hoist_embedded_left_loc():
+            insert_point = adjust_drawing_scale(
+                transform_point_from_yz_to_xy(point), 1 / self.scale
             )
-            hoist_data[num][1] = adjust_drawing_scale(
-                hoist_data[num][1], 1 / self.scale
+            insert_projected_part(
+                self.left_shape,
+                "hoist_embedded_part",
+                hoist_parameter,
+                lambda: data.get_hoist_embedded_part_entities(self.scale),
+                insert_point,
+                self.scale,
+                "G_Embedded",
             )
-        for segment in hoist_data:
-            seg = [
-                (abs(segment[0][0]), abs(segment[0][1]), abs(segment[0][2])),
-                (abs(segment[1][0]), abs(segment[1][1]), abs(segment[1][2])),
-            ]  # 将三维点转化为平面点
-            self.left_shape.add_line(seg[0], seg[1], dxfattribs={"layer": layer_name})
 
     def begin_draw_hole_shape(self):
         """
@@ -1928,32 +1905,23 @@ class StairReinforcementView(object):
 
     def begin_draw_hoist_embedded_shape(self):
         """
-        开始绘制吊装预埋件
+        开始绘制吊装预埋件:各预埋件型号相同,投影一次后以块参照插入
         :return:
         """
-        hoist_data = self.stair_reinforce_data.get_hoist_embedded_cut_shape()
-        layer_name = "G_Embedded"
-        # 变换绘制比例
-        for num in range(len(hoist_data)):
-            hoist_data[num][0] = transform_point_from_yz_to_xy(
-                list(hoist_data[num][0])
-            )  # 起点
-            hoist_data[num][1] = transform_point_from_yz_to_xy(
-                list(hoist_data[num][1])
-            )  # 终点
-            hoist_data[num][0] = adjust_drawing_scale(
-                hoist_data[num][0], 1 / self.scale
+        data = self.stair_reinforce_data
+        hoist_parameter = data.hoist_loc.lifting_parameter  # 吊装预埋件型号
+        for point in data.get_hoist_embedded_left_loc():
+            insert_point = adjust_drawing_scale(
+                transform_point_from_yz_to_xy(point), 1 / self.scale
             )
-            hoist_data[num][1] = adjust_drawing_scale(
-                hoist_data[num][1], 1 / self.scale
-            )
-        for segment in hoist_data:
-            seg = [
-                (abs(segment[0][0]), abs(segment[0][1]), abs(segment[0][2])),
-                (abs(segment[1][0]), abs(segment[1][1]), abs(segment[1][2])),
-            ]  # 将三维点转化为平面点
-            self.embedded_shape.add_line(
-                seg[0], seg[1], dxfattribs={"layer": layer_name}
+            insert_projected_part(
+                self.embedded_shape,
+                "hoist_embedded_part",
+                hoist_parameter,
+                lambda: data.get_hoist_embedded_part_entities(self.scale),
+                insert_point,
+                self.scale,
+                "G_Embedded",
             )
 
     def begin_draw_hole_shape(self):
@@ -4947,10 +4915,14 @@ class StairBottomInstallNodeView(object):
             self.detailed_design.construction_detailed.bottom_hole_type.value == 1
         ):  # 底端连接节点与底部孔洞类型对应，0--固定铰，1--滑动铰
             nut_profile_points = (
-                self.stair_cut_data.get_stair_bottom_connect_nut_projection_drawing()
+                self.stair_cut_data.get_stair_bottom_connect_nut_projection_drawing(
+                    self.scale
+                )
             )  # 底部螺母数据
             shim_profile_points = (
-                self.stair_cut_data.get_stair_bottom_connect_shim_projection_drawing()
+                self.stair_cut_data.get_stair_bottom_connect_shim_projection_drawing(
+                    self.scale
+                )
             )  # 底部垫片数据
             # 螺母--变换绘制比例
             for segment in nut_profile_points:
@@ -6066,10 +6038,14 @@ class StairTopInstallNodeView(object):
             self.detailed_design.construction_detailed.top_hole_type.value == 1
         ):  # 顶端连接节点,节点类型与孔洞类型对应,0--固定铰，1--滑动铰
             nut_profile_points = (
-                self.stair_cut_data.get_stair_top_connect_nut_projection_drawing()
+                self.stair_cut_data.get_stair_top_connect_nut_projection_drawing(
+                    self.scale
+                )
             )  # 顶部螺母数据
             shim_profile_points = (
-                self.stair_cut_data.get_stair_top_connect_shim_projection_drawing()
+                self.stair_cut_data.get_stair_top_connect_shim_projection_drawing(
+                    self.scale
+                )
             )  # 顶部垫片数据
             # 螺母--变换绘制比例
             for segment in nut_profile_points:
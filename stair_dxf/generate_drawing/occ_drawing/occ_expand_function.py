@@ -6,16 +6,22 @@ Aim : set up the relative function of  stair solid
 
 from typing import List, Optional, Tuple, Dict
 from OCC.Core.gp import gp_Pnt, gp_Ax1, gp_Ax2, gp_Ax3, gp_Dir, gp_XYZ
-from OCC.Core.TopoDS import TopoDS_Shape, TopoDS_Wire, TopoDS_Vertex
-from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse, BRepAlgoAPI_Cut, BRepAlgoAPI_Common
+from OCC.Core.TopoDS import TopoDS_Shape, TopoDS_Wire, TopoDS_Vertex, TopoDS_Compound
+from OCC.Core.TopTools import TopTools_ListOfShape
+from OCC.Core.BRepAlgoAPI import (
+    BRepAlgoAPI_Fuse,
+    BRepAlgoAPI_Cut,
+    BRepAlgoAPI_Common,
+    BRepAlgoAPI_Section,
+)
 from OCC.Core.TopAbs import TopAbs_EDGE, TopAbs_VERTEX
 from OCC.Core.BRepBuilderAPI import (
     BRepBuilderAPI_MakeVertex,
-    BRepBuilderAPI_MakeWire,
-    BRepBuilderAPI_MakeEdge,
 )
 
-from OCC.Core.BRep import BRep_Tool
+from OCC.Core.BRep import BRep_Tool, BRep_Builder
+from OCC.Core.BRepAdaptor import BRepAdaptor_Curve
+from OCC.Core.GeomAbs import GeomAbs_Line, GeomAbs_Circle
 
 from OCC.Core.BRepExtrema import BRepExtrema_DistShapeShape  # 形状与形状之间极值点的距离
 
@@ -27,8 +33,7 @@ from OCC.Extend.TopologyUtils import TopologyExplorer
 from OCC.Core.HLRBRep import HLRBRep_Algo, HLRBRep_HLRToShape, HLRBRep_PolyAlgo
 from OCC.Extend.TopologyUtils import (
     list_of_shapes_to_compound,
-    discretize_edge,
-    get_sorted_hlr_edges,
+    discretize_edge as _discretize_edge,
     WireExplorer,
     is_wire,
 )  # 获取每条边的端点信息
@@ -37,6 +42,7 @@ from OCC.Core.TopExp import TopExp_Explorer
 from OCC.Core.TopoDS import topods_Vertex, topods_Edge  # 拓扑顶点
 
 import copy
+import math
 
 from OCC.Core.TopoDS import TopoDS_Shape
 from OCC.Core import TopoDS
@@ -45,6 +51,16 @@ from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
 from OCC.Core.Interface import Interface_Static_SetCVal
 from OCC.Core.IFSelect import IFSelect_RetDone
 
+from stair_dxf.generate_drawing.drawing_profile import (
+    profile_section,
+    OCC_BOOLEAN,
+    HLR,
+    DISCRETIZE,
+)
+
+# 图纸上可接受的离散误差(绘图单位),乘以绘图比例即为模型空间的离散误差
+DRAWING_DEFLECTION = 0.001
+
 
 def transform_solid_to_step_data(solid: TopoDS, filename: str) -> None:
     """
@@ -107,19 +123,20 @@ def rewrite_get_sorted_hlr_edges(
     """
     from OCC.Extend.TopologyUtils import get_sorted_hlr_edges
 
-    # 1.加载模型
-    hlr = HLRBRep_Algo()  # 获得线段本身
-    hlr.Add(topods_shape)
-    # 2.设置视点及投影方向、投影平面
-    ax2 = gp_Ax2(origin, project_dir)
-    projector = HLRAlgo_Projector(ax2)  # 投影函数确定投影平面
-
-    hlr.Projector(projector)  # 设置投影平面
-    # 3.计算投影
-    hlr.Update()  # 隐藏线移除算法更新
-    hlr.Hide()  # 通过该算法计算模型可见性与隐藏线，仅HLRBRep_Algo算法独有
-    # 4.提取边
-    hlr_shapes = HLRBRep_HLRToShape(hlr)  # 开始投影形状操作
+    with profile_section(HLR):
+        # 1.加载模型
+        hlr = HLRBRep_Algo()  # 获得线段本身
+        hlr.Add(topods_shape)
+        # 2.设置视点及投影方向、投影平面
+        ax2 = gp_Ax2(origin, project_dir)
+        projector = HLRAlgo_Projector(ax2)  # 投影函数确定投影平面
+
+        hlr.Projector(projector)  # 设置投影平面
+        # 3.计算投影
+        hlr.Update()  # 隐藏线移除算法更新
+        hlr.Hide()  # 通过该算法计算模型可见性与隐藏线，仅HLRBRep_Algo算法独有
+        # 4.提取边
+        hlr_shapes = HLRBRep_HLRToShape(hlr)  # 开始投影形状操作
 
     # 可视化边
     # 可提取边的类型有
@@ -155,6 +172,17 @@ def rewrite_get_sorted_hlr_edges(
     return visible, hidden
 
 
+def discretize_edge(a_topods_edge, deflection=0.5):
+    """
+    参见 OCC.Extend.TopologyUtils.discretize_edge,增加离散耗时统计
+    :param a_topods_edge:
+    :param deflection:
+    :return:
+    """
+    with profile_section(DISCRETIZE):
+        return _discretize_edge(a_topods_edge, deflection)
+
+
 def discretize_wire(a_topods_wire: TopoDS_Wire, deflection=0.0005):
     """Returns a set of points"""
     if not is_wire(a_topods_wire):
@@ -165,38 +193,127 @@ def discretize_wire(a_topods_wire: TopoDS_Wire, deflection=0.0005):
     wire_pnts = []
     # loop over ordered edges---边排序
     for edg in wire_explorer.ordered_edges():
-        edg_pnts = discretize_edge(edg, deflection)
+        curve = BRepAdaptor_Curve(edg)
+        if curve.GetType() == GeomAbs_Line:  # 直线仅需两端点
+            edg_pnts = [
+                curve.Value(curve.FirstParameter()).Coord(),
+                curve.Value(curve.LastParameter()).Coord(),
+            ]
+        else:
+            edg_pnts = discretize_edge(edg, deflection)
         wire_pnts += edg_pnts
     return wire_pnts
 
 
-def compute_project_shape(shape: TopoDS_Shape, origin: gp_Pnt, project_dir: gp_Dir):
+def discretize_projected_edge(edg, scale: float = 1) -> List[Tuple[float]]:
+    """
+    按边的类型离散投影边:直线仅返回两个端点,圆和圆弧按与绘图比例相关的误差均匀离散,
+    其余自由曲线按与绘图比例相关的误差离散;封闭的边(整圆等)终点与起点重合,按折线绘制时没有缺口
+    Args:
+        edg: 投影后的边
+        scale: 实际尺寸与绘图尺寸的比例
+    Returns:
+
+    """
+    curve = BRepAdaptor_Curve(edg)
+    curve_type = curve.GetType()
+    first = curve.FirstParameter()
+    last = curve.LastParameter()
+    if curve_type == GeomAbs_Line:
+        return [curve.Value(first).Coord(), curve.Value(last).Coord()]
+    deflection = DRAWING_DEFLECTION * scale
+    points = _discretize_edge(edg, deflection)
+    if curve.IsClosed() and points and points[-1] != points[0]:
+        points.append(points[0])
+    return points
+
+
+def projected_edge_to_entity(edg, scale: float = 1) -> Dict:
+    """
+    将投影边转换为dxf 图元描述:直线->LINE,整圆->CIRCLE,圆弧->ARC,其余->POLYLINE
+    返回的坐标为模型空间坐标,绘制时再按比例缩放
+    Args:
+        edg: 投影后的边
+        scale: 实际尺寸与绘图尺寸的比例,用于自由曲线的离散误差
+    Returns:
+
+    """
+    curve = BRepAdaptor_Curve(edg)
+    curve_type = curve.GetType()
+    first = curve.FirstParameter()
+    last = curve.LastParameter()
+    if curve_type == GeomAbs_Line:
+        return {
+            "type": "LINE",
+            "start": curve.Value(first).Coord(),
+            "end": curve.Value(last).Coord(),
+        }
+    if curve_type == GeomAbs_Circle:
+        circle = curve.Circle()
+        center = circle.Location().Coord()
+        radius = circle.Radius()
+        if curve.IsClosed():
+            return {"type": "CIRCLE", "center": center, "radius": radius}
+        start = curve.Value(first).Coord()
+        end = curve.Value(last).Coord()
+        start_angle = math.degrees(
+            math.atan2(start[1] - center[1], start[0] - center[0])
+        )
+        end_angle = math.degrees(math.atan2(end[1] - center[1], end[0] - center[0]))
+        if circle.Axis().Direction().Z() < 0:  # dxf 圆弧按逆时针方向绘制
+            start_angle, end_angle = end_angle, start_angle
+        return {
+            "type": "ARC",
+            "center": center,
+            "radius": radius,
+            "start_angle": start_angle,
+            "end_angle": end_angle,
+        }
+    return {
+        "type": "POLYLINE",
+        "points": _discretize_edge(edg, DRAWING_DEFLECTION * scale),
+    }
+
+
+def compute_project_shape(
+    shape: TopoDS_Shape, origin: gp_Pnt, project_dir: gp_Dir, scale: float = 1
+):
     """
     计算一个shape 投影后在平面内的的形状。返回的shape是在这个ax3 下坐标系表示的
     Args:
         shape:
         origin:坐标原点
         project_dir:投影平面方向
+        scale:实际尺寸与绘图尺寸的比例,决定曲线的离散误差
     Returns:
 
     """
     visible, hidden = rewrite_get_sorted_hlr_edges(
         shape, origin, project_dir, export_hidden_edges=False
     )
-    make_wire = BRepBuilderAPI_MakeWire()
-    points = []
-    for edg in visible:
-        points_3d = discretize_edge(edg, 0.001)  # 转换成点
-        points.append(points_3d)
-        for i in range(len(points_3d) - 1):
-            point_start = points_3d[i]
-            start_pnt = gp_Pnt(*point_start)
-            point_end = points_3d[i + 1]
-            end_pnt = gp_Pnt(*point_end)
-            make_edg_api = BRepBuilderAPI_MakeEdge(start_pnt, end_pnt)
-            edg = make_edg_api.Edge()
-            make_wire.Add(edg)
-    return make_wire.Shape(), points
+    with profile_section(DISCRETIZE):
+        points = [discretize_projected_edge(edg, scale) for edg in visible]
+    return make_compound_shape(visible), points
+
+
+def compute_project_entities(
+    shape: TopoDS_Shape, origin: gp_Pnt, project_dir: gp_Dir, scale: float = 1
+) -> List[Dict]:
+    """
+    计算一个shape 投影后的dxf 图元描述,参见projected_edge_to_entity
+    Args:
+        shape:
+        origin:坐标原点
+        project_dir:投影平面方向
+        scale:实际尺寸与绘图尺寸的比例,决定自由曲线的离散误差
+    Returns:
+
+    """
+    visible, hidden = rewrite_get_sorted_hlr_edges(
+        shape, origin, project_dir, export_hidden_edges=False
+    )
+    with profile_section(DISCRETIZE):
+        return [projected_edge_to_entity(edg, scale) for edg in visible]
 
 
 def compute_project_minimal_distance_pnt(
@@ -259,8 +376,9 @@ def my_BRepAlgoAPI_Fuse(shape1: TopoDS_Shape, shape2: TopoDS_Shape):
     :param shape2:
     :return:
     """
-    fuse_solid = BRepAlgoAPI_Fuse(shape1, shape2)
-    fuse_solid.SimplifyResult()
+    with profile_section(OCC_BOOLEAN):
+        fuse_solid = BRepAlgoAPI_Fuse(shape1, shape2)
+        fuse_solid.SimplifyResult()
     return fuse_solid
 
 
@@ -271,8 +389,9 @@ def my_BRepAlgoAPI_Cut(shape1: TopoDS_Shape, shape2: TopoDS_Shape):
     :param shape2:
     :return:
     """
-    cut_solid = BRepAlgoAPI_Cut(shape1, shape2)
-    cut_solid.SimplifyResult()
+    with profile_section(OCC_BOOLEAN):
+        cut_solid = BRepAlgoAPI_Cut(shape1, shape2)
+        cut_solid.SimplifyResult()
     return cut_solid
 
 
@@ -283,11 +402,114 @@ def my_BRepAlgoAPI_Common(shape1: TopoDS_Shape, shape2: TopoDS_Shape):
     :param shape2:
     :return:
     """
-    common_solid = BRepAlgoAPI_Common(shape1, shape2)
-    common_solid.SimplifyResult()
+    with profile_section(OCC_BOOLEAN):
+        common_solid = BRepAlgoAPI_Common(shape1, shape2)
+        common_solid.SimplifyResult()
     return common_solid
 
 
+def my_BRepAlgoAPI_Section(shape1: TopoDS_Shape, shape2):
+    """
+    求实体与平面(或实体)的截交线
+    :param shape1:
+    :param shape2:
+    :return:
+    """
+    with profile_section(OCC_BOOLEAN):
+        section_solid = BRepAlgoAPI_Section(shape1, shape2)
+    return section_solid
+
+
+def _to_list_of_shape(shapes: List[TopoDS_Shape]) -> TopTools_ListOfShape:
+    """
+    将python 列表转换为OCC 布尔运算所需的形状列表
+    :param shapes:
+    :return:
+    """
+    list_of_shape = TopTools_ListOfShape()
+    for shape in shapes:
+        list_of_shape.Append(shape)
+    return list_of_shape
+
+
+def make_compound_shape(shapes: List[TopoDS_Shape]) -> TopoDS_Compound:
+    """
+    将多个形状组合为复合体,不做布尔运算:适用于钢筋等仅需绘制、不需求交的形状集合
+    :param shapes:
+    :return:
+    """
+    compound = TopoDS_Compound()
+    builder = BRep_Builder()
+    builder.MakeCompound(compound)
+    for shape in shapes:
+        builder.Add(compound, shape)
+    return compound
+
+
+def general_fuse_shape(
+    arguments: List[TopoDS_Shape],
+    tools: Optional[List[TopoDS_Shape]] = None,
+    parallel: bool = True,
+    fuzzy_value: float = 0.0,
+) -> TopoDS_Shape:
+    """
+    一次布尔并运算合并全部形状,避免逐个合并时对不断增长的实体重复遍历
+    :param arguments: 参与运算的对象
+    :param tools: 参与运算的工具,为空时以arguments 的第一个形状为对象,其余为工具
+    :param parallel: 是否开启并行模式
+    :param fuzzy_value: 模糊运算容差,0 表示不启用
+    :return: 没有形状时返回空的复合体,只有一个形状时直接返回该形状
+    """
+    if not tools:
+        arguments, tools = arguments[:1], arguments[1:]
+    if not arguments:
+        return make_compound_shape([])
+    if not tools:
+        return arguments[0]
+    fuse_api = BRepAlgoAPI_Fuse()
+    fuse_api.SetArguments(_to_list_of_shape(arguments))
+    fuse_api.SetTools(_to_list_of_shape(tools))
+    fuse_api.SetRunParallel(parallel)
+    if fuzzy_value > 0:
+        fuse_api.SetFuzzyValue(fuzzy_value)
+    with profile_section(OCC_BOOLEAN):
+        fuse_api.Build()
+        if fuse_api.HasErrors():
+            raise Exception("布尔并运算失败")
+        fuse_api.SimplifyResult()
+    return fuse_api.Shape()
+
+
+def general_cut_shape(
+    shape: TopoDS_Shape,
+    tools: List[TopoDS_Shape],
+    parallel: bool = True,
+    fuzzy_value: float = 0.0,
+) -> TopoDS_Shape:
+    """
+    一次布尔差运算挖去全部工具形状(孔洞、防滑槽、滴水线槽等)
+    :param shape: 被切割的实体
+    :param tools: 工具形状集合
+    :param parallel: 是否开启并行模式
+    :param fuzzy_value: 模糊运算容差,0 表示不启用
+    :return: 没有工具形状时直接返回shape
+    """
+    if not tools:
+        return shape
+    cut_api = BRepAlgoAPI_Cut()
+    cut_api.SetArguments(_to_list_of_shape([shape]))
+    cut_api.SetTools(_to_list_of_shape(tools))
+    cut_api.SetRunParallel(parallel)
+    if fuzzy_value > 0:
+        cut_api.SetFuzzyValue(fuzzy_value)
+    with profile_section(OCC_BOOLEAN):
+        cut_api.Build()
+        if cut_api.HasErrors():
+            raise Exception("布尔差运算失败")
+        cut_api.SimplifyResult()
+    return cut_api.Shape()
+
+
 def fuse_shape(*args):
     """
     合并多个模型为一个混合模型
@@ -296,15 +518,9 @@ def fuse_shape(*args):
     """
     if len(args) == 0:
         return None
-    fuse_shape = None
-    for shape in args:
-        if fuse_shape == None:
-            fuse_shape = shape
-            continue
-        fuse_shape = BRepAlgoAPI_Fuse(fuse_shape, shape)
-        fuse_shape.SimplifyResult()
-        fuse_shape = fuse_shape.Shape()
-    return fuse_shape
+    if len(args) == 1:
+        return args[0]
+    return general_fuse_shape(list(args))
 
 
 def rotation_solid(
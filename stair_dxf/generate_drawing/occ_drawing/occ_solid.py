@@ -43,6 +43,9 @@ from stair_dxf.generate_drawing.occ_drawing.occ_expand_function import (
     my_BRepAlgoAPI_Cut,
     my_BRepAlgoAPI_Common,
     fuse_shape,
+    general_fuse_shape,
+    general_cut_shape,
+    make_compound_shape,
     rotation_solid,
     transform_solid_to_step_data,
 )
@@ -1360,8 +1363,7 @@ class BuildStairSolidModel(object):
         location = railing_datas["location"]  # 栏杆预埋件坐标位置
         direction = railing_datas["layout"]["direction"]  # 预埋件的方向
 
-        init_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
-        cut_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
+        part_shapes = []
         # 特定栏杆预埋件
         point_loc = copy.deepcopy(location[num])  # 栏杆预埋件的位置
         weld_loc = copy.deepcopy(
@@ -1381,7 +1383,7 @@ class BuildStairSolidModel(object):
             weld_shape[1],
             weld_shape[2],
         ).Shape()
-        init_shape = BRepAlgoAPI_Fuse(init_shape, weld_box).Shape()
+        part_shapes.append(weld_box)
         # 遍历钢筋序列
         for k in range(len(rebar_info)):
             rebar_point_, diam_ = copy.deepcopy(rebar_info[k])  # 钢筋1
@@ -1391,9 +1393,8 @@ class BuildStairSolidModel(object):
                 rebar_point_[i][1] += point_loc[1]
                 rebar_point_[i][2] += point_loc[2]
             rebar_shape_ = self.build_polyline_and_polyarc_shape(rebar_point_, diam_)
-            init_shape = BRepAlgoAPI_Fuse(init_shape, rebar_shape_).Shape()
-        init_shape = BRepAlgoAPI_Cut(init_shape, cut_shape).Shape()
-        return init_shape
+            part_shapes.append(rebar_shape_)
+        return general_fuse_shape(part_shapes)  # 焊板与钢筋相交,一次布尔并运算
 
     def build_railing_embedded_shape(self):
         """
@@ -1404,8 +1405,7 @@ class BuildStairSolidModel(object):
         location = railing_datas["location"]  # 栏杆预埋件坐标位置
         direction = railing_datas["layout"]["direction"]  # 预埋件的方向
 
-        init_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
-        cut_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
+        part_shapes = []
         for num in range(len(location)):  # 每个栏杆预埋件
             point_loc = copy.deepcopy(location[num])  # 栏杆预埋件的位置
             weld_loc = copy.deepcopy(
@@ -1425,7 +1425,7 @@ class BuildStairSolidModel(object):
                 weld_shape[1],
                 weld_shape[2],
             ).Shape()
-            init_shape = BRepAlgoAPI_Fuse(init_shape, weld_box).Shape()
+            part_shapes.append(weld_box)
             # 遍历钢筋序列
             for k in range(len(rebar_info)):
                 rebar_point_, diam_ = copy.deepcopy(rebar_info[k])  # 钢筋1
@@ -1437,9 +1437,8 @@ class BuildStairSolidModel(object):
                 rebar_shape_ = self.build_polyline_and_polyarc_shape(
                     rebar_point_, diam_
                 )
-                init_shape = BRepAlgoAPI_Fuse(init_shape, rebar_shape_).Shape()
-        init_shape = BRepAlgoAPI_Cut(init_shape, cut_shape).Shape()
-        return init_shape
+                part_shapes.append(rebar_shape_)
+        return general_fuse_shape(part_shapes)  # 焊板与钢筋相交,一次布尔并运算
 
     def build_rail_embedded_weld_shape(self):
         """
@@ -1450,8 +1449,7 @@ class BuildStairSolidModel(object):
         location = railing_datas["location"]  # 栏杆预埋件坐标位置
         direction = railing_datas["layout"]["direction"]  # 预埋件的方向
 
-        init_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
-        cut_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
+        part_shapes = []
         for num in range(len(location)):  # 每个栏杆预埋件
             point_loc = copy.deepcopy(location[num])  # 栏杆预埋件的位置
             weld_loc = copy.deepcopy(
@@ -1471,9 +1469,8 @@ class BuildStairSolidModel(object):
                 weld_shape[1],
                 weld_shape[2],
             ).Shape()
-            init_shape = BRepAlgoAPI_Fuse(init_shape, weld_box).Shape()
-        init_shape = BRepAlgoAPI_Cut(init_shape, cut_shape).Shape()
-        return init_shape
+            part_shapes.append(weld_box)
+        return make_compound_shape(part_shapes)  # 各焊板互不相交,组合为复合体即可
 
     def build_rail_embedded_U_rebar_shape(self):
         """
@@ -1483,8 +1480,7 @@ class BuildStairSolidModel(object):
         railing_datas = self.occ_data.get_railing_embedded_datas()  # 获取栏杆预埋件的数据信息
         location = railing_datas["location"]  # 栏杆预埋件坐标位置
         direction = railing_datas["layout"]["direction"]  # 预埋件的方向
-        init_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
-        cut_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
+        part_shapes = []
         for num in range(len(location)):  # 每个栏杆预埋件
             point_loc = copy.deepcopy(location[num])  # 栏杆预埋件的位置
             rebar_info = copy.deepcopy(railing_datas["layout"]["rebar"]["path"])  # 钢筋路径
@@ -1499,9 +1495,8 @@ class BuildStairSolidModel(object):
                 rebar_shape_ = self.build_polyline_and_polyarc_shape(
                     rebar_point_, diam_
                 )
-                init_shape = BRepAlgoAPI_Fuse(init_shape, rebar_shape_).Shape()
-        init_shape = BRepAlgoAPI_Cut(init_shape, cut_shape).Shape()
-        return init_shape
+                part_shapes.append(rebar_shape_)
+        return make_compound_shape(part_shapes)  # 钢筋仅用于绘制,无需布尔合并
 
     def build_mid_distribution_rebar_shape(self):
         """
@@ -1511,14 +1506,12 @@ class BuildStairSolidModel(object):
         mid_rebars = self.occ_data.get_all_mid_distribute_rebar()  # 获取所有中部分布筋数据
         rebar_radius = mid_rebars["radius"]  # 中部分布筋的半径
         rebars_path = mid_rebars["path"]  # 中部分布筋的路径
-        init_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
-        cut_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
+        rebar_shapes = []
         for num in range(len(rebars_path)):
             rebar_path = copy.deepcopy(rebars_path[num])  # 获取钢筋当前路径
             shape_ = self.build_u_polyarc_shape(rebar_path, rebar_radius)  # 建立U型形状
-            init_shape = my_BRepAlgoAPI_Fuse(init_shape, shape_).Shape()
-        init_shape = my_BRepAlgoAPI_Cut(init_shape, cut_shape).Shape()
-        return init_shape
+            rebar_shapes.append(shape_)
+        return make_compound_shape(rebar_shapes)  # 钢筋仅用于绘制,无需布尔合并
 
     def build_bottom_long_rebar_shape(self):
         """
@@ -1528,14 +1521,12 @@ class BuildStairSolidModel(object):
         bottom_rebar = self.occ_data.get_bottom_long_rebar_datas()
         rebar_radius = bottom_rebar["radius"]  # 底部纵筋的半径
         rebars_path = bottom_rebar["path"]  # 底部纵筋的路径
-        init_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
-        cut_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
+        rebar_shapes = []
         for num in range(len(rebars_path)):
             rebar_path = copy.deepcopy(rebars_path[num])  # 获取钢筋当前路径
             shape_ = self.build_L_polyarc_shape(rebar_path, rebar_radius)  # 建立U型形状
-            init_shape = my_BRepAlgoAPI_Fuse(init_shape, shape_).Shape()
-        init_shape = my_BRepAlgoAPI_Cut(init_shape, cut_shape).Shape()
-        return init_shape
+            rebar_shapes.append(shape_)
+        return make_compound_shape(rebar_shapes)  # 钢筋仅用于绘制,无需布尔合并
 
     def build_top_long_rebar_shape(self):
         """
@@ -1545,14 +1536,12 @@ class BuildStairSolidModel(object):
         top_rebar = self.occ_data.get_top_long_rebar_datas()  # 获取顶部纵筋数据
         rebar_radius = top_rebar["radius"]  # 底部纵筋的半径
         rebars_path = top_rebar["path"]  # 底部纵筋的路径
-        init_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
-        cut_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
+        rebar_shapes = []
         for num in range(len(rebars_path)):
             rebar_path = copy.deepcopy(rebars_path[num])  # 获取钢筋当前路径
             shape_ = self.build_z_polyarc_shape(rebar_path, rebar_radius)  # 建立U型形状
-            init_shape = my_BRepAlgoAPI_Fuse(init_shape, shape_).Shape()
-        init_shape = my_BRepAlgoAPI_Cut(init_shape, cut_shape).Shape()
-        return init_shape
+            rebar_shapes.append(shape_)
+        return make_compound_shape(rebar_shapes)  # 钢筋仅用于绘制,无需布尔合并
 
     def build_bottom_edge_long_rebar_shape(self):
         """
@@ -1564,14 +1553,12 @@ class BuildStairSolidModel(object):
         )  # 获取底部边缘纵筋数据
         rebar_radius = bottom_edge_rebar["radius"]  # 底部边缘纵筋的半径
         rebars_path = bottom_edge_rebar["path"]  # 底部边缘纵筋的路径
-        init_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
-        cut_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
+        rebar_shapes = []
         for num in range(len(rebars_path)):
             rebar_path = copy.deepcopy(rebars_path[num])  # 获取钢筋当前路径
             shape_ = self.build_line_shape(rebar_path, rebar_radius)  # 建立U型形状
-            init_shape = my_BRepAlgoAPI_Fuse(init_shape, shape_).Shape()
-        init_shape = my_BRepAlgoAPI_Cut(init_shape, cut_shape).Shape()
-        return init_shape
+            rebar_shapes.append(shape_)
+        return make_compound_shape(rebar_shapes)  # 钢筋仅用于绘制,无需布尔合并
 
     def build_top_edge_long_rebar_shape(self):
         """
@@ -1581,14 +1568,12 @@ class BuildStairSolidModel(object):
         top_edge_rebar = self.occ_data.get_top_edge_long_rebar_datas()  # 获取顶部边缘纵筋数据
         rebar_radius = top_edge_rebar["radius"]  # 顶部边缘纵筋的半径
         rebars_path = top_edge_rebar["path"]  # 顶部边缘纵筋的路径
-        init_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
-        cut_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
+        rebar_shapes = []
         for num in range(len(rebars_path)):
             rebar_path = copy.deepcopy(rebars_path[num])  # 获取钢筋当前路径
             shape_ = self.build_line_shape(rebar_path, rebar_radius)  # 建立U型形状
-            init_shape = my_BRepAlgoAPI_Fuse(init_shape, shape_).Shape()
-        init_shape = my_BRepAlgoAPI_Cut(init_shape, cut_shape).Shape()
-        return init_shape
+            rebar_shapes.append(shape_)
+        return make_compound_shape(rebar_shapes)  # 钢筋仅用于绘制,无需布尔合并
 
     def build_bottom_edge_stir_shape(self):
         """
@@ -1598,16 +1583,14 @@ class BuildStairSolidModel(object):
         bottom_edge_stir = self.occ_data.get_bottom_edge_stir_datas()  # 获取底部边缘箍筋数据
         rebar_radius = bottom_edge_stir["radius"]  # 底部边缘箍筋的半径
         rebars_path = bottom_edge_stir["path"]  # 底部边缘箍筋的路径
-        init_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
-        cut_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
+        rebar_shapes = []
         for num in range(len(rebars_path)):
             rebar_path = copy.deepcopy(rebars_path[num])  # 获取钢筋当前路径
             shape_ = self.build_close_rebar_polyarc_shape(
                 rebar_path, rebar_radius
             )  # 建立U型形状
-            init_shape = my_BRepAlgoAPI_Fuse(init_shape, shape_).Shape()
-        init_shape = my_BRepAlgoAPI_Cut(init_shape, cut_shape).Shape()
-        return init_shape
+            rebar_shapes.append(shape_)
+        return make_compound_shape(rebar_shapes)  # 钢筋仅用于绘制,无需布尔合并
 
     def build_top_edge_stir_shape(self):
         """
@@ -1617,16 +1600,14 @@ class BuildStairSolidModel(object):
         top_edge_stir = self.occ_data.get_top_edge_stir_datas()  # 获取顶部边缘箍筋数据
         rebar_radius = top_edge_stir["radius"]  # 顶部边缘箍筋的半径
         rebars_path = top_edge_stir["path"]  # 顶部边缘箍筋的路径
-        init_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
-        cut_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
+        rebar_shapes = []
         for num in range(len(rebars_path)):
             rebar_path = copy.deepcopy(rebars_path[num])  # 获取钢筋当前路径
             shape_ = self.build_close_rebar_polyarc_shape(
                 rebar_path, rebar_radius
             )  # 建立U型形状
-            init_shape = my_BRepAlgoAPI_Fuse(init_shape, shape_).Shape()
-        init_shape = my_BRepAlgoAPI_Cut(init_shape, cut_shape).Shape()
-        return init_shape
+            rebar_shapes.append(shape_)
+        return make_compound_shape(rebar_shapes)  # 钢筋仅用于绘制,无需布尔合并
 
     def build_specific_hole_rein_rebar_shape(self, num: int):
         """
@@ -1637,14 +1618,12 @@ class BuildStairSolidModel(object):
         hole_rein_rebar = self.occ_data.get_hole_rein_rebar_datas()  # 获取孔洞加强筋数据
         rebar_radius = hole_rein_rebar["radius"]  # 获取钢筋的半径
         rebars_path = hole_rein_rebar["path"]  # 获取钢筋的路径信息
-        init_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
-        cut_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
+        rebar_shapes = []
         # 单个孔洞加强筋模型
         rebar_path = copy.deepcopy(rebars_path[num])  # 获取钢筋当前路径
         shape_ = self.build_L_polyarc_shape(rebar_path, rebar_radius)  # 建立U型形状
-        init_shape = my_BRepAlgoAPI_Fuse(init_shape, shape_).Shape()
-        init_shape = my_BRepAlgoAPI_Cut(init_shape, cut_shape).Shape()
-        return init_shape
+        rebar_shapes.append(shape_)
+        return make_compound_shape(rebar_shapes)  # 钢筋仅用于绘制,无需布尔合并
 
     def build_hole_rein_rebar_shape(self):
         """
@@ -1654,14 +1633,12 @@ class BuildStairSolidModel(object):
         hole_rein_rebar = self.occ_data.get_hole_rein_rebar_datas()  # 获取孔洞加强筋数据
         rebar_radius = hole_rein_rebar["radius"]  # 获取钢筋的半径
         rebars_path = hole_rein_rebar["path"]  # 获取钢筋的路径信息
-        init_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
-        cut_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
+        rebar_shapes = []
         for num in range(len(rebars_path)):
             rebar_path = copy.deepcopy(rebars_path[num])  # 获取钢筋当前路径
             shape_ = self.build_L_polyarc_shape(rebar_path, rebar_radius)  # 建立U型形状
-            init_shape = my_BRepAlgoAPI_Fuse(init_shape, shape_).Shape()
-        init_shape = my_BRepAlgoAPI_Cut(init_shape, cut_shape).Shape()
-        return init_shape
+            rebar_shapes.append(shape_)
+        return make_compound_shape(rebar_shapes)  # 钢筋仅用于绘制,无需布尔合并
 
     def build_hoist_rein_long_rebar_shape(self):
         """
@@ -1673,16 +1650,14 @@ class BuildStairSolidModel(object):
         )  # 获取吊装加强纵筋数据
         rebar_radius = hoist_rein_long_rebar["radius"]  # 获取钢筋的半径
         rebars_path = hoist_rein_long_rebar["path"]  # 获取钢筋的路径信息
-        init_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
-        cut_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
+        rebar_shapes = []
         for num in range(len(rebars_path)):
             rebar_path = copy.deepcopy(rebars_path[num])  # 获取钢筋当前路径
             shape_ = self.build_five_sections_polyarc_shape(
                 rebar_path, rebar_radius
             )  # 建立U型形状
-            init_shape = my_BRepAlgoAPI_Fuse(init_shape, shape_).Shape()
-        init_shape = my_BRepAlgoAPI_Cut(init_shape, cut_shape).Shape()
-        return init_shape
+            rebar_shapes.append(shape_)
+        return make_compound_shape(rebar_shapes)  # 钢筋仅用于绘制,无需布尔合并
 
     def build_hoist_rein_point_rebar_shape(self):
         """
@@ -1694,14 +1669,12 @@ class BuildStairSolidModel(object):
         )  # 获取吊装加强点筋数据
         rebar_radius = hoist_rein_point_rebar["radius"]  # 获取钢筋的半径
         rebars_path = hoist_rein_point_rebar["path"]  # 获取钢筋的路径信息
-        init_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
-        cut_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
+        rebar_shapes = []
         for num in range(len(rebars_path)):
             rebar_path = copy.deepcopy(rebars_path[num])  # 获取钢筋当前路径
             shape_ = self.build_line_shape(rebar_path, rebar_radius)  # 建立U型形状
-            init_shape = my_BRepAlgoAPI_Fuse(init_shape, shape_).Shape()
-        init_shape = my_BRepAlgoAPI_Cut(init_shape, cut_shape).Shape()
-        return init_shape
+            rebar_shapes.append(shape_)
+        return make_compound_shape(rebar_shapes)  # 钢筋仅用于绘制,无需布尔合并
 
     def build_top_edge_rein_rebar_shape(self):
         """
@@ -1713,14 +1686,12 @@ class BuildStairSolidModel(object):
         )  # 获取顶部边缘加强筋数据
         rebar_radius = top_edge_rein_rebar["radius"]  # 获取钢筋的半径信息
         rebars_path = top_edge_rein_rebar["path"]  # 获取钢筋的路径信息
-        init_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
-        cut_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
+        rebar_shapes = []
         for num in range(len(rebars_path)):
             rebar_path = copy.deepcopy(rebars_path[num])  # 获取钢筋当前路径
             shape_ = self.build_z_polyarc_shape(rebar_path, rebar_radius)  # 建立U型形状
-            init_shape = my_BRepAlgoAPI_Fuse(init_shape, shape_).Shape()
-        init_shape = my_BRepAlgoAPI_Cut(init_shape, cut_shape).Shape()
-        return init_shape
+            rebar_shapes.append(shape_)
+        return make_compound_shape(rebar_shapes)  # 钢筋仅用于绘制,无需布尔合并
 
     def build_bottom_edge_rein_rebar_shape(self):
         """
@@ -1732,14 +1703,12 @@ class BuildStairSolidModel(object):
         )  # 获取底部边缘加强筋数据
         rebar_radius = bottom_edge_rein_rebar["radius"]  # 获取钢筋的直径
         rebars_path = bottom_edge_rein_rebar["path"]  # 获取钢筋的路径
-        init_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
-        cut_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
+        rebar_shapes = []
         for num in range(len(rebars_path)):
             rebar_path = copy.deepcopy(rebars_path[num])  # 获取钢筋当前路径
             shape_ = self.build_L_polyarc_shape(rebar_path, rebar_radius)  # 建立U型形状
-            init_shape = my_BRepAlgoAPI_Fuse(init_shape, shape_).Shape()
-        init_shape = my_BRepAlgoAPI_Cut(init_shape, cut_shape).Shape()
-        return init_shape
+            rebar_shapes.append(shape_)
+        return make_compound_shape(rebar_shapes)  # 钢筋仅用于绘制,无需布尔合并
 
     @staticmethod
     def build_rounding_heading_embedded_part_shape(
@@ -2067,8 +2036,7 @@ class BuildStairSolidModel(object):
         name = hoist_info["type"]  # 获取吊装预埋件的类型
         shape = hoist_info["specification"]  # 获取吊装预埋件的规格
         embedded_parts = hoist_info["location"]  # 获取吊装预埋件定位信息
-        init_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
-        cut_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
+        part_shapes = []
         for num in range(len(embedded_parts)):
             embedded_loc = copy.deepcopy(embedded_parts[num])  # 获取钢筋当前路径---坐标、旋转角，旋转轴
             if name == 0:
@@ -2079,9 +2047,8 @@ class BuildStairSolidModel(object):
                 shape_ = self.build_embedded_anchor_embedded_part_shape(
                     embedded_loc[0], shape, embedded_loc[1], embedded_loc[2]
                 )
-            init_shape = BRepAlgoAPI_Fuse(init_shape, shape_).Shape()
-        init_shape = BRepAlgoAPI_Cut(init_shape, cut_shape).Shape()
-        return init_shape
+            part_shapes.append(shape_)
+        return make_compound_shape(part_shapes)  # 各预埋件互不相交,组合为复合体即可
 
     def build_specific_basic_demold_embedded_part_shape(self, num: int):
         """
@@ -2144,8 +2111,7 @@ class BuildStairSolidModel(object):
         name = demold_info["type"]  # 获取脱模预埋件的类型
         shape = demold_info["specification"]  # 获取脱模预埋件的规格
         embedded_parts = demold_info["location"]  # 获取脱模预埋件定位信息
-        init_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
-        cut_shape = BRepPrimAPI_MakeBox(gp_Pnt(-100, -100, -100), 1, 1, 1).Shape()
+        part_shapes = []
         for num in range(len(embedded_parts)):
             embedded_loc = copy.deepcopy(embedded_parts[num])  # 获取钢筋当前路径---坐标、旋转角，旋转轴
             if name == 0:
@@ -2156,9 +2122,8 @@ class BuildStairSolidModel(object):
                 shape_ = self.build_embedded_anchor_embedded_part_shape(
                     embedded_loc[0], shape, embedded_loc[1], embedded_loc[2]
                 )
-            init_shape = BRepAlgoAPI_Fuse(init_shape, shape_).Shape()
-        init_shape = BRepAlgoAPI_Cut(init_shape, cut_shape).Shape()
-        return init_shape
+            part_shapes.append(shape_)
+        return make_compound_shape(part_shapes)  # 各预埋件互不相交,组合为复合体即可
 
     def build_bottom_left_beam_shape(self):
         """
@@ -3016,15 +2981,12 @@ class BuildMergeAndCutModel(object):
         hole_model = self.stair_solid.build_all_hole_shape()  # 连接孔洞模型
         step_slot_model = self.stair_solid.build_all_step_slot_shape()  # 防滑槽模型
         water_drip_model = self.stair_solid.build_all_water_drip_shape()  # 滴水线槽模型
-        update_model = my_BRepAlgoAPI_Fuse(simple_stair, top_ear).Shape()  # 合并顶部挑耳模型
-        update_model = my_BRepAlgoAPI_Fuse(update_model, bottom_ear).Shape()  # 合并底部挑耳模型
-        update_model = my_BRepAlgoAPI_Cut(update_model, hole_model).Shape()  # 挖去孔洞模型
-        update_model = my_BRepAlgoAPI_Cut(
-            update_model, step_slot_model
-        ).Shape()  # 挖去防滑槽模型
-        update_model = my_BRepAlgoAPI_Cut(
-            update_model, water_drip_model
-        ).Shape()  # 挖去滴水线槽模型
+        update_model = general_fuse_shape(
+            [simple_stair, top_ear, bottom_ear]
+        )  # 合并顶部和底部挑耳模型
+        update_model = general_cut_shape(
+            update_model, [hole_model, step_slot_model, water_drip_model]
+        )  # 挖去孔洞、防滑槽和滴水线槽模型
         return update_model
 
     def get_stair_solid_and_rail_rabbet_model(self):
@@ -3035,9 +2997,10 @@ class BuildMergeAndCutModel(object):
         top_ear = self.stair_solid.build_top_edge_ear()  # 顶部挑耳
         bottom_ear = self.stair_solid.build_bottom_edge_ear()  # 底部挑耳
         rail_rabbet = self.stair_solid.build_total_rail_rabbet_shape()  # 获取栏杆预埋件企口
-        update_model = my_BRepAlgoAPI_Fuse(simple_stair, top_ear).Shape()  # 合并顶部挑耳模型
-        update_model = my_BRepAlgoAPI_Fuse(update_model, bottom_ear).Shape()  # 合并底部挑耳模型
-        update_model = my_BRepAlgoAPI_Cut(update_model, rail_rabbet).Shape()  # 合并底部挑耳模型
+        update_model = general_fuse_shape(
+            [simple_stair, top_ear, bottom_ear]
+        )  # 合并顶部和底部挑耳模型
+        update_model = general_cut_shape(update_model, [rail_rabbet])  # 挖去栏杆预埋件企口
         return update_model
 
     def get_stair_entity_detailed_model(self):
@@ -3053,22 +3016,13 @@ class BuildMergeAndCutModel(object):
         water_drip_model = self.stair_solid.build_all_water_drip_shape()  # 滴水线槽模型
         internal_corner = self.stair_solid.build_all_internal_corner()  # 楼梯踏步阴角模型
         external_corner = self.stair_solid.build_all_external_corner()  # 楼梯踏步阳角模型
-        update_model = my_BRepAlgoAPI_Fuse(simple_stair, top_ear).Shape()  # 合并顶部挑耳模型
-        update_model = my_BRepAlgoAPI_Fuse(update_model, bottom_ear).Shape()  # 合并底部挑耳模型
-        update_model = my_BRepAlgoAPI_Fuse(
-            update_model, internal_corner
-        ).Shape()  # 合并楼梯踏步阴角模型
-        update_model = my_BRepAlgoAPI_Cut(update_model, hole_model).Shape()  # 挖去孔洞模型
-        update_model = my_BRepAlgoAPI_Cut(
-            update_model, step_slot_model
-        ).Shape()  # 挖去防滑槽模型
-        update_model = my_BRepAlgoAPI_Cut(
-            update_model, water_drip_model
-        ).Shape()  # 挖去滴水线槽模型
-        update_model = my_BRepAlgoAPI_Cut(
-            update_model, external_corner
-        ).Shape()  # 挖去楼梯阳角模型
-
+        update_model = general_fuse_shape(
+            [simple_stair, top_ear, bottom_ear, internal_corner]
+        )  # 合并挑耳和楼梯踏步阴角模型
+        update_model = general_cut_shape(
+            update_model,
+            [hole_model, step_slot_model, water_drip_model, external_corner],
+        )  # 挖去孔洞、防滑槽、滴水线槽和楼梯阳角模型
         return update_model
 
     def get_stair_solid_total_model(self):
@@ -3087,24 +3041,19 @@ class BuildMergeAndCutModel(object):
         rail_rabbet_model = (
             self.stair_solid.build_total_rail_rabbet_shape()
         )  # 栏杆预埋件企口模型
-        update_model = my_BRepAlgoAPI_Fuse(simple_stair, top_ear).Shape()  # 合并顶部挑耳模型
-        update_model = my_BRepAlgoAPI_Fuse(update_model, bottom_ear).Shape()  # 合并底部挑耳模型
-        update_model = my_BRepAlgoAPI_Fuse(
-            update_model, internal_corner
-        ).Shape()  # 合并楼梯踏步阴角模型
-        update_model = my_BRepAlgoAPI_Cut(update_model, hole_model).Shape()  # 挖去孔洞模型
-        update_model = my_BRepAlgoAPI_Cut(
-            update_model, step_slot_model
-        ).Shape()  # 挖去防滑槽模型
-        update_model = my_BRepAlgoAPI_Cut(
-            update_model, water_drip_model
-        ).Shape()  # 挖去滴水线槽模型
-        update_model = my_BRepAlgoAPI_Cut(
-            update_model, external_corner
-        ).Shape()  # 挖去楼梯阳角模型
-        update_model = my_BRepAlgoAPI_Cut(
-            update_model, rail_rabbet_model
-        ).Shape()  # 挖去栏杆预埋件企口模型
+        update_model = general_fuse_shape(
+            [simple_stair, top_ear, bottom_ear, internal_corner]
+        )  # 合并挑耳和楼梯踏步阴角模型
+        update_model = general_cut_shape(
+            update_model,
+            [
+                hole_model,
+                step_slot_model,
+                water_drip_model,
+                external_corner,
+                rail_rabbet_model,
+            ],
+        )  # 挖去孔洞、防滑槽、滴水线槽、楼梯阳角和栏杆预埋件企口模型
         return update_model
 
     def get_stair_entity_construct_model(self):
@@ -3121,24 +3070,19 @@ class BuildMergeAndCutModel(object):
         internal_corner = self.stair_solid.build_all_internal_corner()  # 楼梯踏步阴角模型
         external_corner = self.stair_solid.build_all_external_corner()  # 楼梯踏步阳角模型
         rabbet_model = self.stair_solid.build_all_hoist_embedded_rabbet()  # 楼梯吊装企口模型
-        update_model = my_BRepAlgoAPI_Fuse(simple_stair, top_ear).Shape()  # 合并顶部挑耳模型
-        update_model = my_BRepAlgoAPI_Fuse(update_model, bottom_ear).Shape()  # 合并底部挑耳模型
-        update_model = my_BRepAlgoAPI_Fuse(
-            update_model, internal_corner
-        ).Shape()  # 合并楼梯踏步阴角模型
-        update_model = my_BRepAlgoAPI_Cut(update_model, hole_model).Shape()  # 挖去孔洞模型
-        update_model = my_BRepAlgoAPI_Cut(
-            update_model, step_slot_model
-        ).Shape()  # 挖去防滑槽模型
-        update_model = my_BRepAlgoAPI_Cut(
-            update_model, water_drip_model
-        ).Shape()  # 挖去滴水线槽模型
-        update_model = my_BRepAlgoAPI_Cut(
-            update_model, external_corner
-        ).Shape()  # 挖去楼梯阳角模型
-        update_model = my_BRepAlgoAPI_Cut(
-            update_model, rabbet_model
-        ).Shape()  # 挖去楼梯吊装企口模型
+        update_model = general_fuse_shape(
+            [simple_stair, top_ear, bottom_ear, internal_corner]
+        )  # 合并挑耳和楼梯踏步阴角模型
+        update_model = general_cut_shape(
+            update_model,
+            [
+                hole_model,
+                step_slot_model,
+                water_drip_model,
+                external_corner,
+                rabbet_model,
+            ],
+        )  # 挖去孔洞、防滑槽、滴水线槽、楼梯阳角和吊装企口模型
         return update_model
 
     def get_stair_entity_total_construct_model(self):
@@ -3159,180 +3103,51 @@ class BuildMergeAndCutModel(object):
         rail_rabbet_model = (
             self.stair_solid.build_total_rail_rabbet_shape()
         )  # 栏杆预埋件企口模型
-        update_model = my_BRepAlgoAPI_Fuse(simple_stair, top_ear).Shape()  # 合并顶部挑耳模型
-        update_model = my_BRepAlgoAPI_Fuse(update_model, bottom_ear).Shape()  # 合并底部挑耳模型
-        update_model = my_BRepAlgoAPI_Fuse(
-            update_model, internal_corner
-        ).Shape()  # 合并楼梯踏步阴角模型
-        update_model = my_BRepAlgoAPI_Cut(update_model, hole_model).Shape()  # 挖去孔洞模型
-        update_model = my_BRepAlgoAPI_Cut(
-            update_model, step_slot_model
-        ).Shape()  # 挖去防滑槽模型
-        update_model = my_BRepAlgoAPI_Cut(
-            update_model, water_drip_model
-        ).Shape()  # 挖去滴水线槽模型
-        update_model = my_BRepAlgoAPI_Cut(
-            update_model, external_corner
-        ).Shape()  # 挖去楼梯阳角模型
-        update_model = my_BRepAlgoAPI_Cut(
-            update_model, rabbet_model
-        ).Shape()  # 挖去楼梯吊装企口模型
-        update_model = my_BRepAlgoAPI_Cut(
-            update_model, rail_rabbet_model
-        ).Shape()  # 挖去栏杆预埋件企口
+        update_model = general_fuse_shape(
+            [simple_stair, top_ear, bottom_ear, internal_corner]
+        )  # 合并挑耳和楼梯踏步阴角模型
+        update_model = general_cut_shape(
+            update_model,
+            [
+                hole_model,
+                step_slot_model,
+                water_drip_model,
+                external_corner,
+                rabbet_model,
+                rail_rabbet_model,
+            ],
+        )  # 挖去孔洞、防滑槽、滴水线槽、楼梯阳角、吊装企口和栏杆预埋件企口模型
         return update_model
 
     def get_stair_rebar_part_model(self):
         """
-        建立楼梯钢筋网笼模型
-        :return:
-        """
-        from OCC.Core import BOPAlgo  # 加速布尔运算
-
-        BOPAlgo.BOPAlgo_Algo.SetParallelMode(True)
-        bottom_long_rebar_model = (
-            self.stair_solid.build_bottom_long_rebar_shape()
-        )  # 底部纵筋形状模型
-        top_long_rebar_model = self.stair_solid.build_top_long_rebar_shape()  # 顶部纵筋形状模型
-        update_model_1 = BRepAlgoAPI_Fuse(
-            bottom_long_rebar_model, top_long_rebar_model
-        ).Shape()  # 合并顶部纵筋
-        mid_distribute_rebar_model = (
-            self.stair_solid.build_mid_distribution_rebar_shape()
-        )  # 中部分布筋形状模型
-        update_model_1 = BRepAlgoAPI_Fuse(
-            update_model_1, mid_distribute_rebar_model
-        ).Shape()  # 合并中部分布筋
-        bottom_edge_long_rebar_model = (
-            self.stair_solid.build_bottom_edge_long_rebar_shape()
-        )  # 底部边缘纵筋模型
-        update_model_1 = BRepAlgoAPI_Fuse(
-            update_model_1, bottom_edge_long_rebar_model
-        ).Shape()
-        top_edge_long_rebar_model = (
-            self.stair_solid.build_top_edge_long_rebar_shape()
-        )  # 顶部边缘纵筋模型
-        update_model_1 = BRepAlgoAPI_Fuse(
-            update_model_1, top_edge_long_rebar_model
-        ).Shape()
-        # update_model_2
-        bottom_edge_stir_model = (
-            self.stair_solid.build_bottom_edge_stir_shape()
-        )  # 底部边缘箍筋模型
-        top_edge_stir_model = self.stair_solid.build_top_edge_stir_shape()  # 顶部边缘箍筋模型
-        update_model_2 = BRepAlgoAPI_Fuse(
-            bottom_edge_stir_model, top_edge_stir_model
-        ).Shape()
-        hole_rein_rebar_model = (
-            self.stair_solid.build_hole_rein_rebar_shape()
-        )  # 孔洞加强钢筋模型
-        update_model_2 = BRepAlgoAPI_Fuse(update_model_2, hole_rein_rebar_model).Shape()
-        hoist_rein_long_rebar_model = (
-            self.stair_solid.build_hoist_rein_long_rebar_shape()
-        )  # 吊装加强纵筋模型
-        update_model_2 = BRepAlgoAPI_Fuse(
-            update_model_2, hoist_rein_long_rebar_model
-        ).Shape()
-        hoist_rein_point_rebar_model = (
-            self.stair_solid.build_hoist_rein_point_rebar_shape()
-        )  # 吊装加强点筋模型
-        update_model_2 = BRepAlgoAPI_Fuse(
-            update_model_2, hoist_rein_point_rebar_model
-        ).Shape()
-        bottom_edge_rein_rebar_model = (
-            self.stair_solid.build_bottom_edge_rein_rebar_shape()
-        )  # 下部边缘加强筋模型
-        update_model_2 = BRepAlgoAPI_Fuse(
-            update_model_2, bottom_edge_rein_rebar_model
-        ).Shape()
-        top_edge_rein_rebar_model = (
-            self.stair_solid.build_top_edge_rein_rebar_shape()
-        )  # 上部边缘加强筋模型
-        update_model_2 = BRepAlgoAPI_Fuse(
-            update_model_2, top_edge_rein_rebar_model
-        ).Shape()
-        # 合并两个模型
-        update_model = BRepAlgoAPI_Fuse(update_model_1, update_model_2).Shape()
-        return update_model
+        建立楼梯钢筋网笼模型:钢筋仅用于绘制,不参与求交,组合为复合体以避免逐根布尔合并
+        :return:
+        """
+        rebar_models = [
+            self.stair_solid.build_bottom_long_rebar_shape(),  # 底部纵筋形状模型
+            self.stair_solid.build_top_long_rebar_shape(),  # 顶部纵筋形状模型
+            self.stair_solid.build_mid_distribution_rebar_shape(),  # 中部分布筋形状模型
+            self.stair_solid.build_bottom_edge_long_rebar_shape(),  # 底部边缘纵筋模型
+            self.stair_solid.build_top_edge_long_rebar_shape(),  # 顶部边缘纵筋模型
+            self.stair_solid.build_bottom_edge_stir_shape(),  # 底部边缘箍筋模型
+            self.stair_solid.build_top_edge_stir_shape(),  # 顶部边缘箍筋模型
+            self.stair_solid.build_hole_rein_rebar_shape(),  # 孔洞加强钢筋模型
+            self.stair_solid.build_hoist_rein_long_rebar_shape(),  # 吊装加强纵筋模型
+            self.stair_solid.build_hoist_rein_point_rebar_shape(),  # 吊装加强点筋模型
+            self.stair_solid.build_bottom_edge_rein_rebar_shape(),  # 下部边缘加强筋模型
+            self.stair_solid.build_top_edge_rein_rebar_shape(),  # 上部边缘加强筋模型
+        ]
+        return make_compound_shape(rebar_models)
 
     def get_stair_rebar_embedded_part_model(self):
         """
         获取楼梯钢筋和预埋件数据模型
         :return:
         """
-        from OCC.Core import BOPAlgo  # 加速布尔运算
-
-        BOPAlgo.BOPAlgo_Algo.SetParallelMode(True)
-        bottom_long_rebar_model = (
-            self.stair_solid.build_bottom_long_rebar_shape()
-        )  # 底部纵筋形状模型
-        top_long_rebar_model = self.stair_solid.build_top_long_rebar_shape()  # 顶部纵筋形状模型
-        update_model_1 = BRepAlgoAPI_Fuse(
-            bottom_long_rebar_model, top_long_rebar_model
-        ).Shape()  # 合并顶部纵筋
-        mid_distribute_rebar_model = (
-            self.stair_solid.build_mid_distribution_rebar_shape()
-        )  # 中部分布筋形状模型
-        update_model_1 = BRepAlgoAPI_Fuse(
-            update_model_1, mid_distribute_rebar_model
-        ).Shape()  # 合并中部分布筋
-        bottom_edge_long_rebar_model = (
-            self.stair_solid.build_bottom_edge_long_rebar_shape()
-        )  # 底部边缘纵筋模型
-        update_model_1 = BRepAlgoAPI_Fuse(
-            update_model_1, bottom_edge_long_rebar_model
-        ).Shape()
-        top_edge_long_rebar_model = (
-            self.stair_solid.build_top_edge_long_rebar_shape()
-        )  # 顶部边缘纵筋模型
-        update_model_1 = BRepAlgoAPI_Fuse(
-            update_model_1, top_edge_long_rebar_model
-        ).Shape()
-        # update_model_2
-        bottom_edge_stir_model = (
-            self.stair_solid.build_bottom_edge_stir_shape()
-        )  # 底部边缘箍筋模型
-        top_edge_stir_model = self.stair_solid.build_top_edge_stir_shape()  # 顶部边缘箍筋模型
-        update_model_2 = BRepAlgoAPI_Fuse(
-            bottom_edge_stir_model, top_edge_stir_model
-        ).Shape()
-        hole_rein_rebar_model = (
-            self.stair_solid.build_hole_rein_rebar_shape()
-        )  # 孔洞加强钢筋模型
-        update_model_2 = BRepAlgoAPI_Fuse(update_model_2, hole_rein_rebar_model).Shape()
-        hoist_rein_long_rebar_model = (
-            self.stair_solid.build_hoist_rein_long_rebar_shape()
-        )  # 吊装加强纵筋模型
-        update_model_2 = BRepAlgoAPI_Fuse(
-            update_model_2, hoist_rein_long_rebar_model
-        ).Shape()
-        hoist_rein_point_rebar_model = (
-            self.stair_solid.build_hoist_rein_point_rebar_shape()
-        )  # 吊装加强点筋模型
-        update_model_2 = BRepAlgoAPI_Fuse(
-            update_model_2, hoist_rein_point_rebar_model
-        ).Shape()
-        bottom_edge_rein_rebar_model = (
-            self.stair_solid.build_bottom_edge_rein_rebar_shape()
-        )  # 下部边缘加强筋模型
-        update_model_2 = BRepAlgoAPI_Fuse(
-            update_model_2, bottom_edge_rein_rebar_model
-        ).Shape()
-        top_edge_rein_rebar_model = (
-            self.stair_solid.build_top_edge_rein_rebar_shape()
-        )  # 上部边缘加强筋模型
-        update_model_2 = BRepAlgoAPI_Fuse(
-            update_model_2, top_edge_rein_rebar_model
-        ).Shape()
-        # 合并两个模型
-        update_model = BRepAlgoAPI_Fuse(update_model_1, update_model_2).Shape()
-        rail_model = self.stair_solid.build_railing_embedded_shape()
-        hoist_model = self.stair_solid.build_hoist_embedded_part_shape()
-        demold_model = self.stair_solid.build_demold_embedded_part_shape()
-        update_model = BRepAlgoAPI_Fuse(update_model, rail_model).Shape()
-        update_model = BRepAlgoAPI_Fuse(update_model, hoist_model).Shape()
-        update_model = BRepAlgoAPI_Fuse(update_model, demold_model).Shape()
-        return update_model
+        rebar_model = self.get_stair_rebar_part_model()  # 钢筋网笼模型
+        embedded_part_model = self.get_embedded_part_model()  # 预埋件模型
+        return make_compound_shape([rebar_model, embedded_part_model])
 
     def get_hoist_embedded_part_rabbet_model(self):
         """
@@ -3351,16 +3166,13 @@ class BuildMergeAndCutModel(object):
         hoist_embedded_part_model = (
             self.stair_solid.build_hoist_embedded_part_shape()
         )  # 吊装预埋件模型
-        update_model = BRepAlgoAPI_Fuse(
-            rail_embedded_model, hoist_embedded_part_model
-        ).Shape()
         demold_embedded_part_model = (
             self.stair_solid.build_demold_embedded_part_shape()
         )  # 脱模预埋件模型
-        update_model = BRepAlgoAPI_Fuse(
-            update_model, demold_embedded_part_model
-        ).Shape()
-
+        # 各类预埋件互不相交,组合为复合体即可
+        update_model = make_compound_shape(
+            [rail_embedded_model, hoist_embedded_part_model, demold_embedded_part_model]
+        )
         return update_model
 
     def get_hoist_embedded_part_model(self):
@@ -17,6 +17,9 @@ from OCC.Core.TopoDS import (
 )  # 获取实体的拓扑形状,拓扑顶点，拓扑多线段
 from stair_dxf.generate_drawing.occ_drawing.occ_expand_function import (
     compute_project_shape,
+    compute_project_entities,
+    discretize_edge,
+    my_BRepAlgoAPI_Section,
     rotation_solid,
     move_solid,
     get_U_rein_rebar_vertex,
@@ -57,7 +60,7 @@ from stair_dxf.stair_design.countrebar import (
     StepSlotLoc,
     RailingEmbeddedPart,
 )
-from OCC.Extend.TopologyUtils import TopologyExplorer, discretize_edge
+from OCC.Extend.TopologyUtils import TopologyExplorer
 from stair_dxf.generate_drawing.dxf_drawing_generate.basic_method import (
     get_vector_of_two_points,
 )
@@ -84,6 +87,29 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def get_hoist_embedded_part_entities(
+    hoist_loc: HoistingEmbeddedPartsLoc, scale: float
+) -> List[Dict]:
+    """
+    单个吊装预埋件在原点处沿x 方向的投影图元,作为侧视图中吊装预埋件的图块定义。
+    投影平面坐标为(z,-y),预埋件关于其竖直轴线对称,与侧视图坐标(z,y)一致
+    :param hoist_loc: 吊装预埋件定位数据
+    :param scale: 实际尺寸与绘图尺寸的比例
+    :return:
+    """
+    hoist_info = hoist_loc.get_hoist_embedded_part_info()
+    shape = hoist_info["specification"]  # 吊装预埋件的规格
+    if hoist_info["type"] == 0:  # ROUNDING_HEAD = 0 #    ANCHOR = 1
+        part_model = BuildStairSolidModel.build_rounding_heading_embedded_part_shape(
+            [0, 0, 0], shape, 0, [0, 0, 1]
+        )
+    else:
+        part_model = BuildStairSolidModel.build_embedded_anchor_embedded_part_shape(
+            [0, 0, 0], shape, 0, [0, 0, 1]
+        )
+    return compute_project_entities(part_model, gp_Pnt(0, 0, 0), gp_Dir(1, 0, 0), scale)
+
+
 # 图形精度
 
 
@@ -137,9 +163,10 @@ class StairTopViewData(object):
         self.sin = self.detail_book.sin
         self.cover = self.slab_struct.construction.concrete_cover_thickness  # 保护层厚度
 
-    def get_stair_solid_projection(self):
+    def get_stair_solid_projection(self, scale: float = 1):
         """
         得到主体投影图
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         """
         entity_model = self.composite_model.get_stair_and_ear_model()  # 获取楼梯实体模型
@@ -147,12 +174,15 @@ class StairTopViewData(object):
         normal = [0, 0, 1]
         origin = gp_Pnt(point_0[0], point_0[1], point_0[2])  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
-        project, points = compute_project_shape(entity_model, origin, project_dir)
+        project, points = compute_project_shape(
+            entity_model, origin, project_dir, scale
+        )
         return points
 
-    def get_step_slot_projection(self):
+    def get_step_slot_projection(self, scale: float = 1):
         """
         获取防滑槽投影数据
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         """
         entity_model = self.composite_model.get_stair_all_step_slot_model()  # 获取楼梯防滑槽模型
@@ -160,12 +190,15 @@ class StairTopViewData(object):
         normal = [0, 0, 1]
         origin = gp_Pnt(point_0[0], point_0[1], point_0[2])  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
-        project, points = compute_project_shape(entity_model, origin, project_dir)
+        project, points = compute_project_shape(
+            entity_model, origin, project_dir, scale
+        )
         return points
 
-    def get_hole_projection(self):
+    def get_hole_projection(self, scale: float = 1):
         """
         获取孔洞投影数据
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         """
         entity_model = self.composite_model.get_stair_all_hole_model()  # 获取楼梯孔洞模型
@@ -173,10 +206,45 @@ class StairTopViewData(object):
         normal = [0, 0, 1]
         origin = gp_Pnt(point_0[0], point_0[1], point_0[2])  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
-        project, points = compute_project_shape(entity_model, origin, project_dir)
+        project, points = compute_project_shape(
+            entity_model, origin, project_dir, scale
+        )
 
         return points
 
+    def get_stair_solid_projection_entities(self, scale: float):
+        """
+        得到主体投影图元:直线、圆弧等按类型输出
+        :param scale: 实际尺寸与绘图尺寸的比例
+        :return:
+        """
+        entity_model = self.composite_model.get_stair_and_ear_model()  # 获取楼梯实体模型
+        origin = gp_Pnt(0, 0, 0)  # 参考原点
+        project_dir = gp_Dir(0, 0, 1)  # 投影方向
+        return compute_project_entities(entity_model, origin, project_dir, scale)
+
+    def get_step_slot_projection_entities(self, scale: float):
+        """
+        获取防滑槽投影图元
+        :param scale: 实际尺寸与绘图尺寸的比例
+        :return:
+        """
+        entity_model = self.composite_model.get_stair_all_step_slot_model()  # 获取楼梯防滑槽模型
+        origin = gp_Pnt(0, 0, 0)  # 参考原点
+        project_dir = gp_Dir(0, 0, 1)  # 投影方向
+        return compute_project_entities(entity_model, origin, project_dir, scale)
+
+    def get_hole_projection_entities(self, scale: float):
+        """
+        获取孔洞投影图元:孔洞轮廓直接输出为圆
+        :param scale: 实际尺寸与绘图尺寸的比例
+        :return:
+        """
+        entity_model = self.composite_model.get_stair_all_hole_model()  # 获取楼梯孔洞模型
+        origin = gp_Pnt(0, 0, 0)  # 参考原点
+        project_dir = gp_Dir(0, 0, 1)  # 投影方向
+        return compute_project_entities(entity_model, origin, project_dir, scale)
+
     def get_hoist_embedded_projection(self):
         """
         获取吊装预埋件投影---实体直接投影是一个面，并非轮廓图形，此处绘制的是一个示意图
@@ -207,9 +275,7 @@ class StairTopViewData(object):
         通过一个平面切割实体，获得切割后的图形
         :return:
         """
-        from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-
-        wire_model = BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
+        wire_model = my_BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
         return wire_model
 
     def get_hole_rein_rebar_section(self):
@@ -233,7 +299,7 @@ class StairTopViewData(object):
         hole_rein_rebar_model = (
             self.composite_model.get_hole_rein_rebar_model()
         )  # 获取楼梯孔洞加强筋模型
-        from OCC.Extend.TopologyUtils import TopologyExplorer, discretize_edge
+        from OCC.Extend.TopologyUtils import TopologyExplorer
 
         rebar_locs = [
             [top_loc.x, top_loc.y, top_loc.z],
@@ -310,9 +376,10 @@ class StairBottomViewData(object):
         self.sin = self.detail_book.sin
         self.cover = self.slab_struct.construction.concrete_cover_thickness  # 保护层厚度
 
-    def get_stair_solid_projection(self):
+    def get_stair_solid_projection(self, scale: float = 1):
         """
         得到主体仰视投影图
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         """
         entity_model = self.composite_model.get_stair_and_ear_model()  # 获取楼梯实体模型
@@ -320,13 +387,16 @@ class StairBottomViewData(object):
         normal = [0, 0, -1]
         origin = gp_Pnt(point_0[0], point_0[1], point_0[2])  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
-        project, points = compute_project_shape(entity_model, origin, project_dir)
+        project, points = compute_project_shape(
+            entity_model, origin, project_dir, scale
+        )
         # draw_multiple_line(points)
         return points
 
-    def get_hole_projection(self):
+    def get_hole_projection(self, scale: float = 1):
         """
         获取孔洞投影数据
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         """
         entity_model = self.composite_model.get_stair_all_hole_model()  # 获取楼梯孔洞模型
@@ -334,19 +404,30 @@ class StairBottomViewData(object):
         normal = [0, 0, 1]
         origin = gp_Pnt(point_0[0], point_0[1], point_0[2])  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
-        project, points = compute_project_shape(entity_model, origin, project_dir)
+        project, points = compute_project_shape(
+            entity_model, origin, project_dir, scale
+        )
 
         return points
 
+    def get_hole_projection_entities(self, scale: float):
+        """
+        获取孔洞投影图元:孔洞轮廓直接输出为圆
+        :param scale: 实际尺寸与绘图尺寸的比例
+        :return:
+        """
+        entity_model = self.composite_model.get_stair_all_hole_model()  # 获取楼梯孔洞模型
+        origin = gp_Pnt(0, 0, 0)  # 参考原点
+        project_dir = gp_Dir(0, 0, 1)  # 投影方向
+        return compute_project_entities(entity_model, origin, project_dir, scale)
+
     @staticmethod
     def get_solid_cut_drawing(plane, cut_model):
         """
         通过一个平面切割实体，获得切割后的图形
         :return:
         """
-        from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-
-        wire_model = BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
+        wire_model = my_BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
         return wire_model
 
     def get_hole_rein_rebar_section(self):
@@ -459,9 +540,10 @@ class StairLeftViewData(object):
         self.sin = self.detail_book.sin
         self.cover = self.slab_struct.construction.concrete_cover_thickness  # 保护层厚度
 
-    def get_stair_entity_left_view(self):
+    def get_stair_entity_left_view(self, scale: float = 1):
         """
         获取楼梯左侧视图
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         """
         entity_model = (
@@ -476,7 +558,7 @@ class StairLeftViewData(object):
         origin = gp_Pnt(point_0[0], point_0[1], point_0[2])  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
         project, points = compute_project_shape(
-            rotation_stair_entity, origin, project_dir
+            rotation_stair_entity, origin, project_dir, scale
         )
         # draw_multiple_line(points)
         return points
@@ -489,9 +571,7 @@ class StairLeftViewData(object):
         :param cut_model: 待切割实体
         :return:
         """
-        from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-
-        wire_model = BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
+        wire_model = my_BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
         return wire_model
 
     def get_stair_solid_left_cut_drawing(self):
@@ -573,9 +653,9 @@ class StairLeftViewData(object):
             total_vertex.append(rebar_loc)
         return total_vertex
 
-    def get_hoist_embedded_cut_shape(self):
+    def get_hoist_embedded_left_loc(self) -> List[List[float]]:
         """
-        剖切吊装预埋件
+        获取左侧吊装预埋件的坐标位置,标志点为企口下边缘
         :return:
         """
         hoist_loc = self.hoist_loc.get_hoist_embedded_part_loc()  # 获取吊装预埋件坐标位置
@@ -585,26 +665,20 @@ class StairLeftViewData(object):
             current_point = hoist_loc[num]  # 当前吊装预埋件位置
             if current_point.x < limit_x:
                 left_loc.append([current_point.x, current_point.y, current_point.z])
-        # 剖切平面
-        hoist_model = self.composite_model.get_hoist_embedded_part_model()
-        origin = left_loc[0]
-        plane = gp_Pln(gp_Pnt(origin[0], origin[1], origin[2]), gp_Dir(1, 0, 0))  # 剖切平面
-        compound_ = self.get_solid_cut_drawing(
-            plane, hoist_model
-        ).Shape()  # TopoDS_compound
-        edge = []
-        if compound_:
-            edge += list(TopologyExplorer(compound_).edges())
-        points_ = []
-        for edge_ in edge:
-            points_3d = discretize_edge(edge_, self.drawing_precision)  # 转换成点
-            points_.append(points_3d)
-        # draw_multiple_line(points_)
-        return points_
+        return left_loc
 
-    def get_hoist_embedded_projection_data(self):
+    def get_hoist_embedded_part_entities(self, scale: float) -> List[Dict]:
+        """
+        获取单个吊装预埋件的投影图元,各预埋件形状相同,以图块插入
+        :param scale: 实际尺寸与绘图尺寸的比例
+        :return:
+        """
+        return get_hoist_embedded_part_entities(self.hoist_loc, scale)
+
+    def get_hoist_embedded_projection_data(self, scale: float = 1):
         """
         获取吊装预埋件投影数据
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         """
         hoist_model = self.composite_model.get_hoist_embedded_part_model()  # 获取吊装预埋件
@@ -612,7 +686,7 @@ class StairLeftViewData(object):
         normal = [1, 0, 0]
         origin = gp_Pnt(point_0[0], point_0[1], point_0[2])  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
-        project, points = compute_project_shape(hoist_model, origin, project_dir)
+        project, points = compute_project_shape(hoist_model, origin, project_dir, scale)
         # draw_multiple_line(points)
         return points
 
@@ -667,9 +741,10 @@ class StairRightViewData(object):
         self.sin = self.detail_book.sin
         self.cover = self.slab_struct.construction.concrete_cover_thickness  # 保护层厚度
 
-    def get_stair_entity_right_view(self):
+    def get_stair_entity_right_view(self, scale: float = 1):
         """
         获取楼梯右侧视图
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         """
         entity_model = self.composite_model.get_stair_entity_complete_model()
@@ -682,7 +757,7 @@ class StairRightViewData(object):
         origin = gp_Pnt(point_0[0], point_0[1], point_0[2])  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
         project, points = compute_project_shape(
-            rotation_stair_entity, origin, project_dir
+            rotation_stair_entity, origin, project_dir, scale
         )
         return points
 
@@ -747,9 +822,7 @@ class StairSectionOneViewData(object):
         :param cut_model: 待切割实体
         :return:
         """
-        from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-
-        wire_model = BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
+        wire_model = my_BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
         return wire_model
 
     def get_stair_solid_section_view(self):
@@ -873,9 +946,7 @@ class StairSectionTwoViewData(object):
         :param cut_model: 待切割实体
         :return:
         """
-        from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-
-        wire_model = BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
+        wire_model = my_BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
         return wire_model
 
     def get_stair_solid_section_view(self):
@@ -1105,9 +1176,7 @@ class StairReinforceViewData(object):
         :param cut_model: 待切割实体
         :return:
         """
-        from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-
-        wire_model = BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
+        wire_model = my_BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
         return wire_model
 
     def get_stair_solid_profile_cut_drawing(self):
@@ -1189,9 +1258,9 @@ class StairReinforceViewData(object):
             total_vertex.append(rebar_loc)
         return total_vertex
 
-    def get_hoist_embedded_cut_shape(self):
+    def get_hoist_embedded_left_loc(self) -> List[List[float]]:
         """
-        剖切吊装预埋件
+        获取左侧吊装预埋件的坐标位置,标志点为企口下边缘
         :return:
         """
         hoist_loc = self.hoist_loc.get_hoist_embedded_part_loc()  # 获取吊装预埋件坐标位置
@@ -1201,22 +1270,15 @@ class StairReinforceViewData(object):
             current_point = hoist_loc[num]  # 当前吊装预埋件位置
             if current_point.x < limit_x:
                 left_loc.append([current_point.x, current_point.y, current_point.z])
-        # 剖切平面
-        hoist_model = self.composite_model.get_hoist_embedded_part_model()
-        origin = left_loc[0]
-        plane = gp_Pln(gp_Pnt(origin[0], origin[1], origin[2]), gp_Dir(1, 0, 0))  # 剖切平面
-        compound_ = self.get_solid_cut_drawing(
-            plane, hoist_model
-        ).Shape()  # TopoDS_compound
-        edge = []
-        if compound_:
-            edge += list(TopologyExplorer(compound_).edges())
-        points_ = []
-        for edge_ in edge:
-            points_3d = discretize_edge(edge_, self.drawing_precision)  # 转换成点
-            points_.append(points_3d)
-        # draw_multiple_line(points_)
-        return points_
+        return left_loc
+
+    def get_hoist_embedded_part_entities(self, scale: float) -> List[Dict]:
+        """
+        获取单个吊装预埋件的投影图元,各预埋件形状相同,以图块插入
+        :param scale: 实际尺寸与绘图尺寸的比例
+        :return:
+        """
+        return get_hoist_embedded_part_entities(self.hoist_loc, scale)
 
     def get_bottom_long_rebar_cut_shape(self):
         """
@@ -1485,9 +1547,10 @@ class StairReinforceViewData(object):
         # draw_multiple_line(points_)
         return points_
 
-    def get_hoist_embedded_projection_data(self):
+    def get_hoist_embedded_projection_data(self, scale: float = 1):
         """
         获取吊装预埋件投影数据
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         """
         hoist_model = self.composite_model.get_hoist_embedded_part_model()  # 获取吊装预埋件
@@ -1495,7 +1558,7 @@ class StairReinforceViewData(object):
         normal = [1, 0, 0]
         origin = gp_Pnt(point_0[0], point_0[1], point_0[2])  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
-        project, points = compute_project_shape(hoist_model, origin, project_dir)
+        project, points = compute_project_shape(hoist_model, origin, project_dir, scale)
         # draw_multiple_line(points)
         return points
 
@@ -1616,9 +1679,7 @@ class StairRebarSectionAToAViewData(object):
         :param cut_model: 待切割实体
         :return:
         """
-        from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-
-        wire_model = BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
+        wire_model = my_BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
         return wire_model
 
     def get_stair_solid_profile_cut_drawing(self):
@@ -2000,9 +2061,7 @@ class StairRebarSectionBToBViewData(object):
         :param cut_model: 待切割实体
         :return:
         """
-        from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-
-        wire_model = BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
+        wire_model = my_BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
         return wire_model
 
     def get_view_rotation_angle(self):
@@ -2472,9 +2531,7 @@ class StairRebarSectionCToCViewData(object):
         :param cut_model: 待切割实体
         :return:
         """
-        from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-
-        wire_model = BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
+        wire_model = my_BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
         return wire_model
 
     def get_stair_solid_profile_cut_drawing(self):
@@ -2845,9 +2902,10 @@ class StairProjectionDrawingData(object):
         self.sin = self.detail_book.sin
         self.cover = self.slab_struct.construction.concrete_cover_thickness  # 保护层厚度
 
-    def get_stair_entity_top_view(self):
+    def get_stair_entity_top_view(self, scale: float = 1):
         """
         获取楼梯实体俯视图数据
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         """
         entity_model = (
@@ -2857,12 +2915,15 @@ class StairProjectionDrawingData(object):
         normal = [0, 0, 1]
         origin = gp_Pnt(point_0[0], point_0[1], point_0[2])  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
-        project, points = compute_project_shape(entity_model, origin, project_dir)
+        project, points = compute_project_shape(
+            entity_model, origin, project_dir, scale
+        )
         return points
 
-    def get_stair_entity_left_view(self):
+    def get_stair_entity_left_view(self, scale: float = 1):
         """
         获取楼梯左侧视图
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         """
         entity_model = (
@@ -2877,13 +2938,14 @@ class StairProjectionDrawingData(object):
         origin = gp_Pnt(point_0[0], point_0[1], point_0[2])  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
         project, points = compute_project_shape(
-            rotation_stair_entity, origin, project_dir
+            rotation_stair_entity, origin, project_dir, scale
         )
         return rotation_stair_entity
 
-    def get_stair_entity_right_view(self):
+    def get_stair_entity_right_view(self, scale: float = 1):
         """
         获取楼梯右侧视图
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         """
         entity_model = self.composite_model.get_stair_entity_complete_model()
@@ -2896,12 +2958,13 @@ class StairProjectionDrawingData(object):
         origin = gp_Pnt(point_0[0], point_0[1], point_0[2])  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
         project, points = compute_project_shape(
-            rotation_stair_entity, origin, project_dir
+            rotation_stair_entity, origin, project_dir, scale
         )
 
-    def get_stair_entity_bottom_view(self):
+    def get_stair_entity_bottom_view(self, scale: float = 1):
         """
         获取楼梯俯视图
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         """
         entity_model = (
@@ -2916,13 +2979,14 @@ class StairProjectionDrawingData(object):
         origin = gp_Pnt(point_0[0], point_0[1], point_0[2])  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
         project, points = compute_project_shape(
-            rotation_stair_entity, origin, project_dir
+            rotation_stair_entity, origin, project_dir, scale
         )
         return rotation_stair_entity
 
-    def get_hole_rein_rebar_top_view(self):
+    def get_hole_rein_rebar_top_view(self, scale: float = 1):
         """
         获取孔洞加强筋的俯视图
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         """
         hole_rebar_model = (
@@ -2932,7 +2996,9 @@ class StairProjectionDrawingData(object):
         normal = [0, 0, 1]
         origin = gp_Pnt(point_0[0], point_0[1], point_0[2])  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
-        project, points = compute_project_shape(hole_rebar_model, origin, project_dir)
+        project, points = compute_project_shape(
+            hole_rebar_model, origin, project_dir, scale
+        )
         return hole_rebar_model
 
     @staticmethod
@@ -2941,9 +3007,7 @@ class StairProjectionDrawingData(object):
         通过一个平面切割实体，获得切割后的图形
         :return:
         """
-        from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-
-        wire_model = BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
+        wire_model = my_BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
         return wire_model
 
     def get_bottom_long_rebar_profile_drawing(self):
@@ -3068,9 +3132,7 @@ class StairStepSlotLeftViewData(object):
         :param cut_model: 待切割实体
         :return:
         """
-        from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-
-        wire_model = BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
+        wire_model = my_BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
         return wire_model
 
     def get_stair_solid_long_cut_plane_point(self):
@@ -3628,9 +3690,7 @@ class StairStepSlotTopViewData(object):
         :param cut_model: 待切割实体
         :return:
         """
-        from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-
-        wire_model = BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
+        wire_model = my_BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
         return wire_model
 
     def get_stair_solid_long_cut_plane_point(self):
@@ -3644,9 +3704,10 @@ class StairStepSlotTopViewData(object):
         current_point = [loc_x, loc_y, loc_z]
         return current_point
 
-    def get_stair_solid_projection(self):
+    def get_stair_solid_projection(self, scale: float = 1):
         """
         得到主体投影图
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         """
         entity_model = self.composite_model.get_stair_and_ear_model()  # 获取楼梯实体模型
@@ -3654,12 +3715,15 @@ class StairStepSlotTopViewData(object):
         normal = [0, 0, 1]
         origin = gp_Pnt(point_0[0], point_0[1], point_0[2])  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
-        project, points = compute_project_shape(entity_model, origin, project_dir)
+        project, points = compute_project_shape(
+            entity_model, origin, project_dir, scale
+        )
         return points
 
-    def get_step_slot_projection(self):
+    def get_step_slot_projection(self, scale: float = 1):
         """
         获取防滑槽投影数据
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         """
         entity_model = self.composite_model.get_single_step_slot_model(
@@ -3669,7 +3733,9 @@ class StairStepSlotTopViewData(object):
         normal = [0, 0, 1]
         origin = gp_Pnt(point_0[0], point_0[1], point_0[2])  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
-        project, points = compute_project_shape(entity_model, origin, project_dir)
+        project, points = compute_project_shape(
+            entity_model, origin, project_dir, scale
+        )
         # draw_multiple_line(points)
         return points
 
@@ -4104,9 +4170,7 @@ class StairBottomInstallNodeViewData(object):
         :param cut_model: 待切割实体
         :return:
         """
-        from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-
-        wire_model = BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
+        wire_model = my_BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
         return wire_model
 
     def get_stair_solid_long_cut_plane_point(self):
@@ -4265,9 +4329,10 @@ class StairBottomInstallNodeViewData(object):
             points_.append(points_3d)
         return points_
 
-    def get_stair_bottom_connect_nut_projection_drawing(self):
+    def get_stair_bottom_connect_nut_projection_drawing(self, scale: float = 1):
         """
         获取楼梯底部连接螺母投影数据图
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         """
         bottom_nut_model = self.composite_model.get_bottom_connect_nut_model()
@@ -4275,13 +4340,16 @@ class StairBottomInstallNodeViewData(object):
         normal = [1, 0, 0]
         origin = gp_Pnt(0, 0, 0)  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
-        project, points = compute_project_shape(bottom_nut_model, origin, project_dir)
+        project, points = compute_project_shape(
+            bottom_nut_model, origin, project_dir, scale
+        )
         # draw_multiple_line(points)
         return points
 
-    def get_stair_bottom_connect_shim_projection_drawing(self):
+    def get_stair_bottom_connect_shim_projection_drawing(self, scale: float = 1):
         """
         获取楼梯底部连接螺母垫片投影数据图
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         point_0 = self.get_stair_solid_long_cut_plane_point()  # 基点很重要---会影响投影后的点绝对坐标
         """
@@ -4289,7 +4357,9 @@ class StairBottomInstallNodeViewData(object):
         normal = [1, 0, 0]
         origin = gp_Pnt(0, 0, 0)  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
-        project, points = compute_project_shape(bottom_shim_model, origin, project_dir)
+        project, points = compute_project_shape(
+            bottom_shim_model, origin, project_dir, scale
+        )
         # draw_multiple_line(points)
         return points
 
@@ -5436,9 +5506,7 @@ class StairTopInstallNodeViewData(object):
         :param cut_model: 待切割实体
         :return:
         """
-        from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-
-        wire_model = BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
+        wire_model = my_BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
         return wire_model
 
     def get_stair_solid_long_cut_plane_point(self):
@@ -5597,9 +5665,10 @@ class StairTopInstallNodeViewData(object):
             points_.append(points_3d)
         return points_
 
-    def get_stair_top_connect_nut_projection_drawing(self):
+    def get_stair_top_connect_nut_projection_drawing(self, scale: float = 1):
         """
         获取楼梯顶部连接螺母投影数据图
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         """
         top_nut_model = self.composite_model.get_top_connect_nut_model()
@@ -5607,13 +5676,16 @@ class StairTopInstallNodeViewData(object):
         normal = [1, 0, 0]
         origin = gp_Pnt(0, 0, 0)  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
-        project, points = compute_project_shape(top_nut_model, origin, project_dir)
+        project, points = compute_project_shape(
+            top_nut_model, origin, project_dir, scale
+        )
         # draw_multiple_line(points)
         return points
 
-    def get_stair_top_connect_shim_projection_drawing(self):
+    def get_stair_top_connect_shim_projection_drawing(self, scale: float = 1):
         """
         获取楼梯顶部连接螺母垫片投影数据图
+        :param scale: 实际尺寸与绘图尺寸的比例,决定曲线的离散误差
         :return:
         point_0 = self.get_stair_solid_long_cut_plane_point()  # 基点很重要---会影响投影后的点绝对坐标
         """
@@ -5621,7 +5693,9 @@ class StairTopInstallNodeViewData(object):
         normal = [1, 0, 0]
         origin = gp_Pnt(0, 0, 0)  # 参考原点
         project_dir = gp_Dir(normal[0], normal[1], normal[2])  # 投影方向
-        project, points = compute_project_shape(top_shim_model, origin, project_dir)
+        project, points = compute_project_shape(
+            top_shim_model, origin, project_dir, scale
+        )
         # draw_multiple_line(points)
         return points
 
@@ -6780,9 +6854,7 @@ class StairDoubleSideWallJointLongViewData(object):
         :param cut_model: 待切割实体
         :return:
         """
-        from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-
-        wire_model = BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
+        wire_model = my_BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
         return wire_model
 
     def get_stair_solid_long_cut_plane_point(self):
@@ -8134,9 +8206,7 @@ class StairBottomHoleReinRebarViewData(object):
         :param cut_model: 待切割实体
         :return:
         """
-        from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-
-        wire_model = BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
+        wire_model = my_BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
         return wire_model
 
     def get_stair_solid_long_cut_plane_point(self):
@@ -9192,9 +9262,7 @@ class StairTopHoleReinRebarViewData(object):
         :param cut_model: 待切割实体
         :return:
         """
-        from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-
-        wire_model = BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
+        wire_model = my_BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
         return wire_model
 
     def get_stair_solid_long_cut_plane_point(self):
@@ -10262,9 +10330,7 @@ class StairRailEmbeddedDetailViewData(object):
         :param cut_model: 待切割实体
         :return:
         """
-        from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-
-        wire_model = BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
+        wire_model = my_BRepAlgoAPI_Section(cut_model, plane)  # 获取平面剖切后的线框图
         return wire_model
 
     def get_stair_rail_embedded_weld_cut_plane_point(self):
@@ -23,6 +23,7 @@ from stair_dxf.stair_design.datas import (
     ConnectionHoleInformation,
 )
 from stair_dxf.stair_design.tools import rebar_mandrel_radius
+from stair_detailed.geometry import get_stair_geometry
 from typing import Dict, List
 import math
 import numpy as np
@@ -1128,6 +1129,9 @@ class HoistingEmbeddedPartsLoc(object):
         self.detail_slab = detail_slab
         self.struct_book = struct_book
         self.detail_book = detail_book
+        self.geometry = get_stair_geometry(
+            slab_design, struct_book, detail_slab, detail_book
+        )  # 与IFC、钢筋排布共用的几何数据
         self.generate_basic_datas()  #
 
     def generate_basic_datas(self):
@@ -1162,33 +1166,14 @@ class HoistingEmbeddedPartsLoc(object):
         计算吊装预埋件的坐标点,标志点为企口下边缘
         :return:
         """
-        lifting_position_a = self.detail_slab.inserts_detailed.lifting_position.a
-        lifting_position_b = self.detail_slab.inserts_detailed.lifting_position.b
-        lifting_position_c = float(
-            self.detail_slab.inserts_detailed.lifting_position.c
-        )  # 吊装预埋件左侧横向边距
-        lifting_position_d = float(
-            self.detail_slab.inserts_detailed.lifting_position.d
-        )  # 吊装预埋件右侧横向边距
-        edge_a = self.lb_d + (lifting_position_a - 0.5) * self.tabu_b  # 吊装预埋件顶端纵向边距
-        edge_b = self.lb_d + (lifting_position_b - 0.5) * self.tabu_b  # 吊装预埋件底端纵向边距
-        edge_c = lifting_position_c  # 吊装预埋件左侧横向边距
-        edge_d = lifting_position_d  # 吊装预埋件右侧横向边距
-        top_h = self.h2 + lifting_position_a * self.tabu_h
-        bottom_h = self.h2 + lifting_position_b * self.tabu_h
-
         if self.lifting_type.value == 0:  # ROUNDING_HEAD = 0 #    ANCHOR = 1
             embedded_part_height = self.lifting_parameter.radius  # 吊装预埋件直径  # 埋入深度
         else:  # self.lifting_type.value == 1:
             embedded_part_height = self.lifting_parameter.m_length  # 埋入深度
-        rebar_x = [edge_c, self.b0 - edge_d]
-        rebar_y = [edge_b, edge_a]  # zc改
-        rebar_z = [bottom_h - embedded_part_height, top_h - embedded_part_height]
+        # 预埋件上部中心点下移埋入深度
         embedded_part = [
-            Point(x=rebar_x[0], y=rebar_y[0], z=rebar_z[0]),
-            Point(x=rebar_x[0], y=rebar_y[1], z=rebar_z[1]),
-            Point(x=rebar_x[1], y=rebar_y[0], z=rebar_z[0]),
-            Point(x=rebar_x[1], y=rebar_y[1], z=rebar_z[1]),
+            Point(x=x, y=y, z=z - embedded_part_height)
+            for x, y, z in self.geometry.lifting_positions
         ]
         return embedded_part
 
@@ -1367,6 +1352,9 @@ class StepSlotLoc(object):
         self.detail_slab = detail_slab
         self.struct_book = struct_book
         self.detail_book = detail_book
+        self.geometry = get_stair_geometry(
+            slab_design, struct_book, detail_slab, detail_book
+        )  # 与IFC、钢筋排布共用的几何数据
         self.generate_basic_datas()  #
 
     def generate_basic_datas(self):
@@ -1408,17 +1396,11 @@ class StepSlotLoc(object):
         :return:[[防滑槽组1],[防滑槽组2],[防滑槽组3],[防滑槽组4]]
         """
         total_width = self.step_slot_shape.a + self.step_slot_shape.b  # 防滑槽的宽度
-        edge_y_1 = self.step_slot_position.c3 + total_width / 2  # 组内边缘防滑槽面中心距y向边缘距离
-        step_locs = []  # 踏步定位信息
-        init_loc = [self.step_slot_position.c1, self.lb_d + edge_y_1, self.h2]  # 初始位置
-        tabu_w = self.tabu_b  # 踏步宽度
-        tabu_h = self.tabu_h  # 踏步高度
-        for num in range(self.n):
-            point_: Point = Point(0, 0, 0)
-            point_.x = init_loc[0]
-            point_.y = init_loc[1] + num * tabu_w
-            point_.z = init_loc[2] + (num + 1) * tabu_h
-            step_locs.append(point_)
+        # 防滑槽组右侧边缘沿y 向移至槽面中心
+        step_locs = [
+            Point(x=x, y=y + total_width / 2, z=z)
+            for x, y, z in self.geometry.step_slot_positions
+        ]
         return step_locs
 
     def get_step_slot_configuration(self) -> Dict:
@@ -2503,6 +2485,9 @@ class HoleLocation(object):
         self.detail_slab = detail_slab
         self.struct_book = struct_book
         self.detail_book = detail_book
+        self.geometry = get_stair_geometry(
+            slab_design, struct_book, detail_slab, detail_book
+        )  # 与IFC、钢筋排布共用的几何数据
         self.generate_basic_datas()  #
 
     def generate_basic_datas(self):
@@ -2552,30 +2537,10 @@ class HoleLocation(object):
         计算销键或连接孔洞的位置,以孔洞的下边缘的圆心为标志点
         :return:
         """
-        # 顶端孔洞边距
-        top_right_long_a1 = self.top_hole_position.a1  # 顶端右侧纵向边距
-        top_right_horizon_b1 = self.top_hole_position.b1  # 顶端右侧横向边距
-        top_left_long_a2 = self.top_hole_position.a2  # 顶端左侧纵向边距
-        top_left_horizon_b2 = self.top_hole_position.b2  # 顶端左侧横向边距
-        # 底端孔洞边距
-        bottom_right_long_a3 = self.bottom_hole_position.a3  # 底端右侧纵向边距
-        bottom_right_horizon_b3 = self.bottom_hole_position.b3  # 底端右侧横向边距
-        bottom_left_long_a4 = self.bottom_hole_position.a4  # 底端左侧纵向边距
-        bottom_left_horizon_b4 = self.bottom_hole_position.b4  # 底端左侧横向边距
-
-        total_l = self.lb_d + self.ln + self.lt_d  # 纵向总长
-        total_h = self.h2 + self.height  # 楼梯总高
         hole_model = [
-            Point(x=bottom_left_horizon_b4, y=bottom_left_long_a4, z=0),
-            Point(x=self.b0 - bottom_right_horizon_b3, y=bottom_right_long_a3, z=0),
-            Point(
-                x=top_left_horizon_b2, y=total_l - top_left_long_a2, z=total_h - self.h1
-            ),
-            Point(
-                x=self.b0 - top_right_horizon_b1,
-                y=total_l - top_right_long_a1,
-                z=total_h - self.h1,
-            ),
+            Point(x=x, y=y, z=z)
+            for x, y, z in self.geometry.bottom_hole_positions
+            + self.geometry.top_hole_positions
         ]  # 由底端到顶端，由左到向右
         return hole_model
 
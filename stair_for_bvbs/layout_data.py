@@ -0,0 +1,229 @@
+"""
+# File       : layout_data.py
+# Description：由钢筋排布结果(RebarforBIM)直接生成BVBS 钢筋数据,与IFC 中的钢筋一致,不再重复计算钢筋几何
+"""
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from dc_rebar import Rebar
+from stair_rebar_layout.models import RebarforBIM
+from stair_structure.model import StructuralDesign, RebarParameter
+
+from .models import REBAR_GROUP_MARKS, RebarforBVBS, RebarBVBS, RebarGeoBVBS
+from .tools import ANGLE_PRECISION, polyline_legs, rebar_mandrel_diameter
+
+_logger = logging.getLogger(__name__)
+
+FIRST_EXTRA_MARK = max(REBAR_GROUP_MARKS.values()) + 1  # 同组其余形状的起始序号
+
+_EPS = 1e-6
+
+
+def get_line_segments(rebar: Rebar) -> List[Tuple[int, int]]:
+    """
+    钢筋轨迹中直线段的起止点序号;未给出segments 时相邻两点为一段
+    :param rebar:
+    :return:
+    """
+    segments = rebar.poly.segments
+    if not segments:
+        return [(i, i + 1) for i in range(len(rebar.poly.points) - 1)]
+    return [(s[0] - 1, s[1] - 1) for s in segments if len(s) == 2]
+
+
+def get_arc_radius(rebar: Rebar) -> Optional[float]:
+    """
+    钢筋轨迹中第一个弧段的半径,没有弧段时返回None
+    :param rebar:
+    :return:
+    """
+    for segment in rebar.poly.segments:
+        if len(segment) == 3:
+            a, b, c = (
+                np.array(
+                    [
+                        rebar.poly.points[i - 1].x,
+                        rebar.poly.points[i - 1].y,
+                        rebar.poly.points[i - 1].z,
+                    ]
+                )
+                for i in segment
+            )
+            # 三点外接圆半径
+            cross = np.linalg.norm(np.cross(b - a, c - a))
+            if cross < _EPS:
+                return None
+            return (
+                np.linalg.norm(b - a)
+                * np.linalg.norm(c - b)
+                * np.linalg.norm(a - c)
+                / (2 * cross)
+            )
+    return None
+
+
+def unique_mirrored_legs(legs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    合并相同的钢筋形状;弯折方向全部相反的钢筋(如对称布置的钢筋)翻转后形状相同,视为同一形状
+    :param legs: 各钢筋的段长度和弯折角度交替排列,(钢筋数量, 2 * 段数)
+    :return: 各形状(取首次出现时的方向)及其数量
+    """
+    mirrored = legs.copy()
+    angles = mirrored[:, 1::2]
+    mirrored[:, 1::2] = np.where(np.abs(angles) == 180, angles, -angles)
+    differs = legs != mirrored
+    first_differ = np.argmax(differs, axis=1)
+    rows = np.arange(len(legs))
+    use_mirrored = differs.any(axis=1) & (
+        mirrored[rows, first_differ] < legs[rows, first_differ]
+    )
+    canonical = np.where(use_mirrored[:, None], mirrored, legs)
+    _, first_index, counts = np.unique(
+        canonical, axis=0, return_index=True, return_counts=True
+    )
+    return legs[first_index], counts
+
+
+def group_to_bvbs(
+    rebars: List[Rebar],
+    mark: int,
+    project_ID: str,
+    stair_ID: str,
+    rebar_parameter: RebarParameter,
+) -> List[RebarBVBS]:
+    """
+    一组钢筋转换为BVBS 数据,形状不同的钢筋(如避让调整后的钢筋)分别生成记录
+    :param rebars: 同组钢筋
+    :param mark: 钢筋序号,形状不止一种时其余形状的序号由调用方重新分配
+    :param project_ID:
+    :param stair_ID:
+    :param rebar_parameter: 钢筋材料参数
+    :return: 按数量由多到少排列的BVBS 数据
+    """
+    # 按轨迹点数及段结构分桶,每桶向量化计算
+    buckets: Dict[Tuple, List[Rebar]] = {}
+    for rebar in rebars:
+        key = (
+            len(rebar.poly.points),
+            tuple(tuple(s) for s in rebar.poly.segments),
+            rebar.radius,
+        )
+        buckets.setdefault(key, []).append(rebar)
+
+    shapes: Dict[Tuple, List] = {}
+    for bucket in buckets.values():
+        sample = bucket[0]
+        line_segments = get_line_segments(sample)
+        points = np.array(
+            [[[p.x, p.y, p.z] for p in rebar.poly.points] for rebar in bucket],
+            dtype=float,
+        )
+        # 外包尺寸,与RebarData 一致
+        lengths, angles = polyline_legs(
+            points, 2 * sample.radius, line_segments=line_segments
+        )
+        legs = np.concatenate(
+            [
+                np.rint(lengths)[:, :, None],
+                np.round(angles, ANGLE_PRECISION)[:, :, None],
+            ],
+            axis=2,
+        ).reshape(len(bucket), -1)
+        unique_legs, counts = unique_mirrored_legs(legs)
+        arc_radius = get_arc_radius(sample)
+        if arc_radius is not None:
+            mandrel_diameter = int(round(2 * arc_radius))
+        else:
+            mandrel_diameter = rebar_mandrel_diameter(
+                sample.radius, rebar_parameter.grade
+            )
+        for leg, count in zip(unique_legs, counts):
+            shape_key = (sample.radius, mandrel_diameter, tuple(leg))
+            if shape_key in shapes:
+                shapes[shape_key][1] += int(count)
+            else:
+                shapes[shape_key] = [leg.reshape(-1, 2), int(count)]
+
+    results = []
+    for (radius, mandrel_diameter, _), (leg, count) in sorted(
+        shapes.items(), key=lambda item: -item[1][1]
+    ):
+        geometric = [
+            RebarGeoBVBS(
+                length=int(length),
+                angle=int(angle) if float(angle).is_integer() else float(angle),
+            )
+            for length, angle in leg
+        ]
+        results.append(
+            RebarBVBS(
+                project_ID=project_ID,
+                stair_ID=stair_ID,
+                mark=mark,
+                rebar_length=sum(geo.length for geo in geometric),
+                rebar_quantity=count,
+                rebar_diameter=int(2 * radius),
+                rebar_grade=rebar_parameter.name,
+                mandrel_diameter=mandrel_diameter,
+                geometric=geometric,
+            )
+        )
+    return results
+
+
+def layout_group_to_bvbs(
+    attr: str,
+    rebars: List[Rebar],
+    next_mark: int,
+    project_ID: str,
+    stair_ID: str,
+    rebar_parameter: RebarParameter,
+) -> Tuple[List[RebarBVBS], int]:
+    """
+    排布结果中的一组钢筋转换为BVBS 数据,第一种形状使用该组的序号,其余形状依次使用next_mark 之后的序号
+    :param attr: 钢筋组名称,见REBAR_GROUP_MARKS
+    :param rebars: 同组钢筋
+    :param next_mark: 其余形状的起始序号
+    :param project_ID:
+    :param stair_ID:
+    :param rebar_parameter: 钢筋材料参数
+    :return: BVBS 数据,下一组钢筋其余形状的起始序号
+    """
+    records = group_to_bvbs(
+        rebars, REBAR_GROUP_MARKS[attr], project_ID, stair_ID, rebar_parameter
+    )
+    for record in records[1:]:
+        record.mark = next_mark
+        next_mark += 1
+    return records, next_mark
+
+
+def data_for_bvbs_from_layout(
+    structure_design: StructuralDesign, rebar_for_BIM: RebarforBIM
+) -> RebarforBVBS:
+    """
+    由钢筋排布结果生成BVBS 钢筋数据;同组钢筋形状不止一种时,该组为列表,其余形状的序号依次排在最大序号之后
+    :param structure_design: 结构设计参数,提供项目、楼梯编号及钢筋等级
+    :param rebar_for_BIM: 钢筋排布结果
+    :return:
+    """
+    project_ID = structure_design.stair_id.project_ID
+    stair_ID = structure_design.stair_id.stair_ID
+    rebar_parameter = RebarParameter.by_name(structure_design.material.rebar_name)
+    rebar_for_BVBS = RebarforBVBS()
+    next_mark = FIRST_EXTRA_MARK
+    for attr in REBAR_GROUP_MARKS:
+        rebars = getattr(rebar_for_BIM, attr)
+        if not rebars:
+            continue
+        records, next_mark = layout_group_to_bvbs(
+            attr, rebars, next_mark, project_ID, stair_ID, rebar_parameter
+        )
+        if len(records) > 1:
+            _logger.info(f"{attr} 共{len(records)}种形状,分别生成BVBS 记录")
+            setattr(rebar_for_BVBS, attr, records)
+        else:
+            setattr(rebar_for_BVBS, attr, records[0])
+    return rebar_for_BVBS
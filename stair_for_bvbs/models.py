@@ -6,7 +6,23 @@
 # Description：
 """
 from dataclasses import dataclass, field
-from typing import List
+from typing import Iterator, List, Tuple, Union
+
+# 各组钢筋的序号,按RebarforBVBS 中钢筋组的顺序排列
+REBAR_GROUP_MARKS = {
+    "hole_rebar": 7,
+    "lifting_longitudinal_rebar": 8,
+    "lifting_point_rebar": 12,
+    "bottom_edge_rein_rebar": 11,
+    "top_edge_rein_rebar": 10,
+    "bottom_rebar": 1,
+    "top_rebar": 2,
+    "bottom_edge_stirrup_rebar": 6,
+    "top_edge_stirrup_rebar": 9,
+    "bottom_rein_rebar": 4,
+    "top_rein_rebar": 5,
+    "mid_rebar": 3,
+}
 
 
 @dataclass
@@ -35,18 +51,43 @@ class RebarBVBS:
 @dataclass
 class RebarforBVBS:
     """
-    为生成bvbs准备的钢筋集合的类
+    为生成bvbs准备的钢筋集合的类;由钢筋排布结果生成时,同组形状不止一种的为列表
     """
 
-    hole_rebar: RebarBVBS = None
-    lifting_longitudinal_rebar: RebarBVBS = None
-    lifting_point_rebar: RebarBVBS = None
-    bottom_edge_rein_rebar: RebarBVBS = None
-    top_edge_rein_rebar: RebarBVBS = None
-    bottom_rebar: RebarBVBS = None
-    top_rebar: RebarBVBS = None
-    bottom_edge_stirrup_rebar: RebarBVBS = None
-    top_edge_stirrup_rebar: RebarBVBS = None
-    bottom_rein_rebar: RebarBVBS = None
-    top_rein_rebar: RebarBVBS = None
-    mid_rebar: RebarBVBS = None
+    hole_rebar: Union[RebarBVBS, List[RebarBVBS]] = None
+    lifting_longitudinal_rebar: Union[RebarBVBS, List[RebarBVBS]] = None
+    lifting_point_rebar: Union[RebarBVBS, List[RebarBVBS]] = None
+    bottom_edge_rein_rebar: Union[RebarBVBS, List[RebarBVBS]] = None
+    top_edge_rein_rebar: Union[RebarBVBS, List[RebarBVBS]] = None
+    bottom_rebar: Union[RebarBVBS, List[RebarBVBS]] = None
+    top_rebar: Union[RebarBVBS, List[RebarBVBS]] = None
+    bottom_edge_stirrup_rebar: Union[RebarBVBS, List[RebarBVBS]] = None
+    top_edge_stirrup_rebar: Union[RebarBVBS, List[RebarBVBS]] = None
+    bottom_rein_rebar: Union[RebarBVBS, List[RebarBVBS]] = None
+    top_rein_rebar: Union[RebarBVBS, List[RebarBVBS]] = None
+    mid_rebar: Union[RebarBVBS, List[RebarBVBS]] = None
+
+    def get_group(self, attr: str) -> List[RebarBVBS]:
+        """
+        一组钢筋的全部形状,没有该组钢筋时为空列表
+        :param attr: 钢筋组名称
+        :return:
+        """
+        value = getattr(self, attr)
+        if value is None:
+            return []
+        return value if isinstance(value, list) else [value]
+
+    def iter_rebars(self) -> Iterator[Tuple[str, RebarBVBS]]:
+        """
+        依次给出各组钢筋;由钢筋排布结果生成时,同组形状不止一种的为列表,其余形状的名称加序号后缀
+        :return: 名称及钢筋数据
+        """
+        for attr, value in self.__dict__.items():
+            if value is None:
+                continue
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    yield (attr if index == 0 else f"{attr}_{index}"), item
+            else:
+                yield attr, value
@@ -16,8 +16,16 @@ from stair_structure.model import (
 )
 from stair_structure import __version__ as structure_v
 
-from .models import RebarBVBS, RebarGeoBVBS
-from .tools import rebar_mandrel_diameter, get_y, get_z
+from .models import REBAR_GROUP_MARKS, RebarBVBS, RebarGeoBVBS
+from .tools import (
+    rebar_mandrel_diameter,
+    get_y,
+    get_z,
+    legs_to_geometric,
+    polyline_legs,
+)
+
+SIDE_NORMAL = (1, 0, 0)  # 位于楼梯侧面(y-z 平面)内的钢筋,弯折方向以x 轴为准
 
 
 class RebarData(object):
@@ -141,7 +149,7 @@ class RebarData(object):
         hole_rebar_BVBS = RebarBVBS(
             project_ID=self.project_ID,
             stair_ID=self.stair_ID,
-            mark=7,
+            mark=REBAR_GROUP_MARKS["hole_rebar"],
             rebar_length=2 * LENGTH,
             rebar_quantity=8,
             rebar_diameter=self.hole_rebar_diameter,
@@ -198,7 +206,7 @@ class RebarData(object):
         lifting_longitudinal_rebar_BVBS = RebarBVBS(
             project_ID=self.project_ID,
             stair_ID=self.stair_ID,
-            mark=8,
+            mark=REBAR_GROUP_MARKS["lifting_longitudinal_rebar"],
             rebar_length=rebar_length,
             rebar_quantity=8,
             rebar_diameter=self.lifting_rebar_diameter,
@@ -233,7 +241,7 @@ class RebarData(object):
         lifting_point_rebar_BVBS = RebarBVBS(
             project_ID=self.project_ID,
             stair_ID=self.stair_ID,
-            mark=12,
+            mark=REBAR_GROUP_MARKS["lifting_point_rebar"],
             rebar_length=self.width - 2 * self.cover,
             rebar_quantity=2,
             rebar_diameter=self.lifting_rebar_diameter,
@@ -260,26 +268,19 @@ class RebarData(object):
         y_2 = get_y(self.tan, y_0, z_0, z_2)
         rebar_model = np.array([[0, self.cover, z_1], [0, y_1, z_1], [0, y_2, z_2]])
         # 构造BVBS数据
-        geometric = []
-        length_1 = round(
-            np.sqrt(np.sum(np.square(rebar_model[1] - rebar_model[0])))
-            + self.bottom_edge_reinforce_rebar_diameter / 2
-        )
-        length_2 = round(
-            np.sqrt(np.sum(np.square(rebar_model[2] - rebar_model[1])))
-            + self.bottom_edge_reinforce_rebar_diameter / 2
+        geometric = legs_to_geometric(
+            *polyline_legs(
+                rebar_model, self.bottom_edge_reinforce_rebar_diameter, SIDE_NORMAL
+            )
         )
-        geometric.append(RebarGeoBVBS(length=length_1, angle=self.angle))
-
-        geometric.append(RebarGeoBVBS(length=length_2, angle=0))
-        rebar_length = length_1 + length_2
+        rebar_length = sum(geo.length for geo in geometric)
         mandrel_diameter = rebar_mandrel_diameter(
             self.bottom_edge_reinforce_rebar_diameter / 2, self.rebar_parameter.grade
         )
         bottom_edge_reinforce_rebar_BVBS = RebarBVBS(
             project_ID=self.project_ID,
             stair_ID=self.stair_ID,
-            mark=11,
+            mark=REBAR_GROUP_MARKS["bottom_edge_rein_rebar"],
             rebar_length=rebar_length,
             rebar_quantity=2,
             rebar_diameter=self.bottom_edge_reinforce_rebar_diameter,
@@ -336,30 +337,19 @@ class RebarData(object):
             ]
         )
         # 构造BVBS数据
-        geometric = []
-        length_1 = round(
-            np.sqrt(np.sum(np.square(rebar_model[1] - rebar_model[0])))
-            + self.top_edge_reinforce_rebar_diameter / 2
-        )
-        length_2 = round(
-            np.sqrt(np.sum(np.square(rebar_model[2] - rebar_model[1])))
-            + self.top_edge_reinforce_rebar_diameter
-        )
-        length_3 = round(
-            np.sqrt(np.sum(np.square(rebar_model[3] - rebar_model[2])))
-            + self.top_edge_reinforce_rebar_diameter / 2
-        )
-        geometric.append(RebarGeoBVBS(length=length_1, angle=self.angle))
-        geometric.append(RebarGeoBVBS(length=length_2, angle=-self.angle))
-        geometric.append(RebarGeoBVBS(length=length_3, angle=0))
-        rebar_length = length_1 + length_2 + length_3
+        geometric = legs_to_geometric(
+            *polyline_legs(
+                rebar_model, self.top_edge_reinforce_rebar_diameter, SIDE_NORMAL
+            )
+        )
+        rebar_length = sum(geo.length for geo in geometric)
         mandrel_diameter = rebar_mandrel_diameter(
             self.top_edge_reinforce_rebar_diameter / 2, self.rebar_parameter.grade
         )
         top_edge_reinforce_rebar_BVBS = RebarBVBS(
             project_ID=self.project_ID,
             stair_ID=self.stair_ID,
-            mark=10,
+            mark=REBAR_GROUP_MARKS["top_edge_rein_rebar"],
             rebar_length=rebar_length,
             rebar_quantity=2,
             rebar_diameter=self.top_edge_reinforce_rebar_diameter,
@@ -400,26 +390,17 @@ class RebarData(object):
                 rebar_x.append(start_distance + i * rebar_spacing)
 
         # 构造BVBS数据
-        geometric = []
-        length_1 = round(
-            np.sqrt(np.sum(np.square(rebar_model[1] - rebar_model[0])))
-            + self.bottom_rebar_diameter / 2
+        geometric = legs_to_geometric(
+            *polyline_legs(rebar_model, self.bottom_rebar_diameter, SIDE_NORMAL)
         )
-        length_2 = round(
-            np.sqrt(np.sum(np.square(rebar_model[2] - rebar_model[1])))
-            + self.bottom_rebar_diameter / 2
-        )
-        geometric.append(RebarGeoBVBS(length=length_1, angle=self.angle))
-
-        geometric.append(RebarGeoBVBS(length=length_2, angle=0))
-        rebar_length = length_1 + length_2
+        rebar_length = sum(geo.length for geo in geometric)
         mandrel_diameter = rebar_mandrel_diameter(
             self.bottom_rebar_diameter / 2, self.rebar_parameter.grade
         )
         bottom_rebar_BVBS = RebarBVBS(
             project_ID=self.project_ID,
             stair_ID=self.stair_ID,
-            mark=1,
+            mark=REBAR_GROUP_MARKS["bottom_rebar"],
             rebar_length=rebar_length,
             rebar_quantity=rebar_number,
             rebar_diameter=self.bottom_rebar_diameter,
@@ -482,30 +463,17 @@ class RebarData(object):
             else:
                 rebar_x.append(start_distance + i * rebar_spacing)
         # 构造BVBS数据
-        geometric = []
-        length_1 = round(
-            np.sqrt(np.sum(np.square(rebar_model[1] - rebar_model[0])))
-            + self.top_rebar_diameter / 2
-        )
-        length_2 = round(
-            np.sqrt(np.sum(np.square(rebar_model[2] - rebar_model[1])))
-            + self.top_rebar_diameter
-        )
-        length_3 = round(
-            np.sqrt(np.sum(np.square(rebar_model[3] - rebar_model[2])))
-            + self.top_rebar_diameter / 2
-        )
-        geometric.append(RebarGeoBVBS(length=length_1, angle=self.angle))
-        geometric.append(RebarGeoBVBS(length=length_2, angle=-self.angle))
-        geometric.append(RebarGeoBVBS(length=length_3, angle=0))
-        rebar_length = length_1 + length_2 + length_3
+        geometric = legs_to_geometric(
+            *polyline_legs(rebar_model, self.top_rebar_diameter, SIDE_NORMAL)
+        )
+        rebar_length = sum(geo.length for geo in geometric)
         mandrel_diameter = rebar_mandrel_diameter(
             self.top_rebar_diameter / 2, self.rebar_parameter.grade
         )
         top_rebar_BVBS = RebarBVBS(
             project_ID=self.project_ID,
             stair_ID=self.stair_ID,
-            mark=2,
+            mark=REBAR_GROUP_MARKS["top_rebar"],
             rebar_length=rebar_length,
             rebar_quantity=rebar_number,
             rebar_diameter=self.top_rebar_diameter,
@@ -579,36 +547,17 @@ class RebarData(object):
                 rebar_x.append(start_distance + i * rebar_spacing)
 
         # 构造BVBS数据
-        geometric = []
-        length_1 = round(
-            np.sqrt(np.sum(np.square(rebar_model[1] - rebar_model[0])))
-            + self.bottom_edge_stirrup_diameter
+        geometric = legs_to_geometric(
+            *polyline_legs(rebar_model, self.bottom_edge_stirrup_diameter, SIDE_NORMAL)
         )
-        length_2 = round(
-            np.sqrt(np.sum(np.square(rebar_model[2] - rebar_model[1])))
-            + self.bottom_edge_stirrup_diameter
-        )
-        length_3 = round(
-            np.sqrt(np.sum(np.square(rebar_model[3] - rebar_model[2])))
-            + self.bottom_edge_stirrup_diameter
-        )
-        length_4 = round(
-            np.sqrt(np.sum(np.square(rebar_model[4] - rebar_model[3])))
-            + self.bottom_edge_stirrup_diameter
-        )
-        geometric.append(RebarGeoBVBS(length=length_1, angle=90))
-        geometric.append(RebarGeoBVBS(length=length_2, angle=90))
-        geometric.append(RebarGeoBVBS(length=length_3, angle=90))
-        geometric.append(RebarGeoBVBS(length=length_4, angle=0))
-
-        rebar_length = length_1 + length_2 + length_3 + length_4
+        rebar_length = sum(geo.length for geo in geometric)
         mandrel_diameter = rebar_mandrel_diameter(
             self.bottom_edge_stirrup_diameter / 2, self.rebar_parameter.grade
         )
         bottom_edge_stirrup_rebar_BVBS = RebarBVBS(
             project_ID=self.project_ID,
             stair_ID=self.stair_ID,
-            mark=6,
+            mark=REBAR_GROUP_MARKS["bottom_edge_stirrup_rebar"],
             rebar_length=rebar_length,
             rebar_quantity=rebar_number,
             rebar_diameter=self.bottom_edge_stirrup_diameter,
@@ -688,36 +637,17 @@ class RebarData(object):
             else:
                 rebar_x.append(start_distance + i * rebar_spacing)
         # 构造BVBS数据
-        geometric = []
-        length_1 = round(
-            np.sqrt(np.sum(np.square(rebar_model[1] - rebar_model[0])))
-            + self.top_edge_stirrup_diameter
+        geometric = legs_to_geometric(
+            *polyline_legs(rebar_model, self.top_edge_stirrup_diameter, SIDE_NORMAL)
         )
-        length_2 = round(
-            np.sqrt(np.sum(np.square(rebar_model[2] - rebar_model[1])))
-            + self.top_edge_stirrup_diameter
-        )
-        length_3 = round(
-            np.sqrt(np.sum(np.square(rebar_model[3] - rebar_model[2])))
-            + self.top_edge_stirrup_diameter
-        )
-        length_4 = round(
-            np.sqrt(np.sum(np.square(rebar_model[4] - rebar_model[3])))
-            + self.top_edge_stirrup_diameter
-        )
-        geometric.append(RebarGeoBVBS(length=length_1, angle=90))
-        geometric.append(RebarGeoBVBS(length=length_2, angle=90))
-        geometric.append(RebarGeoBVBS(length=length_3, angle=90))
-        geometric.append(RebarGeoBVBS(length=length_4, angle=0))
-
-        rebar_length = length_1 + length_2 + length_3 + length_4
+        rebar_length = sum(geo.length for geo in geometric)
         mandrel_diameter = rebar_mandrel_diameter(
             self.top_edge_stirrup_diameter / 2, self.rebar_parameter.grade
         )
         top_edge_stirrup_rebar_BVBS = RebarBVBS(
             project_ID=self.project_ID,
             stair_ID=self.stair_ID,
-            mark=9,
+            mark=REBAR_GROUP_MARKS["top_edge_stirrup_rebar"],
             rebar_length=rebar_length,
             rebar_quantity=rebar_number,
             rebar_diameter=self.top_edge_stirrup_diameter,
@@ -778,17 +708,17 @@ class RebarData(object):
             ),
         ]
         # 构造BVBS数据
-        geometric = []
-        length_1 = round(np.sqrt(np.sum(np.square(rebar_model[1] - rebar_model[0]))))
-        geometric.append(RebarGeoBVBS(length=length_1, angle=0))
-        rebar_length = length_1
+        geometric = legs_to_geometric(
+            *polyline_legs(rebar_model, self.bottom_edge_longitudinal_rebar_diameter)
+        )
+        rebar_length = sum(geo.length for geo in geometric)
         mandrel_diameter = rebar_mandrel_diameter(
             self.bottom_edge_longitudinal_rebar_diameter / 2, self.rebar_parameter.grade
         )
         bottom_rein_rebar_BVBS = RebarBVBS(
             project_ID=self.project_ID,
             stair_ID=self.stair_ID,
-            mark=4,
+            mark=REBAR_GROUP_MARKS["bottom_rein_rebar"],
             rebar_length=rebar_length,
             rebar_quantity=rebar_number * 2,
             rebar_diameter=self.bottom_edge_longitudinal_rebar_diameter,
@@ -846,17 +776,17 @@ class RebarData(object):
             ),
         ]
         # 构造BVBS数据
-        geometric = []
-        length_1 = round(np.sqrt(np.sum(np.square(rebar_model[1] - rebar_model[0]))))
-        geometric.append(RebarGeoBVBS(length=length_1, angle=0))
-        rebar_length = length_1
+        geometric = legs_to_geometric(
+            *polyline_legs(rebar_model, self.top_edge_longitudinal_rebar_diameter)
+        )
+        rebar_length = sum(geo.length for geo in geometric)
         mandrel_diameter = rebar_mandrel_diameter(
             self.top_edge_longitudinal_rebar_diameter / 2, self.rebar_parameter.grade
         )
         top_rein_rebar_BVBS = RebarBVBS(
             project_ID=self.project_ID,
             stair_ID=self.stair_ID,
-            mark=5,
+            mark=REBAR_GROUP_MARKS["top_rein_rebar"],
             rebar_length=rebar_length,
             rebar_quantity=rebar_number * 2,
             rebar_diameter=self.top_edge_longitudinal_rebar_diameter,
@@ -931,31 +861,22 @@ class RebarData(object):
         ) / (rebar_number - 1)
 
         # 构造BVBS数据
-        geometric = []
-        length_1 = round(
-            np.sqrt(np.sum(np.square(rebar_model_bottom[1] - rebar_model_bottom[0])))
-            + self.mid_distribution_rebar_diameter / 2
-        )
-        length_2 = round(
-            np.sqrt(np.sum(np.square(rebar_model_bottom[2] - rebar_model_bottom[1])))
-            + self.mid_distribution_rebar_diameter
-        )
-        length_3 = round(
-            np.sqrt(np.sum(np.square(rebar_model_bottom[3] - rebar_model_bottom[2])))
-            + self.mid_distribution_rebar_diameter / 2
+        # 弯折方向以梯段板斜面的法向量为准
+        geometric = legs_to_geometric(
+            *polyline_legs(
+                rebar_model_bottom,
+                self.mid_distribution_rebar_diameter,
+                (0, self.cos, self.sin),
+            )
         )
-
-        geometric.append(RebarGeoBVBS(length=length_1, angle=-90))
-        geometric.append(RebarGeoBVBS(length=length_2, angle=-90))
-        geometric.append(RebarGeoBVBS(length=length_3, angle=0))
-        rebar_length = length_1 + length_2 + length_3
+        rebar_length = sum(geo.length for geo in geometric)
         mandrel_diameter = rebar_mandrel_diameter(
             self.mid_distribution_rebar_diameter / 2, self.rebar_parameter.grade
         )
         mid_distribution_rebar_BVBS = RebarBVBS(
             project_ID=self.project_ID,
             stair_ID=self.stair_ID,
-            mark=3,
+            mark=REBAR_GROUP_MARKS["mid_rebar"],
             rebar_length=rebar_length,
             rebar_quantity=2 * rebar_number,
             rebar_diameter=self.mid_distribution_rebar_diameter,
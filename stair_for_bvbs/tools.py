@@ -5,6 +5,14 @@
 # version    ：python 3.8
 # Description：
 """
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .models import RebarGeoBVBS
+
+ANGLE_PRECISION = 2  # 弯折角度保留的小数位数
+_EPS = 1e-6
 
 
 def rebar_mandrel_diameter(radius=5, steel_grade=1):
@@ -43,3 +51,110 @@ def get_y(slope: float, y_0: float, z_0: float, z) -> float:
     """
     y = y_0 + (z - z_0) / slope
     return y
+
+
+def polylines_to_legs(
+    points: np.ndarray,
+    line_segments: List[Tuple[int, int]],
+    normal: Optional[Sequence[float]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    将一组形状结构相同的钢筋轨迹转换为BVBS 各段长度及段末弯折角度,对全部钢筋向量化计算
+    弯折角度的正负以钢筋所在平面的法向量为准,未给出时法向量取绝对值最大的分量为正,最后一段角度为0
+    :param points: 钢筋轨迹点,(钢筋数量, 点数, 3)
+    :param line_segments: 直线段的起止点序号
+    :param normal: 判断弯折方向的法向量,沿该方向逆时针弯折为正
+    :return: 各段长度(钢筋数量, 段数),各段末弯折角度(钢筋数量, 段数)
+    """
+    start = points[:, [s[0] for s in line_segments], :]
+    end = points[:, [s[1] for s in line_segments], :]
+    directions = end - start
+    lengths = np.linalg.norm(directions, axis=2)
+    angles = np.zeros_like(lengths)
+    if len(line_segments) < 2:
+        return lengths, angles
+
+    cross = np.cross(directions[:, :-1], directions[:, 1:])
+    dot = np.einsum("ijk,ijk->ij", directions[:, :-1], directions[:, 1:])
+    cross_norm = np.linalg.norm(cross, axis=2)
+    turns = np.degrees(np.arctan2(cross_norm, dot))
+
+    if normal is not None:
+        normals = np.broadcast_to(np.asarray(normal, dtype=float), (len(points), 3))
+    else:
+        # 钢筋所在平面的法向量:第一个不共线弯折处的叉积
+        bent = cross_norm > _EPS * np.maximum(lengths[:, :-1] * lengths[:, 1:], 1)
+        first_bent = np.argmax(bent, axis=1)
+        normals = cross[np.arange(len(points)), first_bent]
+        major = np.argmax(np.abs(normals), axis=1)
+        normals *= np.where(normals[np.arange(len(points)), major] < 0, -1, 1)[:, None]
+    signs = np.sign(np.einsum("ijk,ik->ij", cross, normals))
+    signs[signs == 0] = 1  # 直线或180 度弯折
+    angles[:, :-1] = turns * signs
+    return lengths, angles
+
+
+def polyline_legs(
+    points: np.ndarray,
+    diameter: Union[float, np.ndarray],
+    normal: Optional[Sequence[float]] = None,
+    line_segments: Optional[List[Tuple[int, int]]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    由钢筋中心线折线计算BVBS 各段长度及弯折角度,可传入单根或一批点数相同的钢筋
+    各段长度为外包尺寸:弯折处每段加半个钢筋直径,首尾重合(封闭箍筋)时首尾也按弯折处理,自由端不加;
+    两段之间为弧段时,直线段长度已算至弯弧起点,不加长度
+    :param points: 中心线折线点,(点数, 3) 或 (钢筋数量, 点数, 3)
+    :param diameter: 钢筋直径,批量计算时可为各钢筋的直径
+    :param normal: 判断弯折方向的法向量,见polylines_to_legs
+    :param line_segments: 直线段的起止点序号,默认相邻两点为一段
+    :return: 各段长度、各段末弯折角度,单根时为(段数,),批量时为(钢筋数量, 段数)
+    """
+    points = np.asarray(points, dtype=float)
+    single = points.ndim == 2
+    if single:
+        points = points[None]
+    if line_segments is None:
+        line_segments = [(i, i + 1) for i in range(points.shape[1] - 1)]
+    lengths, angles = polylines_to_legs(points, line_segments, normal)
+    # 相邻两段共用端点即为直接弯折
+    joined = np.array(
+        [a[1] == b[0] for a, b in zip(line_segments[:-1], line_segments[1:])],
+        dtype=float,
+    )
+    bent_ends = np.zeros(lengths.shape)
+    bent_ends[:, :-1] += joined
+    bent_ends[:, 1:] += joined
+    if len(line_segments) > 1:
+        closed = (
+            np.linalg.norm(
+                points[:, line_segments[0][0]] - points[:, line_segments[-1][1]],
+                axis=1,
+            )
+            < _EPS
+        )
+        bent_ends[closed, 0] += 1
+        bent_ends[closed, -1] += 1
+    radius = np.reshape(np.asarray(diameter, dtype=float), (-1, 1)) / 2
+    lengths = lengths + bent_ends * radius
+    if single:
+        return lengths[0], angles[0]
+    return lengths, angles
+
+
+def legs_to_geometric(lengths: np.ndarray, angles: np.ndarray) -> List[RebarGeoBVBS]:
+    """
+    单根钢筋的各段长度及弯折角度转换为BVBS 形状数据,长度取整,角度保留ANGLE_PRECISION 位小数
+    :param lengths: 各段长度
+    :param angles: 各段末弯折角度
+    :return:
+    """
+    geometric = []
+    for length, angle in zip(np.rint(lengths), np.round(angles, ANGLE_PRECISION)):
+        angle = float(angle) + 0.0  # 去掉-0.0
+        geometric.append(
+            RebarGeoBVBS(
+                length=int(length), angle=int(angle) if angle.is_integer() else angle
+            )
+        )
+    return geometric
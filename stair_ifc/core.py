@@ -9,6 +9,7 @@ import math
 import time
 import uuid
 import warnings
+from enum import Enum
 from typing import Union, Optional, List, Dict, Tuple
 import hashlib
 import logging
@@ -34,6 +35,44 @@ from stair_ifc.rebar_arc_point import IfcRebarData
 logger = logging.getLogger(__name__)
 Vector = Union[List[float], entity_instance]
 
+# 判断钢筋形状是否相同时坐标的取整位数(mm)
+REBAR_KEY_PRECISION = 4
+# 点、方向去重时坐标的取整位数
+POOL_KEY_PRECISION = 6
+# IFC GlobalId 的64 进制字符表,与ifcopenshell.guid 一致
+GLOBAL_ID_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_$"
+# 128 位整数编码为22 位字符时每位的右移位数:首位2 位,其余每位6 位
+_GLOBAL_ID_SHIFTS = tuple(range(126, -1, -6))
+
+
+class GeometryLOD(Enum):
+    """
+    IFC 几何的详细程度枚举:简化时保留混凝土主体、孔洞及构件的位置、名称、材质和钢筋数量,
+    不生成防滑槽、滴水槽及预埋件企口
+    """
+
+    FULL = 0  # 完整几何
+    SIMPLIFIED = 1  # 钢筋为不计弯弧的折线扫掠体,预埋件为包围盒
+    BOUNDING_BOX = 2  # 钢筋、预埋件均为包围盒
+
+
+def _pool_key(values) -> Tuple[float, ...]:
+    """
+    点、方向去重的键,取整后消除-0.0
+    :param values:
+    :return:
+    """
+    return tuple(round(float(value), POOL_KEY_PRECISION) + 0.0 for value in values)
+
+
+def encode_global_id(value: int) -> str:
+    """
+    将128 位整数编码为22 位的IFC GlobalId,结果与ifcopenshell.guid.compress 相同,但不经过十六进制字符串转换
+    :param value: 128 位整数,如uuid.UUID.int
+    :return:
+    """
+    return "".join(GLOBAL_ID_CHARS[(value >> shift) & 63] for shift in _GLOBAL_ID_SHIFTS)
+
 """
 file只要开头是六个字母是create，就可以创建一个实体（entity），并调用functools.partial方法
 六位以后是IFC数据格式中的实体名（name）
@@ -60,14 +99,48 @@ class IfcDocument(object):
     _owner_history: entity_instance
     _global_geometry_context: entity_instance
     _project: entity_instance
+    _rebar_types: Dict[Tuple, Tuple[entity_instance, entity_instance]]
+    _rebar_type_instances: Dict[Tuple, List[entity_instance]]
+    _identity_transformation: Optional[entity_instance]
+    _point_pool: Dict[Tuple[float, ...], entity_instance]
+    _direction_pool: Dict[Tuple[float, ...], entity_instance]
+    _placement_pool: Dict[Tuple[int, int, int], entity_instance]
+    _materials: Dict[Tuple[str, str], entity_instance]
+    _global_id_count: int
 
     def __init__(
         self,
         update_header: Optional[Dict] = None,
         init_document: Optional[Dict] = None,
         schema="IFC4X3",
+        rebar_instancing: bool = False,
+        entity_pool: bool = True,
+        global_id_namespace: Optional[str] = None,
+        timestamp: Optional[int] = None,
+        lod: GeometryLOD = GeometryLOD.FULL,
     ):
         self._ifc_file = file(schema=schema)  # 创建IFC文件instance实例 ifc 格式内存文件,后续操作都需要基于它
+        # 确定性模式:GlobalId 由命名空间(如楼梯输入数据的指纹)和创建序号生成,相同输入生成逐字节相同的文件
+        self.global_id_namespace = global_id_namespace
+        self._global_id_count = 0
+        self._global_id_hash = (
+            hashlib.md5(global_id_namespace.encode("utf-8"))
+            if global_id_namespace is not None
+            else None
+        )
+        if timestamp is None and global_id_namespace is not None:
+            timestamp = 0
+        self.timestamp = timestamp  # 文件头及IfcOwnerHistory 的时间戳(秒),None 时取当前时间
+        self.entity_pool = entity_pool  # 坐标相同的点、方向及坐标系只创建一次
+        self.lod = lod  # 钢筋、预埋件等构件几何的详细程度
+        self._point_pool = {}
+        self._direction_pool = {}
+        self._placement_pool = {}
+        self._materials = {}
+        self.rebar_instancing = rebar_instancing  # 形状相同的钢筋共用IfcReinforcingBarType 的几何
+        self._rebar_types = {}
+        self._rebar_type_instances = {}
+        self._identity_transformation = None
         self._origin = self.create_IfcCartesianPoint([0.0, 0.0, 0.0])  # 创建基于IFC的向量表示
         self._base_x = self.create_IfcDirection([1.0, 0.0, 0.0])
         self._base_y = self.create_IfcDirection([0.0, 1.0, 0.0])
@@ -80,6 +153,10 @@ class IfcDocument(object):
             self.update_Header(**update_header)
         else:
             self.update_Header()
+        if self.timestamp is not None:
+            self.ifcfile.wrapped_data.header.file_name.time_stamp = time.strftime(
+                "%Y-%m-%dT%H:%M:%S", time.gmtime(self.timestamp)
+            )
         if init_document:
             self.init_document(**init_document)
         else:
@@ -406,6 +483,18 @@ class IfcDocument(object):
         )
         return container
 
+    def get_material(self, name: str, category: str) -> entity_instance:
+        """
+        获取材质,同一文档中名称和类别相同的材质仅创建一次,多楼梯共用
+        :param name: 材质名称
+        :param category: 材质类别,如Concrete、Steel
+        :return:
+        """
+        key = (name, category)
+        if key not in self._materials:
+            self._materials[key] = self.ifcfile.createIfcMaterial(name, None, category)
+        return self._materials[key]
+
     def create_material_layer(self, concrete_material: Optional[str] = None):
 
         # 全局使用的材料
@@ -454,13 +543,18 @@ class IfcDocument(object):
     def person(self) -> entity_instance:
         return self._person
 
-    @staticmethod
-    def get_global_id() -> str:
+    def get_global_id(self) -> str:
         """
         生成GlobalId 在整个软件世界中分配全局唯一标识符。
+        确定性模式下由命名空间和创建序号的md5 摘要生成,否则使用uuid1
         :return:
         """
-        return ifcopenshell.guid.compress(uuid.uuid1().hex)
+        if self._global_id_hash is None:
+            return encode_global_id(uuid.uuid1().int)
+        self._global_id_count += 1
+        digest = self._global_id_hash.copy()
+        digest.update(str(self._global_id_count).encode("ascii"))
+        return encode_global_id(int.from_bytes(digest.digest(), "big"))
 
     @property
     def global_geometry_context(self) -> entity_instance:
@@ -505,30 +599,42 @@ class IfcDocument(object):
 
     def create_IfcCartesianPoint(self, point: List) -> entity_instance:
         """
-        create IfcCartesianPoint
+        create IfcCartesianPoint,启用去重时坐标相同的点仅创建一次
         :param point:
         :return:
         """
+        if self.entity_pool:
+            key = _pool_key(point)
+            if key in self._point_pool:
+                return self._point_pool[key]
         while True:
             point_back: entity_instance = self.ifcfile.createIfcCartesianPoint(point)
             if point_back.get_info().get("id") == 0:
                 warnings.warn(f"创建点失败,id 为0")
             else:
                 break
+        if self.entity_pool:
+            self._point_pool[key] = point_back
         return point_back
 
     def create_IfcDirection(self, vector: List) -> entity_instance:
         """
-        create IfcDirection
+        create IfcDirection,启用去重时分量相同的方向仅创建一次
         :param vector:
         :return:
         """
+        if self.entity_pool:
+            key = _pool_key(vector)
+            if key in self._direction_pool:
+                return self._direction_pool[key]
         while True:
             direction: entity_instance = self.ifcfile.createIfcDirection(vector)
             if direction.get_info().get("id") == 0:
                 warnings.warn(f"创建方向向量失败,id为0,将重新创建")
             else:
                 break
+        if self.entity_pool:
+            self._direction_pool[key] = direction
         return direction
 
     def create_IfcAxis2Placement3D(
@@ -539,6 +645,7 @@ class IfcDocument(object):
         通过两个轴创建一个三维坐标系
         创建一个坐标系,z 指向Z 轴,x 指向X 轴，需要满足右手定则
         如果未提供相关参数，默认新建一个并返回全局坐标系
+        启用去重时,原点和轴方向相同的坐标系仅创建一次
         :param origin:
         :param z:
         :param x:
@@ -560,9 +667,14 @@ class IfcDocument(object):
                     z = self.create_IfcDirection(z)
                 if not isinstance(x, entity_instance):
                     x = self.create_IfcDirection(x)
+                key = (origin.id(), z.id(), x.id())
+                if self.entity_pool and key in self._placement_pool:
+                    return self._placement_pool[key]
                 axis2placement3D: entity_instance = (
                     self.ifcfile.createIfcAxis2Placement3D(origin, z, x)
                 )
+                if self.entity_pool and axis2placement3D.id() != 0:
+                    self._placement_pool[key] = axis2placement3D
             if axis2placement3D.get_info().get("id") == 0:
                 warnings.warn(f"坐标系创建id为0")
             else:
@@ -719,7 +831,7 @@ class IfcDocument(object):
                     None,
                     person_and_organization,
                     application,
-                    int(time.time()),
+                    int(time.time()) if self.timestamp is None else self.timestamp,
                 )
                 if owner_history.get_info().get("id") == 0:
                     warnings.warn(
@@ -741,10 +853,10 @@ class IfcDocument(object):
         extrude_length: float = None,
     ) -> entity_instance:
         # 局部坐标系中的拉伸方向
-        ifc_direction = self.ifcfile.create_entity("IfcDirection", extrude_direction)
+        ifc_direction = self.create_IfcDirection(extrude_direction)
         ifc_points = []
         for point in points:
-            point = self.ifcfile.createIfcCartesianPoint(point)
+            point = self.create_IfcCartesianPoint(point)
             ifc_points.append(point)
         poly_line = self.ifcfile.createIfcPolyLine(ifc_points)
         ifcclosedprofile = self.ifcfile.createIfcArbitraryClosedProfileDef(
@@ -765,10 +877,10 @@ class IfcDocument(object):
         section_2: List = None,
     ) -> entity_instance:
 
-        ifc_direction = self.ifcfile.create_entity("IfcDirection", extrude_direction)
+        ifc_direction = self.create_IfcDirection(extrude_direction)
         ifc_section_1 = []
         for point in section_1:
-            point = self.ifcfile.createIfcCartesianPoint(point)
+            point = self.create_IfcCartesianPoint(point)
             ifc_section_1.append(point)
         poly_line_1 = self.ifcfile.createIfcPolyLine(ifc_section_1)
         ifcclosedprofile_1 = self.ifcfile.createIfcArbitraryClosedProfileDef(
@@ -776,7 +888,7 @@ class IfcDocument(object):
         )  # 封闭平面几何
         ifc_section_2 = []
         for point in section_2:
-            point = self.ifcfile.createIfcCartesianPoint(point)
+            point = self.create_IfcCartesianPoint(point)
             ifc_section_2.append(point)
         poly_line_2 = self.ifcfile.createIfcPolyLine(ifc_section_2)
         ifcclosedprofile_2 = self.ifcfile.createIfcArbitraryClosedProfileDef(
@@ -818,6 +930,87 @@ class IfcDocument(object):
 
         return solid
 
+    def create_BoundingBox_shape(self, points: List[List[float]]) -> entity_instance:
+        """
+        以点集的轴对齐包围盒作为构件的简化几何
+        :param points: 构件局部坐标系下的点
+        :return: IfcProductDefinitionShape
+        """
+        lower = [float(min(point[i] for point in points)) for i in range(3)]
+        upper = [float(max(point[i] for point in points)) for i in range(3)]
+        box = self.ifcfile.createIfcBoundingBox(
+            self.create_IfcCartesianPoint(lower),
+            *[upper[i] - lower[i] for i in range(3)],
+        )
+        representation = self.ifcfile.createIfcShapeRepresentation(
+            self.global_geometry_context, "Box", "BoundingBox", [box]
+        )
+        return self.ifcfile.createIfcProductDefinitionShape(
+            None, None, [representation]
+        )
+
+    @staticmethod
+    def get_rebar_bounds(points: List[List[float]], radius: float) -> List[List[float]]:
+        """
+        钢筋中心线各点沿坐标轴外扩半径后的包围盒角点
+        :param points:
+        :param radius:
+        :return:
+        """
+        radius = float(radius)
+        lower = [min(point[i] for point in points) - radius for i in range(3)]
+        upper = [max(point[i] for point in points) + radius for i in range(3)]
+        return [lower, upper]
+
+    @staticmethod
+    def get_revolved_bounds(sections: List[List[float]]) -> List[List[float]]:
+        """
+        旋转体的包围盒角点:截面坐标为(沿轴距离, 半径),旋转后沿预埋件局部坐标系z 轴,
+        与create_lifting、create_demoulding 中的revolve_placement 一致
+        :param sections: 旋转截面
+        :return:
+        """
+        radius = max(abs(float(point[1])) for point in sections)
+        lower = min(float(point[0]) for point in sections)
+        upper = max(float(point[0]) for point in sections)
+        return [[-radius, -radius, lower], [radius, radius, upper]]
+
+    def create_embedded_part_box(
+        self,
+        name: str,
+        local_placement: entity_instance,
+        points: List[List[float]],
+        stair: entity_instance,
+    ) -> entity_instance:
+        """
+        简化几何的预埋件:以包围盒表示,保留位置和名称并聚合到楼梯
+        :param name:
+        :param local_placement:
+        :param points: 预埋件局部坐标系下的点
+        :param stair:
+        :return:
+        """
+        part = self.ifcfile.create_entity(
+            "IfcElementAssembly",
+            self.get_global_id(),
+            self.owner_history,
+            name,
+            None,
+            None,
+            local_placement,
+            self.create_BoundingBox_shape(points),
+            None,
+        )
+        self.ifcfile.createIfcRelAggregates(
+            self.get_global_id(),
+            self.owner_history,
+            "Stair Container",
+            None,
+            stair,
+            [part],
+        )
+        return part
+
     def create_RevolvedAreaSolid(
         self, section: List, solid_placement, Axis1Placement, angle=360
     ):
@@ -826,7 +1019,7 @@ class IfcDocument(object):
         """
         ifc_points = []
         for point in section:
-            point = self.ifcfile.createIfcCartesianPoint(point)
+            point = self.create_IfcCartesianPoint(point)
             ifc_points.append(point)
         poly_line = self.ifcfile.createIfcPolyLine(ifc_points)
         ifcclosedprofile = self.ifcfile.createIfcArbitraryClosedProfileDef(
@@ -843,7 +1036,7 @@ class IfcDocument(object):
     ) -> entity_instance:
         curve_points = []
         for p in curve:
-            p = self.ifcfile.createIfcCartesianPoint(p)
+            p = self.create_IfcCartesianPoint(p)
             curve_points.append(p)
         ifc_curve = self.ifcfile.createIfcPolyLine(curve_points)
 
@@ -887,8 +1080,8 @@ class IfcDocument(object):
             stair_data.get_top_hole_section(),
             stair_data.get_bottom_hole_section(),
         ]
-        revolve_point = self.ifcfile.createIfcCartesianPoint([0.0, 0.0, 0.0])
-        revolve_direction = self.ifcfile.createIfcDirection([0.0, 1.0, 0.0])
+        revolve_point = self.create_IfcCartesianPoint([0.0, 0.0, 0.0])
+        revolve_direction = self.create_IfcDirection([0.0, 1.0, 0.0])
         Axis1Placement = self.ifcfile.create_entity(
             "IfcAxis1Placement", revolve_point, revolve_direction
         )
@@ -969,20 +1162,18 @@ class IfcDocument(object):
                             z=[0.0, 0.0, -1.0],
                             x=[0.0, 1.0, 0.0],
                         )
-                        ifc_direction = self.ifcfile.create_entity(
-                            "IfcDirection", [0.0, 0.0, 1.0]
-                        )
+                        ifc_direction = self.create_IfcDirection([0.0, 0.0, 1.0])
 
                         ifc_section_1 = []
                         for point in slope_sections_1[k]:
-                            point = self.ifcfile.createIfcCartesianPoint(point)
+                            point = self.create_IfcCartesianPoint(point)
                             ifc_section_1.append(point)
                         ifc_polyline_1 = self.ifcfile.createIfcPolyLine(ifc_section_1)
                         ifc_profile_1 = self.ifcfile.createIfcArbitraryClosedProfileDef(
                             "AREA", None, ifc_polyline_1
                         )
 
-                        ifc_profile_position = self.ifcfile.createIfcCartesianPoint(
+                        ifc_profile_position = self.create_IfcCartesianPoint(
                             slope_sections_2[k]
                         )
                         ifc_CTO = (
@@ -1092,6 +1283,18 @@ class IfcDocument(object):
         ) = railing_signle_data.get_rail_embedded_parts_rabbet()
         plate_section, plate_thickness = railing_signle_data.get_single_rail_plate()
         rebars: List[IfcRebarData] = railing_signle_data.get_single_rail_rebar()
+        if self.lod != GeometryLOD.FULL:
+            points = [[x, y, rabbet_depth] for x, y in plate_section]
+            points += [[x, y, rabbet_depth + plate_thickness] for x, y in plate_section]
+            for rebar in rebars:
+                points += self.get_rebar_bounds(rebar.points, rebar.radius)
+            self.create_embedded_part_box(
+                "栏杆埋件",
+                self.create_IfcLocalplacement(stair_placement, railing_placement),
+                points,
+                stair,
+            )
+            return
 
         extrude_direction = [0.0, 0.0, 1.0]
 
@@ -1219,9 +1422,17 @@ class IfcDocument(object):
         single_rounding_head = RoundingHeadSingleData(rounding_head_parameter)
         rabbet_section = single_rounding_head.get_rounding_head_rabbet()
         ring_section = single_rounding_head.get_rounding_head_ring()
+        if self.lod != GeometryLOD.FULL:
+            self.create_embedded_part_box(
+                "吊钉埋件",
+                lifting_local_placement,
+                self.get_revolved_bounds(ring_section),
+                stair,
+            )
+            return
         if revolve_Axis1Placement == None:
-            revolve_point = self.ifcfile.createIfcCartesianPoint([0.0, 0.0, 0.0])
-            revolve_direction = self.ifcfile.createIfcDirection([1.0, 0.0, 0.0])
+            revolve_point = self.create_IfcCartesianPoint([0.0, 0.0, 0.0])
+            revolve_direction = self.create_IfcDirection([1.0, 0.0, 0.0])
             revolve_Axis1Placement = self.ifcfile.create_entity(
                 "IfcAxis1Placement", revolve_point, revolve_direction
             )
@@ -1322,6 +1533,15 @@ class IfcDocument(object):
         rabbet_section = single_anchor.get_anchor_rabbet()
         anchor_section = single_anchor.get_anchor()
         rebar = single_anchor.get_anchor_rebar()
+        if self.lod != GeometryLOD.FULL:
+            self.create_embedded_part_box(
+                "锚栓埋件",
+                lifting_local_placement,
+                self.get_revolved_bounds(anchor_section)
+                + self.get_rebar_bounds(rebar.points, rebar.radius),
+                stair,
+            )
+            return
         rabbet_solid = self.create_RevolvedAreaSolid(
             rabbet_section, revolve_placement, revolve_Axis1Placement, 360
         )
@@ -1396,8 +1616,8 @@ class IfcDocument(object):
         positions = stair_data.get_lifting_embedded_parts_position()
 
         lifting_parameter = stair_data.lifting_parameter
-        revolve_point = self.ifcfile.createIfcCartesianPoint([0.0, 0.0, 0.0])
-        revolve_direction = self.ifcfile.createIfcDirection([1.0, 0.0, 0.0])
+        revolve_point = self.create_IfcCartesianPoint([0.0, 0.0, 0.0])
+        revolve_direction = self.create_IfcDirection([1.0, 0.0, 0.0])
         revolve_Axis1Placement = self.ifcfile.create_entity(
             "IfcAxis1Placement", revolve_point, revolve_direction
         )
@@ -1450,8 +1670,8 @@ class IfcDocument(object):
                 x_direction,
             ) = stair_data.get_demoulding_embedded_parts_position()
             demoulding_parameter = stair_data.demolding_parameter
-            revolve_point = self.ifcfile.createIfcCartesianPoint([0.0, 0.0, 0.0])
-            revolve_direction = self.ifcfile.createIfcDirection([1.0, 0.0, 0.0])
+            revolve_point = self.create_IfcCartesianPoint([0.0, 0.0, 0.0])
+            revolve_direction = self.create_IfcDirection([1.0, 0.0, 0.0])
             revolve_Axis1Placement = self.ifcfile.create_entity(
                 "IfcAxis1Placement", revolve_point, revolve_direction
             )
@@ -1526,3 +1746,187 @@ class IfcDocument(object):
         )
 
         return instance_show
+
+    def create_rebar_simplified(
+        self, stair_placement, rebar: Rebar, name: str = "钢筋"
+    ) -> entity_instance:
+        """
+        简化几何的钢筋:不计算弯弧,SIMPLIFIED 为沿钢筋折线的扫掠体,BOUNDING_BOX 为包围盒,
+        公称直径和中心线长度记录在钢筋属性中
+        :param stair_placement:
+        :param rebar: 未计算弯弧的钢筋
+        :param name:
+        :return:
+        """
+        points = [[float(p.x), float(p.y), float(p.z)] for p in rebar.poly.points]
+        if self.lod == GeometryLOD.BOUNDING_BOX:
+            rebar_shape = self.create_BoundingBox_shape(
+                self.get_rebar_bounds(points, rebar.radius)
+            )
+        else:
+            curve = self.ifcfile.create_entity(
+                "IfcIndexedPolyCurve",
+                self.ifcfile.create_entity("IfcCartesianPointList3D", points),
+            )
+            solid = self.ifcfile.create_entity(
+                "IfcSweptDiskSolid", curve, float(rebar.radius)
+            )
+            representation = self.ifcfile.createIfcShapeRepresentation(
+                self.global_geometry_context, "Body", "SweptSolid", [solid]
+            )
+            rebar_shape = self.ifcfile.createIfcProductDefinitionShape(
+                None, None, [representation]
+            )
+        bar_length = sum(
+            math.dist(points[i], points[i + 1]) for i in range(len(points) - 1)
+        )
+        return self.ifcfile.create_entity(
+            "IfcReinforcingBar",
+            GlobalId=self.get_global_id(),
+            OwnerHistory=self.owner_history,
+            Name=name,
+            ObjectPlacement=self.create_IfcLocalplacement(
+                stair_placement, self.global_placement
+            ),
+            Representation=rebar_shape,
+            NominalDiameter=2 * float(rebar.radius),
+            BarLength=bar_length,
+        )
+
+    @staticmethod
+    def get_rebar_shape_key(rebar: IfcRebarData) -> Tuple:
+        """
+        钢筋形状的键:以第一个点为基点的相对坐标、半径及分段,平移后重合的钢筋键相同
+        :param rebar:
+        :return:
+        """
+        base = rebar.points[0]
+        relative_points = tuple(
+            tuple(
+                round(point[i] - base[i], REBAR_KEY_PRECISION) + 0.0
+                for i in range(3)
+            )
+            for point in rebar.points
+        )
+        seg_s = tuple((seg.seg_type, tuple(seg.index_s)) for seg in rebar.seg_s)
+        return round(float(rebar.radius), REBAR_KEY_PRECISION), relative_points, seg_s
+
+    @property
+    def identity_transformation(self) -> entity_instance:
+        """
+        映射几何使用的单位变换,所有钢筋实例共用,位置由实例的局部坐标系确定
+        :return:
+        """
+        if self._identity_transformation is None:
+            self._identity_transformation = self.ifcfile.create_entity(
+                "IfcCartesianTransformationOperator3D", None, None, self.origin, None, None
+            )
+        return self._identity_transformation
+
+    def create_rebar_type(
+        self, rebar: IfcRebarData, name: str = "钢筋"
+    ) -> Tuple[entity_instance, entity_instance]:
+        """
+        获取钢筋形状对应的IfcReinforcingBarType 及其RepresentationMap,形状相同的钢筋仅创建一次
+        类型几何以钢筋第一个点为原点
+        :param rebar:
+        :param name:
+        :return:
+        """
+        key = self.get_rebar_shape_key(rebar)
+        if key in self._rebar_types:
+            return self._rebar_types[key]
+        base = rebar.points[0]
+        local_rebar = IfcRebarData(
+            radius=rebar.radius,
+            points=[
+                [float(point[i] - base[i]) for i in range(3)] for point in rebar.points
+            ],
+            seg_s=rebar.seg_s,
+        )
+        solid = self.create_SweptDiskSolid(local_rebar)
+        representation = self.ifcfile.createIfcShapeRepresentation(
+            self.global_geometry_context, "Body", "SweptSolid", [solid]
+        )
+        representation_map = self.ifcfile.createIfcRepresentationMap(
+            self.global_placement, representation
+        )
+        rebar_type = self.ifcfile.create_entity(
+            "IfcReinforcingBarType",
+            GlobalId=self.get_global_id(),
+            OwnerHistory=self.owner_history,
+            Name=f"{name}-{len(self._rebar_types) + 1}",
+            RepresentationMaps=[representation_map],
+            PredefinedType="NOTDEFINED",
+            NominalDiameter=2 * float(rebar.radius),
+        )
+        self._rebar_types[key] = (rebar_type, representation_map)
+        self._rebar_type_instances[key] = []
+        return rebar_type, representation_map
+
+    def create_rebar_instance(
+        self, stair_placement, rebar: IfcRebarData, name: str = "钢筋"
+    ):
+        """
+        以类型实例化的方式创建钢筋:几何通过IfcMappedItem 引用类型的RepresentationMap,
+        局部坐标系原点为钢筋第一个点
+        :param stair_placement:
+        :param rebar:
+        :param name:
+        :return:
+        """
+        rebar_type, representation_map = self.create_rebar_type(rebar, name)
+        mapped_item = self.ifcfile.createIfcMappedItem(
+            representation_map, self.identity_transformation
+        )
+        representation = self.ifcfile.createIfcShapeRepresentation(
+            self.global_geometry_context, "Body", "MappedRepresentation", [mapped_item]
+        )
+        rebar_shape = self.ifcfile.createIfcProductDefinitionShape(
+            None, None, [representation]
+        )
+        rebar_position = self.create_IfcAxis2Placement3D(
+            origin=[float(value) for value in rebar.points[0]]
+        )
+        local_placement = self.ifcfile.createIfcLocalPlacement(
+            stair_placement, rebar_position
+        )
+        instance_show = self.ifcfile.create_entity(
+            "IfcReinforcingBar",
+            self.get_global_id(),
+            self.owner_history,
+            name,
+            None,
+            None,
+            local_placement,
+            rebar_shape,
+            None,
+        )
+        self._rebar_type_instances[self.get_rebar_shape_key(rebar)].append(
+            instance_show
+        )
+        return instance_show
+
+    def create_rebar_type_relations(self) -> List[entity_instance]:
+        """
+        为每个钢筋类型创建IfcRelDefinesByType,关联其尚未关联的实例
+        IFC4 中每个类型最多只能有一个IfcRelDefinesByType,多楼梯共用钢筋类型时应在全部楼梯完成后调用一次
+        :return:
+        """
+        relations = []
+        for key, (rebar_type, _) in self._rebar_types.items():
+            instances = self._rebar_type_instances[key]
+            if not instances:
+                continue
+            self._rebar_type_instances[key] = []  # 已关联的实例不再重复关联
+            relations.append(
+                self.ifcfile.createIfcRelDefinesByType(
+                    self.get_global_id(),
+                    self.owner_history,
+                    None,
+                    None,
+                    instances,
+                    rebar_type,
+                )
+            )
+        return relations
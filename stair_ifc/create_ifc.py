@@ -5,8 +5,10 @@
 # version    ：python 3.8
 # Description：
 """
+import hashlib
 import os
-from typing import Optional
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple, TextIO
 import ifcopenshell
 from ifcopenshell.entity_instance import entity_instance
 
@@ -17,19 +19,94 @@ from stair_structure.structure_calculation import (
     RebarParameter,
     ConcreteParameter,
 )
-from stair_ifc.core import IfcDocument
+from stair_ifc.core import IfcDocument, GeometryLOD
 from stair_detailed.models import DetailedDesign, DetailedDesignResult
 
 from stair_ifc.get_data import StairData
-from stair_ifc.rebar_arc_point import rebar_arc
+from stair_ifc.rebar_arc_point import rebar_arc_batch
+from stair_ifc.writer import IfcStreamWriter
 from stair_rebar_layout.models import RebarforBIM
 
 
-def create_ifc_doc(header_file: Optional[dict] = None, init_doc: Optional[dict] = None):
-    ifc_doc = IfcDocument(header_file, init_doc)  # 创建IFC文件的实例
+@dataclass
+class StairIfcInput(object):
+    """
+    项目级导出中单个楼梯的输入数据
+    """
+
+    structure_design: StructuralDesign
+    structure_design_result: StructuralDesignResult
+    detailed_design: DetailedDesign
+    detailed_design_result: DetailedDesignResult
+    rebar_data: RebarforBIM
+    name: str = "预制混凝土楼梯"
+
+
+def get_stair_fingerprint(*inputs) -> str:
+    """
+    楼梯输入数据的指纹,作为确定性GlobalId 的命名空间:输入相同则指纹相同
+    :param inputs: 楼梯的设计数据、设计结果及钢筋数据(dataclass)
+    :return:
+    """
+    digest = hashlib.sha1()
+    for item in inputs:
+        digest.update(repr(item).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def create_ifc_doc(
+    header_file: Optional[dict] = None,
+    init_doc: Optional[dict] = None,
+    rebar_instancing: bool = False,
+    global_id_namespace: Optional[str] = None,
+    lod: GeometryLOD = GeometryLOD.FULL,
+):
+    ifc_doc = IfcDocument(
+        header_file,
+        init_doc,
+        rebar_instancing=rebar_instancing,
+        global_id_namespace=global_id_namespace,
+        lod=lod,
+    )  # 创建IFC文件的实例
     return ifc_doc
 
 
+def create_spatial_structure(
+    ifc_doc: IfcDocument, elevation: float = 0.0
+) -> Tuple[entity_instance, entity_instance]:
+    """
+    创建场地、建筑、楼层及其层级关系,项目中的楼梯共用
+    :param ifc_doc:
+    :param elevation: 楼层标高
+    :return: 楼层及楼层局部坐标系
+    """
+    site, site_placement = ifc_doc.create_site()
+    building, building_placement = ifc_doc.create_building(site_placement)
+    building_storey, storey_placement = ifc_doc.create_building_storey(
+        building_placement, elevation
+    )
+    # 建立层级关系
+    container_building = ifc_doc.create_RelAggregates(
+        "Building Container", building, building_storey
+    )
+    container_site = ifc_doc.create_RelAggregates("Site Container", site, building)
+
+    container_project = ifc_doc.create_RelAggregates(
+        "Project Container", ifc_doc.project, site
+    )
+    return building_storey, storey_placement
+
+
+def _flush_stream(writer: Optional[IfcStreamWriter]):
+    """
+    给出流式写出器时写出自上次写出后新建的实体
+    :param writer:
+    :return:
+    """
+    if writer is not None:
+        writer.flush()
+
+
 def create_stair_ifc(
     ifc_doc: IfcDocument,
     structure_design: StructuralDesign,
@@ -37,7 +114,32 @@ def create_stair_ifc(
     detailed_design: DetailedDesign,
     detailed_design_result: DetailedDesignResult,
     rebar_data: RebarforBIM,
+    building_storey: Optional[entity_instance] = None,
+    storey_placement: Optional[entity_instance] = None,
+    stair_origin: Optional[List[float]] = None,
+    stair_name: str = "预制混凝土楼梯",
+    writer: Optional[IfcStreamWriter] = None,
+    relate_rebar_types: bool = True,
 ):
+    """
+    在文档中创建一个楼梯,未给出楼层时新建场地、建筑及楼层
+    给出流式写出器时,楼梯主体、各预埋件及每组钢筋建模完成后即写出新建的实体。
+    已写出的实体不再修改:楼层归属、材质关联、钢筋类型关联及楼梯聚合关系均为新建的关系实体,
+    在其关联的构件写出之后创建
+    :param ifc_doc:
+    :param structure_design:
+    :param structure_design_result:
+    :param detailed_design:
+    :param detailed_design_result:
+    :param rebar_data:
+    :param building_storey: 楼梯所在楼层,多楼梯共用
+    :param storey_placement: 楼层局部坐标系
+    :param stair_origin: 楼梯在楼层坐标系中的位置
+    :param stair_name: 楼梯名称
+    :param writer: 流式写出器
+    :param relate_rebar_types: 是否在楼梯完成时创建钢筋类型关联,多楼梯共用钢筋类型时由调用方在全部楼梯完成后创建
+    :return:
+    """
     if structure_v < "0.1.4":
         concrete_parameter = structure_design_result.concrete_parameter
         rebar_parameter = structure_design_result.rebar_parameter
@@ -57,32 +159,19 @@ def create_stair_ifc(
     concrete_name = concrete_parameter.name
     steel_name = rebar_parameter.name
     # 全局使用的材料
-    concrete_material = ifc_doc.ifcfile.createIfcMaterial(
-        concrete_name, None, "Concrete"
-    )  # 混凝土材质
-    steel_material = ifc_doc.ifcfile.createIfcMaterial(
-        steel_name, None, "Steel"
-    )  # 钢筋材质
+    concrete_material = ifc_doc.get_material(concrete_name, "Concrete")  # 混凝土材质
+    steel_material = ifc_doc.get_material(steel_name, "Steel")  # 钢筋材质
 
-    site, site_placement = ifc_doc.create_site()
-    building, building_placement = ifc_doc.create_building(site_placement)
-    elevation = 0.0
-    building_storey, storey_placement = ifc_doc.create_building_storey(
-        building_placement, elevation
-    )
-    # 建立层级关系
-    container_building = ifc_doc.create_RelAggregates(
-        "Building Container", building, building_storey
-    )
-    container_site = ifc_doc.create_RelAggregates("Site Container", site, building)
-
-    container_project = ifc_doc.create_RelAggregates(
-        "Project Container", ifc_doc.project, site
-    )
+    if building_storey is None:
+        building_storey, storey_placement = create_spatial_structure(ifc_doc)
     owner_history = ifc_doc.owner_history
 
     # 混凝土主体建模
-    stair_position = ifc_doc.create_IfcAxis2Placement3D(origin=[0.0, 0.0, 0.0])
+    if stair_origin is None:
+        stair_origin = [0.0, 0.0, 0.0]
+    stair_position = ifc_doc.create_IfcAxis2Placement3D(
+        origin=[float(value) for value in stair_origin]
+    )
     stair_placement = ifc_doc.create_IfcLocalplacement(storey_placement, stair_position)
     CSG_Solid_list = []
     stair_split_solids = []
@@ -160,7 +249,7 @@ def create_stair_ifc(
     stair = ifc_doc.ifcfile.createIfcStair(
         ifc_doc.get_global_id(),
         owner_history,
-        "预制混凝土楼梯",
+        stair_name,
         "预制混凝土楼梯",
         None,
         stair_placement,  # 存放位置,局部坐标
@@ -171,11 +260,13 @@ def create_stair_ifc(
     # 洞口信息
     ifc_doc.create_hole(stair, stair_placement, stair_data)
 
-    # 防滑槽
-    ifc_doc.create_step_slot(stair, stair_placement, stair_data)
+    if ifc_doc.lod == GeometryLOD.FULL:
+        # 防滑槽
+        ifc_doc.create_step_slot(stair, stair_placement, stair_data)
 
-    # 滴水槽
-    ifc_doc.create_water_drop(stair, stair_placement, stair_data)
+        # 滴水槽
+        ifc_doc.create_water_drop(stair, stair_placement, stair_data)
+    _flush_stream(writer)
 
     # 将楼梯绑定到标高处
     ifc_doc.ifcfile.createIfcRelContainedInSpatialStructure(
@@ -199,23 +290,36 @@ def create_stair_ifc(
     # 栏杆预埋件
     ifc_doc.create_railing(stair, stair_placement, stair_data)
     # ifc_doc.create_railing(stair, stair_placement, railing_data, building_storey)
+    _flush_stream(writer)
 
     # 吊装预埋件
     ifc_doc.create_lifting(stair, stair_placement, stair_data)
     # ifc_doc.create_lifting(stair, stair_placement, lifting_data, building_storey)
+    _flush_stream(writer)
 
     # 脱模预埋件
     ifc_doc.create_demoulding(stair, stair_placement, stair_data)
     # ifc_doc.create_demoulding(stair, stair_placement, demoulding_data, building_storey)
+    _flush_stream(writer)
 
     # 创建钢筋
     rebars = []
     for attr, value in rebar_data.__dict__.items():
-        for rebar in value:
-            new_rebar = rebar_arc(rebar, rebar_parameter.grade)
-
-            rebar_instance = ifc_doc.create_rebar(stair_placement, new_rebar)
-            rebars.append(rebar_instance)
+        if ifc_doc.lod != GeometryLOD.FULL:  # 简化几何不计算弯弧
+            for rebar in value:
+                rebars.append(ifc_doc.create_rebar_simplified(stair_placement, rebar))
+        else:
+            for new_rebar in rebar_arc_batch(value, rebar_parameter.grade):
+                if ifc_doc.rebar_instancing:  # 形状相同的钢筋共用类型几何
+                    rebar_instance = ifc_doc.create_rebar_instance(
+                        stair_placement, new_rebar
+                    )
+                else:
+                    rebar_instance = ifc_doc.create_rebar(stair_placement, new_rebar)
+                rebars.append(rebar_instance)
+        _flush_stream(writer)
+    if ifc_doc.rebar_instancing and relate_rebar_types:
+        ifc_doc.create_rebar_type_relations()
     ifc_doc.ifcfile.createIfcRelAssociatesMaterial(
         ifc_doc.get_global_id(),
         owner_history,
@@ -232,6 +336,7 @@ def create_stair_ifc(
         stair,
         rebars,
     )  #
+    _flush_stream(writer)
 
     # entity_instance_write = ifc_doc.ifcfile.createIfcRelContainedInSpatialStructure(
     #     ifc_doc.get_global_id(),
@@ -252,6 +357,10 @@ def stair_IFC_creation(
     detailed_design: DetailedDesign,
     detailed_design_result: DetailedDesignResult,
     rebar_data: RebarforBIM,
+    rebar_instancing: bool = True,
+    deterministic: bool = False,
+    lod: GeometryLOD = GeometryLOD.FULL,
+    stream: Optional[TextIO] = None,
 ):
     """
     绘制楼梯主体并绑定到指定位置,同时绘制开洞
@@ -260,6 +369,10 @@ def stair_IFC_creation(
     :param detailed_design:
     :param detailed_design_result:
     :param rebar_data:
+    :param rebar_instancing: 形状相同的钢筋是否以IfcReinforcingBarType 映射几何的方式实例化
+    :param deterministic: 是否以输入数据指纹生成GlobalId 及固定时间戳,相同输入生成逐字节相同的文件
+    :param lod: 几何详细程度,简化时钢筋、预埋件以折线扫掠体或包围盒表示,文件更小、生成更快
+    :param stream: 文本文件句柄,给出时建模过程中逐组流式写出
     :return: ifc
     """
     detailed_design = detailed_design_result.detailed_design
@@ -276,15 +389,117 @@ def stair_IFC_creation(
     }
     # ifc_doc = create_ifc_doc(header_file, init_doc)
 
-    ifc_doc = create_ifc_doc()
-    ifc_doc = create_stair_ifc(
-        ifc_doc,
-        structure_design,
-        structure_design_result,
-        detailed_design,
-        detailed_design_result,
-        rebar_data,
+    global_id_namespace = (
+        get_stair_fingerprint(
+            structure_design,
+            structure_design_result,
+            detailed_design_result,
+            rebar_data,
+        )
+        if deterministic
+        else None
+    )
+    ifc_doc = create_ifc_doc(
+        rebar_instancing=rebar_instancing,
+        global_id_namespace=global_id_namespace,
+        lod=lod,
+    )
+    if stream is None:
+        return create_stair_ifc(
+            ifc_doc,
+            structure_design,
+            structure_design_result,
+            detailed_design,
+            detailed_design_result,
+            rebar_data,
+        )
+    with IfcStreamWriter(ifc_doc, stream) as writer:
+        create_stair_ifc(
+            ifc_doc,
+            structure_design,
+            structure_design_result,
+            detailed_design,
+            detailed_design_result,
+            rebar_data,
+            writer=writer,
+        )
+    return ifc_doc
+
+
+def create_project_ifc(
+    ifc_doc: IfcDocument,
+    stairs: Iterable[StairIfcInput],
+    stair_spacing: float = 3000.0,
+    writer: Optional[IfcStreamWriter] = None,
+) -> IfcDocument:
+    """
+    在同一文档中创建项目的全部楼梯:共用项目、场地、建筑、楼层、材质及钢筋类型,楼梯沿x 方向依次排布
+    :param ifc_doc:
+    :param stairs: 各楼梯输入数据,可为逐个生成的迭代器
+    :param stair_spacing: 相邻楼梯的间距(mm)
+    :param writer: 流式写出器,给出时各楼梯建模过程中逐组写出其实体
+    :return:
+    """
+    building_storey, storey_placement = create_spatial_structure(ifc_doc)
+    for index, stair_input in enumerate(stairs):
+        create_stair_ifc(
+            ifc_doc,
+            stair_input.structure_design,
+            stair_input.structure_design_result,
+            stair_input.detailed_design_result.detailed_design,
+            stair_input.detailed_design_result,
+            stair_input.rebar_data,
+            building_storey=building_storey,
+            storey_placement=storey_placement,
+            stair_origin=[index * stair_spacing, 0.0, 0.0],
+            stair_name=stair_input.name,
+            writer=writer,
+            relate_rebar_types=False,
+        )
+    if ifc_doc.rebar_instancing:
+        # 每个钢筋类型只能由一个IfcRelDefinesByType 关联,全部楼梯完成后统一创建
+        ifc_doc.create_rebar_type_relations()
+        _flush_stream(writer)
+    return ifc_doc
+
+
+def project_IFC_creation(
+    stairs: Iterable[StairIfcInput],
+    stair_spacing: float = 3000.0,
+    stream: Optional[TextIO] = None,
+    rebar_instancing: bool = True,
+    deterministic: bool = False,
+    lod: GeometryLOD = GeometryLOD.FULL,
+    fingerprint_keys: Optional[Iterable] = None,
+) -> IfcDocument:
+    """
+    项目级IFC 导出:多个楼梯共用一个初始化的文档
+    :param stairs: 各楼梯输入数据,可为逐个生成的迭代器,建模时逐个取用
+    :param stair_spacing: 相邻楼梯的间距(mm)
+    :param stream: 文本文件句柄,给出时逐个楼梯流式写出
+    :param rebar_instancing: 形状相同的钢筋是否以IfcReinforcingBarType 映射几何的方式实例化
+    :param deterministic: 是否以全部楼梯输入数据的指纹生成GlobalId 及固定时间戳
+    :param lod: 几何详细程度
+    :param fingerprint_keys: 各楼梯的指纹键(如楼梯id 及钢筋数据摘要),给出时以其代替楼梯输入数据计算指纹,
+        不需预先取出全部楼梯输入数据
+    :return: ifc
+    """
+    global_id_namespace = None
+    if deterministic:
+        if fingerprint_keys is None:
+            # 指纹需在建模前算出,未给出指纹键时取出全部楼梯输入数据
+            stairs = list(stairs)
+            fingerprint_keys = stairs
+        global_id_namespace = get_stair_fingerprint(stair_spacing, *fingerprint_keys)
+    ifc_doc = create_ifc_doc(
+        rebar_instancing=rebar_instancing,
+        global_id_namespace=global_id_namespace,
+        lod=lod,
     )
+    if stream is None:
+        return create_project_ifc(ifc_doc, stairs, stair_spacing)
+    with IfcStreamWriter(ifc_doc, stream) as writer:
+        create_project_ifc(ifc_doc, stairs, stair_spacing, writer)
     return ifc_doc
 
 
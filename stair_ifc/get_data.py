@@ -5,6 +5,8 @@
 # version    ：python 3.8
 # Description：
 """
+import copy
+
 from dc_rebar import Rebar, IndexedPolyCurve
 
 from stair_structure.model import StructuralDesign, StructuralDesignResult
@@ -16,6 +18,7 @@ from stair_detailed.models import (
     RailParameter,
 )
 
+from stair_detailed.geometry import get_stair_geometry
 from typing import List
 
 from stair_ifc.rebar_arc_point import rebar_arc, IfcRebarData
@@ -33,6 +36,12 @@ class StairData:
         self.structure_design_result = structure_design_result
         self.detailed_design = detailed_design
         self.detailed_design_result = detailed_design_result
+        self.geometry = get_stair_geometry(
+            structure_design,
+            structure_design_result,
+            detailed_design,
+            detailed_design_result,
+        )  # 与钢筋排布、dxf 图纸共用的几何数据
 
         self.steps_number = self.structure_design.geometric.steps_number
         self.steps_h = self.structure_design_result.steps_h
@@ -85,38 +94,7 @@ class StairData:
         要求：1.顶端和底端挑耳除外；2.以楼梯立面图右下角为初始点(0,0,0)，逆时针方向前进。
         :return:
         """
-        # 添加底端板三角点
-        geometry_points = [
-            [0.0, 0.0],
-            [0.0, float(self.bottom_thickness)],
-            [float(self.bottom_top_length), float(self.bottom_thickness)],
-        ]
-        for i in range(self.steps_number - 1):
-            geometry_points.append(
-                [
-                    self.bottom_top_length + i * self.steps_b,
-                    self.bottom_thickness + (i + 1) * self.steps_h,
-                ]
-            )
-            geometry_points.append(
-                [
-                    self.bottom_top_length + (i + 1) * self.steps_b,
-                    self.bottom_thickness + (i + 1) * self.steps_h,
-                ]
-            )
-
-        geometry_points = geometry_points + [
-            [float(self.bottom_top_length + self.ln), float(self.h_total)],
-            [float(self.l_total), float(self.h_total)],
-            [float(self.l_total), float(self.h_total - self.top_thickness)],
-            [
-                float(self.l_total - self.top_bottom_length),
-                float(self.h_total - self.top_thickness),
-            ],
-            [float(self.bottom_bottom_length), 0.0],
-            [0.0, 0.0],
-        ]
-        return geometry_points
+        return copy.deepcopy(self.geometry.step_points)
 
     def get_top_ear(self) -> List[List]:
         """
@@ -166,62 +144,14 @@ class StairData:
         计算销键或连接孔洞的位置,以孔洞的下边缘的圆心为标志点
         :return:
         """
-        # 顶端孔洞边距
-        top_right_long_a1 = (
-            self.detailed_design.construction_detailed.top_hole_position.a1
-        )  # 顶端右侧纵向边距
-        top_right_horizon_b1 = (
-            self.detailed_design.construction_detailed.top_hole_position.b1
-        )  # 顶端右侧横向边距
-        top_left_long_a2 = (
-            self.detailed_design.construction_detailed.top_hole_position.a2
-        )  # 顶端左侧纵向边距
-        top_left_horizon_b2 = (
-            self.detailed_design.construction_detailed.top_hole_position.b2
-        )  # 顶端左侧横向边距
-
-        top_hole_position = [
-            [
-                float(top_left_horizon_b2),
-                float(self.l_total - top_left_long_a2),
-                float(self.h_total - self.top_thickness),
-            ],
-            [
-                float(self.width - top_right_horizon_b1),
-                float(self.l_total - top_right_long_a1),
-                float(self.h_total - self.top_thickness),
-            ],
-        ]  # 由底端到顶端，由左到向右
-        return top_hole_position
+        return copy.deepcopy(self.geometry.top_hole_positions)
 
     def get_bottom_hole_position(self) -> List[List[float]]:
         """
         计算销键或连接孔洞的位置,以孔洞的下边缘的圆心为标志点
         :return:
         """
-        bottom_right_long_a3 = (
-            self.detailed_design.construction_detailed.bottom_hole_position.a3
-        )  # 底端右侧纵向边距
-        bottom_right_horizon_b3 = (
-            self.detailed_design.construction_detailed.bottom_hole_position.b3
-        )  # 底端右侧横向边距
-        bottom_left_long_a4 = (
-            self.detailed_design.construction_detailed.bottom_hole_position.a4
-        )  # 底端左侧纵向边距
-        bottom_left_horizon_b4 = (
-            self.detailed_design.construction_detailed.bottom_hole_position.b4
-        )  # 底端左侧横向边距
-
-        bottom_hole_position = [
-            [float(bottom_left_horizon_b4), float(bottom_left_long_a4), 0.0],
-            [
-                float(self.width - bottom_right_horizon_b3),
-                float(bottom_right_long_a3),
-                0.0,
-            ],
-        ]
-
-        return bottom_hole_position
+        return copy.deepcopy(self.geometry.bottom_hole_positions)
 
     def get_top_hole_section(self) -> List[List[float]]:
         top_hole_type = self.detailed_design.construction_detailed.top_hole_type
@@ -286,23 +216,7 @@ class StairData:
         计算防滑槽的位置信息
         :return:[[防滑槽组1],[防滑槽组2],[防滑槽组3],[防滑槽组4]] 最右侧
         """
-        step_slot_c1 = self.detailed_design.construction_detailed.step_slot_position.c1
-        step_slot_c3 = self.detailed_design.construction_detailed.step_slot_position.c3
-        positions = []
-        init_position = [
-            float(step_slot_c1),
-            float(self.bottom_top_length + step_slot_c3),
-            float(self.bottom_thickness),
-        ]  # 初始位置
-        for num in range(self.steps_number):
-            position = [
-                init_position[0],
-                init_position[1] + float(num * self.steps_b),
-                init_position[2] + float((num + 1) * self.steps_h),
-            ]
-            positions.append(position)
-
-        return positions
+        return copy.deepcopy(self.geometry.step_slot_positions)
 
     def get_slot_position(self) -> List[List[float]]:
         """
@@ -417,102 +331,7 @@ class StairData:
         滴水线槽坐标位置
         :return:
         """
-        curves = []
-        a1 = self.detailed_design.construction_detailed.water_drip_position.a1
-        a2 = self.detailed_design.construction_detailed.water_drip_position.a2
-        a3 = self.detailed_design.construction_detailed.water_drip_position.a3
-        if self.water_drop_layout.value == 0:  # 只有上部
-            curves.append(
-                [
-                    [float(self.width + self.bottom_b), float(a2), 0.0],
-                    [float(self.width - a3), float(a2), 0.0],
-                    [float(self.width - a3), float(self.bottom_bottom_length), 0.0],
-                    [
-                        float(self.width - a3),
-                        float(self.l_total - self.top_bottom_length),
-                        float(self.h_total - self.top_thickness),
-                    ],
-                    [
-                        float(self.width - a3),
-                        float(self.l_total - a1),
-                        float(self.h_total - self.top_thickness),
-                    ],
-                    [
-                        float(self.width + self.top_b),
-                        float(self.l_total - a1),
-                        float(self.h_total - self.top_thickness),
-                    ],
-                ]
-            )
-        elif self.water_drop_layout.value == 1:  # 只有下部
-            curves.append(
-                [
-                    [0.0, float(a2), 0.0],
-                    [float(a3), float(a2), 0.0],
-                    [float(a3), float(self.bottom_bottom_length), 0.0],
-                    [
-                        float(a3),
-                        float(self.l_total - self.top_bottom_length),
-                        float(self.h_total - self.top_thickness),
-                    ],
-                    [
-                        float(a3),
-                        float(self.l_total - a1),
-                        float(self.h_total - self.top_thickness),
-                    ],
-                    [
-                        0.0,
-                        float(self.l_total - a1),
-                        float(self.h_total - self.top_thickness),
-                    ],
-                ]
-            )
-        else:
-            curves.append(
-                [
-                    [float(self.width + self.bottom_b), float(a2), 0.0],
-                    [float(self.width - a3), float(a2), 0.0],
-                    [float(self.width - a3), float(self.bottom_bottom_length), 0.0],
-                    [
-                        float(self.width - a3),
-                        float(self.l_total - self.top_bottom_length),
-                        float(self.h_total - self.top_thickness),
-                    ],
-                    [
-                        float(self.width - a3),
-                        float(self.l_total - a1),
-                        float(self.h_total - self.top_thickness),
-                    ],
-                    [
-                        float(self.width + self.top_b),
-                        float(self.l_total - a1),
-                        float(self.h_total - self.top_thickness),
-                    ],
-                ]
-            )
-            curves.append(
-                [
-                    [0.0, float(a2), 0.0],
-                    [float(a3), float(a2), 0.0],
-                    [float(a3), float(self.bottom_bottom_length), 0.0],
-                    [
-                        float(a3),
-                        float(self.l_total - self.top_bottom_length),
-                        float(self.h_total - self.top_thickness),
-                    ],
-                    [
-                        float(a3),
-                        float(self.l_total - a1),
-                        float(self.h_total - self.top_thickness),
-                    ],
-                    [
-                        0.0,
-                        float(self.l_total - a1),
-                        float(self.h_total - self.top_thickness),
-                    ],
-                ]
-            )
-        return curves
+        return copy.deepcopy(self.geometry.water_drip_curves)
 
     def get_water_drop_section(self):
         """
@@ -620,109 +439,21 @@ class StairData:
         计算栏杆预埋件的坐标点：栏杆上表面,栏杆布置侧为 上楼梯方向的左右侧
         :return:
         """
-        rail_number = self.detailed_design.inserts_detailed.rail_number  # 栏杆所在的阶数
-
-        x_a = self.detailed_design.inserts_detailed.rail_position.a  # 横向边距
-        y_b = self.detailed_design.inserts_detailed.rail_position.b  # 纵向距离台阶
-        # 栏杆布置左右侧
-        position_x = []
-        if self.rail_layout.value == 0:  # ONLY_RIGHT = 0 ONLY_LEFT = 1   BOTH = 2
-            position_x.append(float(self.width - x_a))
-        elif self.rail_layout.value == 1:
-            position_x.append(float(x_a))
-        else:
-            position_x.append(float(x_a))
-            position_x.append(float(self.width - x_a))
-        position_y = []
-        for i in rail_number:
-            position_y.append(float(self.bottom_top_length + i * self.steps_b - y_b))
-        position_z = []
-        for i in rail_number:
-            position_z.append(float(self.bottom_thickness + i * self.steps_h))
-        positions = []
-        for i in range(len(position_x)):
-            for j in range(len(rail_number)):
-                positions.append([position_x[i], position_y[j], position_z[j]])
-        return positions
+        return copy.deepcopy(self.geometry.rail_positions)
 
     def get_lifting_embedded_parts_position(self) -> List[List[float]]:
         """
         计算吊装预埋件的坐标点：预埋件上部中心点
         :return:
         """
-        lifting_position_a = self.detailed_design.inserts_detailed.lifting_position.a
-        lifting_position_b = self.detailed_design.inserts_detailed.lifting_position.b
-        lifting_position_c = float(
-            self.detailed_design.inserts_detailed.lifting_position.c
-        )  # 吊装预埋件左侧横向边距
-        lifting_position_d = float(
-            self.detailed_design.inserts_detailed.lifting_position.d
-        )  # 吊装预埋件右侧横向边距
-
-        edge_a = (
-            self.bottom_top_length + (lifting_position_a - 0.5) * self.steps_b
-        )  # 吊装预埋件顶端纵向边距
-        edge_b = (
-            self.bottom_top_length + (lifting_position_b - 0.5) * self.steps_b
-        )  # 吊装预埋件底端纵向边距
-        top_h = self.bottom_thickness + lifting_position_a * self.steps_h  # 下部吊装件坐标
-        bottom_h = self.bottom_thickness + lifting_position_b * self.steps_h  # 上部吊装件坐标
-
-        position_x = [lifting_position_c, float(self.width - lifting_position_d)]
-        position_y = [float(edge_b), float(edge_a)]
-        position_z = [float(bottom_h), float(top_h)]
-        positions = [
-            [position_x[0], position_y[0], position_z[0]],
-            [position_x[0], position_y[1], position_z[1]],
-            [position_x[1], position_y[0], position_z[0]],
-            [position_x[1], position_y[1], position_z[1]],
-        ]
-
-        return positions
+        return copy.deepcopy(self.geometry.lifting_positions)
 
     def get_demoulding_embedded_parts_position(self):
         """
         计算脱模预埋件的坐标点
         :return:
         """
-        # 获取信息
-        # 侧面脱模预埋件的定位
-        # 顶端侧面脱模预埋件y坐标
-        demolding_a = float(
-            self.detailed_design.inserts_detailed.demolding_position.a
-        )  # 脱模埋件顶端纵向边距
-        demolding_b = float(
-            self.detailed_design.inserts_detailed.demolding_position.b
-        )  # 脱模埋件底端纵向边距
-        demolding_c = float(
-            self.detailed_design.inserts_detailed.demolding_position.c
-        )  # 脱模埋件左侧横向边距
-        demolding_d = float(
-            self.detailed_design.inserts_detailed.demolding_position.d
-        )  # 脱模埋件右侧横向边距
-        demolding_t = float(
-            self.detailed_design.inserts_detailed.demolding_position.t
-        )  # 脱模埋件厚度方向边距
-        demolding_t_y = self.l_total - demolding_a  # 顶端侧面脱模预埋件y坐标
-        # 顶端侧面脱模预埋件z坐标
-        demolding_t_z = (
-            self.l_total - self.bottom_bottom_length - demolding_a
-        ) * self.tan + demolding_t / self.cos
-        # 底端侧面脱模预埋件y坐标
-        demolding_b_y = demolding_b
-        # 底端侧面脱模预埋件z坐标
-        demolding_b_z = (
-            demolding_b - self.bottom_bottom_length
-        ) * self.tan + demolding_t / self.cos
-
-        positions = [
-            [float(self.width), demolding_t_y, demolding_t_z],
-            [float(self.width), demolding_b_y, demolding_b_z],
-        ]
-        z_direction = [-1.0, 0.0, 0.0]
-        x_direction = [0.0, -self.sin, self.cos]
-
-        return positions, z_direction, x_direction
+        return copy.deepcopy(self.geometry.demolding_positions)
 
 
 class RailingSingleData(object):
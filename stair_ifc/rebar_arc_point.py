@@ -1,7 +1,7 @@
 import math
 
 import numpy as np
-from typing import List
+from typing import List, Optional
 from dataclasses import dataclass, field
 
 from dc_rebar import Rebar
@@ -24,16 +24,26 @@ class IfcRebarData(object):
     seg_s: List[Seg] = field(default_factory=list)
 
 
-def rebar_arc(rebar: Rebar, rebar_grade=1):
-    radius = rebar.radius
+def get_bending_radius(radius: float, rebar_grade=1) -> float:
+    """
+    钢筋弯折半径:按钢筋等级取钢筋半径的倍数
+    :param radius: 钢筋半径
+    :param rebar_grade: 钢筋等级
+    :return:
+    """
     if rebar_grade == 1:
-        bending_radius = 1.25 * radius
+        return 1.25 * radius
     elif rebar_grade == 2:
-        bending_radius = 2.0 * radius
+        return 2.0 * radius
     elif rebar_grade == 3:
-        bending_radius = 2.5 * radius
+        return 2.5 * radius
     else:
-        bending_radius = 2.5 * radius
+        return 2.5 * radius
+
+
+def rebar_arc(rebar: Rebar, rebar_grade=1):
+    radius = rebar.radius
+    bending_radius = get_bending_radius(radius, rebar_grade)
 
     points = rebar.poly.points
     poly_curve_points = []
@@ -106,3 +116,103 @@ def rebar_arc(rebar: Rebar, rebar_grade=1):
         radius=float(radius), points=poly_curve_points, seg_s=seg_s
     )
     return new_rebar
+
+
+def _bend_seg_s(bend_number: int) -> List[Seg]:
+    """
+    含bend_number 个弯折的钢筋分段:直线段与弯折段交替,首尾为直线段,索引从1开始
+    :param bend_number:
+    :return:
+    """
+    seg_s = []
+    for k in range(bend_number):
+        start_index = 3 * k + 1
+        seg_s.append(
+            Seg(index_s=[start_index, start_index + 1], seg_type="IfcLineIndex")
+        )
+        seg_s.append(
+            Seg(
+                index_s=[start_index + 1, start_index + 2, start_index + 3],
+                seg_type="IfcArcIndex",
+            )
+        )
+    index_use = 3 * bend_number + 1
+    seg_s.append(Seg(index_s=[index_use, index_use + 1], seg_type="IfcLineIndex"))
+    return seg_s
+
+
+def compute_bend_fillets(vertices: np.ndarray, bending_radius: np.ndarray):
+    """
+    批量计算钢筋中间顶点处的弯折圆弧:各钢筋顶点补齐为同样数量(bars × vertices × 3),
+    一次向量化计算全部弯折中心、切点及圆弧中点
+    :param vertices: 钢筋顶点,形状为(bars, vertices, 3),顶点不足的以nan 补齐
+    :param bending_radius: 各钢筋的弯折半径,形状为(bars,)
+    :return: 弯折中心、起始切点、圆弧中点、终止切点,形状均为(bars, vertices - 2, 3)
+    """
+    point_last = vertices[:, :-2]
+    point_mid = vertices[:, 1:-1]
+    point_next = vertices[:, 2:]
+    v_m_2_s = point_last - point_mid
+    v_m_2_s /= np.linalg.norm(v_m_2_s, axis=-1, keepdims=True)  # 单位化
+    v_m_2_e = point_next - point_mid
+    v_m_2_e /= np.linalg.norm(v_m_2_e, axis=-1, keepdims=True)  # 单位化
+    # 计算角度cos 和tan 值
+    radius_cos = np.clip(np.sum(v_m_2_s * v_m_2_e, axis=-1), -1.0, 1.0)
+    radius_use = np.arccos(radius_cos) / 2
+    tan = np.tan(radius_use)[..., None]
+    sin_ = np.sin(radius_use)[..., None]
+    bending_radius = bending_radius[:, None, None]
+    # 计算弯折中心点
+    v_2_center = v_m_2_e + v_m_2_s
+    v_2_c_normalzise = v_2_center / np.linalg.norm(v_2_center, axis=-1, keepdims=True)
+    center = point_mid + v_2_c_normalzise * (bending_radius / sin_)
+    # 计算圆弧上的三个点
+    mid_new = center - v_2_c_normalzise * bending_radius
+    start_new = point_mid + v_m_2_s * (bending_radius / tan)
+    end_new = point_mid + v_m_2_e * (bending_radius / tan)
+    return center, start_new, mid_new, end_new
+
+
+def rebar_arc_batch(rebars: List[Rebar], rebar_grade=1) -> List[IfcRebarData]:
+    """
+    rebar_arc 的批量版本:同一组钢筋的弯折一次向量化计算,结果与逐根调用rebar_arc 一致
+    已给出分段(segments)的钢筋无需计算弯折,仍逐根转换
+    :param rebars: 一组钢筋
+    :param rebar_grade: 钢筋等级
+    :return:
+    """
+    new_rebars: List[Optional[IfcRebarData]] = [None] * len(rebars)
+    bend_indexes = []
+    for i, rebar in enumerate(rebars):
+        if len(rebar.poly.segments) == 0:
+            bend_indexes.append(i)
+        else:
+            new_rebars[i] = rebar_arc(rebar, rebar_grade)
+    if not bend_indexes:
+        return new_rebars
+
+    counts = np.asarray([len(rebars[i].poly.points) for i in bend_indexes])
+    vertices = np.full((len(bend_indexes), counts.max(), 3), np.nan)
+    for row, i in enumerate(bend_indexes):
+        vertices[row, : counts[row]] = [
+            [p.x, p.y, p.z] for p in rebars[i].poly.points
+        ]
+    radii = np.asarray([float(rebars[i].radius) for i in bend_indexes])
+    bending_radius = np.asarray(
+        [get_bending_radius(radius, rebar_grade) for radius in radii]
+    )
+    with np.errstate(invalid="ignore", divide="ignore"):  # 补齐部分为nan,不参与结果
+        _, start_new, mid_new, end_new = compute_bend_fillets(vertices, bending_radius)
+    arc_points = np.stack([start_new, mid_new, end_new], axis=2)  # (bars, bends, 3, 3)
+
+    for row, i in enumerate(bend_indexes):
+        bend_number = max(int(counts[row]) - 2, 0)
+        poly_curve_points = [vertices[row, 0].tolist()]
+        poly_curve_points += arc_points[row, :bend_number].reshape(-1, 3).tolist()
+        poly_curve_points.append(vertices[row, counts[row] - 1].tolist())
+        new_rebars[i] = IfcRebarData(
+            radius=float(radii[row]),
+            points=poly_curve_points,
+            seg_s=_bend_seg_s(bend_number),
+        )
+    return new_rebars
@@ -0,0 +1,93 @@
+"""
+# File       : writer.py
+# Description：IFC 文件的流式写出, 按实体逐行写入文件句柄, 不生成整个文件的字符串
+"""
+import logging
+from typing import TextIO
+
+from stair_ifc.core import IfcDocument
+
+logger = logging.getLogger(__name__)
+
+
+class IfcStreamWriter(object):
+    """
+    以STEP 格式流式写出IFC 文件:先写文件头, 每次flush 写出自上次写出后新建的实体, 最后写文件尾
+    已写出的实体不得再修改, 之后的修改不会写出。建模时关系实体(楼层归属、材质关联、类型关联、
+    聚合)须在其关联的构件之后新建, 不能向已有关系中追加构件, create_stair_ifc 按此在每组构件后flush
+    流式写出只省去整个文件的字符串, 已写出的实体仍保留在IfcDocument 中, 内存随模型规模增长。
+    IfcOpenShell 删除实体的耗时随文件中的最大id 增长, 多楼梯导出时逐个楼梯删除已写出的实体
+    会使总耗时随楼梯数量成平方增长, 故不删除
+    """
+
+    def __init__(self, ifc_doc: IfcDocument, stream: TextIO):
+        self.ifc_doc = ifc_doc
+        self.stream = stream
+        self._last_written_id = 0  # 已写出的最大实体id
+        self._header_written = False
+        self._closed = False
+
+    def write_header(self):
+        """
+        写出文件头, 并开始数据段
+        :return:
+        """
+        if self._header_written:
+            return
+        header = self.ifc_doc.ifcfile.wrapped_data.header
+        self.stream.write("ISO-10303-21;\nHEADER;\n")
+        for section in (header.file_description, header.file_name, header.file_schema):
+            self.stream.write(f"{section.toString()};\n")
+        self.stream.write("ENDSEC;\nDATA;\n")
+        self._header_written = True
+
+    def flush(self) -> int:
+        """
+        写出自上次写出后新建的实体, 按id 顺序逐行写入
+        :return: 本次写出的实体数量
+        """
+        self.write_header()
+        ifcfile = self.ifc_doc.ifcfile
+        max_id = ifcfile.wrapped_data.getMaxId()
+        count = 0
+        for entity_id in range(self._last_written_id + 1, max_id + 1):
+            try:
+                entity = ifcfile.by_id(entity_id)
+            except RuntimeError:  # 已删除的实体
+                continue
+            self.stream.write(f"{entity.wrapped_data.to_string(True)};\n")
+            count += 1
+        self._last_written_id = max(self._last_written_id, max_id)
+        logger.debug(f"IFC 流式写出实体{count}个,当前最大id:{max_id}")
+        return count
+
+    def close(self):
+        """
+        写出剩余实体及文件尾, 不关闭文件句柄
+        :return:
+        """
+        if self._closed:
+            return
+        self.flush()
+        self.stream.write("ENDSEC;\nEND-ISO-10303-21;\n")
+        self._closed = True
+
+    def __enter__(self):
+        self.write_header()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+
+
+def write_ifc_stream(ifc_doc: IfcDocument, stream: TextIO) -> TextIO:
+    """
+    将IFC 文档流式写入文件句柄
+    :param ifc_doc:
+    :param stream: 文本文件句柄, 二进制句柄需以io.TextIOWrapper 包装
+    :return:
+    """
+    with IfcStreamWriter(ifc_doc, stream):
+        pass
+    return stream
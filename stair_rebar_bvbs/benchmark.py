@@ -0,0 +1,210 @@
+"""
+# File       : benchmark.py
+# Description：BVBS 生成的基准测试,以合成的大规模钢筋表统计生成耗时及输出大小;
+#              以及由基础楼梯组合成的合成项目,统计BVBS、钢筋JSON 压缩文件整个导出流程的
+#              吞吐量、峰值内存及输出大小
+"""
+import io
+import logging
+import time
+import tracemalloc
+from dataclasses import replace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from stair_for_bvbs.layout_data import data_for_bvbs_from_layout
+from stair_for_bvbs.models import RebarBVBS, RebarGeoBVBS
+from stair_rebar_layout.models import RebarforBIM
+from stair_structure.model import StairID, StructuralDesign
+
+from .cache import RebarOutputCache
+from .create_bvbs import create_bvbs, write_bvbs_records
+from .create_JSON import create_json, make_zip_content_export
+
+_logger = logging.getLogger(__name__)
+
+
+def create_synthetic_schedule(bar_count: int = 10000) -> List[RebarBVBS]:
+    """
+    生成合成钢筋表:直条、单弯、箍筋三种形状,长度随序号变化,结果可复现
+    :param bar_count: 记录数量
+    :return:
+    """
+    records = []
+    for index in range(bar_count):
+        length = 500 + (index * 37) % 5500
+        shape = index % 3
+        if shape == 0:
+            geometric = [RebarGeoBVBS(length=length, angle=0)]
+        elif shape == 1:
+            geometric = [
+                RebarGeoBVBS(length=550, angle=32.66),
+                RebarGeoBVBS(length=length, angle=0),
+            ]
+        else:
+            geometric = [
+                RebarGeoBVBS(length=460, angle=90),
+                RebarGeoBVBS(length=160, angle=90),
+                RebarGeoBVBS(length=460, angle=90),
+                RebarGeoBVBS(length=160, angle=0),
+            ]
+        records.append(
+            RebarBVBS(
+                project_ID="BENCH",
+                stair_ID=str(index // 12 + 1),
+                mark=index % 12 + 1,
+                rebar_length=sum(geo.length for geo in geometric),
+                rebar_quantity=1 + index % 48,
+                rebar_diameter=(8, 10, 12)[shape],
+                rebar_grade="HRB400",
+                mandrel_diameter=(25, 30, 20)[shape],
+                geometric=geometric,
+            )
+        )
+    return records
+
+
+def benchmark_bvbs_writer(bar_count: int = 10000, repeat: int = 3) -> Dict:
+    """
+    统计合成钢筋表的BF2D 记录生成及写出耗时,取多次运行的最小值
+    :param bar_count: 记录数量
+    :param repeat: 运行次数
+    :return: wall_time(s), records_per_second, output_bytes
+    """
+    records = create_synthetic_schedule(bar_count)
+    wall_times = []
+    output = ""
+    for _ in range(repeat):
+        stream = io.StringIO()
+        start = time.perf_counter()
+        write_bvbs_records(records, stream)
+        wall_times.append(time.perf_counter() - start)
+        output = stream.getvalue()
+    wall_time = min(wall_times)
+    result = {
+        "wall_time": wall_time,
+        "records_per_second": bar_count / wall_time if wall_time > 0 else 0.0,
+        "output_bytes": len(output.encode("utf-8")),
+    }
+    _logger.info(f"BVBS 写出基准测试,{bar_count}条记录:{result}")
+    return result
+
+
+# 合成项目的楼梯数量
+PROJECT_SIZES = (1, 50, 500)
+
+
+def create_synthetic_project(
+    base_stairs: Sequence[Tuple[StructuralDesign, RebarforBIM]],
+    stair_count: int,
+    project_ID: str = "BENCH",
+) -> List[Tuple[StructuralDesign, RebarforBIM]]:
+    """
+    依次循环使用基础楼梯组成合成项目,各楼梯重新编号,结果可复现
+    :param base_stairs: 基础楼梯的结构设计参数及钢筋排布结果
+    :param stair_count: 楼梯数量
+    :param project_ID: 项目编号
+    :return:
+    """
+    stairs = []
+    for index in range(stair_count):
+        structure_design, rebar_for_BIM = base_stairs[index % len(base_stairs)]
+        stair_id = StairID(project_ID=project_ID, stair_ID=str(index + 1))
+        stairs.append((replace(structure_design, stair_id=stair_id), rebar_for_BIM))
+    return stairs
+
+
+def export_stair(
+    structure_design: StructuralDesign,
+    rebar_for_BIM: RebarforBIM,
+    cache: Optional[RebarOutputCache] = None,
+) -> Tuple[int, int, int]:
+    """
+    一个楼梯的完整导出流程,与make_call_bvbs 相同:BVBS 钢筋数据、BVBS 文件、钢筋JSON 压缩文件
+    :param structure_design:
+    :param rebar_for_BIM:
+    :param cache: 输出缓存,不给出时不缓存
+    :return: BVBS 记录数量、BVBS 文件大小、压缩文件大小
+    """
+    rebar_for_bvbs = data_for_bvbs_from_layout(structure_design, rebar_for_BIM)
+    bvbs_content = create_bvbs(rebar_for_bvbs, cache)
+    file_names, write_rebar, read_rebar = create_json(rebar_for_bvbs)
+    zip_content = make_zip_content_export(file_names, write_rebar, read_rebar, cache)
+    return len(file_names), len(bvbs_content.encode("utf-8")), len(zip_content)
+
+
+def export_project(stairs: Sequence[Tuple[StructuralDesign, RebarforBIM]]) -> Dict:
+    """
+    依次导出合成项目的全部楼梯;各楼梯共用本次运行新建的输出缓存,各次运行的缓存命中情况相同
+    :param stairs: create_synthetic_project 返回的楼梯
+    :return: record_count, bvbs_bytes, zip_bytes
+    """
+    cache = RebarOutputCache()
+    result = {"record_count": 0, "bvbs_bytes": 0, "zip_bytes": 0}
+    for structure_design, rebar_for_BIM in stairs:
+        record_count, bvbs_bytes, zip_bytes = export_stair(
+            structure_design, rebar_for_BIM, cache
+        )
+        result["record_count"] += record_count
+        result["bvbs_bytes"] += bvbs_bytes
+        result["zip_bytes"] += zip_bytes
+    return result
+
+
+def benchmark_bvbs_export(
+    stairs: Sequence[Tuple[StructuralDesign, RebarforBIM]], repeat: int = 3
+) -> Dict:
+    """
+    统计合成项目的导出指标,耗时取多次运行的最小值,峰值内存单独运行一次统计
+    :param stairs: create_synthetic_project 返回的楼梯
+    :param repeat: 计时的运行次数
+    :return: stair_count, record_count, wall_time(s), stairs_per_second,
+        records_per_second, bvbs_bytes, zip_bytes, peak_memory(byte)
+    """
+    wall_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        export_project(stairs)
+        wall_times.append(time.perf_counter() - start)
+
+    # tracemalloc 统计导出过程中新分配的内存,合成项目的输入数据不计入
+    tracemalloc.start()
+    try:
+        output = export_project(stairs)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    wall_time = min(wall_times)
+    result = {
+        "stair_count": len(stairs),
+        "record_count": output["record_count"],
+        "wall_time": wall_time,
+        "stairs_per_second": len(stairs) / wall_time if wall_time > 0 else 0.0,
+        "records_per_second": (
+            output["record_count"] / wall_time if wall_time > 0 else 0.0
+        ),
+        "bvbs_bytes": output["bvbs_bytes"],
+        "zip_bytes": output["zip_bytes"],
+        "peak_memory": peak_memory,
+    }
+    _logger.info(f"BVBS 导出基准测试,{len(stairs)}个楼梯:{result}")
+    return result
+
+
+def run_export_benchmark(
+    base_stairs: Sequence[Tuple[StructuralDesign, RebarforBIM]],
+    sizes: Sequence[int] = PROJECT_SIZES,
+    repeat: int = 3,
+) -> Dict[int, Dict]:
+    """
+    按各楼梯数量组成合成项目并统计导出指标
+    :param base_stairs: 基础楼梯的结构设计参数及钢筋排布结果
+    :param sizes: 合成项目的楼梯数量,默认PROJECT_SIZES
+    :param repeat: 计时的运行次数
+    :return: 各楼梯数量的统计指标
+    """
+    return {
+        stair_count: benchmark_bvbs_export(
+            create_synthetic_project(base_stairs, stair_count), repeat
+        )
+        for stair_count in sizes
+    }
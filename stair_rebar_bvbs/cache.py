@@ -0,0 +1,83 @@
+"""
+# File       : cache.py
+# Description：BVBS 及钢筋JSON 输出的缓存,以钢筋组的形状为键,
+#              形状相同的钢筋组(如箍筋、各楼梯的分布筋)直接使用已生成的内容。
+#              缓存由调用方在需要复用的范围内创建并传入:生成整个文件时默认只在本次调用内复用,
+#              跨楼梯复用(如基准测试的合成项目)时传入同一缓存。不使用进程级缓存,
+#              后台任务每个子进程只执行一个任务(CELERYD_MAX_TASKS_PER_CHILD),进程级缓存无法跨任务复用
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+DEFAULT_CACHE_SIZE = 1024
+
+
+class RebarOutputCache(object):
+    """
+    LRU 缓存
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._memory: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(kind: str, signature: Tuple) -> Tuple[str, str]:
+        """
+        缓存键:内容类型及形状签名的repr;90 与90.0 相等但输出不同(w90@ 与w90.0@),不能直接以签名为键
+        :param kind: 内容类型,如bf2d、subs
+        :param signature: 形状签名,由各段长度、角度等组成
+        :return:
+        """
+        return kind, repr(signature)
+
+    def get(self, kind: str, signature: Tuple, factory: Callable[[], Any]) -> Any:
+        """
+        获取缓存内容,不存在时调用factory 生成并缓存
+        :param kind: 内容类型
+        :param signature: 形状签名
+        :param factory: 生成函数
+        :return:
+        """
+        key = self.make_key(kind, signature)
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = factory()
+        self._memory[key] = value
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+        return value
+
+    def clear(self):
+        """
+        清空缓存
+        :return:
+        """
+        self._memory.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def get_cached(
+    cache: Optional[RebarOutputCache],
+    kind: str,
+    signature: Tuple,
+    factory: Callable[[], Any],
+) -> Any:
+    """
+    由缓存获取内容,未给出缓存时直接调用factory 生成
+    :param cache: 输出缓存
+    :param kind: 内容类型
+    :param signature: 形状签名
+    :param factory: 生成函数
+    :return:
+    """
+    if cache is None:
+        return factory()
+    return cache.get(kind, signature, factory)
@@ -1,18 +1,18 @@
 import json
 from io import BytesIO
+from typing import BinaryIO, Iterable, List, Optional, Tuple, Union
 import shutil
 from dataclasses import asdict
 from stair_for_bvbs.models import RebarforBVBS, RebarBVBS, RebarGeoBVBS
 import numpy as np
 from .models import WriteRebarJSON, ReadRebarJSON, Subs, GEO
+from .cache import RebarOutputCache, get_cached
 import zipfile
 import os
 
 
 class MyEncode(json.JSONEncoder):
     def default(self, obj):
-        print(type(obj))
-        print(obj)
         if isinstance(obj, np.integer):
             return int(obj)
         elif isinstance(obj, np.floating):
@@ -23,67 +23,79 @@ class MyEncode(json.JSONEncoder):
             return super(MyEncode, self).default(obj)
 
 
-def create_json(rebar_for_BVBS: RebarforBVBS):
-    file_names = []
-    write_rebar_JSONs = []
-    read_rebar_JSONs = []
-    for attr, value in rebar_for_BVBS.__dict__.items():
-        value: RebarBVBS
-        geos = []
-        for geo in value.geometric:
-            geo: RebarGeoBVBS
-            if geo.angle == 0:
+def create_rebar_json(value: RebarBVBS) -> Tuple[WriteRebarJSON, ReadRebarJSON]:
+    """
+    一组钢筋的加工设备JSON,写入及读取两种共用同一个subs
+    Args:
+        value: 钢筋组
+
+    Returns:
+
+    """
+    geos = []
+    for geo in value.geometric:
+        geo: RebarGeoBVBS
+        if geo.angle == 0:
+            geos.append(
+                GEO(
+                    length=geo.length,
+                    angle=geo.angle,
+                    lengthCompensation=0,
+                    angleCompensation=0,
+                    direction=False,
+                    arc=False,
+                    retract=False,
+                )
+            )
+        else:
+            if geo.angle == 180:  # 测试  若是180度弯折  arc参数
                 geos.append(
                     GEO(
                         length=geo.length,
                         angle=geo.angle,
                         lengthCompensation=0,
                         angleCompensation=0,
-                        direction=False,
-                        arc=False,
+                        direction=True,
+                        arc=True,
                         retract=False,
                     )
                 )
             else:
-                if geo.angle == 180:  # 测试  若是180度弯折  arc参数
-                    geos.append(
-                        GEO(
-                            length=geo.length,
-                            angle=geo.angle,
-                            lengthCompensation=0,
-                            angleCompensation=0,
-                            direction=True,
-                            arc=True,
-                            retract=False,
-                        )
-                    )
-                else:
-                    geos.append(
-                        GEO(
-                            length=geo.length,
-                            angle=geo.angle,
-                            lengthCompensation=0,
-                            angleCompensation=0,
-                            direction=True,
-                            arc=False,
-                            retract=False,
-                        )
+                geos.append(
+                    GEO(
+                        length=geo.length,
+                        angle=geo.angle,
+                        lengthCompensation=0,
+                        angleCompensation=0,
+                        direction=True,
+                        arc=False,
+                        retract=False,
                     )
-        subs = Subs(geos=geos)
-        write_rebar_JSON = WriteRebarJSON(
-            billcode=value.mark,
-            plan=value.rebar_quantity,
-            finish=0,
-            diameter=value.rebar_diameter,
-            subs=subs,
-        )
-        read_rebar_JSON = ReadRebarJSON(
-            billcode=value.mark,
-            plan=value.rebar_quantity,
-            finish=value.rebar_quantity,
-            diameter=value.rebar_diameter,
-            subs=subs,
-        )
+                )
+    subs = Subs(geos=geos)
+    write_rebar_JSON = WriteRebarJSON(
+        billcode=value.mark,
+        plan=value.rebar_quantity,
+        finish=0,
+        diameter=value.rebar_diameter,
+        subs=subs,
+    )
+    read_rebar_JSON = ReadRebarJSON(
+        billcode=value.mark,
+        plan=value.rebar_quantity,
+        finish=value.rebar_quantity,
+        diameter=value.rebar_diameter,
+        subs=subs,
+    )
+    return write_rebar_JSON, read_rebar_JSON
+
+
+def create_json(rebar_for_BVBS: RebarforBVBS):
+    file_names = []
+    write_rebar_JSONs = []
+    read_rebar_JSONs = []
+    for attr, value in rebar_for_BVBS.iter_rebars():
+        write_rebar_JSON, read_rebar_JSON = create_rebar_json(value)
         file_names.append(attr)
         write_rebar_JSONs.append(write_rebar_JSON)
         read_rebar_JSONs.append(read_rebar_JSON)
@@ -112,28 +124,152 @@ def save_string_to_json_file(file_names, write_rebar_JSONs, read_rebar_JSONs):
     print(f"rebar_json.zip saved successfully.")
 
 
-def make_zip_content_export(file_names, write_rebar_json, read_rebar_json) -> bytes:
+def dumps_rebar_json(
+    rebar_json: Union[WriteRebarJSON, ReadRebarJSON], subs_json: str
+) -> str:
+    """
+    序列化钢筋JSON,subs 使用已序列化的内容,结果与json.dumps(asdict(rebar_json)) 相同
+    Args:
+        rebar_json:
+        subs_json: 已序列化的subs
+
+    Returns:
+
+    """
+    head = {
+        "billcode": rebar_json.billcode,
+        "plan": rebar_json.plan,
+        "finish": rebar_json.finish,
+        "diameter": rebar_json.diameter,
+    }
+    return json.dumps(head, cls=MyEncode)[:-1] + ', "subs": ' + subs_json + "}"
+
+
+def dumps_subs(subs: Subs, cache: Optional[RebarOutputCache] = None) -> str:
+    """
+    序列化钢筋形状,按形状缓存,形状相同的钢筋组只序列化一次
+    Args:
+        subs:
+        cache: 输出缓存,不给出时不缓存
+
+    Returns:
+
+    """
+    return get_cached(
+        cache,
+        "subs",
+        tuple(
+            (
+                geo.length,
+                geo.angle,
+                geo.lengthCompensation,
+                geo.angleCompensation,
+                geo.direction,
+                geo.arc,
+                geo.retract,
+            )
+            for geo in subs.geos
+        ),
+        lambda: json.dumps(asdict(subs), cls=MyEncode),
+    )
+
+
+def rebar_json_entries(
+    file_name: str,
+    write_json: WriteRebarJSON,
+    read_json: ReadRebarJSON,
+    cache: Optional[RebarOutputCache] = None,
+) -> List[Tuple[str, str]]:
+    """
+    一组钢筋在压缩文件中的两个JSON 文件;读写两种JSON 共用subs 时只序列化一次
+    Args:
+        file_name: 钢筋组名称
+        write_json:
+        read_json:
+        cache: 输出缓存,不给出时不缓存
+
+    Returns:
+        压缩文件中的文件名及内容
+
+    """
+    subs_json = dumps_subs(write_json.subs, cache)
+    if read_json.subs is not write_json.subs:
+        read_subs_json = dumps_subs(read_json.subs, cache)
+    else:
+        read_subs_json = subs_json
+    return [
+        (f"write_{file_name}.json", dumps_rebar_json(write_json, subs_json)),
+        (f"read_{file_name}.json", dumps_rebar_json(read_json, read_subs_json)),
+    ]
+
+
+def write_zip_entries(entries: Iterable[Tuple[str, str]], file: BinaryIO) -> BinaryIO:
+    """
+    将已序列化的文件内容依次写入文件句柄上的压缩文件
+    Args:
+        entries: 压缩文件中的文件名及内容
+        file: 二进制文件句柄
+
+    Returns:
+
+    """
+    with zipfile.ZipFile(file, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for name, content in entries:
+            zip_file.writestr(name, content)
+    return file
+
+
+def write_zip_content_export(
+    file_names,
+    write_rebar_json,
+    read_rebar_json,
+    file: BinaryIO,
+    cache: Optional[RebarOutputCache] = None,
+) -> BinaryIO:
+    """
+    将钢筋JSON 逐个写入文件句柄上的压缩文件
+    Args:
+        file_names:
+        write_rebar_json:
+        read_rebar_json:
+        file: 二进制文件句柄
+        cache: 输出缓存,不给出时只在本次写出的钢筋组间复用
+
+    Returns:
+
+    """
+    cache = RebarOutputCache() if cache is None else cache
+    return write_zip_entries(
+        (
+            entry
+            for file_name, write_json, read_json in zip(
+                file_names, write_rebar_json, read_rebar_json
+            )
+            for entry in rebar_json_entries(file_name, write_json, read_json, cache)
+        ),
+        file,
+    )
+
+
+def make_zip_content_export(
+    file_names,
+    write_rebar_json,
+    read_rebar_json,
+    cache: Optional[RebarOutputCache] = None,
+) -> bytes:
     """
     写入压缩文件,并以bytes 格式返回
     Args:
         file_names:
         write_rebar_json:
         read_rebar_json:
+        cache: 输出缓存,不给出时只在本次写出的钢筋组间复用
 
     Returns:
         contents: bytes
     """
     zip_content = BytesIO()
-
-    with zipfile.ZipFile(zip_content, "w", zipfile.ZIP_DEFLATED) as zip_file:
-        for i, file_name in enumerate(file_names):
-            for j in range(2):
-                zip_file.writestr(
-                    f"{['write', 'read'][j]}_{file_name}.json",
-                    json.dumps(
-                        asdict([write_rebar_json, read_rebar_json][j][i]),
-                        cls=MyEncode,
-                    ),
-                )
-    zip_content.seek(0)
-    return zip_content.read()
+    write_zip_content_export(
+        file_names, write_rebar_json, read_rebar_json, zip_content, cache
+    )
+    return zip_content.getvalue()
@@ -1,8 +1,27 @@
 import math
+from collections import OrderedDict
+from typing import Iterable, List, Optional, TextIO, Tuple
 from stair_for_bvbs.models import RebarforBVBS, RebarBVBS, RebarGeoBVBS
+from .cache import RebarOutputCache, get_cached
 import os
 import zipfile
 
+# 形状键中长度、角度的取整位数,避免浮点误差导致相同形状不能合并
+SHAPE_KEY_PRECISION = 1
+STEEL_DENSITY = 7.85  # 钢筋密度 g/cm³
+
+
+def get_bar_weight(bar_diameter: float, bar_length: float) -> float:
+    """
+    单根钢筋的重量
+    :param bar_diameter: 钢筋直径 mm
+    :param bar_length: 钢筋长度 mm
+    :return: 重量 kg
+    """
+    return (
+        STEEL_DENSITY * math.pi * float(bar_diameter) ** 2 / 4 * float(bar_length) / 1e6
+    )
+
 
 class BVBS:
     def __init__(
@@ -49,10 +68,7 @@ class BVBS:
         self.bar_length = "l" + bar_length
         self.bar_quantity = "n" + bar_quantity
         self.bar_weight = "e" + str(
-            round(
-                7.85 * math.pi * float(bar_diameter) ** 2 / 4 * float(bar_length) / 1e6,
-                2,
-            )
+            round(get_bar_weight(bar_diameter, bar_length), 2)
         )
         self.bar_diameter = "d" + bar_diameter
         self.steel_grade = "g" + steel_grade
@@ -65,12 +81,11 @@ class BVBS:
         self.group = "c" + group
         self.CRLF = "\n"
 
-    def create_BF2D(
-        self, Geometry_block=None, Spacer_block=None, Bar_block=None, Coupler_block=None
-    ):
-        self.bvbs_string += "BF2D@"
-        # 增加H字节
-        self.bvbs_string += "H"
+    def create_header(self) -> str:
+        """
+        BF2D 记录的标识及H 字段块
+        :return:
+        """
         BF2D_H = [
             self.project_number,
             self.schedule_number,
@@ -86,15 +101,15 @@ class BVBS:
             self.delta,
             self.group,
         ]
-        for H_string in BF2D_H:
-            self.bvbs_string += H_string + "@"
+        return "BF2D@H" + "@".join(BF2D_H) + "@"
+
+    def create_BF2D(
+        self, Geometry_block=None, Spacer_block=None, Bar_block=None, Coupler_block=None
+    ):
+        # 各字段先放入列表,最后一次拼接
+        parts = [self.create_header()]
         if Geometry_block:
-            self.bvbs_string += "G"
-            for geo in Geometry_block:
-                geo: RebarGeoBVBS
-                self.bvbs_string += (
-                    "l" + str(geo.length) + "@" + "w" + str(geo.angle) + "@"
-                )
+            parts.append(create_geometry_block(Geometry_block))
         elif Spacer_block:
             pass
         elif Bar_block:
@@ -103,6 +118,7 @@ class BVBS:
             pass
         else:
             raise Exception("未定义钢筋形状模块")
+        self.bvbs_string += "".join(parts)
         # 增加checksum字符串
         checksum_string = self.Checksum()
         self.bvbs_string += checksum_string
@@ -110,33 +126,207 @@ class BVBS:
         return self.bvbs_string
 
     def Checksum(self):
-        checksum_string = "C"
-        ascii_sum = 0
-        for s in self.bvbs_string:
-            ascii_sum += ord(s)
-        IP = 96 - ascii_sum % 32
-        checksum_string += str(IP)
-        checksum_string += "@"
-        return checksum_string
-
-
-def create_bvbs(rebar_for_BVBS: RebarforBVBS):
-    ascii_strings = ""
-    for attr, value in rebar_for_BVBS.__dict__.items():
-        value: RebarBVBS
-        bvbs = BVBS(
-            project_number=value.project_ID,
-            schedule_number=value.stair_ID,
-            bar_mark=str(value.mark),
-            bar_length=str(value.rebar_length),
-            bar_quantity=str(value.rebar_quantity),
-            bar_diameter=str(value.rebar_diameter),
-            steel_grade=value.rebar_grade,
-            mandrel_diameter=str(value.mandrel_diameter),
-        )
-        ascii_strings += bvbs.create_BF2D(Geometry_block=value.geometric)
+        return "C" + str(bvbs_checksum(self.bvbs_string)) + "@"
+
+
+def create_geometry_block(Geometry_block: List[RebarGeoBVBS]) -> str:
+    """
+    BF2D 记录的G 字段块:各段长度及段末弯折角度
+    :param Geometry_block:
+    :return:
+    """
+    parts = ["G"]
+    for geo in Geometry_block:
+        parts.extend(("l", str(geo.length), "@w", str(geo.angle), "@"))
+    return "".join(parts)
+
+
+def get_char_sum(bvbs_string: str) -> int:
+    """
+    字符编码之和;ASCII 字符串按字节一次求和
+    :param bvbs_string:
+    :return:
+    """
+    if bvbs_string.isascii():
+        return sum(bvbs_string.encode("ascii"))
+    return sum(map(ord, bvbs_string))
+
+
+def bvbs_checksum(bvbs_string: str) -> int:
+    """
+    BVBS 校验值:全部字符编码之和对32 取余后由96 减去
+    :param bvbs_string: 校验字段之前的记录内容
+    :return:
+    """
+    return 96 - get_char_sum(bvbs_string) % 32
+
+
+def create_bvbs_record(
+    value: RebarBVBS, cache: Optional[RebarOutputCache] = None
+) -> str:
+    """
+    生成一组钢筋的BF2D 记录;G 字段块及其字符编码之和按钢筋形状缓存,形状相同的钢筋组只生成一次
+    :param value: 钢筋组
+    :param cache: 输出缓存,不给出时不缓存
+    :return:
+    """
+    bvbs = BVBS(
+        project_number=value.project_ID,
+        schedule_number=value.stair_ID,
+        bar_mark=str(value.mark),
+        bar_length=str(value.rebar_length),
+        bar_quantity=str(value.rebar_quantity),
+        bar_diameter=str(value.rebar_diameter),
+        steel_grade=value.rebar_grade,
+        mandrel_diameter=str(value.mandrel_diameter),
+    )
+    if not value.geometric:
+        return bvbs.create_BF2D(Geometry_block=value.geometric)
+
+    def create_block():
+        block = create_geometry_block(value.geometric)
+        return [block, get_char_sum(block)]
+
+    geometry_block, geometry_sum = get_cached(
+        cache,
+        "bf2d",
+        tuple((geo.length, geo.angle) for geo in value.geometric),
+        create_block,
+    )
+    header = bvbs.create_header()
+    checksum = 96 - (get_char_sum(header) + geometry_sum) % 32
+    return f"{header}{geometry_block}C{checksum}@{bvbs.CRLF}"
+
+
+def create_bvbs(
+    rebar_for_BVBS: RebarforBVBS, cache: Optional[RebarOutputCache] = None
+) -> str:
+    cache = RebarOutputCache() if cache is None else cache
+    return "".join(
+        create_bvbs_record(value, cache) for _, value in rebar_for_BVBS.iter_rebars()
+    )
+
+
+def write_bvbs_records(
+    records: Iterable[RebarBVBS],
+    stream: TextIO,
+    cache: Optional[RebarOutputCache] = None,
+) -> int:
+    """
+    逐条生成BF2D 记录并写入文件句柄,不保留整个文件的字符串
+    :param records: 钢筋组
+    :param stream: 文本文件句柄
+    :param cache: 输出缓存,不给出时只在本次写出的记录间复用
+    :return: 写出的记录数量
+    """
+    cache = RebarOutputCache() if cache is None else cache
+    count = 0
+    for value in records:
+        stream.write(create_bvbs_record(value, cache))
+        count += 1
+    return count
+
+
+def write_bvbs(rebar_for_BVBS: RebarforBVBS, stream: TextIO) -> TextIO:
+    """
+    将一个楼梯的BVBS 数据流式写入文件句柄
+    :param rebar_for_BVBS:
+    :param stream: 文本文件句柄
+    :return:
+    """
+    write_bvbs_records((value for _, value in rebar_for_BVBS.iter_rebars()), stream)
+    return stream
+
+
+def get_shape_key(value: RebarBVBS) -> Tuple:
+    """
+    钢筋形状的规范化键:钢筋等级、直径、弯曲直径、长度及各段长度和角度相同的钢筋视为同一形状
+    :param value: 钢筋组
+    :return:
+    """
+    return (
+        value.rebar_grade,
+        int(value.rebar_diameter),
+        round(float(value.mandrel_diameter), SHAPE_KEY_PRECISION),
+        round(float(value.rebar_length), SHAPE_KEY_PRECISION),
+        tuple(
+            (
+                round(float(geo.length), SHAPE_KEY_PRECISION),
+                round(float(geo.angle), SHAPE_KEY_PRECISION),
+            )
+            for geo in value.geometric
+        ),
+    )
+
+
+class ProjectBVBSSchedule(object):
+    """
+    项目级钢筋表:逐个楼梯加入钢筋数据,形状相同的钢筋合并为一条记录并累加数量
+    钢筋序号按形状首次出现的顺序分配,楼梯加入顺序不变时序号不变;内存占用只与形状种类数有关
+    """
+
+    def __init__(self, project_number: str, schedule_number: str = "1"):
+        self.project_number = project_number
+        self.schedule_number = schedule_number
+        self.records: "OrderedDict[Tuple, RebarBVBS]" = OrderedDict()
+        self.stair_count = 0
+
+    def add_stair(self, rebar_for_BVBS: RebarforBVBS):
+        """
+        加入一个楼梯的钢筋数据
+        :param rebar_for_BVBS:
+        :return:
+        """
+        for _, value in rebar_for_BVBS.iter_rebars():
+            if not value.rebar_quantity:
+                continue
+            key = get_shape_key(value)
+            record = self.records.get(key)
+            if record is None:
+                self.records[key] = RebarBVBS(
+                    project_ID=self.project_number,
+                    stair_ID=self.schedule_number,
+                    mark=len(self.records) + 1,
+                    rebar_length=value.rebar_length,
+                    rebar_quantity=value.rebar_quantity,
+                    rebar_diameter=value.rebar_diameter,
+                    rebar_grade=value.rebar_grade,
+                    mandrel_diameter=value.mandrel_diameter,
+                    geometric=list(value.geometric),
+                )
+            else:
+                record.rebar_quantity += value.rebar_quantity
+        self.stair_count += 1
+
+    def write(self, stream: TextIO) -> TextIO:
+        """
+        逐条写出BF2D 记录
+        :param stream: 文本文件句柄
+        :return:
+        """
+        write_bvbs_records(self.records.values(), stream)
+        return stream
+
 
-    return ascii_strings
+def create_project_bvbs(
+    rebars_for_BVBS: Iterable[RebarforBVBS],
+    project_number: str,
+    stream: TextIO,
+    schedule_number: str = "1",
+) -> ProjectBVBSSchedule:
+    """
+    项目级BVBS 生成:一次遍历项目的全部楼梯,合并相同形状的钢筋后写出
+    :param rebars_for_BVBS: 各楼梯的钢筋数据,可为生成器,逐个楼梯计算
+    :param project_number: 项目编号
+    :param stream: 文本文件句柄
+    :param schedule_number: 钢筋表格编号
+    :return: 项目钢筋表
+    """
+    schedule = ProjectBVBSSchedule(project_number, schedule_number)
+    for rebar_for_BVBS in rebars_for_BVBS:
+        schedule.add_stair(rebar_for_BVBS)
+    schedule.write(stream)
+    return schedule
 
 
 # Saves the resulting string to the directory runnning the script.
@@ -0,0 +1,298 @@
+"""
+# File       : cutting_stock.py
+# Description：项目钢筋下料优化:按钢筋等级、直径汇总各钢筋的下料长度,在定尺原材(如9m、12m)上排料,
+#              使原材根数及余料最少;大规模时使用首次适应递减(FFD)启发式,小规模时可精确求解
+"""
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from stair_for_bvbs.models import RebarBVBS
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_STOCK_LENGTHS = (9000, 12000)  # 定尺原材长度(mm)
+EXACT_MAX_PIECES = 16  # 精确求解的最大钢筋根数
+EXACT_MAX_NODES = 200000  # 精确求解的最大搜索节点数,超出时使用启发式结果
+
+
+@dataclass
+class CuttingPattern:
+    """
+    一种排料方式:一根原材上切出的各段长度
+    """
+
+    stock_length: int
+    cuts: Tuple[int, ...]
+    count: int = 1  # 使用该排料方式的原材根数
+
+    @property
+    def waste(self) -> int:
+        return self.stock_length - sum(self.cuts)
+
+
+@dataclass
+class CuttingPlan:
+    """
+    一种钢筋等级、直径的下料方案
+    """
+
+    rebar_grade: str
+    rebar_diameter: int
+    stock_length: int
+    kerf: int = 0  # 每次切割的损耗(mm)
+    patterns: List[CuttingPattern] = field(default_factory=list)
+    exact: bool = False  # 原材根数是否已证明最少
+
+    @property
+    def stock_count(self) -> int:
+        return sum(pattern.count for pattern in self.patterns)
+
+    @property
+    def piece_count(self) -> int:
+        return sum(len(pattern.cuts) * pattern.count for pattern in self.patterns)
+
+    @property
+    def required_length(self) -> int:
+        return sum(sum(pattern.cuts) * pattern.count for pattern in self.patterns)
+
+    @property
+    def waste(self) -> int:
+        return self.stock_count * self.stock_length - self.required_length
+
+    @property
+    def utilization(self) -> float:
+        total = self.stock_count * self.stock_length
+        return self.required_length / total if total else 1.0
+
+
+def collect_cut_lengths(
+    records: Iterable[RebarBVBS],
+) -> Dict[Tuple[str, int], Counter]:
+    """
+    按钢筋等级、直径汇总下料长度及根数,下料长度取钢筋展开长度
+    :param records: 钢筋组,如项目钢筋表ProjectBVBSSchedule.records 的值
+    :return: {(钢筋等级, 直径): {下料长度: 根数}}
+    """
+    demands: Dict[Tuple[str, int], Counter] = {}
+    for record in records:
+        if not record.rebar_quantity:
+            continue
+        key = (record.rebar_grade, int(record.rebar_diameter))
+        demands.setdefault(key, Counter())[int(record.rebar_length)] += int(
+            record.rebar_quantity
+        )
+    return demands
+
+
+def first_fit_decreasing(
+    demand: Counter, stock_length: int, kerf: int = 0
+) -> List[List[int]]:
+    """
+    首次适应递减排料:钢筋按长度由长到短依次放入第一根剩余长度足够的原材;
+    以线段树维护各原材的剩余长度,每根钢筋的查找为O(log n)
+    :param demand: {下料长度: 根数}
+    :param stock_length: 原材长度
+    :param kerf: 每次切割的损耗
+    :return: 各原材切出的长度
+    """
+    piece_count = sum(demand.values())
+    size = 1
+    while size < max(piece_count, 1):
+        size *= 2
+    # 叶子为各原材的剩余长度(计入一次切割损耗),未使用的原材剩余长度为stock_length + kerf
+    tree = [stock_length + kerf] * (2 * size)
+    bins: List[List[int]] = []
+    for length in sorted(demand, reverse=True):
+        need = length + kerf
+        if need > stock_length + kerf:
+            raise Exception(f"下料长度{length}超过原材长度{stock_length}")
+        for _ in range(demand[length]):
+            node = 1
+            while node < size:
+                node = 2 * node if tree[2 * node] >= need else 2 * node + 1
+            index = node - size
+            if index == len(bins):
+                bins.append([])
+            bins[index].append(length)
+            tree[node] -= need
+            node //= 2
+            while node:
+                tree[node] = max(tree[2 * node], tree[2 * node + 1])
+                node //= 2
+    return bins
+
+
+def solve_exact(
+    pieces: Sequence[int],
+    stock_length: int,
+    kerf: int = 0,
+    upper_bound: Optional[int] = None,
+    max_nodes: int = EXACT_MAX_NODES,
+) -> Tuple[Optional[List[List[int]]], bool]:
+    """
+    小规模下料的精确求解:深度优先搜索钢筋的分配,原材根数不少于总长度下界时剪枝
+    :param pieces: 各根钢筋的下料长度
+    :param stock_length: 原材长度
+    :param kerf: 每次切割的损耗
+    :param upper_bound: 已知可行解的原材根数,只搜索更优的解
+    :param max_nodes: 最大搜索节点数
+    :return: 找到的最优排料(没有比upper_bound 更优的解时为None),以及是否完成搜索;
+        超出搜索节点数时搜索未完成,找到的排料不一定最优
+    """
+    pieces = sorted(pieces, reverse=True)
+    capacity = stock_length + kerf
+    needs = [piece + kerf for piece in pieces]
+    lower_bound = -(-sum(needs) // capacity)
+    best: List[Optional[List[List[int]]]] = [None]
+    best_count = [upper_bound if upper_bound is not None else len(pieces) + 1]
+    nodes = [0]
+    remaining: List[int] = []
+    assignment: List[List[int]] = []
+
+    def search(index: int) -> bool:
+        nodes[0] += 1
+        if nodes[0] > max_nodes:
+            return False
+        if index == len(pieces):
+            best_count[0] = len(remaining)
+            best[0] = [list(cuts) for cuts in assignment]
+            return best_count[0] > lower_bound
+        tried = set()
+        for bin_index, rest in enumerate(remaining):
+            # 剩余长度相同的原材等价,只尝试一次
+            if rest < needs[index] or rest in tried:
+                continue
+            tried.add(rest)
+            remaining[bin_index] -= needs[index]
+            assignment[bin_index].append(pieces[index])
+            keep_searching = search(index + 1)
+            assignment[bin_index].pop()
+            remaining[bin_index] += needs[index]
+            if not keep_searching:
+                return False
+        if len(remaining) + 1 < best_count[0]:
+            remaining.append(capacity - needs[index])
+            assignment.append([pieces[index]])
+            keep_searching = search(index + 1)
+            assignment.pop()
+            remaining.pop()
+            if not keep_searching:
+                return False
+        return True
+
+    search(0)
+    # 达到下界或搜索完全部分配时已证明最优
+    optimal = nodes[0] <= max_nodes
+    if not optimal:
+        _logger.debug(f"下料精确求解超出搜索节点数{max_nodes}")
+    return best[0], optimal
+
+
+def group_patterns(bins: List[List[int]], stock_length: int) -> List[CuttingPattern]:
+    """
+    将排料结果中相同的排料方式合并
+    :param bins: 各原材切出的长度
+    :param stock_length:
+    :return: 按使用根数由多到少排列的排料方式
+    """
+    counter = Counter(tuple(sorted(cuts, reverse=True)) for cuts in bins)
+    return [
+        CuttingPattern(stock_length=stock_length, cuts=cuts, count=count)
+        for cuts, count in sorted(counter.items(), key=lambda item: -item[1])
+    ]
+
+
+def optimize_cutting(
+    demand: Counter,
+    rebar_grade: str,
+    rebar_diameter: int,
+    stock_lengths: Sequence[int] = DEFAULT_STOCK_LENGTHS,
+    kerf: int = 0,
+    exact_max_pieces: int = EXACT_MAX_PIECES,
+) -> CuttingPlan:
+    """
+    一种钢筋等级、直径的下料优化:对每种原材长度排料,取余料最少的方案
+    :param demand: {下料长度: 根数}
+    :param rebar_grade:
+    :param rebar_diameter:
+    :param stock_lengths: 可选的原材长度
+    :param kerf: 每次切割的损耗
+    :param exact_max_pieces: 钢筋根数不超过该值时尝试精确求解
+    :return:
+    """
+    longest = max(demand)
+    candidates = [length for length in stock_lengths if length >= longest]
+    if not candidates:
+        raise Exception(
+            f"{rebar_grade} d{rebar_diameter} 下料长度{longest}超过全部原材长度{stock_lengths}"
+        )
+    best_plan = None
+    for stock_length in candidates:
+        bins = first_fit_decreasing(demand, stock_length, kerf)
+        exact = False
+        if sum(demand.values()) <= exact_max_pieces:
+            exact_bins, exact = solve_exact(
+                list(demand.elements()), stock_length, kerf, upper_bound=len(bins)
+            )
+            # 没有更优的解且搜索完成时,首次适应递减的结果即为最优
+            if exact_bins is not None:
+                bins = exact_bins
+        plan = CuttingPlan(
+            rebar_grade=rebar_grade,
+            rebar_diameter=rebar_diameter,
+            stock_length=stock_length,
+            kerf=kerf,
+            patterns=group_patterns(bins, stock_length),
+            exact=exact,
+        )
+        if best_plan is None or plan.waste < best_plan.waste:
+            best_plan = plan
+    return best_plan
+
+
+def optimize_project_cutting(
+    records: Iterable[RebarBVBS],
+    stock_lengths: Sequence[int] = DEFAULT_STOCK_LENGTHS,
+    kerf: int = 0,
+    exact_max_pieces: int = EXACT_MAX_PIECES,
+) -> List[CuttingPlan]:
+    """
+    项目下料优化:按钢筋等级、直径分别排料
+    :param records: 钢筋组
+    :param stock_lengths: 可选的原材长度
+    :param kerf: 每次切割的损耗
+    :param exact_max_pieces: 钢筋根数不超过该值时尝试精确求解
+    :return: 各钢筋等级、直径的下料方案
+    """
+    plans = []
+    for (rebar_grade, rebar_diameter), demand in sorted(
+        collect_cut_lengths(records).items()
+    ):
+        plan = optimize_cutting(
+            demand, rebar_grade, rebar_diameter, stock_lengths, kerf, exact_max_pieces
+        )
+        _logger.info(
+            f"{rebar_grade} d{rebar_diameter}:{plan.piece_count}根钢筋使用{plan.stock_length}mm "
+            f"原材{plan.stock_count}根,余料{plan.waste}mm,利用率{plan.utilization:.2%}"
+        )
+        plans.append(plan)
+    return plans
+
+
+def summarize_cutting_plans(plans: List[CuttingPlan]) -> Dict:
+    """
+    下料方案的余料统计
+    :param plans:
+    :return:
+    """
+    stock_total = sum(plan.stock_count * plan.stock_length for plan in plans)
+    required = sum(plan.required_length for plan in plans)
+    return {
+        "stock_count": sum(plan.stock_count for plan in plans),
+        "piece_count": sum(plan.piece_count for plan in plans),
+        "required_length": required,
+        "waste": stock_total - required,
+        "utilization": required / stock_total if stock_total else 1.0,
+    }
@@ -0,0 +1,161 @@
+"""
+# File       : incremental.py
+# Description：BVBS 及钢筋JSON 的增量生成:按钢筋组保存输入摘要及生成的内容,重新排布后只重新生成
+#              输入有变化的钢筋组,其余钢筋组直接使用保存的内容,再按原顺序拼接为完整的文件
+"""
+import hashlib
+import json
+import logging
+from typing import Any, BinaryIO, Dict, List, Optional, TextIO, Tuple
+
+from dc_rebar import Rebar
+from stair_for_bvbs.layout_data import FIRST_EXTRA_MARK, layout_group_to_bvbs
+from stair_for_bvbs.models import REBAR_GROUP_MARKS, RebarforBVBS
+from stair_structure.model import StructuralDesign, RebarParameter
+
+from .cache import RebarOutputCache
+from .create_bvbs import create_bvbs_record
+from .create_JSON import (
+    MyEncode,
+    create_rebar_json,
+    rebar_json_entries,
+    write_zip_entries,
+)
+
+_logger = logging.getLogger(__name__)
+
+# 生成逻辑有变化时修改,使已保存的内容全部失效
+OUTPUT_VERSION = 2
+
+
+def get_group_digest(
+    rebars: List[Any],
+    project_ID: str,
+    stair_ID: str,
+    rebar_name: str,
+    next_mark: int,
+) -> str:
+    """
+    钢筋组的输入摘要:排布结果中该组钢筋的半径和轨迹、项目及楼梯编号、钢筋等级,
+    以及其余形状的起始序号(前面的钢筋组形状数量变化时,该组的序号随之变化)
+    :param rebars: 排布结果中的同组钢筋,即RebarLayoutModel.content 中该组的内容
+    :param project_ID:
+    :param stair_ID:
+    :param rebar_name: 钢筋等级
+    :param next_mark: 其余形状的起始序号
+    :return:
+    """
+    content = json.dumps(
+        [
+            OUTPUT_VERSION,
+            project_ID,
+            stair_ID,
+            rebar_name,
+            next_mark,
+            rebars,
+        ],
+        sort_keys=True,
+        cls=MyEncode,
+    )
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+def update_group_outputs(
+    structure_design: StructuralDesign,
+    rebar_content: Dict,
+    state: Optional[Dict] = None,
+    cache: Optional[RebarOutputCache] = None,
+    rebar_for_bvbs: Optional[RebarforBVBS] = None,
+) -> Tuple[Dict, List[str]]:
+    """
+    按钢筋组生成BVBS 记录及钢筋JSON,输入摘要与state 中相同的钢筋组直接使用保存的内容
+    :param structure_design: 结构设计参数,提供项目、楼梯编号及钢筋等级
+    :param rebar_content: 钢筋排布结果,即RebarLayoutModel.content
+    :param state: 上次生成时保存的内容,{钢筋组名称: {digest, next_mark, bvbs, json}}
+    :param cache: 输出缓存,不给出时只在本次生成的钢筋组间复用
+    :param rebar_for_bvbs: 已由同一排布结果生成的BVBS 钢筋数据,给出时有变化的钢筋组直接使用,
+        不再重新转换
+    :return: 本次的内容(可保存为JSON),重新生成的钢筋组名称
+    """
+    state = state or {}
+    cache = RebarOutputCache() if cache is None else cache
+    project_ID = structure_design.stair_id.project_ID
+    stair_ID = structure_design.stair_id.stair_ID
+    rebar_name = structure_design.material.rebar_name
+    rebar_parameter = None
+    new_state = {}
+    changed = []
+    next_mark = FIRST_EXTRA_MARK
+    for attr in REBAR_GROUP_MARKS:
+        rebars = rebar_content.get(attr) or []
+        digest = get_group_digest(rebars, project_ID, stair_ID, rebar_name, next_mark)
+        previous = state.get(attr)
+        if previous is not None and previous.get("digest") == digest:
+            new_state[attr] = previous
+            next_mark = previous["next_mark"]
+            continue
+
+        changed.append(attr)
+        records = []
+        if rebar_for_bvbs is not None:
+            records = rebar_for_bvbs.get_group(attr)
+            next_mark += max(len(records) - 1, 0)
+        elif rebars:
+            if rebar_parameter is None:
+                rebar_parameter = RebarParameter.by_name(rebar_name)
+            records, next_mark = layout_group_to_bvbs(
+                attr,
+                [Rebar(**rebar) for rebar in rebars],
+                next_mark,
+                project_ID,
+                stair_ID,
+                rebar_parameter,
+            )
+        json_entries = []
+        for index, record in enumerate(records):
+            write_json, read_json = create_rebar_json(record)
+            json_entries.extend(
+                rebar_json_entries(
+                    attr if index == 0 else f"{attr}_{index}",
+                    write_json,
+                    read_json,
+                    cache,
+                )
+            )
+        new_state[attr] = {
+            "digest": digest,
+            "next_mark": next_mark,
+            "bvbs": "".join(create_bvbs_record(record, cache) for record in records),
+            "json": [list(entry) for entry in json_entries],
+        }
+    _logger.info(f"楼梯{stair_ID}重新生成的钢筋组:{changed}")
+    return new_state, changed
+
+
+def write_bvbs_from_state(state: Dict, stream: TextIO) -> TextIO:
+    """
+    按钢筋组顺序将保存的BVBS 记录写入文件句柄,与完整生成的内容相同
+    :param state: update_group_outputs 返回的内容
+    :param stream: 文本文件句柄
+    :return:
+    """
+    for attr in REBAR_GROUP_MARKS:
+        stream.write(state[attr]["bvbs"])
+    return stream
+
+
+def write_zip_from_state(state: Dict, file: BinaryIO) -> BinaryIO:
+    """
+    按钢筋组顺序将保存的钢筋JSON 写入文件句柄上的压缩文件,与完整生成的内容相同
+    :param state: update_group_outputs 返回的内容
+    :param file: 二进制文件句柄
+    :return:
+    """
+    return write_zip_entries(
+        (
+            (name, content)
+            for attr in REBAR_GROUP_MARKS
+            for name, content in state[attr]["json"]
+        ),
+        file,
+    )
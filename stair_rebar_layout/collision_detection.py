@@ -22,6 +22,7 @@ from stair_detailed.models import (
     PouringWay,
 )
 from stair_structure.model import StructuralDesign, StructuralDesignResult
+from stair_detailed.geometry import get_stair_geometry
 from .models import Point
 
 
@@ -37,6 +38,12 @@ class StairObstacle:
         self.structure_design_result = structure_design_result
         self.detailed_design = detailed_design
         self.detailed_design_result = detailed_design_result
+        self.geometry = get_stair_geometry(
+            structure_design,
+            structure_design_result,
+            detailed_design,
+            detailed_design_result,
+        )  # 与IFC、dxf 图纸共用的几何数据
 
         self.steps_number = self.structure_design.geometric.steps_number
         self.steps_h = self.structure_design_result.steps_h
@@ -94,37 +101,11 @@ class StairObstacle:
         要求：1.顶端和底端挑耳除外；2.以楼梯立面图右下角为初始点(0,0,0)，逆时针方向前进。
         :return:
         """
-
-        # 添加底端板三角点
+        # 底端板、踏步及顶端板上表面的角点
         geometry_points = [
-            [0.0, 0.0, 0.0],
-            [0.0, 0.0, float(self.bottom_thickness)],
-            [0.0, float(self.bottom_top_length), float(self.bottom_thickness)],
+            [0.0, float(y), float(z)]
+            for y, z in self.geometry.step_points[: 2 * self.steps_number + 3]
         ]
-        # 添加踏步角点
-        for i in range(self.steps_number - 1):
-            geometry_points.append(
-                [
-                    0.0,
-                    float(self.bottom_top_length + i * self.steps_b),
-                    float(self.bottom_thickness + (i + 1) * self.steps_h),
-                ]
-            )
-            geometry_points.append(
-                [
-                    0.0,
-                    float(self.bottom_top_length + (i + 1) * self.steps_b),
-                    float(self.bottom_thickness + (i + 1) * self.steps_h),
-                ]
-            )
-        geometry_points = geometry_points + [
-            [
-                0.0,
-                float(self.bottom_top_length + self.ln),
-                float(self.h_total),
-            ],  # 添加顶端板右上角点
-            [0.0, float(self.l_total), float(self.h_total)],
-        ]  # 添加顶端板左上角点
         cover_objs = []
         for i in range(int((len(geometry_points) - 1) / 2)):
             cover_objs.append(
@@ -312,33 +293,6 @@ class StairObstacle:
         :return:
         """
         hole_objs = []
-        # 顶端孔洞边距
-        top_right_long_a1 = (
-            self.detailed_design.construction_detailed.top_hole_position.a1
-        )  # 顶端右侧纵向边距
-        top_right_horizon_b1 = (
-            self.detailed_design.construction_detailed.top_hole_position.b1
-        )  # 顶端右侧横向边距
-        top_left_long_a2 = (
-            self.detailed_design.construction_detailed.top_hole_position.a2
-        )  # 顶端左侧纵向边距
-        top_left_horizon_b2 = (
-            self.detailed_design.construction_detailed.top_hole_position.b2
-        )  # 顶端左侧横向边距
-        # 底端孔洞边距
-        bottom_right_long_a3 = (
-            self.detailed_design.construction_detailed.bottom_hole_position.a3
-        )  # 底端右侧纵向边距
-        bottom_right_horizon_b3 = (
-            self.detailed_design.construction_detailed.bottom_hole_position.b3
-        )  # 底端右侧横向边距
-        bottom_left_long_a4 = (
-            self.detailed_design.construction_detailed.bottom_hole_position.a4
-        )  # 底端左侧纵向边距
-        bottom_left_horizon_b4 = (
-            self.detailed_design.construction_detailed.bottom_hole_position.b4
-        )  # 底端左侧横向边距
-
         top_hole_length = self.detailed_design.geometric_detailed.top_thickness
         bottom_hole_length = self.detailed_design.geometric_detailed.bottom_thickness
 
@@ -364,87 +318,30 @@ class StairObstacle:
                 / 2
             )
 
-        hole_objs.append(
-            Cylinder_fcl(
-                radius=bottom_radius,
-                length=bottom_hole_length,
-                position=np.array(
-                    [
-                        bottom_left_horizon_b4,
-                        bottom_left_long_a4,
-                        0 + bottom_hole_length / 2,
-                    ]
-                ),
-            )
-        )
-        hole_objs.append(
-            Cylinder_fcl(
-                radius=bottom_radius,
-                length=bottom_hole_length,
-                position=np.array(
-                    [
-                        self.width - bottom_right_horizon_b3,
-                        bottom_right_long_a3,
-                        0 + bottom_hole_length / 2,
-                    ]
-                ),
-            )
-        )
-        hole_objs.append(
-            Cylinder_fcl(
-                radius=top_radius,
-                length=top_hole_length,
-                position=np.array(
-                    [
-                        top_left_horizon_b2,
-                        self.l_total - top_left_long_a2,
-                        self.h_total - top_hole_length / 2,
-                    ]
-                ),
+        # 孔洞定位点为下边缘圆心,障碍物以圆柱中心定位
+        for position in self.geometry.bottom_hole_positions:
+            hole_objs.append(
+                Cylinder_fcl(
+                    radius=bottom_radius,
+                    length=bottom_hole_length,
+                    position=np.array(position)
+                    + np.array([0.0, 0.0, bottom_hole_length / 2]),
+                )
             )
-        )
-        hole_objs.append(
-            Cylinder_fcl(
-                radius=top_radius,
-                length=top_hole_length,
-                position=np.array(
-                    [
-                        self.width - top_right_horizon_b1,
-                        self.l_total - top_right_long_a1,
-                        self.h_total - top_hole_length / 2,
-                    ]
-                ),
+        for position in self.geometry.top_hole_positions:
+            hole_objs.append(
+                Cylinder_fcl(
+                    radius=top_radius,
+                    length=top_hole_length,
+                    position=np.array(position)
+                    + np.array([0.0, 0.0, top_hole_length / 2]),
+                )
             )
-        )
         return hole_objs
 
     def get_lifting(self):
         lifting_objs = []
-        lifting_position_a = self.detailed_design.inserts_detailed.lifting_position.a
-        lifting_position_b = self.detailed_design.inserts_detailed.lifting_position.b
-        lifting_position_c = float(
-            self.detailed_design.inserts_detailed.lifting_position.c
-        )  # 吊装预埋件左侧横向边距
-        lifting_position_d = float(
-            self.detailed_design.inserts_detailed.lifting_position.d
-        )  # 吊装预埋件右侧横向边距
-        edge_a = (
-            self.bottom_top_length + (lifting_position_a - 0.5) * self.steps_b
-        )  # 吊装预埋件顶端纵向边距
-        edge_b = (
-            self.bottom_top_length + (lifting_position_b - 0.5) * self.steps_b
-        )  # 吊装预埋件底端纵向边距
-        top_h = self.bottom_thickness + lifting_position_a * self.steps_h  # 下部吊装件坐标
-        bottom_h = self.bottom_thickness + lifting_position_b * self.steps_h  # 上部吊装件坐标
-        position_x = [lifting_position_c, float(self.width - lifting_position_d)]
-        position_y = [float(edge_b), float(edge_a)]
-        position_z = [float(bottom_h), float(top_h)]
-        lifting_positions = [
-            [position_x[0], position_y[0], position_z[0]],
-            [position_x[0], position_y[1], position_z[1]],
-            [position_x[1], position_y[0], position_z[0]],
-            [position_x[1], position_y[1], position_z[1]],
-        ]
+        lifting_positions = self.geometry.lifting_positions
         if self.lifting_type.value == 0:  # ROUNDING_HEAD = 0 #    ANCHOR = 1
             rabbet_radius = self.lifting_parameter.radius  # 顶部半球半径
             top_diameter = self.lifting_parameter.top_diameter  # 顶部直径
@@ -551,38 +448,7 @@ class StairObstacle:
     def get_demolding(self):
         demolding_objs = []
         if self.pouring_way.value != 2:  # 0 立式浇筑卧式脱模，1  # 立式浇筑立式脱模，2  # 卧式浇筑卧式脱模
-            # 顶端侧面脱模预埋件y坐标
-            demolding_a = float(
-                self.detailed_design.inserts_detailed.demolding_position.a
-            )  # 脱模埋件顶端纵向边距
-            demolding_b = float(
-                self.detailed_design.inserts_detailed.demolding_position.b
-            )  # 脱模埋件底端纵向边距
-            demolding_c = float(
-                self.detailed_design.inserts_detailed.demolding_position.c
-            )  # 脱模埋件左侧横向边距
-            demolding_d = float(
-                self.detailed_design.inserts_detailed.demolding_position.d
-            )  # 脱模埋件右侧横向边距
-            demolding_t = float(
-                self.detailed_design.inserts_detailed.demolding_position.t
-            )  # 脱模埋件厚度方向边距
-            # 顶端侧面脱模预埋件y坐标
-            demolding_t_y = self.l_total - demolding_a
-            # 顶端侧面脱模预埋件z坐标
-            demolding_t_z = (
-                self.l_total - self.bottom_bottom_length - demolding_a
-            ) * self.tan + demolding_t / self.cos
-            # 底端侧面脱模预埋件y坐标
-            demolding_b_y = demolding_b
-            # 底端侧面脱模预埋件z坐标
-            demolding_b_z = (
-                demolding_b - self.bottom_bottom_length
-            ) * self.tan + demolding_t / self.cos
-            demolding_positions = [
-                [self.width, demolding_t_y, demolding_t_z],
-                [self.width, demolding_b_y, demolding_b_z],
-            ]
+            demolding_positions = self.geometry.demolding_positions[0]
             if self.demolding_type.value == 0:  # ROUNDING_HEAD = 0    ANCHOR = 1
                 rabbet_radius = self.lifting_parameter.radius  # 顶部半球半径
                 top_diameter = self.lifting_parameter.top_diameter  # 顶部直径
@@ -712,32 +578,7 @@ class StairObstacle:
             rabbet_depth = float(self.rail_parameter.depth)  # 埋入深度
             rabbet_add_d = float(self.rail_parameter.length)  # 底边长度
 
-            rail_number = self.detailed_design.inserts_detailed.rail_number  # 栏杆所在的阶数
-            x_a = self.detailed_design.inserts_detailed.rail_position.a  # 横向边距
-            y_b = self.detailed_design.inserts_detailed.rail_position.b  # 纵向距离台阶
-            # 栏杆布置左右侧
-            position_x = []
-            if self.rail_layout.value == 0:  # ONLY_RIGHT = 0 ONLY_LEFT = 1   BOTH = 2
-                position_x.append(float(self.width - x_a))
-            elif self.rail_layout.value == 1:
-                position_x.append(float(x_a))
-            else:
-                position_x.append(float(x_a))
-                position_x.append(float(self.width - x_a))
-            position_y = []
-            for i in rail_number:
-                position_y.append(
-                    float(self.bottom_top_length + i * self.steps_b - y_b)
-                )  # 边界点？中心点？
-            position_z = []
-            for i in rail_number:
-                position_z.append(float(self.bottom_thickness + i * self.steps_h))
-            railing_positions = []
-            for i in range(len(position_x)):
-                for j in range(len(rail_number)):
-                    railing_positions.append(
-                        [position_x[i], position_y[j], position_z[j]]
-                    )
+            railing_positions = self.geometry.rail_positions
             transformation = rotation_matrix_from_vectors(
                 np.array([[0, 0, 1]]), np.array([[0, 1, 0]])
             )
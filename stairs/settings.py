@@ -214,6 +214,9 @@ CELERYD_MAX_TASKS_PER_CHILD = 1
 CELERY_DEFAULT_QUEUE = "stair_web_backend"
 CELERY_ENABLED = False
 
+# dxf 图纸生成性能分析:开启后后台任务将各视图的耗时及图元数量写入日志
+DXF_PROFILE_ENABLED = os.environ.get("STAIRS_SERVER_DXF_PROFILE", "0") == "1"
+
 # django-grappelli 定制配置
 GRAPPELLI_ADMIN_TITLE = "中建科技-楼梯深化设计"
 GRAPPELLI_INDEX_DASHBOARD = {  # alternative method